@@ -0,0 +1,83 @@
+"""Microbenchmark of the base-n encoders in mosdef_gomc.utils.conversion.
+
+Times the original per-digit conversion (_to_base), the lookup table
+conversion (base10_to_base_n), and the array conversion
+(base10_to_base_n_array) on the atom numbers 0 to n - 1, and checks that
+all of them produce the same strings.
+
+Usage: python devtools/benchmarks/bench_base_n_encoders.py [--base 62]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from mosdef_gomc.utils.conversion import (
+    _to_base,
+    base10_to_base_n,
+    base10_to_base_n_array,
+)
+
+
+def best_time(function, repeats):
+    """Get the best wall time of the function and its last output."""
+    best_time_s = np.inf
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        output = function()
+        best_time_s = min(best_time_s, time.perf_counter() - start_time)
+
+    return best_time_s, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base", type=int, default=62)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--max-numbers",
+        type=int,
+        default=10**6,
+        help="the largest number of values to convert",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'n_numbers':>10} {'_to_base_s':>12} {'base_n_s':>12} "
+        f"{'array_s':>12} {'speedup':>10}"
+    )
+    n_numbers = 10**3
+    while n_numbers <= args.max_numbers:
+        numbers = np.arange(n_numbers)
+
+        to_base_time, to_base_list = best_time(
+            lambda: [
+                _to_base(number_i, base=args.base) for number_i in numbers
+            ],
+            args.repeats,
+        )
+        base_n_time, base_n_list = best_time(
+            lambda: [
+                base10_to_base_n(number_i, base=args.base)
+                for number_i in numbers
+            ],
+            args.repeats,
+        )
+        array_time, base_n_array = best_time(
+            lambda: base10_to_base_n_array(numbers, base=args.base),
+            args.repeats,
+        )
+
+        assert base_n_list == to_base_list
+        assert base_n_array.tolist() == to_base_list
+
+        print(
+            f"{n_numbers:>10} {to_base_time:>12.4f} {base_n_time:>12.4f} "
+            f"{array_time:>12.4f} {to_base_time / array_time:>10.1f}"
+        )
+        n_numbers *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Scaling benchmark for the unique CHARMM atom class name allocation in Charmm.
+
+Times the per class stem suffix allocator (_allocate_unique_class_name) against
+the previous probing loop, which checked every suffix number from 0, on a
+synthetic mixture force field, where every residue uses the same class stems
+(i.e., like many alkanes all using the CH3, CH2, and CH classes).
+
+Usage: python devtools/benchmarks/bench_class_suffix_allocation.py [--residues 500]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from mosdef_gomc.formats.gmso_charmm_writer import _allocate_unique_class_name
+from mosdef_gomc.utils.conversion import base10_to_base62_alph_num
+
+
+def probe_unique_class_name(class_stem, used_class_names_set):
+    """The previous allocation, checking every suffix number from 0."""
+    for unique_class_number_k in range(0, 10**6):
+        class_name = (
+            f"{class_stem}{base10_to_base62_alph_num(unique_class_number_k)}"
+        )
+        if class_name not in used_class_names_set or class_name == "*":
+            used_class_names_set.add(class_name)
+            return class_name
+
+
+def build_class_stems(n_residues, class_stems_per_residue):
+    """Get the class stem of each unique (residue, type, class), in residue order."""
+    return [
+        class_stems_per_residue[type_j % len(class_stems_per_residue)]
+        for residue_i in range(n_residues)
+        for type_j in range(len(class_stems_per_residue))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--residues", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    class_stems_per_residue = ["CH3", "CH2", "CH", "C", "O", "H"]
+
+    print(
+        f"{'n_residues':>10} {'n_types':>10} {'probe_time_s':>13} "
+        f"{'alloc_time_s':>13} {'speedup':>8}"
+    )
+    for n_residues in sorted({50, 100, 250, args.residues}):
+        class_stems_list = build_class_stems(
+            n_residues, class_stems_per_residue
+        )
+
+        best_probe_time = np.inf
+        best_allocation_time = np.inf
+        for _ in range(args.repeats):
+            start_time = time.perf_counter()
+            used_class_names_set = set()
+            probe_class_names_list = [
+                probe_unique_class_name(class_stem_i, used_class_names_set)
+                for class_stem_i in class_stems_list
+            ]
+            best_probe_time = min(
+                best_probe_time, time.perf_counter() - start_time
+            )
+
+            start_time = time.perf_counter()
+            used_class_names_set = set()
+            next_suffix_number_dict = {}
+            allocation_class_names_list = [
+                _allocate_unique_class_name(
+                    class_stem_i, used_class_names_set, next_suffix_number_dict
+                )
+                for class_stem_i in class_stems_list
+            ]
+            best_allocation_time = min(
+                best_allocation_time, time.perf_counter() - start_time
+            )
+
+            assert allocation_class_names_list == probe_class_names_list
+
+        print(
+            f"{n_residues:>10} {len(class_stems_list):>10} "
+            f"{best_probe_time:>13.4f} {best_allocation_time:>13.4f} "
+            f"{best_probe_time / best_allocation_time:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Scaling benchmark for the molecule detection in specific_ff_to_residue.
+
+Times the connected components molecule labeling (_get_molecule_ids) on
+synthetic boxes of 3 site molecules (water like), from 1k to 1M sites.
+
+Usage: python devtools/benchmarks/bench_molecule_ids.py [--atoms-per-molecule 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from mosdef_gomc.utils.gmso_specific_ff_to_residue import _get_molecule_ids
+
+
+def build_bonded_atom_pairs(n_sites, atoms_per_molecule):
+    """Bond each molecule's sites in a linear chain, i.e., (0, 1), (1, 2), ..."""
+    site_numbers = np.arange(n_sites).reshape(-1, atoms_per_molecule)
+    bonded_atom_pairs = np.stack(
+        [site_numbers[:, :-1].ravel(), site_numbers[:, 1:].ravel()], axis=1
+    )
+
+    # shuffle the bond order, as the typed topology does not keep them sorted
+    np.random.default_rng(12345).shuffle(bonded_atom_pairs)
+
+    return bonded_atom_pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--atoms-per-molecule", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'n_sites':>10} {'n_bonds':>10} {'best_time_s':>12} {'us/site':>10}"
+    )
+    for n_molecules in [
+        10**3 // args.atoms_per_molecule,
+        10**4 // args.atoms_per_molecule,
+        10**5 // args.atoms_per_molecule,
+        10**6 // args.atoms_per_molecule,
+    ]:
+        n_sites = n_molecules * args.atoms_per_molecule
+        bonded_atom_pairs = build_bonded_atom_pairs(
+            n_sites, args.atoms_per_molecule
+        )
+
+        best_time = np.inf
+        for _ in range(args.repeats):
+            start_time = time.perf_counter()
+            molecule_ids = _get_molecule_ids(n_sites, bonded_atom_pairs)
+            best_time = min(best_time, time.perf_counter() - start_time)
+
+        expected_ids = np.repeat(
+            np.arange(n_molecules), args.atoms_per_molecule
+        )
+        assert np.array_equal(molecule_ids, expected_ids)
+
+        print(
+            f"{n_sites:>10} {len(bonded_atom_pairs):>10} {best_time:>12.4f} "
+            f"{best_time / n_sites * 1e6:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,12 @@
+import bisect
 import datetime
+import functools
+import itertools
 import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from warnings import warn
 
 import gmso
@@ -11,13 +18,13 @@ from mbuild.compound import Compound
 from unyt.dimensions import angle, energy, length, temperature
 
 from mosdef_gomc.utils.conversion import (
-    OPLS_to_periodic,
-    RB_to_periodic,
-    base10_to_base16_alph_num,
+    OPLS_to_periodic_array,
+    RB_to_periodic_array,
     base10_to_base26_alph,
     base10_to_base44_alph,
     base10_to_base52_alph,
     base10_to_base62_alph_num,
+    base10_to_base_n_array,
 )
 from mosdef_gomc.utils.gmso_equation_compare import (
     evaluate_harmonic_angle_format_with_scaler,
@@ -30,7 +37,12 @@ from mosdef_gomc.utils.gmso_equation_compare import (
     evaluate_RB_torsion_format_with_scaler,
     get_atom_type_expressions_and_scalars,
 )
-from mosdef_gomc.utils.gmso_specific_ff_to_residue import specific_ff_to_residue
+from mosdef_gomc.utils.gmso_forcefield_cache import FORCEFIELD_CACHE_DIR_ENV
+from mosdef_gomc.utils.gmso_specific_ff_to_residue import (
+    _get_forcefield_selection_with_paths,
+    _load_forcefield_selection,
+    specific_ff_to_residue,
+)
 
 
 def _check_convert_bond_k_constant_units(
@@ -214,6 +226,45 @@ def _check_convert_angle_k_constant_units(
         raise TypeError(print_error_message)
 
 
+def _unyt_quantities_to_value(unyt_quantities_list, to_units, equivalence=None):
+    """Convert a list of unyt quantities to a values array in the to_units.
+
+    The quantities are grouped by their units, so the unit conversion is
+    done once per unique unit, not once per quantity.
+
+    Parameters
+    ----------
+    unyt_quantities_list: list of unyt.unyt_quantity
+        The quantities to convert, which can have different (compatible) units.
+    to_units: str or unyt.Unit
+        The units to convert the quantities to.
+    equivalence: str or None, default=None
+        The unyt equivalence used for the conversion (i.e., 'thermal').
+
+    Returns
+    ----------
+    values_array: numpy.ndarray, shape (len(unyt_quantities_list),)
+        The quantity values in the to_units.
+    """
+    values_array = np.empty(len(unyt_quantities_list))
+    units_and_indices_dict = {}
+    for quantity_index_i, quantity_i in enumerate(unyt_quantities_list):
+        units_and_indices_dict.setdefault(
+            str(quantity_i.units), [quantity_i.units, []]
+        )[1].append(quantity_index_i)
+
+    for units_j, quantity_indices_j in units_and_indices_dict.values():
+        values_array[quantity_indices_j] = u.unyt_array(
+            [
+                unyt_quantities_list[quantity_index_i].value
+                for quantity_index_i in quantity_indices_j
+            ],
+            units_j,
+        ).to_value(to_units, equivalence=equivalence)
+
+    return values_array
+
+
 def _LJ_sigma_to_r_min(sigma):
     """Convert sigma to Rmin for the non-bonded Lennard-Jones (LJ) potential energy equation.
 
@@ -284,6 +335,9 @@ def _Exp6_Rmin_to_sigma(sigma, Rmin, alpha):
     return exp6_eqn_with_sigma_only_variable
 
 
+# the solved values are cached, in a bounded LRU cache, as the same Exp6 atom types
+# are often converted for many Charmm objects
+@functools.lru_cache(maxsize=1024)
 def _Exp6_Rmin_to_sigma_solver(
     Rmin_actual, alpha_actual, Rmin_fraction_for_sigma_findroot=0.95
 ):
@@ -373,6 +427,7 @@ def _Exp6_sigma_to_Rmin(Rmin, sigma, alpha):
     return exp6_eqn_with_r_min_only_variable
 
 
+@functools.lru_cache(maxsize=1024)
 def _Exp6_sigma_to_Rmin_solver(
     sigma_actual, alpha_actual, sigma_fraction_for_Rmin_findroot=1.05
 ):
@@ -430,6 +485,388 @@ def _Exp6_sigma_to_Rmin_solver(
     return Rmin_calculated
 
 
+# the maximum number of Exp6 (value, alpha, starting fraction) solutions
+# held in memory for this process by the batch solvers
+MAX_EXP6_SOLVER_CACHE_ENTRIES = 1024
+
+# The Exp6 batch solver LRU cache, which stores the solved sigma or Rmin
+# values.  {(conversion, value, alpha, starting fraction): solved value}
+_Exp6_solver_array_cache = OrderedDict()
+
+
+def _add_Exp6_solver_array_cache_value(cache_key, solved_value):
+    """Add a solved value to the Exp6 batch solver LRU cache.
+
+    The least recently used values over the
+    MAX_EXP6_SOLVER_CACHE_ENTRIES limit are removed.
+
+    Parameters
+    ----------
+    cache_key: tuple, (str, float, float, float)
+        The conversion ('Rmin_to_sigma' or 'sigma_to_Rmin'), Rmin or sigma
+        value, alpha value, and starting fraction.
+    solved_value: float
+        The solved sigma or Rmin value.
+    """
+    _Exp6_solver_array_cache[cache_key] = solved_value
+    while len(_Exp6_solver_array_cache) > MAX_EXP6_SOLVER_CACHE_ENTRIES:
+        _Exp6_solver_array_cache.popitem(last=False)
+
+
+def _Exp6_bracketed_ratio_solver(
+    alpha_array,
+    start_ratio,
+    max_iterations=100,
+    relative_tolerance=10 ** (-13),
+    bracket_step_fraction=0.9,
+    max_bracket_steps=60,
+):
+    """Numerically solve the Exp6 sigma / Rmin ratios for the alpha values.
+
+    The Exp6 potential energy equation is zero at sigma, which only depends
+    on the ratio of sigma and Rmin (x = sigma / Rmin), so all the ratios are
+    solved together with vectorized, bracketed Newton iterations.
+
+    .. math::
+    f(x) &= 6 / alpha * np.exp(alpha * (1 - x)) - x**(-6)
+
+    For alpha > 6, f(x) goes from -infinity at x = 0 up through the Exp6
+    potential's non-logical root, and then down through the sigma root,
+    staying negative up to x = 1.  The sigma root is the only root where
+    f(x) goes from positive to negative with increasing x, so the bracket
+    [x_lower, x_upper], with f(x_lower) >= 0 and f(x_upper) < 0, always
+    contains the sigma root, and never the non-logical root.
+
+    The bracket is found by stepping down (or up, toward x = 1) from the
+    starting ratio by the bracket_step_fraction.  The Newton steps which
+    leave the bracket are replaced by bisection steps, so the iterations
+    stay in the bracket.  The ratios without a bracket (i.e., the starting
+    ratio is not between 0 and 1, alpha <= 6, the steps pass the
+    non-logical root, or f(x) is not finite) are not converged, and are
+    left to the scipy solvers.
+
+    Parameters
+    ----------
+    alpha_array: numpy.ndarray of float
+        The alpha values for the non-bonded Exp6 potential energy equation.
+    start_ratio: float
+        The starting x = sigma / Rmin ratio, which is the
+        Rmin_fraction_for_sigma_findroot or
+        1 / sigma_fraction_for_Rmin_findroot value.
+    max_iterations: int, default=100
+        The maximum number of Newton (or bisection) iterations.
+    relative_tolerance: float, default=10 ** (-13)
+        The step size, relative to the ratio, which is considered converged.
+    bracket_step_fraction: float, default=0.9
+        The fraction the ratio is multiplied (step down) or divided
+        (step up) by in each bracket search step.
+    max_bracket_steps: int, default=60
+        The maximum number of bracket search steps.
+
+    Returns
+    ----------
+    ratio_array, converged_array: numpy.ndarray of float, numpy.ndarray of bool
+        The solved x = sigma / Rmin ratios, and if each ratio converged
+        in its bracket.
+    """
+
+    alpha_array = np.asarray(alpha_array, dtype=float)
+    ratio_array = np.full(alpha_array.shape, np.nan)
+    converged_array = np.zeros(alpha_array.shape, dtype=bool)
+    start_ratio = float(start_ratio)
+    if not 0 < start_ratio < 1:
+        return ratio_array, converged_array
+
+    def exp6_ratio_function(x_array):
+        return 6 / alpha_array * np.exp(alpha_array * (1 - x_array)) - (
+            x_array**-6
+        )
+
+    with np.errstate(all="ignore"):
+        # find the [x_lower, x_upper] brackets of the sigma roots
+        start_ratio_array = np.full(alpha_array.shape, start_ratio)
+        start_function_value = exp6_ratio_function(start_ratio_array)
+        bracketed_array = np.isfinite(start_function_value) & (alpha_array > 6)
+        x_lower_array = np.where(
+            start_function_value >= 0, start_ratio_array, np.nan
+        )
+        x_upper_array = np.where(
+            start_function_value < 0, start_ratio_array, np.nan
+        )
+        for _ in range(max_bracket_steps):
+            find_lower = bracketed_array & np.isnan(x_lower_array)
+            find_upper = bracketed_array & np.isnan(x_upper_array)
+            if not np.any(find_lower | find_upper):
+                break
+
+            # step down from x_upper, until f(x) >= 0
+            x_trial_array = np.where(
+                find_lower, x_upper_array * bracket_step_fraction, np.nan
+            )
+            function_value = exp6_ratio_function(x_trial_array)
+            bracketed_array &= ~find_lower | np.isfinite(function_value)
+            x_lower_array = np.where(
+                find_lower & (function_value >= 0), x_trial_array, x_lower_array
+            )
+            x_upper_array = np.where(
+                find_lower & (function_value < 0), x_trial_array, x_upper_array
+            )
+
+            # step up from x_lower toward x = 1, until f(x) < 0
+            x_trial_array = np.where(
+                find_upper,
+                np.minimum(x_lower_array / bracket_step_fraction, 1),
+                np.nan,
+            )
+            function_value = exp6_ratio_function(x_trial_array)
+            bracketed_array &= ~find_upper | np.isfinite(function_value)
+            bracketed_array &= ~(
+                find_upper & (function_value >= 0) & (x_trial_array >= 1)
+            )
+            x_upper_array = np.where(
+                find_upper & (function_value < 0), x_trial_array, x_upper_array
+            )
+            x_lower_array = np.where(
+                find_upper & (function_value >= 0), x_trial_array, x_lower_array
+            )
+
+        bracketed_array &= ~np.isnan(x_lower_array) & ~np.isnan(x_upper_array)
+
+        # the bracketed Newton iterations, with the bisection steps
+        ratio_array = np.where(
+            bracketed_array, (x_lower_array + x_upper_array) / 2, np.nan
+        )
+        active_array = bracketed_array.copy()
+        for _ in range(max_iterations):
+            function_value = exp6_ratio_function(ratio_array)
+            derivative_value = (
+                -6 * np.exp(alpha_array * (1 - ratio_array))
+                + 6 * ratio_array**-7
+            )
+            active_array &= np.isfinite(function_value)
+            converged_array |= active_array & (function_value == 0)
+            active_array &= function_value != 0
+
+            x_lower_array = np.where(
+                active_array & (function_value > 0), ratio_array, x_lower_array
+            )
+            x_upper_array = np.where(
+                active_array & (function_value < 0), ratio_array, x_upper_array
+            )
+            newton_ratio_array = ratio_array - function_value / derivative_value
+            use_bisection = (
+                ~np.isfinite(newton_ratio_array)
+                | (newton_ratio_array <= x_lower_array)
+                | (newton_ratio_array >= x_upper_array)
+            )
+            new_ratio_array = np.where(
+                use_bisection,
+                (x_lower_array + x_upper_array) / 2,
+                newton_ratio_array,
+            )
+            converged_array |= active_array & (
+                np.absolute(new_ratio_array - ratio_array)
+                <= relative_tolerance * np.absolute(ratio_array)
+            )
+            ratio_array = np.where(active_array, new_ratio_array, ratio_array)
+            active_array &= ~converged_array
+
+            if not np.any(active_array):
+                break
+
+    converged_array &= np.isfinite(ratio_array) & (ratio_array > 0)
+
+    return ratio_array, converged_array
+
+
+def _Exp6_Rmin_to_sigma_solver_array(
+    Rmin_array, alpha_array, Rmin_fraction_for_sigma_findroot=0.95
+):
+    """
+    Numerically solve the sigma values in non-bonded Exp6 potential for arrays of Rmin and alpha values.
+
+    This is the batch version of _Exp6_Rmin_to_sigma_solver. The solved
+    values are memoized in a bounded LRU cache (_Exp6_solver_array_cache),
+    keyed by the (Rmin, alpha, Rmin_fraction_for_sigma_findroot) values.
+    The new unique (Rmin, alpha) pairs are solved together via the
+    vectorized, bracketed Newton iterations (_Exp6_bracketed_ratio_solver).
+    Any pair that does not converge, or where sigma_calculated >= Rmin_actual,
+    is solved with the cached _Exp6_Rmin_to_sigma_solver, which raises the
+    same errors.
+
+    Parameters
+    ----------
+    Rmin_array: array-like of float
+        The Rmin values for the non-bonded Exp6 potential energy equation.
+    alpha_array: array-like of float
+        The alpha values for the non-bonded Exp6 potential energy equation.
+    Rmin_fraction_for_sigma_findroot: float, default=0.95
+        The fraction of the r_min value used to provide the starting input
+        to the numerical solver. See _Exp6_Rmin_to_sigma_solver.
+
+    Returns
+    ----------
+    sigma_calculated_array: numpy.ndarray of float
+        The numerically solved sigma values for the non-bonded Exp6 potential energy equation.
+    """
+    Rmin_array, alpha_array = np.broadcast_arrays(
+        np.asarray(Rmin_array, dtype=float),
+        np.asarray(alpha_array, dtype=float),
+    )
+    for Rmin_actual, alpha_actual in zip(Rmin_array.flat, alpha_array.flat):
+        if alpha_actual == 6 or Rmin_actual == 0:
+            raise ValueError(
+                f"ERROR: The Exp6 potential Rmin --> sigma converter failed. "
+                f"The Exp6 potential values can not be Rmin = 0 or alpha = 6, "
+                f"as it divides by zero. "
+                f"The entered values are Rmin = {Rmin_actual} and alpha = {alpha_actual}."
+            )
+
+    solver_keys_list = [
+        ("Rmin_to_sigma", Rmin_i, alpha_i, Rmin_fraction_for_sigma_findroot)
+        for Rmin_i, alpha_i in zip(
+            Rmin_array.ravel().tolist(), alpha_array.ravel().tolist()
+        )
+    ]
+    sigma_calculated_dict = {}
+    new_solver_keys_list = []
+    for solver_key_i in dict.fromkeys(solver_keys_list):
+        if solver_key_i in _Exp6_solver_array_cache:
+            _Exp6_solver_array_cache.move_to_end(solver_key_i)
+            sigma_calculated_dict[solver_key_i] = _Exp6_solver_array_cache[
+                solver_key_i
+            ]
+        else:
+            new_solver_keys_list.append(solver_key_i)
+
+    if len(new_solver_keys_list) > 0:
+        new_Rmin_array = np.array([key_i[1] for key_i in new_solver_keys_list])
+        sigma_ratio_array, converged_array = _Exp6_bracketed_ratio_solver(
+            [key_i[2] for key_i in new_solver_keys_list],
+            Rmin_fraction_for_sigma_findroot,
+        )
+        new_sigma_array = sigma_ratio_array * new_Rmin_array
+        for i, solver_key_i in enumerate(new_solver_keys_list):
+            if converged_array[i] and new_sigma_array[i] < new_Rmin_array[i]:
+                sigma_calculated_dict[solver_key_i] = float(new_sigma_array[i])
+            else:
+                sigma_calculated_dict[solver_key_i] = (
+                    _Exp6_Rmin_to_sigma_solver(
+                        solver_key_i[1],
+                        solver_key_i[2],
+                        Rmin_fraction_for_sigma_findroot=Rmin_fraction_for_sigma_findroot,
+                    )
+                )
+
+    for solver_key_i in new_solver_keys_list:
+        _add_Exp6_solver_array_cache_value(
+            solver_key_i, sigma_calculated_dict[solver_key_i]
+        )
+
+    return np.array(
+        [
+            sigma_calculated_dict[solver_key_i]
+            for solver_key_i in solver_keys_list
+        ],
+        dtype=float,
+    ).reshape(Rmin_array.shape)
+
+
+def _Exp6_sigma_to_Rmin_solver_array(
+    sigma_array, alpha_array, sigma_fraction_for_Rmin_findroot=1.05
+):
+    """
+    Numerically solve the Rmin values in non-bonded Exp6 potential for arrays of sigma and alpha values.
+
+    This is the batch version of _Exp6_sigma_to_Rmin_solver. The solved
+    values are memoized in a bounded LRU cache (_Exp6_solver_array_cache),
+    keyed by the (sigma, alpha, sigma_fraction_for_Rmin_findroot) values.
+    The new unique (sigma, alpha) pairs are solved together via the
+    vectorized, bracketed Newton iterations (_Exp6_bracketed_ratio_solver),
+    using Rmin / sigma = 1 / x. Any pair that does not converge, or where
+    Rmin_calculated <= sigma_actual, is solved with the cached
+    _Exp6_sigma_to_Rmin_solver, which raises the same errors.
+
+    Parameters
+    ----------
+    sigma_array: array-like of float
+        The sigma values for the non-bonded Exp6 potential energy equation.
+    alpha_array: array-like of float
+        The alpha values for the non-bonded Exp6 potential energy equation.
+    sigma_fraction_for_Rmin_findroot: float, default=1.05
+        The fraction of the sigma value used to provide the starting input
+        to the numerical solver. See _Exp6_sigma_to_Rmin_solver.
+
+    Returns
+    ----------
+    Rmin_calculated_array: numpy.ndarray of float
+        The numerically solved Rmin values for the non-bonded Exp6 potential energy equation.
+    """
+    sigma_array, alpha_array = np.broadcast_arrays(
+        np.asarray(sigma_array, dtype=float),
+        np.asarray(alpha_array, dtype=float),
+    )
+    for sigma_actual, alpha_actual in zip(sigma_array.flat, alpha_array.flat):
+        if alpha_actual == 6 or sigma_actual == 0:
+            raise ValueError(
+                f"ERROR: The Exp6 potential sigma --> Rmin converter failed. "
+                f"The Exp6 potential values can not be sigma = 0 or alpha = 6, "
+                f"as it divides by zero. "
+                f"The entered values are sigma = {sigma_actual} and alpha = {alpha_actual}."
+            )
+
+    solver_keys_list = [
+        ("sigma_to_Rmin", sigma_i, alpha_i, sigma_fraction_for_Rmin_findroot)
+        for sigma_i, alpha_i in zip(
+            sigma_array.ravel().tolist(), alpha_array.ravel().tolist()
+        )
+    ]
+    Rmin_calculated_dict = {}
+    new_solver_keys_list = []
+    for solver_key_i in dict.fromkeys(solver_keys_list):
+        if solver_key_i in _Exp6_solver_array_cache:
+            _Exp6_solver_array_cache.move_to_end(solver_key_i)
+            Rmin_calculated_dict[solver_key_i] = _Exp6_solver_array_cache[
+                solver_key_i
+            ]
+        else:
+            new_solver_keys_list.append(solver_key_i)
+
+    if len(new_solver_keys_list) > 0:
+        new_sigma_array = np.array([key_i[1] for key_i in new_solver_keys_list])
+        if sigma_fraction_for_Rmin_findroot != 0:
+            start_ratio = 1 / sigma_fraction_for_Rmin_findroot
+        else:
+            start_ratio = np.inf
+        sigma_ratio_array, converged_array = _Exp6_bracketed_ratio_solver(
+            [key_i[2] for key_i in new_solver_keys_list],
+            start_ratio,
+        )
+        new_Rmin_array = new_sigma_array / sigma_ratio_array
+        for i, solver_key_i in enumerate(new_solver_keys_list):
+            if converged_array[i] and new_Rmin_array[i] > new_sigma_array[i]:
+                Rmin_calculated_dict[solver_key_i] = float(new_Rmin_array[i])
+            else:
+                Rmin_calculated_dict[solver_key_i] = _Exp6_sigma_to_Rmin_solver(
+                    solver_key_i[1],
+                    solver_key_i[2],
+                    sigma_fraction_for_Rmin_findroot=sigma_fraction_for_Rmin_findroot,
+                )
+
+    for solver_key_i in new_solver_keys_list:
+        _add_Exp6_solver_array_cache_value(
+            solver_key_i, Rmin_calculated_dict[solver_key_i]
+        )
+
+    return np.array(
+        [
+            Rmin_calculated_dict[solver_key_i]
+            for solver_key_i in solver_keys_list
+        ],
+        dtype=float,
+    ).reshape(sigma_array.shape)
+
+
 def unique_atom_naming(
     topology, residue_id_list, residue_names_list, bead_to_atom_name_dict=None
 ):
@@ -466,27 +903,34 @@ def unique_atom_naming(
     unique_individual_atom_names_dict = {}
     individual_atom_names_list = []
     missing_bead_to_atom_name = []
-    for i, site in enumerate(topology.sites):
-        site_name_unique_naming = site.__dict__["name_"]
 
-        # extract element or atom name from mol2 without numbers (integers)
-        element_name_unique_naming = ""
-        for site_name_unique_naming_char_i in site_name_unique_naming:
-            try:
-                int(site_name_unique_naming_char_i)
+    # The atom name value (element or bead name), the number of name digits, and
+    # if the bead is missing from the bead_to_atom_name_dict, for each unique site name.
+    # {site_name: [atom_name_value, no_digits_atom_name, missing_bead_iter]}
+    atom_name_value_by_site_name_dict = {}
 
-            except:
-                element_name_unique_naming += site_name_unique_naming_char_i
+    # The next (lowest) possible free j for each residue and atom name value.
+    # All the j values below it are already used, as names are never removed,
+    # so the names are the same as testing every j from 1.
+    # {(residue_id, residue_name, atom_name_value): j}
+    next_atom_name_j_dict = {}
+    for i, site in enumerate(topology.sites):
+        site_name_unique_naming = site.__dict__["name_"]
 
-        if element_name_unique_naming == "":
-            raise ValueError(
-                "ERROR: The input file, likely mol2 file does not contain element names or char, only int."
+        if site_name_unique_naming not in atom_name_value_by_site_name_dict:
+            # extract element or atom name from mol2 without numbers (integers)
+            element_name_unique_naming = "".join(
+                site_name_unique_naming_char_i
+                for site_name_unique_naming_char_i in site_name_unique_naming
+                if not site_name_unique_naming_char_i.isdecimal()
             )
 
-        interate_thru_names = True
-        j = 0
-        while interate_thru_names is True:
-            j = j + 1
+            if element_name_unique_naming == "":
+                raise ValueError(
+                    "ERROR: The input file, likely mol2 file does not contain element names or char, only int."
+                )
+
+            missing_bead_iter = False
             if str(site_name_unique_naming)[:1] == "_":
                 if (
                     bead_to_atom_name_dict is not None
@@ -511,7 +955,7 @@ def unique_atom_naming(
                         ]
                         no_digits_atom_name = 2
                 else:
-                    missing_bead_to_atom_name.append(1)
+                    missing_bead_iter = True
                     atom_name_value = "BD"
                     no_digits_atom_name = 2
             elif (
@@ -532,33 +976,47 @@ def unique_atom_naming(
                 no_digits_atom_name = 2
                 atom_name_value = element_name_unique_naming
 
-            atom_name_iteration = str(atom_name_value) + str(
-                base10_to_base62_alph_num(j)
-            )
-            atom_res_no_resname_atomname_iteration = (
-                str(residue_id_list[i])
-                + "_"
-                + str(residue_names_list[i])
-                + "_"
-                + atom_name_iteration
-            )
+            atom_name_value_by_site_name_dict[site_name_unique_naming] = [
+                str(atom_name_value),
+                no_digits_atom_name,
+                missing_bead_iter,
+            ]
 
-            if (
-                unique_individual_atom_names_dict.get(
-                    str(atom_res_no_resname_atomname_iteration)
-                )
-                is None
-            ):
-                unique_individual_atom_names_dict.update(
-                    {atom_res_no_resname_atomname_iteration: i + 1}
-                )
-                interate_thru_names = False
-                individual_atom_names_list.append(
-                    str(atom_name_value)
-                    + str(
-                        str(base10_to_base62_alph_num(j))[-no_digits_atom_name:]
-                    )
-                )
+        [
+            atom_name_value,
+            no_digits_atom_name,
+            missing_bead_iter,
+        ] = atom_name_value_by_site_name_dict[site_name_unique_naming]
+
+        atom_res_no_resname_prefix = (
+            str(residue_id_list[i])
+            + "_"
+            + str(residue_names_list[i])
+            + "_"
+            + atom_name_value
+        )
+
+        # names from other atom name values can use the same key
+        # (Example: 'C' + 'l5' and 'Cl' + '5'), so the used names are still checked
+        j = next_atom_name_j_dict.get(atom_res_no_resname_prefix, 1)
+        while (
+            atom_res_no_resname_prefix + base10_to_base62_alph_num(j)
+            in unique_individual_atom_names_dict
+        ):
+            j += 1
+        next_atom_name_j_dict[atom_res_no_resname_prefix] = j + 1
+
+        unique_individual_atom_names_dict.update(
+            {atom_res_no_resname_prefix + base10_to_base62_alph_num(j): i + 1}
+        )
+        individual_atom_names_list.append(
+            atom_name_value
+            + str(base10_to_base62_alph_num(j))[-no_digits_atom_name:]
+        )
+
+        # a missing bead is counted once for every name that was tested
+        if missing_bead_iter:
+            missing_bead_to_atom_name.extend([1] * j)
 
     if sum(missing_bead_to_atom_name) > 0:
         warn(
@@ -691,6 +1149,828 @@ def _check_fixed_bonds_angles_lists(
                 )
 
 
+def _get_connection_index_array(connections, site_index_dict, no_members):
+    """Get the zero-based site indices of all the connection members in one array.
+
+    Parameters
+    ----------
+    connections: iterable of gmso connections (i.e., bonds, angles, dihedrals, or impropers)
+        The connections, which all have the same number of connection members.
+    site_index_dict: dict, {gmso.Site: int}
+        The topology's site to zero-based site index map.
+    no_members: int
+        The number of connection members (i.e., bonds = 2, angles = 3,
+        dihedrals = 4, and impropers = 4).
+
+    Returns
+    ----------
+    connection_index_array: numpy.ndarray of int32, shape (n_connections, no_members)
+        The zero-based site indices of each connection's members, in the
+        connection's member order.
+    """
+    connection_index_list = [
+        site_index_dict[member_j]
+        for connection_i in connections
+        for member_j in connection_i.connection_members
+    ]
+
+    return np.asarray(connection_index_list, dtype=np.int32).reshape(
+        -1, no_members
+    )
+
+
+def _psf_connection_section(connection_index_array, connections_per_line):
+    """Format the psf bonds, angles, dihedrals, or impropers section lines.
+
+    The sections are formatted in bulk, with each site index printed as an
+    8 character right justified field, connections_per_line connections per line,
+    and the same trailing blank lines that the psf format and GOMC expect.
+
+    Parameters
+    ----------
+    connection_index_array: numpy.ndarray of int, shape (n_connections, no_members)
+        The zero-based site indices of each connection's members.
+    connections_per_line: int
+        The number of connections printed on each line
+        (i.e., bonds = 4, angles = 3, dihedrals = 2, and impropers = 2).
+
+    Returns
+    ----------
+    psf_section_text: str
+        The section text, without the section's header line.
+    """
+    no_connections, no_members = connection_index_array.shape
+    psf_indices_list = (connection_index_array.ravel() + 1).tolist()
+    values_per_line = no_members * connections_per_line
+    full_line_format = "%8s" * values_per_line + "\n"
+
+    no_full_lines = no_connections // connections_per_line
+    psf_section_lines = [
+        full_line_format % tuple(psf_indices_list[i : i + values_per_line])
+        for i in range(0, no_full_lines * values_per_line, values_per_line)
+    ]
+
+    remaining_indices_list = psf_indices_list[no_full_lines * values_per_line :]
+    if len(remaining_indices_list) != 0:
+        psf_section_lines.append(
+            "%8s" * len(remaining_indices_list) % tuple(remaining_indices_list)
+        )
+
+    if no_connections % connections_per_line == 0:
+        psf_section_lines.append("\n")
+    else:
+        psf_section_lines.append("\n\n")
+
+    if no_connections == 0:
+        psf_section_lines.append("\n")
+
+    return "".join(psf_section_lines)
+
+
+def _dihedral_to_periodic_max_abs_deviation(
+    dihedral_type_str_list,
+    input_dihedral_coefficients_list,
+    periodic_dihedral_K_n_d_array,
+    dihedral_steps=5 * 10 ** (-3),
+):
+    """Get the max deviation between the input and converted periodic dihedrals, for each dihedral type.
+
+    All the dihedral types are evaluated at once on a (n_types, n_angles) grid
+    of phi values, from 0 to 2 * pi + dihedral_steps, in dihedral_steps increments.
+
+    Parameters
+    ----------
+    dihedral_type_str_list: list of str, length n_types
+        The input dihedral type of each dihedral, which is 'OPLSTorsionPotential',
+        'RyckaertBellemansTorsionPotential', or 'PeriodicTorsionPotential'.
+    input_dihedral_coefficients_list: list, length n_types
+        The input dihedral coefficients (kcal/mol) of each dihedral,
+        which are [f0, f1, f2, f3, f4] for the 'OPLSTorsionPotential',
+        [c0, c1, c2, c3, c4, c5] for the 'RyckaertBellemansTorsionPotential',
+        and None for the 'PeriodicTorsionPotential', which uses the
+        periodic_dihedral_K_n_d_array values with n = 0 to 5.
+    periodic_dihedral_K_n_d_array: array-like, shape (n_types, 6, 3)
+        The converted periodic dihedral [K (kcal/mol), n, d (degrees)] values
+        for the K0-K5 terms of each dihedral.
+    dihedral_steps: float, default=5 * 10 ** (-3)
+        The phi sample resolution in radians.
+
+    Returns
+    ----------
+    max_abs_deviation_array: numpy.ndarray, shape (n_types,)
+        The maximum | (input dihedral calc) - (periodic dihedral calc) |
+        of each dihedral type (kcal/mol).
+    """
+    dihedral_no_steps = int(2 * np.pi / dihedral_steps) + 1
+    phi = np.arange(0, dihedral_no_steps + 1) * dihedral_steps
+
+    periodic_dihedral_K_n_d_array = np.asarray(
+        periodic_dihedral_K_n_d_array, dtype=float
+    ).reshape(-1, 6, 3)
+    K_array = periodic_dihedral_K_n_d_array[:, :, 0, np.newaxis]
+    n_array = periodic_dihedral_K_n_d_array[:, :, 1, np.newaxis]
+    d_radians_array = (
+        periodic_dihedral_K_n_d_array[:, :, 2, np.newaxis] * np.pi / 180
+    )
+
+    # calulate the periodic dihedral (PeriodicTorsionPotential), shape (n_types, n_angles)
+    periodic_dihedral_calc = np.sum(
+        K_array * (1 + np.cos(n_array * phi - d_radians_array)), axis=1
+    )
+
+    input_dihedral_calc = np.zeros_like(periodic_dihedral_calc)
+    for dihedral_type_str_j in set(dihedral_type_str_list):
+        type_index_j = [
+            i
+            for i, dihedral_type_str_i in enumerate(dihedral_type_str_list)
+            if dihedral_type_str_i == dihedral_type_str_j
+        ]
+
+        if dihedral_type_str_j == "OPLSTorsionPotential":
+            f_array = np.asarray(
+                [input_dihedral_coefficients_list[i] for i in type_index_j],
+                dtype=float,
+            )
+            input_dihedral_calc[type_index_j] = (
+                f_array[:, 0:1] / 2
+                + f_array[:, 1:2] / 2 * (1 + np.cos(1 * phi))
+                + f_array[:, 2:3] / 2 * (1 - np.cos(2 * phi))
+                + f_array[:, 3:4] / 2 * (1 + np.cos(3 * phi))
+                + f_array[:, 4:5] / 2 * (1 - np.cos(4 * phi))
+            )
+
+        elif dihedral_type_str_j == "RyckaertBellemansTorsionPotential":
+            c_array = np.asarray(
+                [input_dihedral_coefficients_list[i] for i in type_index_j],
+                dtype=float,
+            )
+            cos_psi_powers = np.cos(phi - np.pi) ** np.arange(6)[:, np.newaxis]
+            input_dihedral_calc[type_index_j] = c_array @ cos_psi_powers
+
+        elif dihedral_type_str_j == "PeriodicTorsionPotential":
+            input_dihedral_calc[type_index_j] = np.sum(
+                K_array[type_index_j]
+                * (
+                    1
+                    + np.cos(
+                        np.arange(6)[:, np.newaxis] * phi
+                        - d_radians_array[type_index_j]
+                    )
+                ),
+                axis=1,
+            )
+
+        else:
+            raise ValueError(
+                f"ERROR: The {dihedral_type_str_j} dihedral type can not be "
+                f"compared to the periodic dihedral. The supported dihedral types are "
+                f"{'OPLSTorsionPotential'}, {'RyckaertBellemansTorsionPotential'}, "
+                f"and {'PeriodicTorsionPotential'}."
+            )
+
+    return np.max(
+        np.absolute(input_dihedral_calc - periodic_dihedral_calc), axis=1
+    ).reshape(-1)
+
+
+def _allocate_unique_class_name(
+    class_stem, used_class_names_set, next_suffix_number_dict
+):
+    """Allocate the next unique CHARMM atom class name for an atom class stem.
+
+    The class name is the class stem plus the lowest base-62 suffix number
+    (0, 1, ..., 9, A, ..., z, 10, ...), which is not already in the used class names.
+    The next suffix number to check is kept for each class stem, and the suffix
+    numbers below it are all already used, as the used class names are only added.
+    Therefore, the same class names are allocated as checking every suffix number
+    from 0, but in O(1) amortized time per class name.
+
+    Parameters
+    ----------
+    class_stem: str
+        The atom class stem (i.e., the atom class without the leading "_" for beads).
+    used_class_names_set: set
+        The class names which are already used. The allocated class name is added to it.
+    next_suffix_number_dict: dict, {str: int}
+        The next suffix number to check for each class stem, which is updated.
+
+    Returns
+    -------
+    class_name: str
+        The unique class name.
+    """
+    suffix_number = next_suffix_number_dict.get(class_stem, 0)
+    class_name = f"{class_stem}{base10_to_base62_alph_num(suffix_number)}"
+    while class_name in used_class_names_set and class_name != "*":
+        suffix_number += 1
+        class_name = f"{class_stem}{base10_to_base62_alph_num(suffix_number)}"
+
+    used_class_names_set.add(class_name)
+    next_suffix_number_dict[class_stem] = suffix_number + 1
+
+    return class_name
+
+
+def _register_parameter_entry(
+    parameter_registry_dict,
+    parameter_key,
+    parameter_entry,
+    compared_value_indices,
+    parameter_name,
+    multi_row_entry=False,
+):
+    """Add a force field parameter entry to the registry of the written parameters.
+
+    The registry is keyed by the entry's atomclasses or atomtypes, in a single
+    (canonical) order, so the regular and reverse orders have the same key.
+    The first entry for each key is stored, and any later entry with the same key
+    must have the same (rounded) values, so each entry is only checked against
+    the first entry, not every previous entry.  The multi-term entries (i.e., the
+    dihedral K0-K5 terms) are compared row by row.
+
+    Parameters
+    ----------
+    parameter_registry_dict: dict, {parameter_key: parameter_entry}
+        The registry of the first entry for each key, which is updated in place.
+    parameter_key: tuple or str
+        The canonical atomclasses or atomtypes of the entry.
+    parameter_entry: list
+        The entry's atomclasses or atomtypes, values, and extended names,
+        or a list of these rows if multi_row_entry=True.
+    compared_value_indices: list of int
+        The entry (or row) indices of the values, which must be the same for the
+        same key.
+    parameter_name: str
+        The parameter name used in the error message (i.e., 'mass', 'bond', ...).
+    multi_row_entry: bool, default=False
+        If True, the parameter_entry is a list of rows (one per term), and the
+        values of each row are compared to the same row of the first entry.
+
+    Returns
+    ----------
+    new_parameter_entry: bool
+        True if this is the first entry with this key (i.e., it is written),
+        and False if it is a duplicate.
+    """
+    first_parameter_entry = parameter_registry_dict.setdefault(
+        parameter_key, parameter_entry
+    )
+    if first_parameter_entry is parameter_entry:
+        return True
+
+    if multi_row_entry:
+        compared_rows_list = list(zip(parameter_entry, first_parameter_entry))
+        error_message_end = "."
+    else:
+        compared_rows_list = [[parameter_entry, first_parameter_entry]]
+        error_message_end = " "
+
+    for parameter_row_i, first_parameter_row_i in compared_rows_list:
+        for value_index_j in compared_value_indices:
+            if (
+                parameter_row_i[value_index_j]
+                != first_parameter_row_i[value_index_j]
+            ):
+                raise ValueError(
+                    f"ERROR: The same atomclass or atomtype in the "
+                    f"force field are have different {parameter_name} values.\n"
+                    f"{parameter_row_i} != {first_parameter_row_i}"
+                    f"{error_message_end}"
+                )
+
+    return False
+
+
+def _run_writer_tasks(writer_tasks_list, parallel=False, max_workers=None):
+    """Run the file writer tasks serially, or render the text in a process pool.
+
+    Parameters
+    ----------
+    writer_tasks_list: list of [function, list, function or None, str or None]
+        The file writer tasks, [prepare_function, prepare_args, render_function,
+        output_file_name].  The prepare_functions are always run in this
+        process.  If the render_function is None, the prepare_function
+        writes its own file (i.e., write_inp).  Otherwise, the
+        prepare_function returns the picklable file data, the module level
+        render_function renders the file text from it, and this process
+        writes the text to the output_file_name.
+    parallel: bool, default=False
+        If True, the render_functions are run concurrently in a process pool,
+        so the pure Python text formatting is not limited by the GIL.  This
+        process prepares the file data, runs the tasks which write their own
+        files after all the render_functions are submitted, and then writes
+        the rendered files.
+        If False or there is only 1 render_function, the tasks are run
+        serially in order.
+    max_workers: int or None, default=None
+        The maximum number of processes used when parallel=True.
+        If None, one process is used per render_function.
+    """
+    no_render_tasks = len(
+        [
+            writer_task_iter
+            for writer_task_iter in writer_tasks_list
+            if writer_task_iter[2] is not None
+        ]
+    )
+    if not parallel or no_render_tasks <= 1:
+        for (
+            prepare_function_iter,
+            prepare_args_iter,
+            render_function_iter,
+            output_file_name_iter,
+        ) in writer_tasks_list:
+            file_data_iter = prepare_function_iter(*prepare_args_iter)
+            if render_function_iter is not None:
+                with open(output_file_name_iter, "w") as output_write:
+                    output_write.write(render_function_iter(file_data_iter))
+
+        return
+
+    if max_workers is None:
+        max_workers = no_render_tasks
+
+    with ProcessPoolExecutor(max_workers=max_workers) as writer_executor:
+        render_futures_list = []
+        for (
+            prepare_function_iter,
+            prepare_args_iter,
+            render_function_iter,
+            output_file_name_iter,
+        ) in writer_tasks_list:
+            if render_function_iter is not None:
+                render_futures_list.append(
+                    [
+                        output_file_name_iter,
+                        writer_executor.submit(
+                            render_function_iter,
+                            prepare_function_iter(*prepare_args_iter),
+                        ),
+                    ]
+                )
+
+        # the tasks which write their own files are run while the
+        # file text is rendered
+        for (
+            prepare_function_iter,
+            prepare_args_iter,
+            render_function_iter,
+            output_file_name_iter,
+        ) in writer_tasks_list:
+            if render_function_iter is None:
+                prepare_function_iter(*prepare_args_iter)
+
+        # write the files in the task order, which raises the first
+        # render error in the task order
+        for output_file_name_iter, render_future_iter in render_futures_list:
+            with open(output_file_name_iter, "w") as output_write:
+                output_write.write(render_future_iter.result())
+
+
+def _render_psf_box_text(psf_box_data):
+    """Render the Charmm style PSF file text for a box.
+
+    This only uses the picklable box data (site table columns and connection
+    index arrays) from Charmm._psf_box_render_data, so it can be run in a
+    separate process.
+
+    Parameters
+    ----------
+    psf_box_data: dict
+        The box's PSF file data, from Charmm._psf_box_render_data.
+
+    Returns
+    ----------
+    psf_text: str
+        The PSF file text.
+    """
+    no_donors = 0
+    no_acceptors = 0
+    no_groups = 0
+    no_NNB = 0
+
+    first_indent = "%8s"
+    psf_formating = "%8s %-4s %-4s %-4s %-4s %-6s %10.6f %13.4f" + 11 * " "
+
+    no_of_remarks = 3
+    psf_text_list = [
+        "PSF ",
+        "\n\n",
+        first_indent % no_of_remarks + " !NTITLE\n",
+        f" REMARKS this file "
+        f"{psf_box_data['file_name']} "
+        f"- created by using MoSDeF-GOMC. \n",
+        f" REMARKS parameters from the "
+        f"{psf_box_data['forcefield_selection']} "
+        f"force field via MoSDef\n",
+        f" REMARKS created on {psf_box_data['date_time']}\n\n\n",
+    ]
+
+    # ATOMS: Calculate the atom data
+    # psf_formating is conducted for the for CHARMM format (i.e., atom types are base 44, letters only)
+    # The sections are built in bulk and joined into a single string.
+    max_resname_char = psf_box_data["max_resname_char"]
+    segment_id_list_psf = psf_box_data["segment_ids"]
+    res_no_chain_iter_corrected_list_psf = psf_box_data["residue_numbers"]
+    residue_names_list_psf = psf_box_data["residue_names"]
+    individual_atom_names_list = psf_box_data["atom_names"]
+    atom_types_by_type_code_list = psf_box_data["atom_types_by_type_code"]
+    type_codes_psf = psf_box_data["type_codes"].tolist()
+    charges_psf = psf_box_data["charges"].tolist()
+    masses_psf = psf_box_data["masses"].tolist()
+
+    psf_text_list.append(first_indent % psf_box_data["no_atoms"] + " !NATOM\n")
+    for i_atom in range(psf_box_data["no_atoms"]):
+        atom_lines_iteration = psf_formating % (
+            i_atom + 1,
+            segment_id_list_psf[i_atom],
+            res_no_chain_iter_corrected_list_psf[i_atom],
+            str(residue_names_list_psf[i_atom])[:max_resname_char],
+            individual_atom_names_list[i_atom],
+            atom_types_by_type_code_list[type_codes_psf[i_atom]],
+            charges_psf[i_atom],
+            masses_psf[i_atom],
+        )
+
+        psf_text_list.append("%s\n" % atom_lines_iteration)
+
+    psf_text_list.append("\n")
+
+    # BONDS: Calculate the bonding data
+    psf_text_list.append(
+        first_indent % psf_box_data["no_bonds"] + " !NBOND: bonds\n"
+    )
+    psf_text_list.append(_psf_connection_section(psf_box_data["bonds"], 4))
+
+    # ANGLES: Calculate the angle data
+    psf_text_list.append(
+        first_indent % psf_box_data["no_angles"] + " !NTHETA: angles\n"
+    )
+    psf_text_list.append(_psf_connection_section(psf_box_data["angles"], 3))
+
+    # DIHEDRALS: Calculate the dihedral  data
+    psf_text_list.append(
+        first_indent % psf_box_data["no_dihedrals"] + " !NPHI: dihedrals\n"
+    )
+    psf_text_list.append(_psf_connection_section(psf_box_data["dihedrals"], 2))
+
+    # IMPROPERS: Calculate the improper data
+    psf_text_list.append(
+        first_indent % psf_box_data["no_impropers"] + " !NIMPHI: impropers\n"
+    )
+    psf_text_list.append(_psf_connection_section(psf_box_data["impropers"], 2))
+
+    # DONOR: calculate the donor data (not calculated here printing the header)
+    psf_text_list.append(first_indent % no_donors + " !NDON: donors\n")
+    psf_text_list.append("\n")
+
+    # ACCEPTOR: calculate the acceptor data (not calculated here printing the header)
+    psf_text_list.append(first_indent % no_acceptors + " !NACC: acceptors\n")
+    psf_text_list.append("\n")
+
+    # NNB: calculate the NNB data (not calculated here printing the header)
+    psf_text_list.append(first_indent % no_NNB + " !NNB\n")
+    psf_text_list.append("\n")
+
+    # GROUP: calculate the group data  (not calculated here printing the header)
+    psf_text_list.append(first_indent % no_groups + " !NGRP \n")
+    psf_text_list.append("\n")
+
+    return "".join(psf_text_list)
+
+
+def _render_pdb_box_text(pdb_box_data):
+    """Render the Charmm style PDB file text for a box.
+
+    This only uses the picklable box data (site table columns and coordinates)
+    from Charmm._pdb_box_render_data, so it can be run in a separate process.
+
+    Parameters
+    ----------
+    pdb_box_data: dict
+        The box's PDB file data, from Charmm._pdb_box_render_data.
+
+    Returns
+    ----------
+    pdb_text: str
+        The PDB file text.
+    """
+    max_no_atoms_in_base10 = 99999  # 99,999 for atoms in psf/pdb
+
+    pdb_atom_line_format = "ATOM  %5s %-4s%1s%-4s%1s%4d%1s   %8.3f%8.3f%8.3f%6.2f%6.2f      %-4s%2s%-2s\n"
+
+    max_resname_char = pdb_box_data["max_resname_char"]
+    individual_atom_names_list = pdb_box_data["atom_names"]
+    residue_names_list_pdb = pdb_box_data["residue_names"]
+    segment_id_list_pdb = pdb_box_data["segment_ids"]
+    res_no_chain_iter_corrected_list_pdb = pdb_box_data["residue_numbers"]
+    x_y_z_coor_list = pdb_box_data["coordinates"]
+    occupancy_values_atoms_list = pdb_box_data["occupancies"]
+    fix_atoms_list = pdb_box_data["betas"]
+    element_list = pdb_box_data["elements"]
+
+    # the atom numbers above 99,999 are converted to base-16 in one call
+    no_pdb_atoms = len(x_y_z_coor_list)
+    pdb_atom_numbers_list = (
+        list(range(1, min(no_pdb_atoms, max_no_atoms_in_base10) + 1))
+        + base10_to_base_n_array(
+            np.arange(max_no_atoms_in_base10 + 1, no_pdb_atoms + 1), base=16
+        ).tolist()
+    )
+
+    pdb_text_list = []
+    if pdb_box_data["cryst1_line"] is not None:
+        pdb_text_list.append(pdb_box_data["cryst1_line"])
+
+    # the atom alternate location, residue code insertion, and
+    # segment id (columns 73-76) are all blank
+    pdb_text_list += [
+        pdb_atom_line_format
+        % (
+            pdb_atom_numbers_list[v],
+            individual_atom_names_list[v],
+            "",
+            str(residue_names_list_pdb[v])[:max_resname_char],
+            segment_id_list_pdb[v],
+            res_no_chain_iter_corrected_list_pdb[v],
+            "",
+            x_y_z_coor_list[v][0],
+            x_y_z_coor_list[v][1],
+            x_y_z_coor_list[v][2],
+            occupancy_values_atoms_list[v],
+            fix_atoms_list[v],
+            "",
+            element_list[v],
+            "",
+        )
+        for v in range(no_pdb_atoms)
+    ]
+    pdb_text_list.append("%-80s\n" % "END")
+
+    return "".join(pdb_text_list)
+
+
+class _ConcatenatedSequence(Sequence):
+    """A read-only sequence view of the concatenated sequences, without copying them.
+
+    Parameters
+    ----------
+    sequences_list: list of sequences
+        The sequences (e.g., gmso.Topology.sites), in the concatenated order.
+        They are only indexed if the view is indexed, so only iteration and len
+        are needed otherwise (e.g., gmso.Topology.bond_types).
+    """
+
+    def __init__(self, sequences_list):
+        self._sequences_list = list(sequences_list)
+        self._offsets_list = [0]
+        for sequence_iter in self._sequences_list:
+            self._offsets_list.append(
+                self._offsets_list[-1] + len(sequence_iter)
+            )
+
+    def __len__(self):
+        return self._offsets_list[-1]
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._sequences_list)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self[index_iter]
+                for index_iter in range(*index.indices(len(self)))
+            ]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("The _ConcatenatedSequence index is out of range.")
+
+        sequence_number = bisect.bisect_right(self._offsets_list, index) - 1
+        return self._sequences_list[sequence_number][
+            index - self._offsets_list[sequence_number]
+        ]
+
+
+class _TwoBoxTopologyView:
+    """A lightweight merged view of the box 0 and box 1 typed topologies.
+
+    The sites, connections, and potential types of both boxes are exposed lazily,
+    in the box 0 then box 1 order, without adding them to a new gmso.Topology,
+    which would duplicate the GMSO bookkeeping for the entire system.
+
+    Parameters
+    ----------
+    topology_box_0: gmso.Topology
+        The box 0 typed topology.
+    topology_box_1: gmso.Topology
+        The box 1 typed topology.
+
+    Attributes
+    ----------
+    topologies: tuple, (gmso.Topology, gmso.Topology)
+        The box 0 and box 1 typed topologies.
+    site_offsets: tuple, (int, int)
+        The index of each box's first site in the merged sites.
+    """
+
+    def __init__(self, topology_box_0, topology_box_1):
+        self.topologies = (topology_box_0, topology_box_1)
+        self.site_offsets = (0, topology_box_0.n_sites)
+
+    def _concatenate(self, attribute):
+        return _ConcatenatedSequence(
+            [
+                getattr(topology_iter, attribute)
+                for topology_iter in self.topologies
+            ]
+        )
+
+    def _sum(self, attribute):
+        return sum(
+            getattr(topology_iter, attribute)
+            for topology_iter in self.topologies
+        )
+
+    @property
+    def sites(self):
+        return self._concatenate("sites")
+
+    @property
+    def bonds(self):
+        return self._concatenate("bonds")
+
+    @property
+    def angles(self):
+        return self._concatenate("angles")
+
+    @property
+    def dihedrals(self):
+        return self._concatenate("dihedrals")
+
+    @property
+    def impropers(self):
+        return self._concatenate("impropers")
+
+    @property
+    def connections(self):
+        return self._concatenate("connections")
+
+    @property
+    def bond_types(self):
+        return self._concatenate("bond_types")
+
+    @property
+    def angle_types(self):
+        return self._concatenate("angle_types")
+
+    @property
+    def dihedral_types(self):
+        return self._concatenate("dihedral_types")
+
+    @property
+    def improper_types(self):
+        return self._concatenate("improper_types")
+
+    @property
+    def n_sites(self):
+        return self._sum("n_sites")
+
+    @property
+    def n_bonds(self):
+        return self._sum("n_bonds")
+
+    @property
+    def n_angles(self):
+        return self._sum("n_angles")
+
+    @property
+    def n_dihedrals(self):
+        return self._sum("n_dihedrals")
+
+    @property
+    def n_impropers(self):
+        return self._sum("n_impropers")
+
+    @property
+    def n_connections(self):
+        return self._sum("n_connections")
+
+    def get_index(self, site):
+        """Get the index of a site in the merged sites (box 0 then box 1)."""
+        for site_offset_iter, topology_iter in zip(
+            self.site_offsets, self.topologies
+        ):
+            if site in topology_iter.sites:
+                return site_offset_iter + topology_iter.get_index(site)
+
+        raise ValueError(
+            "ERROR: The site is not in the box 0 or box 1 topology."
+        )
+
+
+def _specific_ff_to_residue_boxes(
+    structures_list,
+    forcefield_selection,
+    gmso_match_ff_by,
+    residues,
+    boxes_for_simulation,
+    parallel=False,
+    parallel_residue_typing=False,
+    max_workers=None,
+    residue_template_cache=False,
+):
+    """Apply the force fields to the box structures, serially or concurrently in a process pool.
+
+    In the process pool, each force field xml file is parsed once in this process,
+    and the parsed force fields are shared with the box processes via the
+    content-addressed force field cache (see gmso_forcefield_cache), so the
+    processes only unpickle them.  The typed topologies and the per-residue
+    dictionaries are returned from the processes with the highest pickle protocol.
+
+    Parameters
+    ----------
+    structures_list: list of mbuild.Compound or mbuild.Box
+        The box structures, in the box order.
+    forcefield_selection: dict
+        The force field xml file or standard foyer force field name for each residue.
+    gmso_match_ff_by: str ("group" or "molecule")
+        How the GMSO force field is applied (see specific_ff_to_residue).
+    residues: list, [str, ..., str]
+        The residue names.
+    boxes_for_simulation: int, [1, 2]
+        The number of simulation boxes.
+    parallel: bool, default=False
+        If True, the boxes are typed concurrently in a process pool.
+        If False or there is only 1 box, the boxes are typed serially in order.
+    parallel_residue_typing: bool, default=False
+        If True, the residues in each box are typed concurrently in worker processes
+        (see specific_ff_to_residue).
+    max_workers: int or None, default=None
+        The maximum number of worker processes per box used if
+        parallel_residue_typing is True (see specific_ff_to_residue).
+    residue_template_cache: bool, default=False
+        If True, the force fields are applied from the cached typed residue
+        templates (see specific_ff_to_residue).
+
+    Returns
+    -------
+    specific_ff_to_residue_outputs_list: list
+        The specific_ff_to_residue outputs for each box, in the box order.
+    """
+    specific_ff_to_residue_kwargs = {
+        "forcefield_selection": forcefield_selection,
+        "gmso_match_ff_by": gmso_match_ff_by,
+        "residues": residues,
+        "boxes_for_simulation": boxes_for_simulation,
+        "parallel_residue_typing": parallel_residue_typing,
+        "max_workers": max_workers,
+        "residue_template_cache": residue_template_cache,
+    }
+    if not parallel or len(structures_list) <= 1:
+        return [
+            specific_ff_to_residue(
+                structure_iter, **specific_ff_to_residue_kwargs
+            )
+            for structure_iter in structures_list
+        ]
+
+    with tempfile.TemporaryDirectory() as temp_forcefield_cache_dir:
+        forcefield_cache_dir = os.environ.get(
+            FORCEFIELD_CACHE_DIR_ENV, temp_forcefield_cache_dir
+        )
+
+        # parse each force field xml once, before the box processes start.
+        # Any force field selection errors are raised here, with the same
+        # error messages as specific_ff_to_residue.
+        _load_forcefield_selection(
+            _get_forcefield_selection_with_paths(
+                forcefield_selection, residues
+            ),
+            forcefield_cache_dir=forcefield_cache_dir,
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=len(structures_list)
+        ) as typing_executor:
+            typing_futures_list = [
+                typing_executor.submit(
+                    specific_ff_to_residue,
+                    structure_iter,
+                    forcefield_cache_dir=forcefield_cache_dir,
+                    **specific_ff_to_residue_kwargs,
+                )
+                for structure_iter in structures_list
+            ]
+
+            # raise the first error in the box order, after all the boxes finish
+            return [
+                typing_future_iter.result()
+                for typing_future_iter in typing_futures_list
+            ]
+
+
 class Charmm:
     """Generates a Charmm object via foyer and gmso that is required to produce the Charmm style parameter
     (force field), PDB, PSF files, which are usable in the GOMC and NAMD engines.
@@ -1002,6 +2282,30 @@ class Charmm:
         Otherwise, they will be 0.00.
         NOTE: In GOMC, This defines which atoms belong to which box for the GCMC and GEMC ensembles.
         NOTE: In NAMD, This can be used for fixes which are manually set in the control file (please see NAMD manual).
+    parallel_typing: bool, default=False
+        If True and both boxes are provided, the force fields are applied to box 0 and box 1
+        concurrently in a process pool.  Each force field xml file is parsed once, and the
+        parsed force field is shared with both box processes via the force field cache
+        (the MOSDEF_GOMC_FF_CACHE_DIR directory, or a temporary directory if it is not set).
+        If False, the force fields are applied to box 0 and then box 1.
+    parallel_residue_typing: bool, default=False
+        If True, each box's topology is partitioned by residue (the gmso_match_ff_by labels),
+        and each residue is typed with its force field in a separate worker process,
+        which is useful for mixtures with many different residues
+        (see specific_ff_to_residue).  The typed atoms/beads are in the same order
+        as the serial typing.  If False, all the residues in a box are typed in one process.
+    residue_typing_max_workers: int or None, default=None
+        The maximum number of worker processes per box used if parallel_residue_typing is True.
+        If None, the smaller of the number of residues and the CPU count is used.
+    residue_template_cache: bool, default=False
+        If True, the force fields are applied from the typed residue templates,
+        which are cached in memory and in the MOSDEF_GOMC_FF_CACHE_DIR directory
+        (if it is set), keyed by the force field xml file's content hash and the
+        molecule graph (see specific_ff_to_residue).  Each unique molecule is
+        only typed with GMSO the first time it is seen, so repeat builds from the
+        same molecules and force fields do not parse the force fields or run
+        the GMSO (SMARTS) typing.
+        If True, the parallel_residue_typing is not used.
 
     Attributes
     ----------
@@ -1145,6 +2449,13 @@ class Charmm:
         The box 1 topology (from structure_box_1) after all the provided
         force fields are applied. This only exists if the box 1 structure
         (structure_box_1) is provided.
+    topology_box_0_and_1_ff: gmso.Topology
+        The combined box 0 and box 1 topology, with all the box 0 sites and connections,
+        then all the box 1 sites and connections.  It is only built when it is first
+        accessed, and it only exists if the box 1 structure (structure_box_1) is provided.
+    topology_selection: gmso.Topology
+        The box 0 topology (topology_box_0_ff), or the combined box 0 and box 1
+        topology (topology_box_0_and_1_ff) if the box 1 structure is provided.
     residues_applied_list_box_0: list
         The residues in box 0 that were found and had the force fields applied to them.
     residues_applied_list_box_1: list
@@ -1308,6 +2619,10 @@ class Charmm:
         set_residue_pdb_occupancy_to_1=None,
         ff_filename=None,
         gmso_match_ff_by="molecule",
+        parallel_typing=False,
+        parallel_residue_typing=False,
+        residue_typing_max_workers=None,
+        residue_template_cache=False,
     ):
         # set all input variables to the class
         self.structure_box_0 = structure_box_0
@@ -1588,6 +2903,33 @@ class Charmm:
             )
             raise TypeError(print_error_message)
 
+        if not isinstance(parallel_typing, bool):
+            self.input_error = True
+            print_error_message = "ERROR: Please enter the parallel_typing as a bool (True or False)."
+            raise TypeError(print_error_message)
+
+        if not isinstance(parallel_residue_typing, bool):
+            self.input_error = True
+            print_error_message = "ERROR: Please enter the parallel_residue_typing as a bool (True or False)."
+            raise TypeError(print_error_message)
+
+        if residue_typing_max_workers is not None and (
+            not isinstance(residue_typing_max_workers, int)
+            or isinstance(residue_typing_max_workers, bool)
+            or residue_typing_max_workers < 1
+        ):
+            self.input_error = True
+            print_error_message = (
+                "ERROR: Please enter the residue_typing_max_workers as None or "
+                "an integer greater than or equal to 1."
+            )
+            raise ValueError(print_error_message)
+
+        if not isinstance(residue_template_cache, bool):
+            self.input_error = True
+            print_error_message = "ERROR: Please enter the residue_template_cache as a bool (True or False)."
+            raise TypeError(print_error_message)
+
         if not isinstance(gmso_match_ff_by, str) or gmso_match_ff_by not in [
             "molecule",
             "group",
@@ -1616,63 +2958,52 @@ class Charmm:
 
         if self.structure_box_1:
             print(
-                "GOMC FF writing each residues FF as a group for structure_box_0"
+                "GOMC FF writing each residues FF as a group for structure_box_0 "
+                "and structure_box_1"
             )
             [
-                self.topology_box_0_ff,
-                self.residues_applied_list_box_0,
-                self.electrostatics14Scale_dict_box_0,
-                self.nonBonded14Scale_dict_box_0,
-                self.atom_types_dict_box_0,
-                self.bond_types_dict_box_0,
-                self.angle_types_dict_box_0,
-                self.dihedral_types_dict_box_0,
-                self.improper_types_dict_box_0,
-                self.combining_rule_dict_box_0,
-            ] = specific_ff_to_residue(
-                self.structure_box_0,
+                [
+                    self.topology_box_0_ff,
+                    self.residues_applied_list_box_0,
+                    self.electrostatics14Scale_dict_box_0,
+                    self.nonBonded14Scale_dict_box_0,
+                    self.atom_types_dict_box_0,
+                    self.bond_types_dict_box_0,
+                    self.angle_types_dict_box_0,
+                    self.dihedral_types_dict_box_0,
+                    self.improper_types_dict_box_0,
+                    self.combining_rule_dict_box_0,
+                ],
+                [
+                    self.topology_box_1_ff,
+                    self.residues_applied_list_box_1,
+                    self.electrostatics14Scale_dict_box_1,
+                    self.nonBonded14Scale_dict_box_1,
+                    self.atom_types_dict_box_1,
+                    self.bond_types_dict_box_1,
+                    self.angle_types_dict_box_1,
+                    self.dihedral_types_dict_box_1,
+                    self.improper_types_dict_box_1,
+                    self.combining_rule_dict_box_1,
+                ],
+            ] = _specific_ff_to_residue_boxes(
+                [self.structure_box_0, self.structure_box_1],
                 forcefield_selection=self.forcefield_selection,
                 gmso_match_ff_by=gmso_match_ff_by,
                 residues=self.residues,
                 boxes_for_simulation=self.boxes_for_simulation,
+                parallel=parallel_typing,
+                parallel_residue_typing=parallel_residue_typing,
+                max_workers=residue_typing_max_workers,
+                residue_template_cache=residue_template_cache,
             )
 
-            print(
-                "GOMC FF writing each residues FF as a group for  structure_box_1"
-            )
-            [
-                self.topology_box_1_ff,
-                self.residues_applied_list_box_1,
-                self.electrostatics14Scale_dict_box_1,
-                self.nonBonded14Scale_dict_box_1,
-                self.atom_types_dict_box_1,
-                self.bond_types_dict_box_1,
-                self.angle_types_dict_box_1,
-                self.dihedral_types_dict_box_1,
-                self.improper_types_dict_box_1,
-                self.combining_rule_dict_box_1,
-            ] = specific_ff_to_residue(
-                self.structure_box_1,
-                forcefield_selection=self.forcefield_selection,
-                gmso_match_ff_by=gmso_match_ff_by,
-                residues=self.residues,
-                boxes_for_simulation=self.boxes_for_simulation,
+            # combine the topologies of box 0 and 1 in a merged view,
+            # which does not copy their sites and connections
+            self._topology_box_0_and_1_view = _TwoBoxTopologyView(
+                self.topology_box_0_ff, self.topology_box_1_ff
             )
 
-            # combine the topologies of box 0 and 1
-            self.topology_box_0_and_1_ff = gmso.Topology()
-            # iterate thru sites to combine the topologies of box 0 and 1
-            for site_i in self.topology_box_0_ff.sites:
-                self.topology_box_0_and_1_ff.add_site(site_i)
-            for site_i in self.topology_box_1_ff.sites:
-                self.topology_box_0_and_1_ff.add_site(site_i)
-            # iterate thru connections (bonds, angles, dihedrals, and impropers) and add to empty topology
-            # to combine the topologyies of box 0 and 1
-            for connection_i in self.topology_box_0_ff.connections:
-                self.topology_box_0_and_1_ff.add_connection(connection_i)
-            for connection_i in self.topology_box_1_ff.connections:
-                self.topology_box_0_and_1_ff.add_connection(connection_i)
-
             # create/add to alot of the dictionaries
             self.atom_types_dict_per_residue.update(self.atom_types_dict_box_0)
             self.atom_types_dict_per_residue.update(self.atom_types_dict_box_1)
@@ -1761,7 +3092,7 @@ class Charmm:
 
             # check that there are atoms in the system (checking box 0 and 1)
             site_list_box_0_and_1 = [
-                site for site in self.topology_box_0_and_1_ff.sites
+                site for site in self._topology_box_0_and_1_view.sites
             ]
             if len(site_list_box_0_and_1) == 0:
                 self.input_error = True
@@ -1771,55 +3102,6 @@ class Charmm:
                 )
                 raise ValueError(print_error_message)
 
-            # Check if the box 0's charges sum to zero
-            charge_list_box_0 = [
-                site.atom_type.__dict__["charge_"].to("C") / u.elementary_charge
-                for site in self.topology_box_0_ff.sites
-            ]
-
-            if len(charge_list_box_0) != 0:
-                total_charge_box_0 = sum(charge_list_box_0)
-                total_charge_box_0 = total_charge_box_0.to_value(
-                    "(dimensionless)"
-                )
-
-                if round(total_charge_box_0, 6) != 0.0:
-                    warn(
-                        "System is not charge neutral for structure_box_0. "
-                        "Total charge is {}.".format(total_charge_box_0)
-                    )
-
-            # Check if the box 1's charges sum to zero
-            charge_list_box_1 = [
-                site.atom_type.__dict__["charge_"].to("C") / u.elementary_charge
-                for site in self.topology_box_1_ff.sites
-            ]
-            if len(charge_list_box_1) != 0:
-                total_charge_box_1 = sum(charge_list_box_1)
-                total_charge_box_1 = total_charge_box_1.to_value(
-                    "(dimensionless)"
-                )
-
-                if round(total_charge_box_1, 6) != 0.0:
-                    warn(
-                        "System is not charge neutral for structure_box_1. "
-                        "Total charge is {}.".format(total_charge_box_1)
-                    )
-
-            # Check if the box 0 and 1's charges sum to zero
-            charge_list_box_0_and_1 = [
-                site.atom_type.__dict__["charge_"].to("C") / u.elementary_charge
-                for site in self.topology_box_0_and_1_ff.sites
-            ]
-            total_charge_box_0_and_1 = sum(charge_list_box_0_and_1).to_value(
-                "(dimensionless)"
-            )
-            if round(total_charge_box_0_and_1, 6) != 0.0:
-                warn(
-                    "System is not charge neutral for structure_0_and_1. "
-                    "Total charge is {}.".format(total_charge_box_0_and_1)
-                )
-
         else:
             print(
                 "GOMC FF writing each residues FF as a group for structure_box_0"
@@ -1841,6 +3123,9 @@ class Charmm:
                 gmso_match_ff_by=gmso_match_ff_by,
                 residues=self.residues,
                 boxes_for_simulation=self.boxes_for_simulation,
+                parallel_residue_typing=parallel_residue_typing,
+                max_workers=residue_typing_max_workers,
+                residue_template_cache=residue_template_cache,
             )
 
             self.atom_types_dict_per_residue.update(self.atom_types_dict_box_0)
@@ -1899,23 +3184,6 @@ class Charmm:
                 )
                 raise ValueError(print_error_message)
 
-            # Check if the box 0's charges sum to zero
-            charge_list_box_0 = [
-                site.atom_type.__dict__["charge_"].to("C") / u.elementary_charge
-                for site in self.topology_box_0_ff.sites
-            ]
-            if len(charge_list_box_0) != 0:
-                total_charge_box_0 = sum(charge_list_box_0)
-                total_charge_box_0 = total_charge_box_0.to_value(
-                    "(dimensionless)"
-                )
-
-                if round(total_charge_box_0, 6) != 0.0:
-                    warn(
-                        "System is not charge neutral for structure_box_0. "
-                        "Total charge is {}.".format(total_charge_box_0)
-                    )
-
         print(f"forcefield type from compound = {self.forcefield_selection}")
         print(
             f"coulomb14scale from compound = {self.combined_1_4_electrostatic_dict_per_residue}"
@@ -1926,15 +3194,18 @@ class Charmm:
 
         # select all atoms in the or both boxes
         if self.structure_box_1:
-            self.topology_selection = self.topology_box_0_and_1_ff
+            self._topology_selection = self._topology_box_0_and_1_view
         else:
-            self.topology_selection = self.topology_box_0_ff
+            self._topology_selection = self.topology_box_0_ff
+
+        # build the indexed site table for all the sites in the or both boxes
+        self._build_site_table()
 
         # get atom_type info
         # Example: {'ff_atom_name': {'atomclass': 'CT', 'description': 'alkane CH3',
         # 'definition': '[C;X4](C)(H)(H)H]', 'doi': 'doi.xxxx' }, ..., }
         self.atom_type_info_dict = {}
-        for site in self.topology_selection.sites:
+        for site in self.site_table["first_site_of_type_code"]:
             key_iter = f"{site.__dict__['residue_name_']}_{site.atom_type.__dict__['name_']}"
             if key_iter not in self.atom_type_info_dict.keys():
                 charge_value = (
@@ -1972,28 +3243,22 @@ class Charmm:
 
         # change 'residue_name_' to "residue_name_"
         # change 'residue_number_' to "residue_number_"
-        self.residues_types_classes = []
-        for site in self.topology_selection.sites:
-            self.residues_types_classes.append(
-                (
-                    str(site.__dict__["residue_name_"]),
-                    str(site.atom_type.__dict__["atomclass_"]),
-                    str(site.atom_type.__dict__["name_"]),
-                )
-            )
-        self.unique_residues_types_classes = list(
-            set(self.residues_types_classes)
-        )
+        self.residues_types_classes = [
+            self.site_table["type_keys"][type_code_i]
+            for type_code_i in self.site_table["type_codes"]
+        ]
+        self.unique_residues_types_classes = list(self.site_table["type_keys"])
         self.unique_residues_types_classes.sort(
             key=lambda x: (x[0], x[1], x[2])
         )
 
+        # the per site types and classes are broadcast from the site table's type codes
         self.types = np.array(
             [
                 f"{site_res_type_i[0]}_{site_res_type_i[2]}"
-                for site_res_type_i in self.residues_types_classes
+                for site_res_type_i in self.site_table["type_keys"]
             ]
-        )
+        )[self.site_table["type_codes"]]
         self.unique_types = list(set(self.types))
         self.unique_types = np.array(
             [
@@ -2007,9 +3272,9 @@ class Charmm:
         self.classes = np.array(
             [
                 f"{site_res_type_i[0]}_{site_res_type_i[1]}"
-                for site_res_type_i in self.residues_types_classes
+                for site_res_type_i in self.site_table["type_keys"]
             ]
-        )
+        )[self.site_table["type_codes"]]
         self.unique_classes = np.array(
             [
                 f"{site_res_type_i[0]}_{site_res_type_i[1]}"
@@ -2029,6 +3294,7 @@ class Charmm:
         self.mosdef_residue_atom_name_to_unique_charmm_atom_type_dict = {}
         self.mosdef_atom_name_to_general_charmm_atom_type_per_residue_dict = {}
         self.mosdef_atom_name_to_unique_charmm_atom_type_per_residue_dict = {}
+        next_class_suffix_number_dict = {}
 
         for (
             unique_residues_types_classes_k
@@ -2088,91 +3354,108 @@ class Charmm:
                     }
                 )
 
-            for unique_class_number_k in range(0, 10**6):
-                unique_atom_name_and_classes_iter = (
-                    f"{mosdef_class_with_char_iter}"
-                    f"{base10_to_base62_alph_num(unique_class_number_k)}"
-                )
-
-                if (
-                    unique_atom_name_and_classes_iter
-                    not in self.atom_name_to_all_unique_classes_added_alpha_nums
-                    or str(unique_atom_name_and_classes_iter) == "*"
-                ):
-                    self.atom_name_to_all_unique_classes_added_alpha_nums.add(
-                        unique_atom_name_and_classes_iter
-                    )
+            unique_atom_name_and_classes_iter = _allocate_unique_class_name(
+                mosdef_class_with_char_iter,
+                self.atom_name_to_all_unique_classes_added_alpha_nums,
+                next_class_suffix_number_dict,
+            )
 
-                    self.mosdef_residue_atom_name_to_unique_charmm_atom_type_dict.update(
-                        {
-                            f"{unique_residues_types_classes_k[0]}_{unique_residues_types_classes_k[2]}": unique_atom_name_and_classes_iter
+            self.mosdef_residue_atom_name_to_unique_charmm_atom_type_dict.update(
+                {
+                    f"{unique_residues_types_classes_k[0]}_{unique_residues_types_classes_k[2]}": unique_atom_name_and_classes_iter
+                }
+            )
+            try:
+                self.mosdef_atom_name_to_unique_charmm_atom_type_per_residue_dict[
+                    unique_residues_types_classes_k[0]
+                ].update(
+                    {
+                        unique_residues_types_classes_k[
+                            2
+                        ]: unique_atom_name_and_classes_iter
+                    }
+                )
+            except:
+                self.mosdef_atom_name_to_unique_charmm_atom_type_per_residue_dict.update(
+                    {
+                        unique_residues_types_classes_k[0]: {
+                            unique_residues_types_classes_k[
+                                2
+                            ]: unique_atom_name_and_classes_iter
                         }
-                    )
-                    try:
-                        self.mosdef_atom_name_to_unique_charmm_atom_type_per_residue_dict[
-                            unique_residues_types_classes_k[0]
-                        ].update(
-                            {
-                                unique_residues_types_classes_k[
-                                    2
-                                ]: unique_atom_name_and_classes_iter
-                            }
-                        )
-                    except:
-                        self.mosdef_atom_name_to_unique_charmm_atom_type_per_residue_dict.update(
-                            {
-                                unique_residues_types_classes_k[0]: {
-                                    unique_residues_types_classes_k[
-                                        2
-                                    ]: unique_atom_name_and_classes_iter
-                                }
-                            }
-                        )
-
-                    break
+                    }
+                )
 
-        self.masses = np.array(
+        # convert the masses and charges once per unique atom type, and broadcast
+        # them to the sites with the site type codes
+        type_codes = self.site_table["type_codes"]
+        masses_per_type_code = np.array(
             [
                 site.atom_type.__dict__["mass_"].to_value("amu")
-                for site in self.topology_selection.sites
-            ]
-        )
-
-        self.mass_atom_type_dict = dict(
-            [
-                (atom_type, mass)
-                for atom_type, mass in zip(self.types, self.masses)
-            ]
-        )
-        self.mass_atom_class_dict = dict(
-            [
-                (atom_class, mass)
-                for atom_class, mass in zip(self.classes, self.masses)
-            ]
+                for site in self.site_table["first_site_of_type_code"]
+            ],
+            dtype=float,
         )
-
-        self.charges = np.array(
+        charges_per_type_code = np.array(
             [
                 (
                     site.atom_type.__dict__["charge_"].to("C")
                     / u.elementary_charge
                 ).to_value("(dimensionless)")
-                for site in self.topology_selection.sites
-            ]
+                for site in self.site_table["first_site_of_type_code"]
+            ],
+            dtype=float,
+        )
+        self.masses = masses_per_type_code[type_codes]
+        self.charges = charges_per_type_code[type_codes]
+
+        types_per_type_code = [
+            f"{site_res_type_i[0]}_{site_res_type_i[2]}"
+            for site_res_type_i in self.site_table["type_keys"]
+        ]
+        classes_per_type_code = [
+            f"{site_res_type_i[0]}_{site_res_type_i[1]}"
+            for site_res_type_i in self.site_table["type_keys"]
+        ]
+        self.mass_atom_type_dict = dict(
+            zip(types_per_type_code, masses_per_type_code.tolist())
+        )
+        self.mass_atom_class_dict = dict(
+            zip(classes_per_type_code, masses_per_type_code.tolist())
         )
         self.charges_atom_type_dict = dict(
-            [
-                (atom_type, charge)
-                for atom_type, charge in zip(self.types, self.charges)
-            ]
+            zip(types_per_type_code, charges_per_type_code.tolist())
         )
         self.charges_atom_class_dict = dict(
-            [
-                (atom_class, charge)
-                for atom_class, charge in zip(self.classes, self.charges)
-            ]
+            zip(classes_per_type_code, charges_per_type_code.tolist())
         )
 
+        self.site_table["masses"] = self.masses
+        self.site_table["charges"] = self.charges
+
+        # Check if the box 0's, box 1's, and box 0 and 1's charges sum to zero
+        if self.structure_box_1:
+            charge_check_slices_list = [
+                ["structure_box_0", self.site_table["box_site_slices"][0]],
+                ["structure_box_1", self.site_table["box_site_slices"][1]],
+                ["structure_0_and_1", slice(None)],
+            ]
+        else:
+            charge_check_slices_list = [
+                ["structure_box_0", self.site_table["box_site_slices"][0]],
+            ]
+        for structure_name_iter, site_slice_iter in charge_check_slices_list:
+            charges_iter = self.charges[site_slice_iter]
+            if len(charges_iter) != 0:
+                total_charge_iter = float(np.sum(charges_iter))
+                if round(total_charge_iter, 6) != 0.0:
+                    warn(
+                        "System is not charge neutral for {}. "
+                        "Total charge is {}.".format(
+                            structure_name_iter, total_charge_iter
+                        )
+                    )
+
         # normalize by sigma
         self.box_0 = Box(
             lengths=self.topology_box_0_ff.box.lengths,
@@ -2211,7 +3494,7 @@ class Charmm:
         # need to add only the residue name
         residues_all_list = [
             site.__dict__["residue_name_"]
-            for site in self.topology_selection.sites
+            for site in self._topology_selection.sites
         ]
 
         # Non-Bonded forces
@@ -2299,7 +3582,7 @@ class Charmm:
                 * self.atom_type_experssion_and_scalar_combined[
                     f'{site.__dict__["residue_name_"]}_{site.atom_type.__dict__["name_"]}'
                 ]["expression_scalar"]
-                for site in self.topology_selection.sites
+                for site in self._topology_selection.sites
             ]
         )
         self.epsilon_kcal_per_mol_atom_class_dict = dict(
@@ -2324,7 +3607,7 @@ class Charmm:
             # Therefore, we check if m=6 for all, and if not this writer will fail
             self.mie_m_required_value = 6
 
-            for site in self.topology_selection.sites:
+            for site in self._topology_selection.sites:
                 atom_type_residue_iter = f"{site.__dict__['residue_name_']}_{site.atom_type.__dict__['name_']}"
                 nonbonded_expresseion_iter = (
                     self.atom_type_experssion_and_scalar_combined[
@@ -2381,7 +3664,7 @@ class Charmm:
         # get the sigma values for the LJ and Mie forms calculate sigmas based on FF type
         sigmas_angstrom = []
         if self.utilized_NB_expression in ["LJ", "Mie"]:
-            for site in self.topology_selection.sites:
+            for site in self._topology_selection.sites:
                 sigmas_angstrom.append(
                     site.atom_type.parameters["sigma"].to("angstrom").to_value()
                 )
@@ -2402,7 +3685,7 @@ class Charmm:
 
         # get the sigma values for the Exp6 forms calculate sigmas based on FF type
         elif self.utilized_NB_expression in ["Exp6"]:
-            for site in self.topology_selection.sites:
+            for site in self._topology_selection.sites:
                 atom_type_residue_iter = f"{site.__dict__['residue_name_']}_{site.atom_type.__dict__['name_']}"
                 nonbonded_expresseion_iter = (
                     self.atom_type_experssion_and_scalar_combined[
@@ -2416,7 +3699,7 @@ class Charmm:
                     site.atom_type.parameters["alpha"]
                     .to("dimensionless")
                     .to_value()
-                    for site in self.topology_selection.sites
+                    for site in self._topology_selection.sites
                 ]
             )
             self.exp6_alpha_atom_class_dict = dict(
@@ -2438,7 +3721,7 @@ class Charmm:
             exp6_r_min_angstrom = np.array(
                 [
                     site.atom_type.parameters["Rmin"].to("angstrom").to_value()
-                    for site in self.topology_selection.sites
+                    for site in self._topology_selection.sites
                 ]
             )
 
@@ -2457,49 +3740,48 @@ class Charmm:
                 ]
             )
 
-            # Get the Exp6 sigma atom_class_dict by looping the other atom_class_dict dictionaries.
-            # Use the Exp6 alpha and Rmin values to numerically convert Rmin --> Sigma.
-            # There is no analytical conversion.
-            self.sigma_angstrom_atom_class_dict = {}
-            for (
-                exp6_key,
-                exp6_value,
-            ) in self.exp6_r_min_angstrom_atom_class_dict.items():
-                r_min_exp6_iter = exp6_value
-
-                # get the corresponding alpha for Exp6
-                alpha_exp6_iter = self.exp6_alpha_atom_class_dict[exp6_key]
-
-                # use scipy to numerically solve for sigma for atom class dict
-                exp6_sigma_iter = _Exp6_Rmin_to_sigma_solver(
-                    r_min_exp6_iter, alpha_exp6_iter
-                )
-
-                self.sigma_angstrom_atom_class_dict.update(
-                    {exp6_key: exp6_sigma_iter}
-                )
-
-            # Get the Exp6 sigma atom_type_dict by looping the other atom_type_dict dictionaries.
+            # Get the Exp6 sigma atom_class_dict and atom_type_dict from the other
+            # atom_class_dict and atom_type_dict dictionaries.
             # Use the Exp6 alpha and Rmin values to numerically convert Rmin --> Sigma.
-            # There is no analytical conversion.
-            self.sigma_angstrom_atom_type_dict = {}
-            for (
-                exp6_key,
-                exp6_value,
-            ) in self.exp6_r_min_angstrom_atom_type_dict.items():
-                r_min_exp6_iter = exp6_value
-
-                # get the corresponding alpha for Exp6
-                alpha_exp6_iter = self.exp6_alpha_atom_type_dict[exp6_key]
+            # There is no analytical conversion, so all the values are solved together,
+            # and each unique (Rmin, alpha) pair is only solved once.
+            exp6_atom_classes_list = list(
+                self.exp6_r_min_angstrom_atom_class_dict.keys()
+            )
+            exp6_atom_types_list = list(
+                self.exp6_r_min_angstrom_atom_type_dict.keys()
+            )
+            exp6_sigma_array = _Exp6_Rmin_to_sigma_solver_array(
+                [
+                    self.exp6_r_min_angstrom_atom_class_dict[exp6_key]
+                    for exp6_key in exp6_atom_classes_list
+                ]
+                + [
+                    self.exp6_r_min_angstrom_atom_type_dict[exp6_key]
+                    for exp6_key in exp6_atom_types_list
+                ],
+                [
+                    self.exp6_alpha_atom_class_dict[exp6_key]
+                    for exp6_key in exp6_atom_classes_list
+                ]
+                + [
+                    self.exp6_alpha_atom_type_dict[exp6_key]
+                    for exp6_key in exp6_atom_types_list
+                ],
+            )
 
-                # use scipy to numerically solve for sigma for atom type dict
-                exp6_sigma_iter = _Exp6_Rmin_to_sigma_solver(
-                    r_min_exp6_iter, alpha_exp6_iter
+            self.sigma_angstrom_atom_class_dict = dict(
+                zip(
+                    exp6_atom_classes_list,
+                    exp6_sigma_array[: len(exp6_atom_classes_list)],
                 )
-
-                self.sigma_angstrom_atom_type_dict.update(
-                    {exp6_key: exp6_sigma_iter}
+            )
+            self.sigma_angstrom_atom_type_dict = dict(
+                zip(
+                    exp6_atom_types_list,
+                    exp6_sigma_array[len(exp6_atom_classes_list) :],
                 )
+            )
 
         # Determine if we can use MOSDEF (foyer/gmso) atom classes or traditional CHARMM atom types,
         # instead of using MOSDEF (foyer/gmso) atom names.  MOSDEF (foyer/gmso) atom names usages for the
@@ -2924,17 +4206,20 @@ class Charmm:
             stuct_only_iteration = stuct_only[q_i]
 
             # caluculate the atom name and unique atom names
-            residue_names_list = []
-            residue_id_list = []
+            box_site_slice_iter = self.site_table["box_site_slices"][q_i]
+            residue_names_list = [
+                self.site_table["residue_names"][residue_code_i]
+                for residue_code_i in self.site_table["residue_name_codes"][
+                    box_site_slice_iter
+                ]
+            ]
+            residue_id_list = self.site_table["residue_ids"][
+                box_site_slice_iter
+            ].tolist()
             res_no_chain_iter_corrected_list = []
             segment_id_list = []
             segment_id_iter = 0  # starts at 0 as it adds 1 the first iter (being 0 -> A for 1st iteration)
-            for site in stuct_only_iteration.sites:
-                residue_names_list.append(site.__dict__["residue_name_"])
-
-                residue_id_list_iter = site.__dict__["residue_number_"]
-                residue_id_list.append(residue_id_list_iter)
-
+            for residue_id_list_iter in residue_id_list:
                 res_id_adder = int(
                     (residue_id_list_iter % self.max_residue_no)
                     % self.max_residue_no
@@ -3016,17 +4301,9 @@ class Charmm:
         else:
             self.all_res_unique_atom_name_dict = {}
             for res_i in range(0, len(self.all_individual_atom_names_list)):
-                if self.all_res_unique_atom_name_dict in list(
-                    self.all_res_unique_atom_name_dict.keys()
-                ):
-                    self.all_res_unique_atom_name_dict.setdefault(
-                        self.all_residue_names_list[res_i], set()
-                    ).add(self.all_individual_atom_names_list[res_i])
-
-                else:
-                    self.all_res_unique_atom_name_dict.setdefault(
-                        self.all_residue_names_list[res_i], set()
-                    ).add(self.all_individual_atom_names_list[res_i])
+                self.all_res_unique_atom_name_dict.setdefault(
+                    self.all_residue_names_list[res_i], set()
+                ).add(self.all_individual_atom_names_list[res_i])
 
         print(
             "all_res_unique_atom_name_dict = {}".format(
@@ -3034,9 +4311,146 @@ class Charmm:
             )
         )
 
-    def write_inp(self):
+    @property
+    def topology_box_0_and_1_ff(self):
+        """The combined box 0 and box 1 gmso.Topology, which is built when it is first accessed.
+
+        The Charmm writers use a merged view of the box 0 and box 1 topologies
+        instead, which does not copy their sites and connections.
+        """
+        if not self.structure_box_1:
+            raise AttributeError(
+                "The topology_box_0_and_1_ff only exists if the box 1 structure "
+                "(structure_box_1) is provided."
+            )
+
+        if getattr(self, "_topology_box_0_and_1_ff", None) is None:
+            # combine the topologies of box 0 and 1
+            topology_box_0_and_1_ff = gmso.Topology()
+            # iterate thru sites to combine the topologies of box 0 and 1
+            for site_i in self.topology_box_0_ff.sites:
+                topology_box_0_and_1_ff.add_site(site_i)
+            for site_i in self.topology_box_1_ff.sites:
+                topology_box_0_and_1_ff.add_site(site_i)
+            # iterate thru connections (bonds, angles, dihedrals, and impropers) and add to empty topology
+            # to combine the topologyies of box 0 and 1
+            for connection_i in self.topology_box_0_ff.connections:
+                topology_box_0_and_1_ff.add_connection(connection_i)
+            for connection_i in self.topology_box_1_ff.connections:
+                topology_box_0_and_1_ff.add_connection(connection_i)
+
+            self._topology_box_0_and_1_ff = topology_box_0_and_1_ff
+
+        return self._topology_box_0_and_1_ff
+
+    @property
+    def topology_selection(self):
+        """The gmso.Topology with all the atoms in the box 0 or both boxes."""
+        if self.structure_box_1:
+            return self.topology_box_0_and_1_ff
+        else:
+            return self.topology_box_0_ff
+
+    def _build_site_table(self):
+        """Build the indexed site table, which is shared by the Charmm object and its writers.
+
+        All the sites in box 0, then box 1 (if it exists), are walked only once, and stored
+        as NumPy code arrays with hash-based lookup maps, in the same site order as
+        the topology_selection.
+
+        The self.site_table dict contains:
+
+        * 'residue_name_codes' : numpy.ndarray of int32, the residue name code of each site.
+        * 'residue_names' : list, the residue names, indexed by their code.
+        * 'residue_name_to_code' : dict, {residue_name: residue_name_code}.
+        * 'residue_ids' : numpy.ndarray of int64, the residue id (residue_number_) of each site.
+        * 'type_codes' : numpy.ndarray of int32, the type code of each site.
+        * 'type_keys' : list, the (residue_name, atom_class, atom_type_name) str tuples,
+          indexed by their type code.
+        * 'type_key_to_code' : dict, {(residue_name, atom_class, atom_type_name): type_code}.
+        * 'first_site_of_type_code' : list, the first site of each type code.
+        * 'box_site_slices' : list, the slice of the site arrays for each box.
+        * 'masses' and 'charges' : numpy.ndarray of float, the mass (amu) and charge
+          (elementary charge) of each site, which are added after they are calculated.
+        """
+        if self.structure_box_1:
+            list_of_topologies = [
+                self.topology_box_0_ff,
+                self.topology_box_1_ff,
+            ]
+        else:
+            list_of_topologies = [self.topology_box_0_ff]
+
+        residue_name_to_code_dict = {}
+        type_key_to_code_dict = {}
+        first_site_of_type_code_list = []
+        residue_name_codes_list = []
+        residue_ids_list = []
+        type_codes_list = []
+        box_site_slices_list = []
+        for topology_iter in list_of_topologies:
+            box_first_site_index = len(type_codes_list)
+            for site in topology_iter.sites:
+                residue_name_iter = site.__dict__["residue_name_"]
+                if residue_name_iter not in residue_name_to_code_dict:
+                    residue_name_to_code_dict[residue_name_iter] = len(
+                        residue_name_to_code_dict
+                    )
+
+                type_key_iter = (
+                    str(residue_name_iter),
+                    str(site.atom_type.__dict__["atomclass_"]),
+                    str(site.atom_type.__dict__["name_"]),
+                )
+                if type_key_iter not in type_key_to_code_dict:
+                    type_key_to_code_dict[type_key_iter] = len(
+                        type_key_to_code_dict
+                    )
+                    first_site_of_type_code_list.append(site)
+
+                residue_name_codes_list.append(
+                    residue_name_to_code_dict[residue_name_iter]
+                )
+                residue_ids_list.append(site.__dict__["residue_number_"])
+                type_codes_list.append(type_key_to_code_dict[type_key_iter])
+
+            box_site_slices_list.append(
+                slice(box_first_site_index, len(type_codes_list))
+            )
+
+        self.site_table = {
+            "residue_name_codes": np.array(
+                residue_name_codes_list, dtype=np.int32
+            ),
+            "residue_names": list(residue_name_to_code_dict.keys()),
+            "residue_name_to_code": residue_name_to_code_dict,
+            "residue_ids": np.array(residue_ids_list, dtype=np.int64),
+            "type_codes": np.array(type_codes_list, dtype=np.int32),
+            "type_keys": list(type_key_to_code_dict.keys()),
+            "type_key_to_code": type_key_to_code_dict,
+            "first_site_of_type_code": first_site_of_type_code_list,
+            "box_site_slices": box_site_slices_list,
+        }
+
+    def write_inp(
+        self,
+        dihedral_conversion_steps=5 * 10 ** (-3),
+        dihedral_conversion_tolerance=10 ** (-10),
+    ):
         """This write_inp function writes the Charmm style parameter (force field) file, which can be utilized
-        in the GOMC and NAMD engines."""
+        in the GOMC and NAMD engines.
+
+        Parameters
+        ----------
+        dihedral_conversion_steps: float, default=5 * 10 ** (-3)
+            The phi sample resolution (radians), which is used to check the error of the
+            input dihedrals (OPLS, RB, and periodic) converted to the periodic dihedrals.
+        dihedral_conversion_tolerance: float, default=10 ** (-10)
+            The maximum | (input dihedral calc) - (periodic dihedral calc) | (kcal/mol)
+            allowed before a warning is printed for the dihedral conversion.
+            The default tolerance is written as 10^(-10) in the INP file notes,
+            and any other tolerance is written as a formatted float (e.g., 1e-05).
+        """
         print("******************************")
         print("")
         print(
@@ -3064,29 +4478,22 @@ class Charmm:
             print("writing the GOMC force field file ")
             date_time = datetime.datetime.today()
 
-            residue_id_list = []
-            residue_names_list = []
-
-            if self.structure_box_1:
-                for k, site in enumerate(self.topology_box_0_ff.sites):
-                    residue_id_list.append(site.__dict__["residue_number_"])
-                    residue_names_list.append(site.__dict__["residue_name_"])
-
-                for k, site in enumerate(self.topology_box_1_ff.sites):
-                    residue_id_list.append(site.__dict__["residue_number_"])
-                    residue_names_list.append(site.__dict__["residue_name_"])
-
-            else:
-                for k, site in enumerate(self.topology_box_0_ff.sites):
-                    residue_id_list.append(site.__dict__["residue_number_"])
-                    residue_names_list.append(site.__dict__["residue_name_"])
-
-            for n in range(0, len(residue_names_list)):
-                if residue_names_list[n] not in self.residues:
-                    print("residue_names_list = " + str(residue_names_list))
-                    self.input_error = True
-                    print_error_message = "ERROR: Please specifiy all residues (residues) in a list"
-                    raise ValueError(print_error_message)
+            # check the unique residue names in the site table, not every site
+            residues_not_specified_list = [
+                residue_name_i
+                for residue_name_i in self.site_table["residue_names"]
+                if residue_name_i not in self.residues
+            ]
+            if len(residues_not_specified_list) != 0:
+                print(
+                    "residues not in the residues list = "
+                    + str(residues_not_specified_list)
+                )
+                self.input_error = True
+                print_error_message = (
+                    "ERROR: Please specifiy all residues (residues) in a list"
+                )
+                raise ValueError(print_error_message)
 
             # Start writing the force field (.inp) file
             with open(self.ff_filename, "w") as data:
@@ -3110,23 +4517,25 @@ class Charmm:
                     f", and non-bonded mixing rule = {self.combining_rule}\n\n"
                 )
                 data.write(
-                    "* {:15d} atoms\n".format(self.topology_selection.n_sites)
+                    "* {:15d} atoms\n".format(self._topology_selection.n_sites)
                 )
 
                 data.write(
-                    "* {:15d} bonds\n".format(self.topology_selection.n_bonds)
+                    "* {:15d} bonds\n".format(self._topology_selection.n_bonds)
                 )
                 data.write(
-                    "* {:15d} angles\n".format(self.topology_selection.n_angles)
+                    "* {:15d} angles\n".format(
+                        self._topology_selection.n_angles
+                    )
                 )
                 data.write(
                     "* {:15d} dihedrals\n".format(
-                        self.topology_selection.n_dihedrals
+                        self._topology_selection.n_dihedrals
                     )
                 )
                 data.write(
                     "* {:15d} impropers\n\n".format(
-                        self.topology_selection.n_impropers
+                        self._topology_selection.n_impropers
                     )
                 )
 
@@ -3140,6 +4549,7 @@ class Charmm:
                 )
                 atom_mass_decimals_round = 4
                 atom_mass_list = []
+                atom_mass_registry_dict = {}
                 for atom_type, mass in self.mass_atom_type_dict.items():
                     atom_mass_list.append(
                         [
@@ -3154,29 +4564,16 @@ class Charmm:
                     )
 
                     # check for duplicates, for duplicate class or atom type
-                    mass_same_count = 0  # Start at 0 (1 always found) count numbr of values that are the same
-                    for mass_check_i in range(0, len(atom_mass_list)):
-
-                        # check if atomclass or atomtype is the same
-                        if (
-                            atom_mass_list[-1][0]
-                            == atom_mass_list[mass_check_i][0]
-                        ):
-                            mass_same_count += 1
-
-                            # check if values are the same since atomclass or atomtype is the same
-                            if (
-                                atom_mass_list[-1][1]
-                                != atom_mass_list[mass_check_i][1]
-                            ):
-                                raise ValueError(
-                                    f"ERROR: The same atomclass or atomtype in the "
-                                    f"force field are have different {'mass'} values.\n"
-                                    f"{atom_mass_list[-1]} != {atom_mass_list[mass_check_i]} "
-                                )
+                    new_mass_entry = _register_parameter_entry(
+                        atom_mass_registry_dict,
+                        atom_mass_list[-1][0],
+                        atom_mass_list[-1],
+                        [1],
+                        "mass",
+                    )
 
-                    # Only print for 1 time so mass_same_count=1 (starts at 0)
-                    if mass_same_count == 1:
+                    # Only print the first entry for each atomclass or atomtype
+                    if new_mass_entry:
                         mass_format = "* {:15s} {:15s} ! {:25s}\n"
                         data.write(
                             mass_format.format(
@@ -3187,7 +4584,7 @@ class Charmm:
                         )
 
                 # Bond coefficients
-                if len(self.topology_selection.bond_types) > 0:
+                if len(self._topology_selection.bond_types) > 0:
                     data.write("\n")
                     data.write("BONDS * harmonic\n")
                     data.write("! \n")
@@ -3217,6 +4614,7 @@ class Charmm:
                     bond_distance_round_decimals = 6
 
                     bond_values_list = []
+                    bond_registry_dict = {}
                     for bond_type_x in self.combinded_residue_bond_types:
                         res_x = bond_type_x.__dict__["tags_"]["resname"]
                         bond_members_iter = bond_type_x.member_types
@@ -3322,38 +4720,17 @@ class Charmm:
                             )
 
                         # check for duplicates, for duplicate class or atom type
-                        bond_same_count = 0  # Start at 0 (1 always found) count numbr of values that are the same
-                        for bond_check_i in range(0, len(bond_values_list)):
-
-                            # check if atomclass or atomtype is the same (check regular and reverse bond order)
-                            if (
-                                bond_values_list[-1][0]
-                                == bond_values_list[bond_check_i][0]
-                                and bond_values_list[-1][1]
-                                == bond_values_list[bond_check_i][1]
-                            ) or (
-                                bond_values_list[-1][0]
-                                == bond_values_list[bond_check_i][1]
-                                and bond_values_list[-1][1]
-                                == bond_values_list[bond_check_i][0]
-                            ):
-                                bond_same_count += 1
-
-                                # check if values are the same since atomclass or atomtype is the same
-                                if (
-                                    bond_values_list[-1][2]
-                                    != bond_values_list[bond_check_i][2]
-                                    or bond_values_list[-1][3]
-                                    != bond_values_list[bond_check_i][3]
-                                ):
-                                    raise ValueError(
-                                        f"ERROR: The same atomclass or atomtype in the "
-                                        f"force field are have different {'bond'} values.\n"
-                                        f"{bond_values_list[-1]} != {bond_values_list[bond_check_i]} "
-                                    )
+                        # (the regular and reverse bond order have the same key)
+                        new_bond_entry = _register_parameter_entry(
+                            bond_registry_dict,
+                            tuple(sorted(bond_values_list[-1][0:2])),
+                            bond_values_list[-1],
+                            [2, 3],
+                            "bond",
+                        )
 
-                        # Only print for 1 time so bond_same_count=1 (starts at 0)
-                        if bond_same_count == 1:
+                        # Only print the first entry for each atomclass or atomtype
+                        if new_bond_entry:
                             bond_format = (
                                 "{:10s} {:10s} {:15s} {:15s} ! {:20s} {:20s}\n"
                             )
@@ -3369,7 +4746,7 @@ class Charmm:
                             )
 
                 # Angle coefficients
-                if len(self.topology_selection.angle_types):
+                if len(self._topology_selection.angle_types):
                     data.write("\nANGLES * harmonic\n")
                     data.write("! \n")
                     data.write("! V(angle) = Ktheta(Theta - Theta0)**2\n")
@@ -3402,6 +4779,7 @@ class Charmm:
                     angle_k_Kelvin_round_decimals = 4
                     angle_degree_round_decimals = 6
                     angle_values_list = []
+                    angle_registry_dict = {}
                     for angle_type_x in self.combinded_residue_angle_types:
                         res_x = angle_type_x.__dict__["tags_"]["resname"]
                         angle_members_iter = angle_type_x.member_types
@@ -3519,43 +4897,25 @@ class Charmm:
                             )
 
                         # check for duplicates, for duplicate class or atom type
-                        angle_same_count = 0  # Start at 0 (1 always found) count numbr of values that are the same
-                        for angle_check_i in range(0, len(angle_values_list)):
-
-                            # check if atomclass or atomtype is the same (check regular and reverse angle order)
-                            if angle_values_list[-1][1] == angle_values_list[
-                                angle_check_i
-                            ][1] and (
-                                (
-                                    angle_values_list[-1][0]
-                                    == angle_values_list[angle_check_i][0]
-                                    and angle_values_list[-1][2]
-                                    == angle_values_list[angle_check_i][2]
-                                )
-                                or (
-                                    angle_values_list[-1][0]
-                                    == angle_values_list[angle_check_i][2]
-                                    and angle_values_list[-1][2]
-                                    == angle_values_list[angle_check_i][0]
+                        # (the regular and reverse angle order have the same key)
+                        new_angle_entry = _register_parameter_entry(
+                            angle_registry_dict,
+                            (angle_values_list[-1][1],)
+                            + tuple(
+                                sorted(
+                                    [
+                                        angle_values_list[-1][0],
+                                        angle_values_list[-1][2],
+                                    ]
                                 )
-                            ):
-                                angle_same_count += 1
-
-                                # check if values are the same since atomclass or atomtype is the same
-                                if (
-                                    angle_values_list[-1][3]
-                                    != angle_values_list[angle_check_i][3]
-                                    or angle_values_list[-1][4]
-                                    != angle_values_list[angle_check_i][4]
-                                ):
-                                    raise ValueError(
-                                        f"ERROR: The same atomclass or atomtype in the "
-                                        f"force field are have different {'angle'} values.\n"
-                                        f"{angle_values_list[-1]} != {angle_values_list[angle_check_i]} "
-                                    )
+                            ),
+                            angle_values_list[-1],
+                            [3, 4],
+                            "angle",
+                        )
 
-                        # Only print for 1 time so angle_same_count=1 (starts at 0)
-                        if angle_same_count == 1:
+                        # Only print the first entry for each atomclass or atomtype
+                        if new_angle_entry:
                             angle_format = "{:10s} {:10s} {:10s} {:15s} {:15s} ! {:20s} {:20s} {:20s}\n"
                             data.write(
                                 angle_format.format(
@@ -3571,15 +4931,7 @@ class Charmm:
                             )
 
                 # Dihedral coefficients
-                if len(self.topology_selection.dihedral_types):
-                    list_if_large_error_dihedral_overall = []
-
-                    list_if_largest_error_abs_values_for_dihedral_overall = []
-                    list_dihedral_overall_error = []
-
-                    list_if_abs_max_values_for_dihedral_overall = []
-                    list_dihedral_atoms_all_dihedral_overall = []
-
+                if len(self._topology_selection.dihedral_types):
                     if self.utilized_NB_expression in ["LJ"]:
                         data.write("\nDIHEDRALS * CHARMM\n")
                     elif self.utilized_NB_expression in ["Mie"]:
@@ -3624,15 +4976,18 @@ class Charmm:
                 dihedral_k_Kelvin_round_decimals = 4
                 dihedral_phase_degree_round_decimals = 6
 
-                no_pi = np.pi
-                dihedral_steps = 5 * 10 ** (-3)
-                dihedral_range = 2 * no_pi
-                dihedral_no_steps = int(dihedral_range / dihedral_steps) + 1
+                # the input dihedral and converted periodic dihedral values,
+                # which are all compared at once after the dihedrals are written
+                dihedral_conversion_type_str_list = []
+                dihedral_conversion_input_list = []
+                dihedral_conversion_K_n_d_list = []
 
-                dihedral_values_list = []
+                # get the input dihedral form of each dihedral type first, so the
+                # OPLS and RB dihedrals are unit converted (once per parameter and
+                # unit) and converted to the periodic dihedrals in bulk
+                dihedral_form_list = []
                 for dihedral_type_x in self.combinded_residue_dihedral_types:
                     res_x = dihedral_type_x.__dict__["tags_"]["resname"]
-                    dihedral_members_iter = dihedral_type_x.member_types
 
                     dihedral_type_str_iter = None
                     dihedral_eqn_scalar_iter = None
@@ -3754,89 +5109,114 @@ class Charmm:
                             f"{'RyckaertBellemansTorsionPotential'}."
                         )
 
-                    # convert dihedral to Periodic style
-                    if dihedral_type_str_iter == "OPLSTorsionPotential":
-                        f0 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["k0"].to_value(
-                                "kcal/mol", equivalence="thermal"
-                            )
-                        )
-                        f1 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["k1"].to_value(
-                                "kcal/mol", equivalence="thermal"
-                            )
-                        )
-                        f2 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["k2"].to_value(
-                                "kcal/mol", equivalence="thermal"
-                            )
-                        )
-                        f3 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["k3"].to_value(
-                                "kcal/mol", equivalence="thermal"
-                            )
-                        )
-                        f4 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["k4"].to_value(
-                                "kcal/mol", equivalence="thermal"
-                            )
-                        )
+                    dihedral_form_list.append(
+                        [dihedral_type_str_iter, dihedral_eqn_scalar_iter]
+                    )
 
-                        [
-                            [K0, n0, d0],
-                            [K1, n1, d1],
-                            [K2, n2, d2],
-                            [K3, n3, d3],
-                            [K4, n4, d4],
-                            [K5, n5, d5],
-                        ] = OPLS_to_periodic(f0, f1, f2, f3, f4)
+                dihedral_input_coefficients_dict = {}
+                dihedral_periodic_K_n_d_dict = {}
+                for [
+                    dihedral_form_j,
+                    parameter_names_j,
+                    to_periodic_array_function_j,
+                ] in [
+                    [
+                        "OPLSTorsionPotential",
+                        ["k0", "k1", "k2", "k3", "k4"],
+                        OPLS_to_periodic_array,
+                    ],
+                    [
+                        "RyckaertBellemansTorsionPotential",
+                        ["c0", "c1", "c2", "c3", "c4", "c5"],
+                        RB_to_periodic_array,
+                    ],
+                ]:
+                    form_indices_j = [
+                        index_i
+                        for index_i, form_i in enumerate(dihedral_form_list)
+                        if form_i[0] == dihedral_form_j
+                    ]
+                    if len(form_indices_j) == 0:
+                        continue
 
-                    elif (
-                        dihedral_type_str_iter
-                        == "RyckaertBellemansTorsionPotential"
-                    ):
-                        c0 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["c0"].to_value(
-                                "kcal/mol", equivalence="thermal"
-                            )
-                        )
-                        c1 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["c1"].to_value(
-                                "kcal/mol", equivalence="thermal"
-                            )
-                        )
-                        c2 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["c2"].to_value(
-                                "kcal/mol", equivalence="thermal"
-                            )
-                        )
-                        c3 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["c3"].to_value(
-                                "kcal/mol", equivalence="thermal"
-                            )
-                        )
-                        c4 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["c4"].to_value(
-                                "kcal/mol", equivalence="thermal"
+                    form_scalars_j = np.array(
+                        [
+                            dihedral_form_list[index_i][1]
+                            for index_i in form_indices_j
+                        ]
+                    )
+                    input_coefficients_j = np.stack(
+                        [
+                            form_scalars_j
+                            * _unyt_quantities_to_value(
+                                [
+                                    self.combinded_residue_dihedral_types[
+                                        index_i
+                                    ].parameters[parameter_name_k]
+                                    for index_i in form_indices_j
+                                ],
+                                "kcal/mol",
+                                equivalence="thermal",
                             )
+                            for parameter_name_k in parameter_names_j
+                        ],
+                        axis=1,
+                    )
+                    periodic_K_n_d_j = to_periodic_array_function_j(
+                        input_coefficients_j
+                    )
+                    for row_k, index_i in enumerate(form_indices_j):
+                        dihedral_input_coefficients_dict[index_i] = (
+                            input_coefficients_j[row_k].tolist()
                         )
-                        c5 = (
-                            dihedral_eqn_scalar_iter
-                            * dihedral_type_x.parameters["c5"].to_value(
-                                "kcal/mol", equivalence="thermal"
-                            )
+                        dihedral_periodic_K_n_d_dict[index_i] = (
+                            periodic_K_n_d_j[row_k]
                         )
 
+                dihedral_values_list = []
+                dihedral_registry_dict = {}
+                for dihedral_index_x, dihedral_type_x in enumerate(
+                    self.combinded_residue_dihedral_types
+                ):
+                    res_x = dihedral_type_x.__dict__["tags_"]["resname"]
+                    dihedral_members_iter = dihedral_type_x.member_types
+
+                    # convert dihedral to Periodic style
+                    [
+                        dihedral_type_str_iter,
+                        dihedral_eqn_scalar_iter,
+                    ] = dihedral_form_list[dihedral_index_x]
+                    if dihedral_type_str_iter == "OPLSTorsionPotential":
+                        [
+                            f0,
+                            f1,
+                            f2,
+                            f3,
+                            f4,
+                        ] = dihedral_input_coefficients_dict[dihedral_index_x]
+
+                        [
+                            [K0, n0, d0],
+                            [K1, n1, d1],
+                            [K2, n2, d2],
+                            [K3, n3, d3],
+                            [K4, n4, d4],
+                            [K5, n5, d5],
+                        ] = dihedral_periodic_K_n_d_dict[dihedral_index_x]
+
+                    elif (
+                        dihedral_type_str_iter
+                        == "RyckaertBellemansTorsionPotential"
+                    ):
+                        [
+                            c0,
+                            c1,
+                            c2,
+                            c3,
+                            c4,
+                            c5,
+                        ] = dihedral_input_coefficients_dict[dihedral_index_x]
+
                         [
                             [K0, n0, d0],
                             [K1, n1, d1],
@@ -3844,7 +5224,7 @@ class Charmm:
                             [K3, n3, d3],
                             [K4, n4, d4],
                             [K5, n5, d5],
-                        ] = RB_to_periodic(c0, c1, c2, c3, c4, c5)
+                        ] = dihedral_periodic_K_n_d_dict[dihedral_index_x]
 
                     elif dihedral_type_str_iter == "PeriodicTorsionPotential":
                         # get the number of periodic dihedral
@@ -4041,97 +5421,33 @@ class Charmm:
                                 n5 = nx_dihedral_iter
                                 d5 = phi_eqx_dihedral_iter
 
-                    # test dihedral conversion for errors
-                    input_dihedral_to_periodic_abs_diff = []
-                    for i in range(0, dihedral_no_steps + 1):
-                        phi = i * dihedral_steps
-                        psi = phi - no_pi
-
-                        # calulate the periodic dihedral (PeriodicTorsionPotential)
-                        periodic_dihedral_calc = (
-                            K0 * (1 + np.cos(n0 * phi - d0 * no_pi / 180))
-                            + K1 * (1 + np.cos(n1 * phi - d1 * no_pi / 180))
-                            + K2 * (1 + np.cos(n2 * phi - d2 * no_pi / 180))
-                            + K3 * (1 + np.cos(n3 * phi - d3 * no_pi / 180))
-                            + K4 * (1 + np.cos(n4 * phi - d4 * no_pi / 180))
-                            + K5 * (1 + np.cos(n5 * phi - d5 * no_pi / 180))
-                        )
-
-                        if dihedral_type_str_iter == "OPLSTorsionPotential":
-                            input_dihedral_calc = (
-                                f0 / 2
-                                + f1 / 2 * (1 + np.cos(1 * phi))
-                                + f2 / 2 * (1 - np.cos(2 * phi))
-                                + f3 / 2 * (1 + np.cos(3 * phi))
-                                + f4 / 2 * (1 - np.cos(4 * phi))
-                            )
-
-                        elif (
-                            dihedral_type_str_iter
-                            == "RyckaertBellemansTorsionPotential"
-                        ):
-                            input_dihedral_calc = (
-                                c0
-                                + c1 * np.cos(psi) ** 1
-                                + c2 * np.cos(psi) ** 2
-                                + c3 * np.cos(psi) ** 3
-                                + c4 * np.cos(psi) ** 4
-                                + c5 * np.cos(psi) ** 5
-                            )
-
-                        elif (
-                            dihedral_type_str_iter == "PeriodicTorsionPotential"
-                        ):
-                            input_dihedral_calc = (
-                                K0 * (1 + np.cos(0 * phi - d0 * no_pi / 180))
-                                + K1 * (1 + np.cos(1 * phi - d1 * no_pi / 180))
-                                + K2 * (1 + np.cos(2 * phi - d2 * no_pi / 180))
-                                + K3 * (1 + np.cos(3 * phi - d3 * no_pi / 180))
-                                + K4 * (1 + np.cos(4 * phi - d4 * no_pi / 180))
-                                + K5 * (1 + np.cos(5 * phi - d5 * no_pi / 180))
-                            )
-
-                        input_to_periodic_absolute_difference = np.absolute(
-                            input_dihedral_calc - periodic_dihedral_calc
+                    # collect the values to test the dihedral conversion for errors
+                    dihedral_conversion_type_str_list.append(
+                        dihedral_type_str_iter
+                    )
+                    if dihedral_type_str_iter == "OPLSTorsionPotential":
+                        dihedral_conversion_input_list.append(
+                            [f0, f1, f2, f3, f4]
                         )
-
-                        input_dihedral_to_periodic_abs_diff.append(
-                            input_to_periodic_absolute_difference
+                    elif (
+                        dihedral_type_str_iter
+                        == "RyckaertBellemansTorsionPotential"
+                    ):
+                        dihedral_conversion_input_list.append(
+                            [c0, c1, c2, c3, c4, c5]
                         )
-                        list_if_large_error_dihedral_iteration = []
-                        list_abs_max_dihedral_iteration = []
-
-                        if max(input_dihedral_to_periodic_abs_diff) > 10 ** (
-                            -10
-                        ):
-                            list_if_large_error_dihedral_iteration.append(1)
-                            list_abs_max_dihedral_iteration.append(
-                                max(input_dihedral_to_periodic_abs_diff)
-                            )
-
-                            list_if_large_error_dihedral_overall.append(1)
-                            list_if_largest_error_abs_values_for_dihedral_overall.append(
-                                max(input_dihedral_to_periodic_abs_diff)
-                            )
-
-                            list_dihedral_overall_error.append(
-                                f"{res_x}_{dihedral_members_iter[0]}, "
-                                f"{res_x}_{dihedral_members_iter[1]}, "
-                                f"{res_x}_{dihedral_members_iter[2]}, "
-                                f"{res_x}_{dihedral_members_iter[3]}, "
-                            )
-
-                        else:
-                            list_if_large_error_dihedral_iteration.append(0)
-                            list_if_abs_max_values_for_dihedral_overall.append(
-                                max(input_dihedral_to_periodic_abs_diff)
-                            )
-                            list_dihedral_atoms_all_dihedral_overall.append(
-                                f"{res_x}_{dihedral_members_iter[0]}, "
-                                f"{res_x}_{dihedral_members_iter[1]}, "
-                                f"{res_x}_{dihedral_members_iter[2]}, "
-                                f"{res_x}_{dihedral_members_iter[3]}, "
-                            )
+                    else:
+                        dihedral_conversion_input_list.append(None)
+                    dihedral_conversion_K_n_d_list.append(
+                        [
+                            [K0, n0, d0],
+                            [K1, n1, d1],
+                            [K2, n2, d2],
+                            [K3, n3, d3],
+                            [K4, n4, d4],
+                            [K5, n5, d5],
+                        ]
+                    )
 
                     if self.utilized_NB_expression == "LJ":
                         # K0_output_energy_iter in LJ CHARMM format is only a harmonic dihedral,
@@ -4329,59 +5645,26 @@ class Charmm:
                     )
 
                     # check for duplicates, for duplicate class or atom type
-                    dihedral_same_count = 0  # Start at 0 (1 always found) count numbr of values that are the same
-                    for dihedral_check_i in range(0, len(dihedral_values_list)):
-                        # check if atomclass or atomtype is the same (check regular and reverse angle order)
-                        if (
-                            dihedral_values_list[-1][0][0]
-                            == dihedral_values_list[dihedral_check_i][0][0]
-                            and dihedral_values_list[-1][0][1]
-                            == dihedral_values_list[dihedral_check_i][0][1]
-                            and dihedral_values_list[-1][0][2]
-                            == dihedral_values_list[dihedral_check_i][0][2]
-                            and dihedral_values_list[-1][0][3]
-                            == dihedral_values_list[dihedral_check_i][0][3]
-                        ) or (
-                            dihedral_values_list[-1][0][0]
-                            == dihedral_values_list[dihedral_check_i][0][3]
-                            and dihedral_values_list[-1][0][1]
-                            == dihedral_values_list[dihedral_check_i][0][2]
-                            and dihedral_values_list[-1][0][2]
-                            == dihedral_values_list[dihedral_check_i][0][1]
-                            and dihedral_values_list[-1][0][3]
-                            == dihedral_values_list[dihedral_check_i][0][0]
-                        ):
-                            dihedral_same_count += 1
-
-                            # check if values are the same since atomclass or atomtype is the same
-                            max_k_value_used_int = len(dihedral_values_list[-1])
-                            for k_v_i in range(0, max_k_value_used_int):
-                                if (
-                                    dihedral_values_list[-1][k_v_i][4]
-                                    != dihedral_values_list[dihedral_check_i][
-                                        k_v_i
-                                    ][4]
-                                    or dihedral_values_list[-1][k_v_i][5]
-                                    != dihedral_values_list[dihedral_check_i][
-                                        k_v_i
-                                    ][5]
-                                    or dihedral_values_list[-1][k_v_i][6]
-                                    != dihedral_values_list[dihedral_check_i][
-                                        k_v_i
-                                    ][6]
-                                ):
-                                    raise ValueError(
-                                        f"ERROR: The same atomclass or atomtype in the "
-                                        f"force field are have different {'dihedral'} values.\n"
-                                        f"{dihedral_values_list[-1][k_v_i]} != {dihedral_values_list[dihedral_check_i][k_v_i]}."
-                                    )
+                    # (the regular and reverse dihedral order have the same key)
+                    dihedral_key = min(
+                        tuple(dihedral_values_list[-1][0][0:4]),
+                        tuple(dihedral_values_list[-1][0][3::-1]),
+                    )
+                    new_dihedral_entry = _register_parameter_entry(
+                        dihedral_registry_dict,
+                        dihedral_key,
+                        dihedral_values_list[-1],
+                        [4, 5, 6],
+                        "dihedral",
+                        multi_row_entry=True,
+                    )
 
                     dihedral_format = (
                         "{:10s} {:10s} {:10s} {:10s} {:15s} {:10s} {:15s} "
                         "! {:20s} {:20s} {:20s} {:20s}\n"
                     )
-                    # Only print for 1 time so dihedral_count=1 (starts at 0)
-                    if dihedral_same_count == 1:
+                    # Only print the first entry for each atomclass or atomtype
+                    if new_dihedral_entry:
 
                         # write charmm dihedral K0 (zero order dihedral --- a constant) if Mie or Exp6,
                         # but not written for periodic as the K0 constant is defined as a
@@ -4501,37 +5784,53 @@ class Charmm:
                                 )
                             )
 
-                if len(self.topology_selection.dihedral_types):
-                    if sum(list_if_large_error_dihedral_overall) > 0:
-                        list_max_error_abs_dihedral_overall = max(
-                            list_if_largest_error_abs_values_for_dihedral_overall
+                if len(self._topology_selection.dihedral_types):
+                    # the max error of each dihedral type, from all types at once
+                    dihedral_max_abs_deviation_array = (
+                        _dihedral_to_periodic_max_abs_deviation(
+                            dihedral_conversion_type_str_list,
+                            dihedral_conversion_input_list,
+                            dihedral_conversion_K_n_d_list,
+                            dihedral_steps=dihedral_conversion_steps,
                         )
+                    )
+                    dihedral_max_abs_deviation = np.max(
+                        dihedral_max_abs_deviation_array
+                    )
+                    # the default tolerance keeps its original 10^(-10) wording
+                    if dihedral_conversion_tolerance == 10 ** (-10):
+                        dihedral_conversion_tolerance_str = "10^(-10)"
+                    else:
+                        dihedral_conversion_tolerance_str = (
+                            f"{dihedral_conversion_tolerance}"
+                        )
+                    if np.any(
+                        dihedral_max_abs_deviation_array
+                        > dihedral_conversion_tolerance
+                    ):
                         info_if_dihedral_error_too_large = (
                             f"! WARNING: The input dihedral type(s) to "
                             f"periodic dihedral conversion error"
-                            f" is to large [error > 10^(-10)] \n"
+                            f" is to large [error > {dihedral_conversion_tolerance_str}] \n"
                             f"! WARNING: Maximum( "
                             f"|(input dihedral calc)-(periodic dihedral calc)| ) =  "
-                            f"{list_max_error_abs_dihedral_overall}\n"
+                            f"{dihedral_max_abs_deviation}\n"
                         )
                         warn(info_if_dihedral_error_too_large)
                         data.write(info_if_dihedral_error_too_large)
                         print(info_if_dihedral_error_too_large)
                     else:
-                        list_if_abs_max_values_for_dihedral_overall_max = max(
-                            list_if_abs_max_values_for_dihedral_overall
-                        )
                         info_if_dihedral_error_ok = (
                             f"! The input dihedral to periodic dihedral conversion error is OK "
-                            f"[error <= 10^(-10)]\n"
+                            f"[error <= {dihedral_conversion_tolerance_str}]\n"
                             f"! Maximum( |(input dihedral calc)-(periodic dihedral calc)| ) =  "
-                            f"{list_if_abs_max_values_for_dihedral_overall_max}\n"
+                            f"{dihedral_max_abs_deviation}\n"
                         )
                         data.write(info_if_dihedral_error_ok)
                         print(info_if_dihedral_error_ok)
 
                 # Improper coefficients
-                if len(self.topology_selection.improper_types):
+                if len(self._topology_selection.improper_types):
                     if self.utilized_NB_expression in ["Mie", "Exp6"]:
                         print_error = f"ERROR: Currently, the Mie and Exp6 potentials do not support impropers."
                         raise ValueError(print_error)
@@ -4577,6 +5876,7 @@ class Charmm:
                 improper_phase_degree_round_decimals = 6
 
                 impr_periodic_val_list = []
+                improper_registry_dict = {}
                 for improper_type_x in self.combinded_residue_improper_types:
                     res_x = improper_type_x.__dict__["tags_"]["resname"]
                     improper_members_iter = improper_type_x.member_types
@@ -4952,68 +6252,24 @@ class Charmm:
                             )
 
                             # check for duplicates, for duplicate class or atom type
-                            improper_same_count = 0  # Start at 0 (1 always found) count numbr of values that are the same
-                            for improper_check_i in range(
-                                0, len(impr_periodic_val_list)
-                            ):
-
-                                # check if atomclass or atomtype is the same (check regular and reverse improper order)
-                                if (
-                                    impr_periodic_val_list[-1][0]
-                                    == impr_periodic_val_list[improper_check_i][
-                                        0
-                                    ]
-                                    and impr_periodic_val_list[-1][3]
-                                    == impr_periodic_val_list[improper_check_i][
-                                        3
-                                    ]
-                                    and impr_periodic_val_list[-1][5]
-                                    == impr_periodic_val_list[improper_check_i][
-                                        5
-                                    ]
-                                ) and (
-                                    (
-                                        impr_periodic_val_list[-1][1]
-                                        == impr_periodic_val_list[
-                                            improper_check_i
-                                        ][1]
-                                        and impr_periodic_val_list[-1][2]
-                                        == impr_periodic_val_list[
-                                            improper_check_i
-                                        ][2]
-                                    )
-                                    or (
-                                        impr_periodic_val_list[-1][1]
-                                        == impr_periodic_val_list[
-                                            improper_check_i
-                                        ][2]
-                                        and impr_periodic_val_list[-1][2]
-                                        == impr_periodic_val_list[
-                                            improper_check_i
-                                        ][1]
-                                    )
-                                ):
-                                    improper_same_count += 1
-
-                                    # check if values are the same since atomclass or atomtype is the same
-                                    if (
-                                        impr_periodic_val_list[-1][4]
-                                        != impr_periodic_val_list[
-                                            improper_check_i
-                                        ][4]
-                                        or impr_periodic_val_list[-1][6]
-                                        != impr_periodic_val_list[
-                                            improper_check_i
-                                        ][6]
-                                    ):
-                                        raise ValueError(
-                                            f"ERROR: The same atomclass or atomtype in the "
-                                            f"force field are have different {'improper'} values.\n"
-                                            f"{impr_periodic_val_list[-1]} != {impr_periodic_val_list[improper_check_i]} "
-                                        )
+                            # (the regular and reverse order of the 2 middle atoms have the same key)
+                            new_improper_entry = _register_parameter_entry(
+                                improper_registry_dict,
+                                (
+                                    impr_periodic_val_list[-1][0],
+                                    impr_periodic_val_list[-1][3],
+                                    impr_periodic_val_list[-1][5],
+                                )
+                                + tuple(
+                                    sorted(impr_periodic_val_list[-1][1:3])
+                                ),
+                                impr_periodic_val_list[-1],
+                                [4, 6],
+                                "improper",
+                            )
 
-                            # Only print for 1 time so improper_same_count=1 (starts at 0)
-                            if improper_same_count == 1:
+                            # Only print the first entry for each atomclass or atomtype
+                            if new_improper_entry:
                                 improper_format = (
                                     "{:10s} {:10s} {:10s} {:10s} {:15s} {:10s} {:15s} "
                                     "! {:20s} {:20s} {:20s} {:20s}\n"
@@ -5133,6 +6389,7 @@ class Charmm:
 
                 # write out the non-bonded portion
                 nb_val_list = []
+                nb_registry_dict = {}
                 for (
                     class_x,
                     epsilon_kcal_per_mol,
@@ -5284,35 +6541,16 @@ class Charmm:
                         )
 
                     # check for duplicates, for duplicate class or atom type
-                    nb_same_count = 0  # Start at 0 (1 always found) count numbr of values that are the same
-                    for nb_check_i in range(0, len(nb_val_list)):
-
-                        # check if atomclass or atomtype is the same
-                        if nb_val_list[-1][0] == nb_val_list[nb_check_i][0]:
-                            nb_same_count += 1
-
-                            # check if values are the same since atomclass or atomtype is the same
-                            if (
-                                nb_val_list[-1][1] != nb_val_list[nb_check_i][1]
-                                or nb_val_list[-1][2]
-                                != nb_val_list[nb_check_i][2]
-                                or nb_val_list[-1][3]
-                                != nb_val_list[nb_check_i][3]
-                                or nb_val_list[-1][4]
-                                != nb_val_list[nb_check_i][4]
-                                or nb_val_list[-1][5]
-                                != nb_val_list[nb_check_i][5]
-                                or nb_val_list[-1][6]
-                                != nb_val_list[nb_check_i][6]
-                            ):
-                                raise ValueError(
-                                    f"ERROR: The same atomclass or atomtype in the "
-                                    f"force field are have different {'non-bonded'} values.\n"
-                                    f"{nb_val_list[-1]} != {nb_val_list[nb_check_i]} "
-                                )
+                    new_nb_entry = _register_parameter_entry(
+                        nb_registry_dict,
+                        nb_val_list[-1][0],
+                        nb_val_list[-1],
+                        [1, 2, 3, 4, 5, 6],
+                        "non-bonded",
+                    )
 
-                    # Only print for 1 time so nb_same_count=1 (starts at 0)
-                    if nb_same_count == 1:
+                    # Only print the first entry for each atomclass or atomtype
+                    if new_nb_entry:
                         nb_format = "{:10s} {:15s} {:15s} {:15s} {:15s} {:15s} {:15s} ! {:20s} {:20s}\n"
                         data.write(
                             nb_format.format(
@@ -5337,9 +6575,29 @@ class Charmm:
         # **********************************
         # **********************************
 
-    def write_psf(self):
+    def write_psf(self, parallel=False, max_workers=None):
         """This write_psf function writes the Charmm style PSF (topology) file, which can be utilized
-        in the GOMC and NAMD engines."""
+        in the GOMC and NAMD engines.
+
+        Parameters
+        ----------
+        parallel: bool, default=False
+            If True, the box 0 and box 1 PSF file text is rendered concurrently
+            in a process pool, from the picklable site table data, and the
+            files are written by this process.
+            If False or there is only 1 box, the files are written serially.
+        max_workers: int or None, default=None
+            The maximum number of processes used when parallel=True.
+            If None, one process is used per box.
+        """
+        _run_writer_tasks(
+            self._psf_writer_tasks(),
+            parallel=parallel,
+            max_workers=max_workers,
+        )
+
+    def _psf_writer_tasks(self):
+        """Get the write_psf box writer tasks, [[function, args], ...], one per box."""
         # **********************************
         # **********************************
         # psf writer (start)
@@ -5375,303 +6633,135 @@ class Charmm:
             list_of_file_names = [self.filename_box_0]
             stuct_only = [self.topology_box_0_ff]
 
-        for q in range(0, len(list_of_topologies)):
-            stuct_iteration = list_of_topologies[q]
-            file_name_iteration = list_of_file_names[q]
-            output = str(file_name_iteration) + ".psf"
-            stuct_only_iteration = stuct_only[q]
-
-            no_atoms = stuct_iteration.n_sites
-            no_bonds = stuct_iteration.n_bonds
-            no_angles = stuct_iteration.n_angles
-
-            no_dihedrals = stuct_iteration.n_dihedrals
-            no_impropers = stuct_iteration.n_impropers
-
-            no_donors = 0
-            no_acceptors = 0
-            no_groups = 0
-            no_NNB = 0
-
-            # psf printing (start)
-
-            if q == 0:
-                residue_names_list_psf = self.residue_names_list_box_0
-                residue_id_list_psf = self.residue_id_list_box_0
-                res_no_chain_iter_corrected_list_psf = (
-                    self.res_no_chain_iter_corrected_list_box_0
-                )
-                segment_id_list_psf = self.segment_id_list_box_0
-
-            else:
-                residue_names_list_psf = self.residue_names_list_box_1
-                residue_id_list_psf = self.residue_id_list_box_1
-                res_no_chain_iter_corrected_list_psf = (
-                    self.res_no_chain_iter_corrected_list_box_1
-                )
-                segment_id_list_psf = self.segment_id_list_box_1
-
-            output_write = open(output, "w")
-
-            first_indent = "%8s"
-            psf_formating = (
-                "%8s %-4s %-4s %-4s %-4s %-6s %10.6f %13.4f" + 11 * " "
-            )
-
-            output_write.write("PSF ")
-            output_write.write("\n\n")
-
-            no_of_remarks = 3
-            output_write.write(first_indent % no_of_remarks + " !NTITLE\n")
-            output_write.write(
-                f" REMARKS this file "
-                f"{file_name_iteration} "
-                f"- created by using MoSDeF-GOMC. \n"
-            )
-            output_write.write(
-                f" REMARKS parameters from the "
-                f"{self.forcefield_selection} "
-                f"force field via MoSDef\n"
-            )
-            output_write.write(f" REMARKS created on {date_time}\n\n\n")
-
-            # This converts the atom name in the GOMC psf and pdb files to unique atom names
-            print(f"bead_to_atom_name_dict = {self.bead_to_atom_name_dict}")
+        return [
             [
-                unique_individual_atom_names_dict,
-                individual_atom_names_list,
-                missing_bead_to_atom_name,
-            ] = unique_atom_naming(
-                stuct_only_iteration,
-                residue_id_list_psf,
-                residue_names_list_psf,
-                bead_to_atom_name_dict=self.bead_to_atom_name_dict,
-            )
-
-            if None in [
-                unique_individual_atom_names_dict,
-                individual_atom_names_list,
-                missing_bead_to_atom_name,
-            ]:
-                self.input_error = True
-                print_error_message = (
-                    "ERROR: The unique_atom_naming function failed while "
-                    "running the charmm_writer function. Ensure the proper inputs are "
-                    "in the bead_to_atom_name_dict."
-                )
-                raise ValueError(print_error_message)
-
-            # ATOMS: Calculate the atom data
-            # psf_formating is conducted for the for CHARMM format (i.e., atom types are base 44, letters only)
-            output_write.write(first_indent % no_atoms + " !NATOM\n")
-            for i_atom, PSF_atom_iteration_1 in enumerate(
-                stuct_iteration.sites
-            ):
-                charge_iter = (
-                    PSF_atom_iteration_1.atom_type.__dict__["charge_"].to("C")
-                    / u.elementary_charge
-                )
-                charge_iter = charge_iter.to_value("(dimensionless)")
-                mass_iter = PSF_atom_iteration_1.atom_type.__dict__[
-                    "mass_"
-                ].to_value("amu")
-                residue_name_iter = PSF_atom_iteration_1.__dict__[
-                    "residue_name_"
-                ]
-                atom_class_name_iter = PSF_atom_iteration_1.atom_type.__dict__[
-                    "atomclass_"
-                ]
-                atom_type_name_iter = PSF_atom_iteration_1.atom_type.__dict__[
-                    "name_"
-                ]
-
-                atom_type_iter = self.mosdef_atom_name_to_atom_type_dict[
-                    f"{residue_name_iter}_{atom_type_name_iter}"
-                ]
-
-                atom_lines_iteration = psf_formating % (
-                    i_atom + 1,
-                    segment_id_list_psf[i_atom],
-                    res_no_chain_iter_corrected_list_psf[i_atom],
-                    str(residue_names_list_psf[i_atom])[
-                        : self.max_resname_char
-                    ],
-                    individual_atom_names_list[i_atom],
-                    atom_type_iter,
-                    charge_iter,
-                    mass_iter,
-                )
-
-                output_write.write("%s\n" % atom_lines_iteration)
-
-            output_write.write("\n")
-
-            # BONDS: Calculate the bonding data
-            output_write.write(first_indent % no_bonds + " !NBOND: bonds\n")
-            for i_bond, bond_iteration in enumerate(stuct_iteration.bonds):
-                output_write.write(
-                    (first_indent * 2)
-                    % (
-                        stuct_iteration.get_index(
-                            bond_iteration.connection_members[0]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            bond_iteration.connection_members[1]
-                        )
-                        + 1,
-                    )
-                )
-
-                if (i_bond + 1) % 4 == 0:
-                    output_write.write("\n")
-
-            if no_bonds % 4 == 0:
-                output_write.write("\n")
-            else:
-                output_write.write("\n\n")
-
-            if no_bonds == 0:
-                output_write.write("\n")
-
-            # ANGLES: Calculate the angle data
-            output_write.write(first_indent % no_angles + " !NTHETA: angles\n")
-            for i_angle, angle_iteration in enumerate(stuct_iteration.angles):
-                output_write.write(
-                    (first_indent * 3)
-                    % (
-                        stuct_iteration.get_index(
-                            angle_iteration.connection_members[0]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            angle_iteration.connection_members[1]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            angle_iteration.connection_members[2]
-                        )
-                        + 1,
-                    )
-                )
+                self._psf_box_render_data,
+                [
+                    q,
+                    list_of_topologies[q],
+                    list_of_file_names[q],
+                    stuct_only[q],
+                    date_time,
+                ],
+                _render_psf_box_text,
+                str(list_of_file_names[q]) + ".psf",
+            ]
+            for q in range(0, len(list_of_topologies))
+        ]
 
-                if (i_angle + 1) % 3 == 0:
-                    output_write.write("\n")
+    def _psf_box_render_data(
+        self,
+        q,
+        stuct_iteration,
+        file_name_iteration,
+        stuct_only_iteration,
+        date_time,
+    ):
+        """Get the picklable PSF file data for box q (0 or 1), for _render_psf_box_text."""
+        no_atoms = stuct_iteration.n_sites
+        no_bonds = stuct_iteration.n_bonds
+        no_angles = stuct_iteration.n_angles
 
-            if no_angles % 3 == 0:
-                output_write.write("\n")
-            else:
-                output_write.write("\n\n")
+        no_dihedrals = stuct_iteration.n_dihedrals
+        no_impropers = stuct_iteration.n_impropers
 
-            if no_angles == 0:
-                output_write.write("\n")
+        # psf printing (start)
 
-            # DIHEDRALS: Calculate the dihedral  data
-            output_write.write(
-                first_indent % no_dihedrals + " !NPHI: dihedrals\n"
+        if q == 0:
+            residue_names_list_psf = self.residue_names_list_box_0
+            residue_id_list_psf = self.residue_id_list_box_0
+            res_no_chain_iter_corrected_list_psf = (
+                self.res_no_chain_iter_corrected_list_box_0
             )
-            for i_dihedral, dihedral_iter in enumerate(
-                stuct_iteration.dihedrals
-            ):
-                output_write.write(
-                    (first_indent * 4)
-                    % (
-                        stuct_iteration.get_index(
-                            dihedral_iter.connection_members[0]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            dihedral_iter.connection_members[1]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            dihedral_iter.connection_members[2]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            dihedral_iter.connection_members[3]
-                        )
-                        + 1,
-                    )
-                )
-
-                if (i_dihedral + 1) % 2 == 0:
-                    output_write.write("\n")
-
-            if no_dihedrals % 2 == 0:
-                output_write.write("\n")
-            else:
-                output_write.write("\n\n")
-
-            if no_dihedrals == 0:
-                output_write.write("\n")
+            segment_id_list_psf = self.segment_id_list_box_0
 
-            # IMPROPERS: Calculate the improper data
-            output_write.write(
-                first_indent % no_impropers + " !NIMPHI: impropers\n"
+        else:
+            residue_names_list_psf = self.residue_names_list_box_1
+            residue_id_list_psf = self.residue_id_list_box_1
+            res_no_chain_iter_corrected_list_psf = (
+                self.res_no_chain_iter_corrected_list_box_1
             )
-            for i_improper, improper_iter in enumerate(
-                stuct_iteration.impropers
-            ):
-                output_write.write(
-                    (first_indent * 4)
-                    % (
-                        stuct_iteration.get_index(
-                            improper_iter.connection_members[0]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            improper_iter.connection_members[1]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            improper_iter.connection_members[2]
-                        )
-                        + 1,
-                        stuct_iteration.get_index(
-                            improper_iter.connection_members[3]
-                        )
-                        + 1,
-                    )
-                )
-
-                if (i_improper + 1) % 2 == 0:
-                    output_write.write("\n")
-
-            if no_impropers % 2 == 0:
-                output_write.write("\n")
-            else:
-                output_write.write("\n\n")
-
-            if no_impropers == 0:
-                output_write.write("\n")
-
-            # DONOR: calculate the donor data (not calculated here printing the header)
-            output_write.write(first_indent % no_donors + " !NDON: donors\n")
-            output_write.write("\n")
+            segment_id_list_psf = self.segment_id_list_box_1
+
+        # This converts the atom name in the GOMC psf and pdb files to unique atom names
+        print(f"bead_to_atom_name_dict = {self.bead_to_atom_name_dict}")
+        [
+            unique_individual_atom_names_dict,
+            individual_atom_names_list,
+            missing_bead_to_atom_name,
+        ] = unique_atom_naming(
+            stuct_only_iteration,
+            residue_id_list_psf,
+            residue_names_list_psf,
+            bead_to_atom_name_dict=self.bead_to_atom_name_dict,
+        )
 
-            # ACCEPTOR: calculate the acceptor data (not calculated here printing the header)
-            output_write.write(
-                first_indent % no_acceptors + " !NACC: acceptors\n"
+        if None in [
+            unique_individual_atom_names_dict,
+            individual_atom_names_list,
+            missing_bead_to_atom_name,
+        ]:
+            self.input_error = True
+            print_error_message = (
+                "ERROR: The unique_atom_naming function failed while "
+                "running the charmm_writer function. Ensure the proper inputs are "
+                "in the bead_to_atom_name_dict."
             )
-            output_write.write("\n")
-
-            # NNB: calculate the NNB data (not calculated here printing the header)
-            output_write.write(first_indent % no_NNB + " !NNB\n")
-            output_write.write("\n")
+            raise ValueError(print_error_message)
 
-            # GROUP: calculate the group data  (not calculated here printing the header)
-            output_write.write(first_indent % no_groups + " !NGRP \n")
-            output_write.write("\n")
+        # ATOMS: The charges, masses, and atom types come from the shared
+        # site table.  The site to index map replaces the per member
+        # get_index calls.
+        box_site_slice_iter = self.site_table["box_site_slices"][q]
+        site_index_dict = {
+            site_i: i_atom
+            for i_atom, site_i in enumerate(stuct_iteration.sites)
+        }
 
-            output_write.close()
         # **********************************
         # **********************************
         # psf writer (end)
         # **********************************
         # **********************************
 
-    def write_pdb(self, space_group="P 1"):
+        return {
+            "file_name": str(file_name_iteration),
+            "forcefield_selection": self.forcefield_selection,
+            "date_time": date_time,
+            "max_resname_char": self.max_resname_char,
+            "no_atoms": no_atoms,
+            "no_bonds": no_bonds,
+            "no_angles": no_angles,
+            "no_dihedrals": no_dihedrals,
+            "no_impropers": no_impropers,
+            "segment_ids": segment_id_list_psf,
+            "residue_numbers": res_no_chain_iter_corrected_list_psf,
+            "residue_names": residue_names_list_psf,
+            "atom_names": individual_atom_names_list,
+            "atom_types_by_type_code": [
+                self.mosdef_atom_name_to_atom_type_dict[
+                    f"{type_key_i[0]}_{type_key_i[2]}"
+                ]
+                for type_key_i in self.site_table["type_keys"]
+            ],
+            "type_codes": self.site_table["type_codes"][box_site_slice_iter],
+            "charges": self.site_table["charges"][box_site_slice_iter],
+            "masses": self.site_table["masses"][box_site_slice_iter],
+            "bonds": _get_connection_index_array(
+                stuct_iteration.bonds, site_index_dict, 2
+            ),
+            "angles": _get_connection_index_array(
+                stuct_iteration.angles, site_index_dict, 3
+            ),
+            "dihedrals": _get_connection_index_array(
+                stuct_iteration.dihedrals, site_index_dict, 4
+            ),
+            "impropers": _get_connection_index_array(
+                stuct_iteration.impropers, site_index_dict, 4
+            ),
+        }
+
+    def write_pdb(self, space_group="P 1", parallel=False, max_workers=None):
         """This write_pdb function writes the Charmm style PDB (coordinate file), which can be utilized
         in the GOMC and NAMD engines.
 
@@ -5679,8 +6769,23 @@ class Charmm:
         ----------
         space_group: str (default="P 1")
             The space group of the structure
-
+        parallel: bool, default=False
+            If True, the box 0 and box 1 PDB file text is rendered concurrently
+            in a process pool, from the picklable site table data, and the
+            files are written by this process.
+            If False or there is only 1 box, the files are written serially.
+        max_workers: int or None, default=None
+            The maximum number of processes used when parallel=True.
+            If None, one process is used per box.
         """
+        _run_writer_tasks(
+            self._pdb_writer_tasks(space_group=space_group),
+            parallel=parallel,
+            max_workers=max_workers,
+        )
+
+    def _pdb_writer_tasks(self, space_group="P 1"):
+        """Get the write_pdb box writer tasks, [[function, args], ...], one per box."""
         # **********************************
         # **********************************
         # pdb writer (start)
@@ -5724,62 +6829,66 @@ class Charmm:
             list_of_file_names = [self.filename_box_0]
             stuct_only = [self.topology_box_0_ff]
 
-        for q in range(0, len(list_of_topologies)):
-            file_name_iteration = list_of_file_names[q]
-            output = str(file_name_iteration) + ".pdb"
-            stuct_only_iteration = stuct_only[q]
+        return [
+            [
+                self._pdb_box_render_data,
+                [q, list_of_file_names[q], stuct_only[q], space_group],
+                _render_pdb_box_text,
+                str(list_of_file_names[q]) + ".pdb",
+            ]
+            for q in range(0, len(list_of_topologies))
+        ]
 
-            if q == 0:
-                residue_names_list_pdb = self.residue_names_list_box_0
-                residue_id_list_pdb = self.residue_id_list_box_0
-                res_no_chain_iter_corrected_list_pdb = (
-                    self.res_no_chain_iter_corrected_list_box_0
-                )
-                segment_id_list_pdb = self.segment_id_list_box_0
+    def _pdb_box_render_data(
+        self, q, file_name_iteration, stuct_only_iteration, space_group
+    ):
+        """Get the picklable PDB file data for box q (0 or 1), for _render_pdb_box_text."""
+        if q == 0:
+            residue_names_list_pdb = self.residue_names_list_box_0
+            residue_id_list_pdb = self.residue_id_list_box_0
+            res_no_chain_iter_corrected_list_pdb = (
+                self.res_no_chain_iter_corrected_list_box_0
+            )
+            segment_id_list_pdb = self.segment_id_list_box_0
 
-            else:
-                residue_names_list_pdb = self.residue_names_list_box_1
-                residue_id_list_pdb = self.residue_id_list_box_1
-                res_no_chain_iter_corrected_list_pdb = (
-                    self.res_no_chain_iter_corrected_list_box_1
+        else:
+            residue_names_list_pdb = self.residue_names_list_box_1
+            residue_id_list_pdb = self.residue_id_list_box_1
+            res_no_chain_iter_corrected_list_pdb = (
+                self.res_no_chain_iter_corrected_list_box_1
+            )
+            segment_id_list_pdb = self.segment_id_list_box_1
+
+        # output_write.write(
+        #'REMARK this file ' + file_name_iteration + ' - created by using MoSDeF-GOMC.' + '\n')
+        # output_write.write(
+        #'REMARK parameters from the ' + str(self.forcefield_selection) + ' force field via MoSDef\n')
+        # output_write.write('REMARK created on ' + str(date_time) + '\n')
+
+        # caluculate the atom name and unique atom names
+        # The per site columns are precomputed once, with the element names
+        # looked up per unique site name, the beta (fixed atom) and occupancy
+        # values looked up per residue name, and the coordinates converted
+        # to Angstroms in a single array operation.
+        element_by_site_name_dict = {}
+        beta_and_occupancy_by_residue_dict = {}
+        element_list = []
+        occupancy_values_atoms_list = []
+        fix_atoms_list = []
+        x_y_z_coor_list = []
+        for residue_name_i in self.site_table["residue_names"]:
+            if residue_name_i not in self.residues:
+                self.input_error = True
+                print_error_message = (
+                    "ERROR: Please specifiy all residues (residues) in a list"
                 )
-                segment_id_list_pdb = self.segment_id_list_box_1
-
-            output_write = open(output, "w")
-            # output_write.write(
-            #'REMARK this file ' + file_name_iteration + ' - created by using MoSDeF-GOMC.' + '\n')
-            # output_write.write(
-            #'REMARK parameters from the ' + str(self.forcefield_selection) + ' force field via MoSDef\n')
-            # output_write.write('REMARK created on ' + str(date_time) + '\n')
-
-            # caluculate the atom name and unique atom names
-            max_no_atoms_in_base10 = 99999  # 99,999 for atoms in psf/pdb
-
-            atom_no_list = []
-            element_list = []
-
-            occupancy_values_atoms_list = []
-            fix_atoms_list = []
-            atom_alternate_location_list = []
-            residue_code_insertion_list = []
-            x_y_z_coor_list = []
-            segment_id = []
-
-            atom_alternate_location_all_values = ""
-            residue_code_insertion_all_values = ""
-            segment_id_all_values = ""
-            for f, site in enumerate(stuct_only_iteration.sites):
-                if residue_names_list_pdb[f] not in self.residues:
-                    self.input_error = True
-                    print_error_message = "ERROR: Please specifiy all residues (residues) in a list"
-                    raise ValueError(print_error_message)
-
-                # get other values
-                atom_no_list.append(stuct_only_iteration.get_index(site))
+                raise ValueError(print_error_message)
 
-                # only 2 character element names are allowed
-                site_name = str(site.__dict__["name_"])
+        for f, site in enumerate(stuct_only_iteration.sites):
+            # only 2 character element names are allowed
+            site_name = str(site.__dict__["name_"])
 
+            if site_name not in element_by_site_name_dict:
                 # extract element or atom name from mol2 without numbers (integers)
                 if site_name[0] == "_":
                     element_name = site_name
@@ -5800,131 +6909,154 @@ class Charmm:
                         element_name = "TL"
                 except:
                     element_name = "UN"
-                element_list.append(element_name)
+                element_by_site_name_dict[site_name] = element_name
+            element_list.append(element_by_site_name_dict[site_name])
 
+            site_residue_name = site.__dict__["residue_name_"]
+            if site_residue_name not in beta_and_occupancy_by_residue_dict:
                 if (self.fix_residue is not None) and (
-                    site.__dict__["residue_name_"] in self.fix_residue
+                    site_residue_name in self.fix_residue
                 ):
                     beta_iteration = 1.00
                 elif (self.fix_residue_in_box is not None) and (
-                    site.__dict__["residue_name_"] in self.fix_residue_in_box
+                    site_residue_name in self.fix_residue_in_box
                 ):
                     beta_iteration = 2.00
                 else:
                     beta_iteration = 0.00
-                fix_atoms_list.append(beta_iteration)
 
                 if (self.set_residue_pdb_occupancy_to_1 is not None) and (
-                    site.__dict__["residue_name_"]
-                    in self.set_residue_pdb_occupancy_to_1
+                    site_residue_name in self.set_residue_pdb_occupancy_to_1
                 ):
                     occupancy_iteration = 1.00
                 else:
                     occupancy_iteration = 0.00
-                occupancy_values_atoms_list.append(occupancy_iteration)
 
-                atom_alternate_location_list.append(
-                    atom_alternate_location_all_values
-                )
-                residue_code_insertion_list.append(
-                    residue_code_insertion_all_values
-                )
+                beta_and_occupancy_by_residue_dict[site_residue_name] = [
+                    beta_iteration,
+                    occupancy_iteration,
+                ]
 
-                x_y_z_coor = site.__dict__["position_"].to_value("angstrom")
-                x_y_z_coor_list.append(x_y_z_coor)
+            (
+                beta_iteration,
+                occupancy_iteration,
+            ) = beta_and_occupancy_by_residue_dict[site_residue_name]
+            fix_atoms_list.append(beta_iteration)
+            occupancy_values_atoms_list.append(occupancy_iteration)
 
-                segment_id.append(segment_id_all_values)
+            x_y_z_coor_list.append(site.__dict__["position_"])
 
-            if (self.fix_residue is not None) and (
-                self.fix_residue_in_box is not None
-            ):
-                for n in range(0, len(self.fix_residue)):
-                    if self.fix_residue[n] in self.fix_residue_in_box:
-                        self.input_error = True
-                        print_error_message = (
-                            "ERROR: residue type can not be specified to both "
-                            "fix_residue and fix_residue_in_box"
-                        )
-                        raise ValueError(print_error_message)
-
-            if stuct_only_iteration.box is not None:
-                output_write.write(
-                    "CRYST1%9.3f%9.3f%9.3f%7.2f%7."
-                    "2f%7.2f %-11s%4s\n"
-                    % (
-                        stuct_only_iteration.box.lengths[0].to("angstrom"),
-                        stuct_only_iteration.box.lengths[1].to("angstrom"),
-                        stuct_only_iteration.box.lengths[2].to("angstrom"),
-                        stuct_only_iteration.box.angles[0].to("degree"),
-                        stuct_only_iteration.box.angles[1].to("degree"),
-                        stuct_only_iteration.box.angles[2].to("degree"),
-                        space_group,
-                        "",
-                    )
-                )
+        if len(x_y_z_coor_list) != 0:
+            x_y_z_coor_list = (
+                u.unyt_array(x_y_z_coor_list).to_value("angstrom").tolist()
+            )
 
-            pdb_atom_line_format = "ATOM  %5s %-4s%1s%-4s%1s%4d%1s   %8.3f%8.3f%8.3f%6.2f%6.2f      %-4s%2s%-2s\n"
+        if (self.fix_residue is not None) and (
+            self.fix_residue_in_box is not None
+        ):
+            for n in range(0, len(self.fix_residue)):
+                if self.fix_residue[n] in self.fix_residue_in_box:
+                    self.input_error = True
+                    print_error_message = (
+                        "ERROR: residue type can not be specified to both "
+                        "fix_residue and fix_residue_in_box"
+                    )
+                    raise ValueError(print_error_message)
 
-            # This converts the atom name in the CHARMM psf and pdb files to unique atom names
-            [
-                unique_individual_atom_names_dict,
-                individual_atom_names_list,
-                missing_bead_to_atom_name,
-            ] = unique_atom_naming(
-                stuct_only_iteration,
-                residue_id_list_pdb,
-                residue_names_list_pdb,
-                bead_to_atom_name_dict=self.bead_to_atom_name_dict,
+        cryst1_line = None
+        if stuct_only_iteration.box is not None:
+            cryst1_line = (
+                "CRYST1%9.3f%9.3f%9.3f%7.2f%7."
+                "2f%7.2f %-11s%4s\n"
+                % (
+                    stuct_only_iteration.box.lengths[0].to("angstrom"),
+                    stuct_only_iteration.box.lengths[1].to("angstrom"),
+                    stuct_only_iteration.box.lengths[2].to("angstrom"),
+                    stuct_only_iteration.box.angles[0].to("degree"),
+                    stuct_only_iteration.box.angles[1].to("degree"),
+                    stuct_only_iteration.box.angles[2].to("degree"),
+                    space_group,
+                    "",
+                )
             )
 
-            if None in [
-                unique_individual_atom_names_dict,
-                individual_atom_names_list,
-                missing_bead_to_atom_name,
-            ]:
-                self.input_error = True
-                print_error_message = (
-                    "ERROR: The unique_atom_naming function failed while "
-                    "running the charmm_writer function. Ensure the proper inputs are "
-                    "in the bead_to_atom_name_dict."
-                )
+        # This converts the atom name in the CHARMM psf and pdb files to unique atom names
+        [
+            unique_individual_atom_names_dict,
+            individual_atom_names_list,
+            missing_bead_to_atom_name,
+        ] = unique_atom_naming(
+            stuct_only_iteration,
+            residue_id_list_pdb,
+            residue_names_list_pdb,
+            bead_to_atom_name_dict=self.bead_to_atom_name_dict,
+        )
 
-                raise ValueError(print_error_message)
+        if None in [
+            unique_individual_atom_names_dict,
+            individual_atom_names_list,
+            missing_bead_to_atom_name,
+        ]:
+            self.input_error = True
+            print_error_message = (
+                "ERROR: The unique_atom_naming function failed while "
+                "running the charmm_writer function. Ensure the proper inputs are "
+                "in the bead_to_atom_name_dict."
+            )
 
-            for v, atom_iter_1 in enumerate(stuct_only_iteration.sites):
-                if v + 1 > max_no_atoms_in_base10:
-                    atom_number = base10_to_base16_alph_num(v + 1)
+            raise ValueError(print_error_message)
 
-                else:
-                    atom_number = v + 1
-
-                output_write.write(
-                    pdb_atom_line_format
-                    % (
-                        atom_number,
-                        individual_atom_names_list[v],
-                        atom_alternate_location_list[v],
-                        str(residue_names_list_pdb[v])[: self.max_resname_char],
-                        segment_id_list_pdb[v],
-                        res_no_chain_iter_corrected_list_pdb[v],
-                        residue_code_insertion_list[v],
-                        x_y_z_coor_list[v][0],
-                        x_y_z_coor_list[v][1],
-                        x_y_z_coor_list[v][2],
-                        occupancy_values_atoms_list[v],
-                        fix_atoms_list[v],
-                        segment_id[v],
-                        element_list[v],
-                        "",
-                    )
-                )
+        # **********************************
+        # **********************************
+        # pdb writer (end)
+        # **********************************
+        # **********************************
 
-            output_write.write("%-80s\n" % "END")
+        return {
+            "cryst1_line": cryst1_line,
+            "max_resname_char": self.max_resname_char,
+            "segment_ids": segment_id_list_pdb,
+            "residue_numbers": res_no_chain_iter_corrected_list_pdb,
+            "residue_names": residue_names_list_pdb,
+            "atom_names": individual_atom_names_list,
+            "coordinates": x_y_z_coor_list,
+            "occupancies": occupancy_values_atoms_list,
+            "betas": fix_atoms_list,
+            "elements": element_list,
+        }
+
+    def write_all(self, space_group="P 1", parallel=False, max_workers=None):
+        """This write_all function writes the Charmm style force field (.inp) file,
+        and the PSF and PDB files for each box, which can be utilized in the GOMC
+        and NAMD engines.
+
+        The force field (.inp) file is only written if the ff_filename was provided.
+        With parallel=True, the PSF and PDB file text for each box is rendered
+        concurrently in a process pool, from the picklable site table data,
+        so the pure Python text formatting is not limited by the GIL.  This
+        process writes the force field file while the text is rendered,
+        and then writes the PSF and PDB files.
 
-            output_write.close()
+        Parameters
+        ----------
+        space_group: str (default="P 1")
+            The space group of the structure, which is used in the PDB files.
+        parallel: bool, default=False
+            If True, the PSF and PDB file text is rendered concurrently in a
+            process pool.
+            If False, the files are written serially, which is the same as
+            running the write_inp, write_psf, and write_pdb functions.
+        max_workers: int or None, default=None
+            The maximum number of processes used when parallel=True.
+            If None, one process is used per PSF and PDB file.  This is only
+            used when parallel=True.
+        """
+        writer_tasks_list = []
+        if self.ff_filename is not None:
+            writer_tasks_list.append([self.write_inp, [], None, None])
+        writer_tasks_list += self._psf_writer_tasks()
+        writer_tasks_list += self._pdb_writer_tasks(space_group=space_group)
 
-            # **********************************
-            # **********************************
-            # pdb writer (end)
-            # **********************************
-            # **********************************
+        _run_writer_tasks(
+            writer_tasks_list, parallel=parallel, max_workers=max_workers
+        )
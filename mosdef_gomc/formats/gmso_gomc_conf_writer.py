@@ -1,5 +1,11 @@
+import copy
 import datetime
+import io
+import itertools
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
 from warnings import warn
 
 import numpy as np
@@ -166,21 +172,23 @@ def _get_required_data(description=False):
         return list(required_data.keys())
 
 
-def _get_all_possible_input_variables(description=False):
+def _build_all_possible_input_variables_dict(default_input_variables_dict):
     """
-    Provides a list of the variables inputs (user optional) for all possible ensembles.
+    Builds the descriptions of the variables inputs (user optional) for all possible ensembles.
+
+    This is only called once, when the control variable registry is compiled
+    (see _get_control_variable_registry).
 
     Parameters
     ----------
-    description:  bool, default = False.
-        If True, it prints the descriptions of the input_variables (i.e. dict),
-        If False, it only prints the input_variables without the descriptions (i.e. list)
+    default_input_variables_dict: dict
+        The default variables inputs, which are written into the descriptions
+        (see _build_default_variables_dict).
 
     Returns
     ---------
-    valid_input_variables: dict or list, default = list.
-        If the description = True then a dict is provided with the key and value.
-        if the description = False then a list of the dict keys is provided.
+    valid_input_variables: dict
+        A dict of the variables inputs (keys) and their descriptions (values).
 
     Note:
     Variables and text extracted with permission from the GOMC manual version 2.60.
@@ -206,46 +214,46 @@ def _get_all_possible_input_variables(description=False):
         "line 2 = Random_Seed user_selected_integer. "
         'Example 1: for a random seed enter the string "RANDOM. '
         "Example 2: for a specific seed number enter a integer of your choosing. "
-        "".format(_get_default_variables_dict()["PRNG"]),
+        "".format(default_input_variables_dict["PRNG"]),
         "ParaTypeCHARMM": "Simulation info (all ensembles): boolean, default = {}. "
         "True if a CHARMM forcefield, False otherwise."
         "Note: This is changed by the MoSDeF-GOMC Charmm object if the "
         "ParaTypeCHARMM or ParaTypeMie is detected."
-        "".format(_get_default_variables_dict()["ParaTypeCHARMM"]),
+        "".format(default_input_variables_dict["ParaTypeCHARMM"]),
         "ParaTypeMie": "Simulation info (all ensembles): boolean, default = {}. "
         "True if a Mie or Exp6 forcefield types, False otherwise."
         "Note: This is changed by the MoSDeF-GOMC Charmm object if the "
         "ParaTypeCHARMM or ParaTypeMie is detected."
-        "".format(_get_default_variables_dict()["ParaTypeMie"]),
+        "".format(default_input_variables_dict["ParaTypeMie"]),
         "ParaTypeMARTINI": "Simulation info (all ensembles): boolean, default = {}. "
         "True if a MARTINI forcefield, False otherwise. "
         "Note: The ParaTypeMARTINI is not changed or detected by the MoSDeF-GOMC Charmm object."
-        "".format(_get_default_variables_dict()["ParaTypeMARTINI"]),
+        "".format(default_input_variables_dict["ParaTypeMARTINI"]),
         "RcutCoulomb_box_0": "Simulation info (all ensembles): unyt.unyt_quantity in length units (>= 0), "
         "default = {}."
         "Sets a specific radius in box 0 (written in Angstroms) where the short-range "
         "electrostatic energy will be calculated (i.e., The distance to truncate the "
         "short-range electrostatic energy in box 0.)"
         "Note: if None, GOMC will default to the Rcut value"
-        "".format(_get_default_variables_dict()["RcutCoulomb_box_0"]),
+        "".format(default_input_variables_dict["RcutCoulomb_box_0"]),
         "RcutCoulomb_box_1": "Simulation info (all ensembles): unyt.unyt_quantity in length units (>= 0), "
         "written in Angstroms, default = {}."
         "Sets a specific radius in box 1 (written in Angstroms) where the short-range  "
         "electrostatic energy will be calculated. (i.e., The distance to truncate the "
         "short-range electrostatic energy in box 1.)"
         "Note: if None, GOMC will default to the Rcut value"
-        "".format(_get_default_variables_dict()["RcutCoulomb_box_1"]),
+        "".format(default_input_variables_dict["RcutCoulomb_box_1"]),
         "Pressure": "Simulation info (only GEMC_NPT and NPT): unyt.unyt_quantity in pressure units (>= 0), "
         "default = {}. "
         "The pressure (written in bar) is utilized for the NPT and GEMC_NPT simulations."
-        "".format(_get_default_variables_dict()["Pressure"]),
+        "".format(default_input_variables_dict["Pressure"]),
         "Rcut": "Simulation info (all ensembles): unyt.unyt_quantity in length units "
         "(>= 0 and RcutLow < Rswitch < Rcut), default = {}. "
         "Sets a specific radius (written in Angstroms) that non-bonded interaction "
         "energy and force will be considered and calculated using defined potential function. "
         "The distance in Angstoms to truncate the LJ, Mie, or other VDW type potential at. "
         'Note: Rswitch is only used when the "Potential" = SWITCH. '
-        "".format(_get_default_variables_dict()["Rcut"]),
+        "".format(default_input_variables_dict["Rcut"]),
         "RcutLow": "Simulation info (all ensembles): unyt.unyt_quantity in length units "
         "(>= 0 and RcutLow < Rswitch < Rcut), default = {}. "
         "Sets a specific minimum possible distance (written in Angstroms) that reject "
@@ -257,12 +265,12 @@ def _get_all_possible_input_variables(description=False):
         "the RcutLow need to be greater than zero, typically 1 angstrom. "
         "WARNING: When using the free energy calculations, RcutLow needs to be set to zero (RcutLow=0);"
         "otherwise, the free energy calculations can produce results that are slightly off or wrong. "
-        "".format(_get_default_variables_dict()["RcutLow"]),
+        "".format(default_input_variables_dict["RcutLow"]),
         "LRC": "Simulation info (all ensembles): boolean, default = {}. "
         "If True, the simulation considers the long range tail corrections for the non-bonded VDW or "
         "dispersion interactions. "
         "Note: In case of using SHIFT or SWITCH potential functions, LRC will be ignored."
-        "".format(_get_default_variables_dict()["LRC"]),
+        "".format(default_input_variables_dict["LRC"]),
         "IPC": "Simulation info (all ensembles): boolean, default = {}. "
         "If True, the simulation adds the impulse correction term to the pressure, "
         "which considers to correct for the discontinuous Rcut potential "
@@ -270,7 +278,7 @@ def _get_all_possible_input_variables(description=False):
         "the long range tail corrections for the non-bonded VDW or dispersion interactions. "
         "If False, the impulse correction term to the pressure is not applied. "
         "Note: This can not be used if LRC is True or the Potential is set to SWITCH, or SHIFT."
-        "".format(_get_default_variables_dict()["IPC"]),
+        "".format(default_input_variables_dict["IPC"]),
         "Exclude": "Simulation info (all ensembles): str "
         '(The string inputs are "1-2", "1-3", or "1-4"), default = {}. '
         "Note: In CHARMM force field, the 1-4 interaction needs to be considered. "
@@ -287,7 +295,7 @@ def _get_all_possible_input_variables(description=False):
         '\t\t\t\t\t\t\t\t\t\t\t\t\t --- "1-4": All interaction pairs of bonded atoms, '
         "except the ones that separated with one, "
         "two or three bonds, will be considered using non-bonded parameters defined in parameter file."
-        "".format(_get_default_variables_dict()["Exclude"]),
+        "".format(default_input_variables_dict["Exclude"]),
         "Potential": 'Simulation info (all ensembles): str, ["VDW", "EXP6", "SHIFT" or "SWITCH"], default = {}. '
         "Defines the potential function type to calculate non-bonded dispersion interaction "
         "energy and force between atoms. \n"
@@ -302,7 +310,7 @@ def _get_all_possible_input_variables(description=False):
         '\t\t\t\t\t\t\t\t\t\t\t\t\t --- "SWITCH": This option smoothly forces the potential '
         "energy to be zero at Rcut distance and starts modifying the potential at Rswitch "
         "distance. Depending on force field type, specific potential function will be applied. "
-        "".format(_get_default_variables_dict()["Potential"]),
+        "".format(default_input_variables_dict["Potential"]),
         "Rswitch": "Simulation info (all ensembles): unyt.unyt_quantity in length units "
         "(>= 0 and RcutLow < Rswitch < Rcut), default = {}. "
         'Note: Rswitch is only used when the SWITCH function is used (i.e., "Potential" = SWITCH). '
@@ -311,20 +319,20 @@ def _get_all_possible_input_variables(description=False):
         'choosing "SWITCH" as potential function, the Rswitch distance defines where the'
         "non-bonded interaction energy modification is started, which is eventually truncated "
         "smoothly at Rcut distance. "
-        "".format(_get_default_variables_dict()["Rswitch"]),
+        "".format(default_input_variables_dict["Rswitch"]),
         "ElectroStatic": "Simulation info (all ensembles): boolean, default = {}. "
         "Considers the coulomb interactions or not. "
         "If True, coulomb interactions are considered and false if not. "
         "Note: To simulate the polar molecule in MARTINI force field, ElectroStatic needs to be "
         "turn on. The MARTINI force field uses short-range coulomb interaction with constant "
         "Dielectric of 15.0."
-        "".format(_get_default_variables_dict()["ElectroStatic"]),
+        "".format(default_input_variables_dict["ElectroStatic"]),
         "Ewald": "Simulation info (all ensembles): boolean, default = {}. "
         "Considers the standard Ewald summation method for electrostatic calculations. "
         "If True, Ewald summation calculation needs to be considered and false if not. "
         "Note: By default, GOMC will set ElectroStatic to True if Ewald summation  "
         "method was used to calculate coulomb interaction."
-        "".format(_get_default_variables_dict()["Ewald"]),
+        "".format(default_input_variables_dict["Ewald"]),
         "CachedFourier": "Simulation info (all ensembles): boolean, default = {}. "
         "Considers storing the reciprocal terms for Ewald summation "
         "calculation in order to improve the code performance. This option would increase the code "
@@ -332,36 +340,36 @@ def _get_all_possible_input_variables(description=False):
         "summation calculation and False if not. "
         "Warning: Monte Carlo moves, such as MEMC-1, MEMC-2, MEMC-3, "
         "IntraMEMC-1, IntraMEMC-2, and IntraMEMC-3 are not support with CachedFourier."
-        "".format(_get_default_variables_dict()["CachedFourier"]),
+        "".format(default_input_variables_dict["CachedFourier"]),
         "Tolerance": "Simulation info (all ensembles): float (0.0 < float < 1.0), default = {}. "
         "Sets the accuracy in Ewald summation calculation. Ewald separation parameter and number "
         "of reciprocal vectors for the Ewald summation are determined based on the accuracy parameter."
-        "".format(_get_default_variables_dict()["Tolerance"]),
+        "".format(default_input_variables_dict["Tolerance"]),
         "Dielectric": "Simulation info (all ensembles): int or float (>= 0.0), default = {}. "
         "Sets dielectric value used in coulomb interaction when the Martini "
         "force field is used. Note: In MARTINI force field, Dielectric needs to be set to 15.0."
-        "".format(_get_default_variables_dict()["Dielectric"]),
+        "".format(default_input_variables_dict["Dielectric"]),
         "PressureCalc": "Simulation info (all ensembles): list [bool , int (> 0)] or [bool , step_frequency], "
         "default = {} or [{} , set via formula based on the number of RunSteps or {} max]. "
         "Calculate the system pressure or not. bool = True, enables the pressure calculation "
         "during the simulation, false disables the calculation. The int/step frequency sets the "
         "frequency of calculating the pressure."
         "".format(
-            _get_default_variables_dict()["PressureCalc"],
-            _get_default_variables_dict()["PressureCalc"][0],
-            _get_default_variables_dict()["PressureCalc"][1],
+            default_input_variables_dict["PressureCalc"],
+            default_input_variables_dict["PressureCalc"][0],
+            default_input_variables_dict["PressureCalc"][1],
         ),
         "EqSteps": "Simulation info (all ensembles): int (> 0), "
         "default = set via formula based on the number of RunSteps or {} max. "
         "Sets the number of steps necessary to equilibrate the system. "
         "Averaging will begin at this step. "
         "Note: In GCMC simulations, the Histogram files will be outputed at EqSteps."
-        "".format(_get_default_variables_dict()["EqSteps"]),
+        "".format(default_input_variables_dict["EqSteps"]),
         "AdjSteps": "Simulation info (all ensembles): int (> 0), "
         "default = set via formula based on the number of RunSteps or {} max. "
         "Sets the number of steps per adjustment of the parameter associated with each move "
         "(e.g. maximum translate distance, maximum rotation, maximum volume exchange, etc.)."
-        "".format(_get_default_variables_dict()["AdjSteps"]),
+        "".format(default_input_variables_dict["AdjSteps"]),
         "VDWGeometricSigma": "Simulation info (all ensembles): boolean, default = {}. "
         "Use geometric mean, as required by OPLS force field, "
         "to combining Lennard-Jones sigma parameters for different atom types. "
@@ -372,22 +380,22 @@ def _get_all_possible_input_variables(description=False):
         "VDW sigma parameters for different atom types."
         "NOTE: In GOMC, for Mie FFs the following is always true --> n_ij = (n_ii + n_jj)/2."
         "NOTE: In GOMC, for Exp FFs the following is always true --> alpha_ij = (alpha_ii * alpha_jj)**0.5."
-        "".format(_get_default_variables_dict()["VDWGeometricSigma"]),
+        "".format(default_input_variables_dict["VDWGeometricSigma"]),
         "useConstantArea": "Simulation info (only GEMC_NPT and NPT): boolean: default = {}. "
         "Changes the volume of the simulation box by fixing the cross-sectional "
         "area (x-y plane). If true, the volume will change only in z axis, If False, "
         "the volume of the box will change in a way to maintain the constant axis ratio. "
-        "".format(_get_default_variables_dict()["useConstantArea"]),
+        "".format(default_input_variables_dict["useConstantArea"]),
         "FixVolBox0": "Simulation info (only GEMC_NPT): boolean, default = {}. "
         "Changing the volume of fluid phase (Box 1) to maintain the constant imposed pressure and "
         "Temperature, while keeping the volume of adsorbed phase (Box 0) fixed. Note: By default, "
         "GOMC will set useConstantArea to False if no value was set. It means, the volume of the "
         "box will change in a way to maintain the constant axis ratio."
-        "".format(_get_default_variables_dict()["FixVolBox0"]),
+        "".format(default_input_variables_dict["FixVolBox0"]),
         # GCMC only properties
         "ChemPot": "Simulation info (only GCMC): dict {str (4 dig limit) ,  "
         "unyt.unyt_quantity in energy units (kcal/mol, kJ/mol, or K)}, "
-        + "default = {} ".format(_get_default_variables_dict()["ChemPot"])
+        + "default = {} ".format(default_input_variables_dict["ChemPot"])
         + "(i.e., the user must set this variable as there is no working default)."
         "The chemical potentials are written in GOMC units of energy, K. "
         "There is a 4 character limit for the string/residue name since the PDB/PSF "
@@ -400,7 +408,7 @@ def _get_all_possible_input_variables(description=False):
         'Example 1 (system with only water):  {"H2O": -4000 * unyt.kcal / unyt.mol} . '
         'Example 2 (system with water and ethanol):  {"H2O": -4000 * unyt.K, "ETH": -8000 * unyt.K} ',
         "Fugacity": "Simulation info (only GCMC): dict {str , unyt.unyt_quantity in pressure units (>= 0)}, "
-        + "default = {} ".format(_get_default_variables_dict()["Fugacity"])
+        + "default = {} ".format(default_input_variables_dict["Fugacity"])
         + "(i.e., the user must set this variable as there is no working default). "
         "The fugacity is written in GOMC units of pressure, bar. "
         "There is a 4 character limit for the string/residue name since the PDB/PSF "
@@ -416,24 +424,24 @@ def _get_all_possible_input_variables(description=False):
         "CBMC_First": "CBMC inputs (all ensembles): int (>= 0), default = {}, "
         "The number of CD-CBMC trials to choose the first atom position"
         "(Lennard-Jones trials for first seed growth)."
-        "".format(_get_default_variables_dict()["CBMC_First"]),
+        "".format(default_input_variables_dict["CBMC_First"]),
         "CBMC_Nth": "CBMC inputs (all ensembles): int (>= 0), default = {},  "
         "The number of CD-CBMC trials to choose the later atom positions "
         "(Lennard-Jones trials for first seed growth)."
-        "".format(_get_default_variables_dict()["CBMC_Nth"]),
+        "".format(default_input_variables_dict["CBMC_Nth"]),
         "CBMC_Ang": "CBMC inputs (all ensembles): int (>= 0), default = {}, "
         "The number of CD-CBMC bending angle trials to perform for geometry "
         "(per the coupled-decoupled CBMC scheme)."
-        "".format(_get_default_variables_dict()["CBMC_Ang"]),
+        "".format(default_input_variables_dict["CBMC_Ang"]),
         "CBMC_Dih": "CBMC inputs (all ensembles): int (>= 0), default = {}, "
         "The number of CD-CBMC dihedral angle trials to perform for geometry "
         "(per the coupled-decoupled CBMC scheme)."
-        "".format(_get_default_variables_dict()["CBMC_Dih"]),
+        "".format(default_input_variables_dict["CBMC_Dih"]),
         # Control file (.conf file ) output controls/parameters
         "OutputName": "Output Frequency (all ensembles): str (NO SPACES), default = {}. "
         "The UNIQUE STRING NAME, WITH NO SPACES, which is used for the "
         "output block average, PDB, and PSF file names."
-        "".format(_get_default_variables_dict()["OutputName"]),
+        "".format(default_input_variables_dict["OutputName"]),
         "CoordinatesFreq": "PDB Output Frequency (all ensembles): list [bool , int (> 0)] or "
         "[Generate_data_bool , steps_per_data_output_int], "
         "default = {} or [{} , set via formula based on the number of RunSteps or {} max]. "
@@ -442,9 +450,9 @@ def _get_all_possible_input_variables(description=False):
         "integer frequency (set steps_per_data_output_int), "
         'while "False" disables outputting the coordinates.'
         "".format(
-            _get_default_variables_dict()["CoordinatesFreq"],
-            _get_default_variables_dict()["CoordinatesFreq"][0],
-            _get_default_variables_dict()["CoordinatesFreq"][1],
+            default_input_variables_dict["CoordinatesFreq"],
+            default_input_variables_dict["CoordinatesFreq"][0],
+            default_input_variables_dict["CoordinatesFreq"][1],
         ),
         "DCDFreq": "DCD Output Frequency (all ensembles): list [bool , int (> 0)] or "
         "[Generate_data_bool , steps_per_data_output_int], "
@@ -454,9 +462,9 @@ def _get_all_possible_input_variables(description=False):
         "integer frequency (set steps_per_data_output_int), "
         'while "False" disables outputting the coordinates.'
         "".format(
-            _get_default_variables_dict()["DCDFreq"],
-            _get_default_variables_dict()["DCDFreq"][0],
-            _get_default_variables_dict()["DCDFreq"][1],
+            default_input_variables_dict["DCDFreq"],
+            default_input_variables_dict["DCDFreq"][0],
+            default_input_variables_dict["DCDFreq"][1],
         ),
         "RestartFreq": "Output Frequency (all ensembles): list [bool , int (> 0)] or "
         "[Generate_data_bool , steps_per_data_output_int], "
@@ -467,9 +475,9 @@ def _get_all_possible_input_variables(description=False):
         "integer frequency (set steps_per_data_output_int), "
         "while “false” disables outputting the PDB/PSF restart files. "
         "".format(
-            _get_default_variables_dict()["RestartFreq"],
-            _get_default_variables_dict()["RestartFreq"][0],
-            _get_default_variables_dict()["RestartFreq"][1],
+            default_input_variables_dict["RestartFreq"],
+            default_input_variables_dict["RestartFreq"][0],
+            default_input_variables_dict["RestartFreq"][1],
         ),
         "CheckpointFreq": "Output Frequency (all ensembles): list [bool , int (> 0)] or "
         "[Generate_data_bool , steps_per_data_output_int], "
@@ -488,9 +496,9 @@ def _get_all_possible_input_variables(description=False):
         "integer frequency (set steps_per_data_output_int), "
         'while "False" disables outputting the checkpoint file.'
         "".format(
-            _get_default_variables_dict()["CheckpointFreq"],
-            _get_default_variables_dict()["CheckpointFreq"][0],
-            _get_default_variables_dict()["CheckpointFreq"][1],
+            default_input_variables_dict["CheckpointFreq"],
+            default_input_variables_dict["CheckpointFreq"][0],
+            default_input_variables_dict["CheckpointFreq"][1],
         ),
         "ConsoleFreq": "Output Frequency (all ensembles): list [bool , int (> 0)] or "
         "[Generate_data_bool , steps_per_data_output_int], "
@@ -502,9 +510,9 @@ def _get_all_possible_input_variables(description=False):
         '(set steps_per_data_output_int), while "False" disables outputting the console '
         "data file. "
         "".format(
-            _get_default_variables_dict()["ConsoleFreq"],
-            _get_default_variables_dict()["ConsoleFreq"][0],
-            _get_default_variables_dict()["ConsoleFreq"][1],
+            default_input_variables_dict["ConsoleFreq"],
+            default_input_variables_dict["ConsoleFreq"][0],
+            default_input_variables_dict["ConsoleFreq"][1],
         ),
         "BlockAverageFreq": "Output Frequency (all ensembles): list [bool , int (> 0)] or "
         "[Generate_data_bool , steps_per_data_output_int], "
@@ -516,9 +524,9 @@ def _get_all_possible_input_variables(description=False):
         "integer frequency (set steps_per_data_output_int), "
         'while "False" disables outputting the block averaging data/file.'
         "".format(
-            _get_default_variables_dict()["BlockAverageFreq"],
-            _get_default_variables_dict()["BlockAverageFreq"][0],
-            _get_default_variables_dict()["BlockAverageFreq"][1],
+            default_input_variables_dict["BlockAverageFreq"],
+            default_input_variables_dict["BlockAverageFreq"][0],
+            default_input_variables_dict["BlockAverageFreq"][1],
         ),
         "HistogramFreq": "Output Frequency (all ensembles): list [bool , int (> 0)] or "
         "[Generate_data_bool , steps_per_data_output_int], "
@@ -531,55 +539,55 @@ def _get_all_possible_input_variables(description=False):
         "integer frequency (set steps_per_data_output_int), "
         'while "False" disables outputting the histogram data.'
         "".format(
-            _get_default_variables_dict()["HistogramFreq"],
-            _get_default_variables_dict()["HistogramFreq"][0],
-            _get_default_variables_dict()["HistogramFreq"][1],
+            default_input_variables_dict["HistogramFreq"],
+            default_input_variables_dict["HistogramFreq"][0],
+            default_input_variables_dict["HistogramFreq"][1],
         ),
         # Histogram data
         "DistName": "Histogram Output (all ensembles): str (NO SPACES), default = {}. "
         "Short phrase which will be combined with RunNumber and RunLetter "
         "to use in the name of the binned histogram for molecule distribution."
-        "".format(_get_default_variables_dict()["DistName"]),
+        "".format(default_input_variables_dict["DistName"]),
         "HistName": "Histogram Output (all ensembles): str (NO SPACES), default = {}. "
         "Short phrase, which will be combined with RunNumber and RunLetter, "
         "to use in the name of the energy/molecule count sample file."
-        "".format(_get_default_variables_dict()["HistName"]),
+        "".format(default_input_variables_dict["HistName"]),
         "RunNumber": "Histogram Output (all ensembles): int  ( > 0 ), default = {}. "
         "Sets a number, which is a part of DistName and HistName file name."
-        "".format(_get_default_variables_dict()["RunNumber"]),
+        "".format(default_input_variables_dict["RunNumber"]),
         "RunLetter": "Histogram Output (all ensembles): str (1 alphabetic character only), default = {}. "
         "Sets a letter, which is a part of DistName and HistName file name."
-        "".format(_get_default_variables_dict()["RunLetter"]),
+        "".format(default_input_variables_dict["RunLetter"]),
         "SampleFreq": "Histogram Output (all ensembles): int ( > 0 ), default = {}. "
         "The number of steps per histogram sample or frequency."
-        "".format(_get_default_variables_dict()["SampleFreq"]),
+        "".format(default_input_variables_dict["SampleFreq"]),
         # Data output for the console and bulk properties calculations
         "OutEnergy": "Output Data (all ensembles): [bool, bool], default = {}.   "
         "The list provides the booleans to [block_averages_bool, console_output_bool]. "
         "This outputs the energy data into the block averages and console output/log files."
-        "".format(_get_default_variables_dict()["OutEnergy"]),
+        "".format(default_input_variables_dict["OutEnergy"]),
         "OutPressure": "Output Data (all ensembles): [bool, bool], default = {}.   "
         "The list provides the booleans to [block_averages_bool, console_output_bool]. "
         "This outputs the pressure data into the block averages and console output/log files."
-        "".format(_get_default_variables_dict()["OutPressure"]),
+        "".format(default_input_variables_dict["OutPressure"]),
         "OutMolNum": "Output Data (all ensembles): [bool, bool], default = {}.   "
         "The list provides the booleans to [block_averages_bool, console_output_bool]. "
         "This outputs the number of molecules data into the block averages and console "
         "output/log files."
-        "".format(_get_default_variables_dict()["OutMolNum"]),
+        "".format(default_input_variables_dict["OutMolNum"]),
         "OutDensity": "Output Data (all ensembles): [bool, bool], default = {}.   "
         "The list provides the booleans to [block_averages_bool, console_output_bool]. "
         "This outputs the density data into the block averages and console output/log files."
-        "".format(_get_default_variables_dict()["OutDensity"]),
+        "".format(default_input_variables_dict["OutDensity"]),
         "OutVolume": "Output Data (all ensembles): [bool, bool], default = {}.   "
         "The list provides the booleans to [block_averages_bool, console_output_bool]. "
         "This outputs the volume data into the block averages and console output/log files."
-        "".format(_get_default_variables_dict()["OutVolume"]),
+        "".format(default_input_variables_dict["OutVolume"]),
         "OutSurfaceTension": "Output Data (all ensembles): [bool, bool], default = {}. "
         "The list provides the booleans to [block_averages_bool, console_output_bool]. "
         "This outputs the surface tension data into the block averages and console "
         "output/log files."
-        "".format(_get_default_variables_dict()["OutSurfaceTension"]),
+        "".format(default_input_variables_dict["OutSurfaceTension"]),
         # free energy calculation in NVT and NPT ensembles.
         "FreeEnergyCalc": "Free Energy Calcs (NVT and NPT only): list [bool , int (> 0)] or "
         "[Generate_data_bool , steps_per_data_output_int], default = {}. "
@@ -587,14 +595,14 @@ def _get_all_possible_input_variables(description=False):
         "the calculation. The int/step frequency sets the frequency of calculating the free energy."
         "WARNING: When using the free energy calculations, RcutLow needs to be set to zero (RcutLow=0);"
         "otherwise, the free energy calculations can produce results that are slightly off or wrong."
-        "".format(_get_default_variables_dict()["FreeEnergyCalc"]),
+        "".format(default_input_variables_dict["FreeEnergyCalc"]),
         "MoleculeType": "Free Energy Calcs (NVT and NPT only): list [str , int (> 0)] or "
         '["residue_name" , residue_ID], '
         "The user must set this variable as there is no working default (default = {}). "
         'Note: ONLY 4 characters can be used for the string (i.e., "residue_name"). '
         "Sets the solute molecule kind (residue name) and molecule number (residue ID), "
         "which absolute solvation free will be calculated for."
-        "".format(_get_default_variables_dict()["MoleculeType"]),
+        "".format(default_input_variables_dict["MoleculeType"]),
         "InitialState": "Free Energy Calcs (NVT and NPT only): int (>= 0), "
         "The user must set this variable as there is no working default (default = {}). "
         "The index of LambdaCoulomb and LambdaVDW vectors. Sets the index of the"
@@ -602,7 +610,7 @@ def _get_all_possible_input_variables(description=False):
         "VDW and Coulomb interactions. "
         "WARNING: This must an integer within the vector count of the LambdaVDW and LambdaCoulomb, "
         "in which the counting starts at 0.  "
-        "".format(_get_default_variables_dict()["InitialState"]),
+        "".format(default_input_variables_dict["InitialState"]),
         "LambdaVDW": "Free Energy Calcs (NVT and NPT only): list of floats (0 <= floats <= 1), "
         "The user must set this variable as there is no working default (default = {}). "
         "Lambda values for VDW interaction in ascending order. Sets the intermediate "
@@ -612,7 +620,7 @@ def _get_all_possible_input_variables(description=False):
         "starting with 0.0 and ending with 1.0; otherwise, the program will terminate."
         "Example of ascending order 1: [0.0, 0.1, 1.0] "
         "Example of ascending order 2: [0.0, 0.1, 0.2, 0.4, 0.9, 1.0] "
-        "".format(_get_default_variables_dict()["LambdaVDW"]),
+        "".format(default_input_variables_dict["LambdaVDW"]),
         "LambdaCoulomb": "Free Energy Calcs (NVT and NPT only):  list of floats (0 <= floats <= 1), "
         "The user must set this variable as there is no working default (default = {}). "
         "Lambda values for Coulombic interaction in ascending order. Sets the intermediate "
@@ -624,24 +632,24 @@ def _get_all_possible_input_variables(description=False):
         "starting with 0.0 and ending with 1.0; otherwise, the program will terminate."
         "Example of ascending order 1: [0.0, 0.1, 1.0] "
         "Example of ascending order 2: [0.0, 0.1, 0.2, 0.4, 0.9, 1.0] "
-        "".format(_get_default_variables_dict()["LambdaCoulomb"]),
+        "".format(default_input_variables_dict["LambdaCoulomb"]),
         "ScaleCoulomb": "Free Energy Calcs (NVT and NPT only): bool, default = {}, "
         "Determines to scale the Coulombic interaction non-linearly (soft-core scheme) or not. "
         "True if the Coulombic interaction needs to be scaled non-linearly. "
         "False if the Coulombic interaction needs to be scaled linearly. "
-        "".format(_get_default_variables_dict()["ScaleCoulomb"]),
+        "".format(default_input_variables_dict["ScaleCoulomb"]),
         "ScalePower": "Free Energy Calcs (NVT and NPT only): int (>= 0), default = {}, "
         "The p value in the soft-core scaling scheme, where the distance between "
         "solute and solvent is scaled non-linearly."
-        "".format(_get_default_variables_dict()["ScalePower"]),
+        "".format(default_input_variables_dict["ScalePower"]),
         "ScaleAlpha": "Free Energy Calcs (NVT and NPT only): int or float (>= 0), default = {}, "
         "The alpha value in the soft-core scaling scheme, where the distance "
         "between solute and solvent is scaled non-linearly."
-        "".format(_get_default_variables_dict()["ScaleAlpha"]),
+        "".format(default_input_variables_dict["ScaleAlpha"]),
         "MinSigma": "Free Energy Calcs (NVT and NPT only): unyt.unyt_quantity in length units (>= 0), default = {}, "
         "The minimum sigma value in the soft-core scaling scheme (written in Angstroms), where the "
         "distance between solute and solvent is scaled non-linearly."
-        "".format(_get_default_variables_dict()["MinSigma"]),
+        "".format(default_input_variables_dict["MinSigma"]),
         # moves without MEMC
         "DisFreq": "Std. MC moves (all ensembles)                     : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
@@ -649,14 +657,14 @@ def _get_all_possible_input_variables(description=False):
         "(i.e., fraction of displacement moves). Note: all of the move types"
         "are not available in for every ensemble. Note: all of the move fractions"
         "must sum to 1, or the control file writer will fail.  "
-        "".format(_get_default_variables_dict()["DisFreq"]),
+        "".format(default_input_variables_dict["DisFreq"]),
         "RotFreq": "Std. MC moves (all ensembles)                     : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which the rotation move will occur "
         "(i.e., fraction of rotation moves). Note: all of the move types"
         "are not available in for every ensemble. Note: all of the move fractions"
         "must sum to 1, or the control file writer will fail.  "
-        "".format(_get_default_variables_dict()["RotFreq"]),
+        "".format(default_input_variables_dict["RotFreq"]),
         "IntraSwapFreq": "Std. MC moves (all ensembles)                     : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which the molecule will be removed from a "
@@ -664,7 +672,7 @@ def _get_all_possible_input_variables(description=False):
         "algorithm. (i.e., fraction of intra-molecule swap moves). Note: all of the move types"
         "are not available in for every ensemble. Note: all of the move fractions"
         "must sum to 1, or the control file writer will fail.  "
-        "".format(_get_default_variables_dict()["IntraSwapFreq"]),
+        "".format(default_input_variables_dict["IntraSwapFreq"]),
         "SwapFreq": "Std. MC moves (only GEMC_NPT, GEMC_NVT, and GCMC) : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "For Gibbs and Grand Canonical (GC) ensemble runs only: Fractional "
@@ -672,7 +680,7 @@ def _get_all_possible_input_variables(description=False):
         "configurational-bias. (i.e., fraction of molecule swaps moves). Note: all of the move types"
         "are not available in for every ensemble. Note: all of the move fractions"
         "must sum to 1, or the control file writer will fail.  "
-        "".format(_get_default_variables_dict()["SwapFreq"]),
+        "".format(default_input_variables_dict["SwapFreq"]),
         "RegrowthFreq": "Std. MC moves (all ensembles)                     : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which part of the molecule will be "
@@ -680,7 +688,7 @@ def _get_all_possible_input_variables(description=False):
         "(i.e., fraction of molecular growth moves). Note: all of the move types"
         "are not available in for every ensemble. Note: all of the move fractions"
         "must sum to 1, or the control file writer will fail.  "
-        "".format(_get_default_variables_dict()["RegrowthFreq"]),
+        "".format(default_input_variables_dict["RegrowthFreq"]),
         "CrankShaftFreq": "Std. MC moves (all ensembles)                    : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which crankshaft move will occur. "
@@ -690,14 +698,14 @@ def _get_all_possible_input_variables(description=False):
         "(i.e., fraction of crankshaft moves). Note: all of the move types"
         "are not available in for every ensemble. Note: all of the move fractions"
         "must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["CrankShaftFreq"]),
+        "".format(default_input_variables_dict["CrankShaftFreq"]),
         "VolFreq": "Std. MC moves (only  GEMC_NPT  and  NPT )        : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at  which a volume move will occur "
         "(i.e., fraction of Volume moves). "
         "Note: all of the move types are not available in for every ensemble. "
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["VolFreq"]),
+        "".format(default_input_variables_dict["VolFreq"]),
         "MultiParticleFreq": "Std. MC moves (all ensembles)                     : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which multi-particle move will "
@@ -708,7 +716,7 @@ def _get_all_possible_input_variables(description=False):
         "Note: Both MultiParticle (MultiParticleFreq) and MultiParticleBrownian "
         "(MultiParticleBrownianFreq) cannot be used at the same time. "
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["MultiParticleFreq"]),
+        "".format(default_input_variables_dict["MultiParticleFreq"]),
         "MultiParticleBrownianFreq": "Std. MC moves (all ensembles)                     : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which multi-particle brownian move will occur. In this "
@@ -719,19 +727,19 @@ def _get_all_possible_input_variables(description=False):
         "Note: Both MultiParticle (MultiParticleFreq) and MultiParticleBrownian "
         "(MultiParticleBrownianFreq) cannot be used at the same time. "
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["MultiParticleFreq"]),
+        "".format(default_input_variables_dict["MultiParticleFreq"]),
         "MultiParticleLiquid": "bool, default=True (GEMC-only)                  : "
         "Use the multi-particle moves (MultiParticleFreq and MultiParticleBrownianFreq) "
         "in the liquid phase. "
         "Note: GOMC determines the boxes are liquid or gas/vapor before "
         "running each move, based on the calculated density of the GEMC boxes."
-        "".format(_get_default_variables_dict()["MultiParticleLiquid"]),
+        "".format(default_input_variables_dict["MultiParticleLiquid"]),
         "MultiParticleGas": "bool, default=False (GEMC-only)                    : "
         "Use the multi-particle moves (MultiParticleFreq and MultiParticleBrownianFreq) "
         "in the gas/vapor phase. "
         "Note: GOMC determines the boxes are liquid or gas/vapor before "
         "running each move, based on the calculated density of the GEMC boxes."
-        "".format(_get_default_variables_dict()["MultiParticleGas"]),
+        "".format(default_input_variables_dict["MultiParticleGas"]),
         # MEMC moves
         "IntraMEMC-1Freq": "MEMC MC moves (all ensembles)                     : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
@@ -741,7 +749,7 @@ def _get_all_possible_input_variables(description=False):
         "ExchangeVolumeDim, ExchangeRatio, ExchangeSmallKind, and ExchangeLargeKind."
         "Note: all of the move types are not available in for every ensemble."
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["IntraMEMC-1Freq"]),
+        "".format(default_input_variables_dict["IntraMEMC-1Freq"]),
         "MEMC-1Freq": "MEMC MC moves (only GEMC_NPT, GEMC_NVT, and GCMC) : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which specified number of small molecule kind will be exchanged "
@@ -750,7 +758,7 @@ def _get_all_possible_input_variables(description=False):
         "ExchangeSmallKind, and ExchangeLargeKind."
         "Note: all of the move types are not available in for every ensemble."
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["MEMC-1Freq"]),
+        "".format(default_input_variables_dict["MEMC-1Freq"]),
         "IntraMEMC-2Freq": "MEMC MC moves (all ensembles)                     : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which specified number of small molecule kind "
@@ -761,7 +769,7 @@ def _get_all_possible_input_variables(description=False):
         "ExchangeLargeKind, SmallKindBackBone, and LargeKindBackBone. "
         "Note: all of the move types are not available in for every ensemble."
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["IntraMEMC-2Freq"]),
+        "".format(default_input_variables_dict["IntraMEMC-2Freq"]),
         "MEMC-2Freq": "MEMC MC moves (only GEMC_NPT, GEMC_NVT, and GCMC) : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which specified number of small molecule kind will be "
@@ -772,7 +780,7 @@ def _get_all_possible_input_variables(description=False):
         "ExchangeSmallKind, ExchangeLargeKind, SmallKindBackBone, and LargeKindBackBone. "
         "Note: all of the move types are not available in for every ensemble."
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["MEMC-2Freq"]),
+        "".format(default_input_variables_dict["MEMC-2Freq"]),
         "MEMC-2-LiqFreq": "MEMC MC moves (only GEMC_NPT, GEMC_NVT, and GCMC) : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which specified number of small molecule kind will be "
@@ -784,7 +792,7 @@ def _get_all_possible_input_variables(description=False):
         "this move is designed for Liquid-Liquid Equilibria"
         "Note: all of the move types are not available in for every ensemble."
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["MEMC-2-LiqFreq"]),
+        "".format(default_input_variables_dict["MEMC-2-LiqFreq"]),
         "IntraMEMC-3Freq": "MEMC MC moves (all ensembles)                     : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which specified number of small molecule kind will be "
@@ -795,7 +803,7 @@ def _get_all_possible_input_variables(description=False):
         "ExchangeLargeKind, and LargeKindBackBone. "
         "Note: all of the move types are not available in for every ensemble."
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["IntraMEMC-3Freq"]),
+        "".format(default_input_variables_dict["IntraMEMC-3Freq"]),
         "MEMC-3Freq": "MEMC MC moves (only GEMC_NPT, GEMC_NVT, and GCMC) : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which specified number of small molecule kind will be exchanged "
@@ -806,7 +814,7 @@ def _get_all_possible_input_variables(description=False):
         "and LargeKindBackBone. "
         "Note: all of the move types are not available in for every ensemble."
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["MEMC-3Freq"]),
+        "".format(default_input_variables_dict["MEMC-3Freq"]),
         "MEMC-3-LiqFreq": "MEMC MC moves (only GEMC_NPT, GEMC_NVT, and GCMC) : "
         "int or float (0 <= value <= 1), default are specific for each ensemble {}. "
         "Fractional percentage at which specified number of small molecule kind will be exchanged "
@@ -818,7 +826,7 @@ def _get_all_possible_input_variables(description=False):
         "Design for LLE"
         "Note: all of the move types are not available in for every ensemble."
         "Note: all of the move fractions must sum to 1, or the control file writer will fail. "
-        "".format(_get_default_variables_dict()["MEMC-3-LiqFreq"]),
+        "".format(default_input_variables_dict["MEMC-3-LiqFreq"]),
         # MEMC move parameters
         "ExchangeVolumeDim": "MEMC parameters (all ensembles)                   : "
         "list of 3 floats or integers "
@@ -834,10 +842,10 @@ def _get_all_possible_input_variables(description=False):
         "Note: In case of exchanging 1 small molecule kind with 1 large molecule kind in "
         "IntraMEMC-2, IntraMEMC-3, MEMC-2, MEMC-3 Monte Carlo moves, the sub-volume "
         "dimension has no effect on acceptance rate. "
-        "".format(_get_default_variables_dict()["ExchangeVolumeDim"]),
+        "".format(default_input_variables_dict["ExchangeVolumeDim"]),
         "MEMC_DataInput": "MEMC parameters (availablity based on selelection): nested lists, "
         + "default = {}.  ".format(
-            _get_default_variables_dict()["MEMC_DataInput"]
+            default_input_variables_dict["MEMC_DataInput"]
         )
         + "Enter data as a list with some sub-lists as follows: "
         "[[ExchangeRatio_int (> 0), ExchangeLargeKind_str, "
@@ -974,13 +982,13 @@ def _get_all_possible_input_variables(description=False):
         'Alternatively, the user can just set the value to ["ALL"] or "ALL", which covers all the residues. '
         '\t\t\t\t\t\t\t\t\t\t\t\t\t --- "SubVolumeRigidSwap" : bool, '
         + "default = {} ".format(
-            _get_default_variables_dict()["SubVolumeRigidSwap".lower()]
+            default_input_variables_dict["SubVolumeRigidSwap".lower()]
         )
         + "Choose whether to use a rigid or flexible molecule insertion using CD-CBMC for the subVolume. "
         "True uses a rigid molecule insertion, while False uses a flexible molecule insertion "
         '\t\t\t\t\t\t\t\t\t\t\t\t\t --- "SubVolumePBC" : str ("X", "XY", "XZ", "XYZ", "Y", "YZ", or "Z"), '
         + "default = {} ".format(
-            _get_default_variables_dict()["SubVolumePBC".lower()]
+            default_input_variables_dict["SubVolumePBC".lower()]
         )
         + "Apply periodic boundary condition (PBC) in selected axes for the subVolume. "
         'Example 1, "X" applies PBC only in the X axis. Example 2, "XY" applies PBC only in the X and Y axes. '
@@ -1022,15 +1030,12 @@ def _get_all_possible_input_variables(description=False):
         # insert citation here:
         # ******************************************************************************************************
     }
-    if description:
-        return valid_input_variables
-    else:
-        return list(valid_input_variables.keys())
+    return valid_input_variables
 
 
-def _get_default_variables_dict():
+def _build_default_variables_dict():
     """
-    Provides a dictionary of the default variables inputs and their default settings (user optional).
+    Builds a dictionary of the default variables inputs and their default settings (user optional).
 
     Returns
     ---------
@@ -1256,6 +1261,330 @@ def _get_default_variables_dict():
     return default_input_variables_dict
 
 
+# the GOMC ensembles, which the control file can be written for
+_GOMC_ENSEMBLE_TYPES = ("NVT", "NPT", "GEMC_NVT", "GEMC_NPT", "GCMC")
+
+# the GOMCControl value checking method for each variable input (user optional),
+# or None if the variable has its own specific checks in GOMCControl
+_control_variable_validator_dict = {
+    "PRNG": None,
+    "ParaTypeCHARMM": "ck_input_variable_true_or_false",
+    "ParaTypeMie": "ck_input_variable_true_or_false",
+    "ParaTypeMARTINI": "ck_input_variable_true_or_false",
+    "RcutCoulomb_box_0": "ck_input_variable_int_or_float_zero_or_greater",
+    "RcutCoulomb_box_1": "ck_input_variable_int_or_float_zero_or_greater",
+    "Pressure": "ck_input_variable_int_or_float_zero_or_greater",
+    "Rcut": "ck_input_variable_int_or_float_zero_or_greater",
+    "RcutLow": "ck_input_variable_int_or_float_zero_or_greater",
+    "LRC": "ck_input_variable_true_or_false",
+    "IPC": "ck_input_variable_true_or_false",
+    "Exclude": None,
+    "Potential": None,
+    "Rswitch": "ck_input_variable_int_or_float_zero_or_greater",
+    "ElectroStatic": "ck_input_variable_true_or_false",
+    "Ewald": "ck_input_variable_true_or_false",
+    "CachedFourier": "ck_input_variable_true_or_false",
+    "Tolerance": "ck_input_variable_float_greater_zero_less_1",
+    "Dielectric": "ck_input_variable_int_or_float_zero_or_greater",
+    "PressureCalc": "ck_input_variable_list_bool_int_zero_or_greater",
+    "EqSteps": "ck_input_variable_int_greater_zero",
+    "AdjSteps": "ck_input_variable_int_greater_zero",
+    "VDWGeometricSigma": "ck_input_variable_true_or_false",
+    "useConstantArea": "ck_input_variable_true_or_false",
+    "FixVolBox0": "ck_input_variable_true_or_false",
+    "ChemPot": "ck_input_variable_GCMC_chempot_dict",
+    "Fugacity": "ck_input_variable_GCMC_fugacity_dict",
+    "CBMC_First": "ck_input_variable_int_zero_or_greater",
+    "CBMC_Nth": "ck_input_variable_int_zero_or_greater",
+    "CBMC_Ang": "ck_input_variable_int_zero_or_greater",
+    "CBMC_Dih": "ck_input_variable_int_zero_or_greater",
+    "OutputName": "ck_input_variable_str_with_no_spaces",
+    "CoordinatesFreq": "ck_input_variable_list_bool_int_greater_zero",
+    "DCDFreq": "ck_input_variable_list_bool_int_greater_zero",
+    "RestartFreq": "ck_input_variable_list_bool_int_greater_zero",
+    "CheckpointFreq": "ck_input_variable_list_bool_int_greater_zero",
+    "ConsoleFreq": "ck_input_variable_list_bool_int_greater_zero",
+    "BlockAverageFreq": "ck_input_variable_list_bool_int_greater_zero",
+    "HistogramFreq": "ck_input_variable_list_bool_int_greater_zero",
+    "DistName": "ck_input_variable_str_with_no_spaces",
+    "HistName": "ck_input_variable_str_with_no_spaces",
+    "RunNumber": "ck_input_variable_int_greater_zero",
+    "RunLetter": None,
+    "SampleFreq": "ck_input_variable_int_greater_zero",
+    "OutEnergy": "ck_input_variable_list_bool_bool",
+    "OutPressure": "ck_input_variable_list_bool_bool",
+    "OutMolNum": "ck_input_variable_list_bool_bool",
+    "OutDensity": "ck_input_variable_list_bool_bool",
+    "OutVolume": "ck_input_variable_list_bool_bool",
+    "OutSurfaceTension": "ck_input_variable_list_bool_bool",
+    "FreeEnergyCalc": "ck_input_variable_list_bool_int_greater_zero",
+    "MoleculeType": "ck_input_variable_list_residue_str_int_greater_zero",
+    "InitialState": "ck_input_variable_int_zero_or_greater",
+    "LambdaVDW": "ck_input_variable_list_of_floats_zero_to_1",
+    "LambdaCoulomb": "ck_input_variable_list_of_floats_zero_to_1",
+    "ScaleCoulomb": "ck_input_variable_true_or_false",
+    "ScalePower": "ck_input_variable_int_zero_or_greater",
+    "ScaleAlpha": "ck_input_variable_int_or_float_zero_or_greater",
+    "MinSigma": "ck_input_variable_int_or_float_zero_or_greater",
+    "DisFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "RotFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "IntraSwapFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "SwapFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "RegrowthFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "CrankShaftFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "VolFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "MultiParticleFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "MultiParticleBrownianFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "MultiParticleLiquid": "ck_input_variable_true_or_false",
+    "MultiParticleGas": "ck_input_variable_true_or_false",
+    "IntraMEMC-1Freq": "ck_input_variable_int_or_float_zero_to_1",
+    "MEMC-1Freq": "ck_input_variable_int_or_float_zero_to_1",
+    "IntraMEMC-2Freq": "ck_input_variable_int_or_float_zero_to_1",
+    "MEMC-2Freq": "ck_input_variable_int_or_float_zero_to_1",
+    "MEMC-2-LiqFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "IntraMEMC-3Freq": "ck_input_variable_int_or_float_zero_to_1",
+    "MEMC-3Freq": "ck_input_variable_int_or_float_zero_to_1",
+    "MEMC-3-LiqFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "ExchangeVolumeDim": None,
+    "MEMC_DataInput": None,
+    "TargetedSwapFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "IntraTargetedSwapFreq": "ck_input_variable_int_or_float_zero_to_1",
+    "TargetedSwap_DataInput": None,
+}
+
+# the variable input types, which are checked by each GOMCControl checking method
+_control_validator_type_dict = {
+    "ck_input_variable_true_or_false": "bool",
+    "ck_input_variable_int_or_float_zero_or_greater": "int or float (>= 0)",
+    "ck_input_variable_int_zero_or_greater": "int (>= 0)",
+    "ck_input_variable_float_zero_or_greater": "float (>= 0)",
+    "ck_input_variable_int_or_float_greater_zero": "int or float (> 0)",
+    "ck_input_variable_int_greater_zero": "int (> 0)",
+    "ck_input_variable_float_greater_zero": "float (> 0)",
+    "ck_input_variable_float_greater_zero_less_1": "float (0 < float < 1)",
+    "ck_input_variable_int_or_float_zero_to_1": "int or float (0 <= value <= 1)",
+    "ck_input_variable_float_zero_to_1": "float (0 <= float <= 1)",
+    "ck_input_variable_int_zero_to_1": "int (0 <= int <= 1)",
+    "ck_input_variable_list_bool_int_zero_or_greater": "list [bool, int (>= 0)]",
+    "ck_input_variable_list_bool_int_greater_zero": "list [bool, int (> 0)]",
+    "ck_input_variable_list_residue_str_int_greater_zero": "list [str, int (> 0)]",
+    "ck_input_variable_list_bool_bool": "list [bool, bool]",
+    "ck_input_variable_list_of_floats_zero_to_1": "list of floats (0 <= floats <= 1)",
+    "ck_input_variable_GCMC_chempot_dict": "dict {str, unyt.unyt_quantity in energy units}",
+    "ck_input_variable_GCMC_fugacity_dict": "dict {str, unyt.unyt_quantity in pressure units (>= 0)}",
+    "ck_input_variable_str_with_no_spaces": "str (NO SPACES)",
+}
+
+# the variable input types for the variables with their own specific checks in GOMCControl
+_control_variable_specific_type_dict = {
+    "PRNG": 'str or int (>= 0) ("RANDOM" or integer)',
+    "Exclude": 'str ("1-2", "1-3", or "1-4")',
+    "Potential": 'str ("VDW", "EXP6", "SHIFT" or "SWITCH")',
+    "RunLetter": "str (1 alphabetic character only)",
+    "ExchangeVolumeDim": "list of 3 floats or integers (> 0)",
+    "MEMC_DataInput": "nested lists",
+    "TargetedSwap_DataInput": "dict",
+}
+
+# the compiled control variable registry, which is built upon its first use
+# (see _get_control_variable_registry)
+_control_variable_registry_cache_dict = {}
+
+
+def _freeze_control_default_value(default_value):
+    """
+    Provides a read-only copy of a default variable setting for the control variable registry.
+
+    The lists are converted to tuples, the dicts to read-only dicts
+    (types.MappingProxyType), and the numpy and unyt arrays to read-only array copies,
+    including the nested values, so the registry default values can not be modified.
+
+    Parameters
+    ----------
+    default_value: any
+        The default variable setting.
+
+    Returns
+    ---------
+    frozen_default_value: any
+        The read-only copy of the default variable setting.
+    """
+    if isinstance(default_value, (list, tuple)):
+        return tuple(
+            _freeze_control_default_value(value_i) for value_i in default_value
+        )
+    elif isinstance(default_value, dict):
+        return MappingProxyType(
+            {
+                key_i: _freeze_control_default_value(value_i)
+                for key_i, value_i in default_value.items()
+            }
+        )
+    elif isinstance(default_value, np.ndarray):
+        frozen_default_value = default_value.copy()
+        frozen_default_value.flags.writeable = False
+        return frozen_default_value
+    else:
+        return default_value
+
+
+def _compile_control_variable_registry():
+    """
+    Compiles the registry of the variables inputs (user optional) and stores it in
+    the module cache (_control_variable_registry_cache_dict).
+
+    The default variables, their descriptions, and the valid ensembles for each
+    variable are only built once here, instead of every time a GOMCControl object is
+    constructed or the valid variables are printed or checked.
+    """
+    default_input_variables_dict = _build_default_variables_dict()
+    valid_input_variables_dict = _build_all_possible_input_variables_dict(
+        default_input_variables_dict
+    )
+
+    ensemble_input_variables_dict = {}
+    for ensemble_type_i in _GOMC_ENSEMBLE_TYPES:
+        ensemble_input_variables_dict[ensemble_type_i] = tuple(
+            _build_possible_ensemble_input_variables(ensemble_type_i)
+        )
+
+    control_variable_registry_dict = {}
+    for variable_i, description_i in valid_input_variables_dict.items():
+        validator_i = _control_variable_validator_dict.get(variable_i)
+        if validator_i is None:
+            type_i = _control_variable_specific_type_dict.get(variable_i)
+        else:
+            type_i = _control_validator_type_dict[validator_i]
+
+        control_variable_registry_dict[variable_i] = MappingProxyType(
+            {
+                "type": type_i,
+                "default": _freeze_control_default_value(
+                    default_input_variables_dict.get(variable_i)
+                ),
+                "valid_ensembles": tuple(
+                    ensemble_type_j
+                    for ensemble_type_j in _GOMC_ENSEMBLE_TYPES
+                    if variable_i
+                    in ensemble_input_variables_dict[ensemble_type_j]
+                ),
+                "validator": validator_i,
+                "description": description_i,
+            }
+        )
+
+    _control_variable_registry_cache_dict.update(
+        {
+            "default_input_variables": default_input_variables_dict,
+            "ensemble_input_variables": MappingProxyType(
+                ensemble_input_variables_dict
+            ),
+            "ensemble_input_variables_sets": MappingProxyType(
+                {
+                    ensemble_type_i: frozenset(ensemble_variables_i)
+                    for (
+                        ensemble_type_i,
+                        ensemble_variables_i,
+                    ) in ensemble_input_variables_dict.items()
+                }
+            ),
+            "lower_case_to_input_variables": MappingProxyType(
+                {
+                    variable_i.lower(): variable_i
+                    for variable_i in control_variable_registry_dict.keys()
+                }
+            ),
+            "registry": MappingProxyType(control_variable_registry_dict),
+        }
+    )
+
+
+def _get_control_variable_registry():
+    """
+    Provides the compiled registry of the variables inputs (user optional) for all possible ensembles.
+
+    The registry is built once, upon its first use, and then the same registry is
+    provided to all the GOMCControl objects and the valid variable printing and checking
+    functions.  The registry, its entries, and the entry default values are read-only
+    (use _get_default_variables_dict for a modifiable copy of the default values).
+
+    Returns
+    ---------
+    control_variable_registry: types.MappingProxyType
+        A read-only dict of the variables inputs (keys), in the GOMC manual order,
+        and their read-only entries (values), which have the keys:
+
+        --- "type": str, the valid variable input type.
+
+        --- "default": the read-only default variable setting (None if not provided),
+        with the lists as tuples and the dicts as types.MappingProxyType.
+
+        --- "valid_ensembles": tuple of str, the ensembles which can use the variable.
+
+        --- "validator": str or None, the GOMCControl method which checks the
+        variable input value, or None if GOMCControl has specific checks for it.
+
+        --- "description": str, the variable input description.
+    """
+    if not _control_variable_registry_cache_dict:
+        _compile_control_variable_registry()
+
+    return _control_variable_registry_cache_dict["registry"]
+
+
+def _get_default_variables_dict():
+    """
+    Provides a dictionary of the default variables inputs and their default settings (user optional).
+
+    The defaults are taken from the compiled control variable registry, and a new
+    copy is provided for every call, since the GOMCControl object modifies some of them.
+
+    Returns
+    ---------
+    default_input_variables_dict: dict
+        Provides a dict of the default variables inputs (user optional)
+
+    """
+    _get_control_variable_registry()
+
+    return copy.deepcopy(
+        _control_variable_registry_cache_dict["default_input_variables"]
+    )
+
+
+def _get_all_possible_input_variables(description=False):
+    """
+    Provides a list of the variables inputs (user optional) for all possible ensembles.
+
+    Parameters
+    ----------
+    description:  bool, default = False.
+        If True, it prints the descriptions of the input_variables (i.e. dict),
+        If False, it only prints the input_variables without the descriptions (i.e. list)
+
+    Returns
+    ---------
+    valid_input_variables: dict or list, default = list.
+        If the description = True then a dict is provided with the key and value.
+        if the description = False then a list of the dict keys is provided.
+
+    Note:
+    Variables and text extracted with permission from the GOMC manual version 2.60.
+    Some of the text was modified from its original version.
+    Cite: Potoff, Jeffrey; Schwiebert, Loren; et. al. GOMC Documentation.
+    https://raw.githubusercontent.com/GOMC-WSU/GOMC/master/GOMC_Manual.pdf, 2021.
+    """
+    control_variable_registry = _get_control_variable_registry()
+
+    if description:
+        return {
+            variable_i: entry_i["description"]
+            for variable_i, entry_i in control_variable_registry.items()
+        }
+    else:
+        return list(control_variable_registry.keys())
+
+
 def print_required_input(description=False):
     """
     Prints the required ensemble arguments with an optional description based on the ensemble type
@@ -1325,9 +1654,15 @@ def check_valid_ensemble_input_variables(
 
     bad_key_inputs_list = []
 
-    valid_input_variables_list = _get_possible_ensemble_input_variables(
-        ensemble_type
-    )
+    # use the compiled registry's set of the valid variables for fast lookups
+    _get_control_variable_registry()
+    valid_input_variables_list = _control_variable_registry_cache_dict[
+        "ensemble_input_variables_sets"
+    ].get(ensemble_type)
+    if valid_input_variables_list is None:
+        valid_input_variables_list = _get_possible_ensemble_input_variables(
+            ensemble_type
+        )
     ensemble_has_valid_input_variables_list = True
     for iter in range(0, len(testing_input_variables_list)):
         if testing_input_variables_list[iter] not in valid_input_variables_list:
@@ -1396,9 +1731,9 @@ def print_valid_ensemble_input_variables(ensemble_type, description=False):
         )
 
 
-def _get_possible_ensemble_input_variables(ensemble_type):
+def _build_possible_ensemble_input_variables(ensemble_type):
     """
-    Provides list of the possible optional input variables based on the ensemble type
+    Builds the list of the possible optional input variables based on the ensemble type
 
     Parameters
     ----------
@@ -1546,6 +1881,32 @@ def _get_possible_ensemble_input_variables(ensemble_type):
     return valid_input_variables_list
 
 
+def _get_possible_ensemble_input_variables(ensemble_type):
+    """
+    Provides list of the possible optional input variables based on the ensemble type
+
+    Parameters
+    ----------
+    ensemble_type: str, valid options are 'NVT', 'NPT', 'GEMC_NVT', 'GEMC_NPT', 'GCMC'
+        The ensemble type of the simulation.
+
+    Returns
+    ---------
+    valid_input_variables_list: list
+        A list possible optional input variables for the provided ensemble type.
+    """
+    _get_control_variable_registry()
+    ensemble_input_variables_dict = _control_variable_registry_cache_dict[
+        "ensemble_input_variables"
+    ]
+
+    if ensemble_type in ensemble_input_variables_dict:
+        return list(ensemble_input_variables_dict[ensemble_type])
+    else:
+        # an invalid ensemble_type, which warns and returns None
+        return _build_possible_ensemble_input_variables(ensemble_type)
+
+
 class GOMCControl:
     """
      Constructs the GOMC control file with user selected variables.
@@ -3336,18 +3697,14 @@ class GOMCControl:
             print_error_message = "ERROR: The input_variables_dict variable is not None or a dictionary."
             raise ValueError(print_error_message)
 
-        # Create all lower case spelled keywords, and return case specific keywords
-        # Also, creates a dict to convert the lower case keys to case sensitive keys
-        all_input_var_case_spec_list = _get_all_possible_input_variables(
-            description=False
+        # Get the dict to convert the lower case keys to case sensitive keys,
+        # which is compiled once with the control variable registry
+        _get_control_variable_registry()
+        all_input_var_case_unspec_to_spec_dict = (
+            _control_variable_registry_cache_dict[
+                "lower_case_to_input_variables"
+            ]
         )
-        all_input_var_case_unspec_list = []
-        all_input_var_case_unspec_to_spec_dict = {}
-        for var_i in all_input_var_case_spec_list:
-            all_input_var_case_unspec_list.append(var_i.lower())
-            all_input_var_case_unspec_to_spec_dict.update(
-                {var_i.lower(): var_i}
-            )
 
         # create/fix user case insensitive input variables (input_variables_dict) keys to case sensitive keys
         input_var_dict_orig_keys_list = dict_keys_to_list(
@@ -3355,7 +3712,7 @@ class GOMCControl:
         )
         for z_j in range(0, len(input_var_dict_orig_keys_list)):
             key_lower = input_var_dict_orig_keys_list[z_j].lower()
-            if key_lower in all_input_var_case_unspec_list:
+            if key_lower in all_input_var_case_unspec_to_spec_dict:
                 input_variables_dict[
                     all_input_var_case_unspec_to_spec_dict[key_lower]
                 ] = input_variables_dict.pop(input_var_dict_orig_keys_list[z_j])
@@ -3477,15 +3834,13 @@ class GOMCControl:
         input_variables_dict_keys_list = dict_keys_to_list(
             self.input_variables_dict
         )
-        if (
-            check_valid_ensemble_input_variables(
-                self.ensemble_type, input_variables_dict_keys_list
-            )[0]
-            is False
-        ):
-            returned_ck_bad_inputs_list = check_valid_ensemble_input_variables(
-                self.ensemble_type, input_variables_dict_keys_list
-            )[1]
+        (
+            ensemble_has_valid_input_variables,
+            returned_ck_bad_inputs_list,
+        ) = check_valid_ensemble_input_variables(
+            self.ensemble_type, input_variables_dict_keys_list
+        )
+        if ensemble_has_valid_input_variables is False:
             self.input_error = True
             print_error_message = (
                 "ERROR: All the correct input variables where not provided for the {} "
@@ -3591,17 +3946,25 @@ class GOMCControl:
             if input_var_keys_list[var_iter] == "Potential":
                 self.Potential = self.input_variables_dict["Potential"]
 
+        # check all the input variable values, which have a compiled validator,
+        # in a single pass (the variable specific checks are done below)
+        bad_input_variables_values_list.extend(
+            error_i[0]
+            for error_i in _check_input_variables_values(
+                {
+                    key_i: self.input_variables_dict[key_i]
+                    for key_i in input_var_keys_list
+                },
+                residues=self.residues,
+                collect_all=False,
+            )
+        )
+
         # check for bad input variables and list the bad ones
         for var_iter in range(0, len(input_var_keys_list)):
             # Set the Multi-particle move in GEMC in liquid and vapor/gas
             key = "MultiParticleLiquid"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3610,12 +3973,6 @@ class GOMCControl:
 
             key = "MultiParticleGas"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3642,12 +3999,6 @@ class GOMCControl:
 
             key = "ParaTypeCHARMM"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3659,12 +4010,6 @@ class GOMCControl:
 
             key = "ParaTypeMie"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3676,12 +4021,6 @@ class GOMCControl:
 
             key = "ParaTypeMARTINI"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3698,11 +4037,6 @@ class GOMCControl:
                         key, self.input_variables_dict[key]
                     )
                 )
-                self.ck_input_variable_int_or_float_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
 
                 if (
                     input_var_keys_list[var_iter] == key
@@ -3717,11 +4051,6 @@ class GOMCControl:
                         key, self.input_variables_dict[key]
                     )
                 )
-                self.ck_input_variable_int_or_float_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
 
                 if (
                     input_var_keys_list[var_iter] == key
@@ -3736,11 +4065,6 @@ class GOMCControl:
                         key, self.input_variables_dict[key]
                     )
                 )
-                self.ck_input_variable_int_or_float_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
 
                 if (
                     input_var_keys_list[var_iter] == key
@@ -3763,11 +4087,6 @@ class GOMCControl:
                     "after rcut self.input_variables_dict[key] = "
                     + str(self.input_variables_dict[key])
                 )
-                self.ck_input_variable_int_or_float_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
 
                 if (
                     input_var_keys_list[var_iter] == key
@@ -3782,11 +4101,6 @@ class GOMCControl:
                         key, self.input_variables_dict[key]
                     )
                 )
-                self.ck_input_variable_int_or_float_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
                 if isinstance(
                     self.input_variables_dict[key], float
                 ) or isinstance(self.input_variables_dict[key], int):
@@ -3801,12 +4115,6 @@ class GOMCControl:
 
             key = "LRC"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3815,12 +4123,6 @@ class GOMCControl:
 
             key = "IPC"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3865,11 +4167,6 @@ class GOMCControl:
                         key, self.input_variables_dict[key]
                     )
                 )
-                self.ck_input_variable_int_or_float_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
 
                 if (
                     (
@@ -3900,12 +4197,6 @@ class GOMCControl:
 
             key = "ElectroStatic"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3914,12 +4205,6 @@ class GOMCControl:
 
             key = "Ewald"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3928,12 +4213,6 @@ class GOMCControl:
 
             key = "CachedFourier"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3942,12 +4221,6 @@ class GOMCControl:
 
             key = "Tolerance"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_float_greater_zero_less_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3956,12 +4229,6 @@ class GOMCControl:
 
             key = "Dielectric"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3970,12 +4237,6 @@ class GOMCControl:
 
             key = "PressureCalc"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_int_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3984,12 +4245,6 @@ class GOMCControl:
 
             key = "EqSteps"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -3998,12 +4253,6 @@ class GOMCControl:
 
             key = "AdjSteps"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4012,12 +4261,6 @@ class GOMCControl:
 
             key = "VDWGeometricSigma"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4026,12 +4269,6 @@ class GOMCControl:
 
             key = "useConstantArea"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4040,12 +4277,6 @@ class GOMCControl:
 
             key = "FixVolBox0"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4055,12 +4286,6 @@ class GOMCControl:
             # ChemPot and Fugacity are only for GCMC
             key = "ChemPot"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_GCMC_chempot_dict(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4069,12 +4294,6 @@ class GOMCControl:
 
             key = "Fugacity"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_GCMC_fugacity_dict(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4083,12 +4302,6 @@ class GOMCControl:
 
             key = "CBMC_First"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4097,12 +4310,6 @@ class GOMCControl:
 
             key = "CBMC_Nth"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4111,12 +4318,6 @@ class GOMCControl:
 
             key = "CBMC_Ang"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4125,12 +4326,6 @@ class GOMCControl:
 
             key = "CBMC_Dih"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4139,12 +4334,6 @@ class GOMCControl:
 
             key = "OutputName"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_str_with_no_spaces(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4153,12 +4342,6 @@ class GOMCControl:
 
             key = "CoordinatesFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4167,12 +4350,6 @@ class GOMCControl:
 
             key = "DCDFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4181,12 +4358,6 @@ class GOMCControl:
 
             key = "RestartFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4195,12 +4366,6 @@ class GOMCControl:
 
             key = "CheckpointFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4209,12 +4374,6 @@ class GOMCControl:
 
             key = "ConsoleFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4223,12 +4382,6 @@ class GOMCControl:
 
             key = "BlockAverageFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4237,12 +4390,6 @@ class GOMCControl:
 
             key = "HistogramFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4251,12 +4398,6 @@ class GOMCControl:
 
             key = "DistName"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_str_with_no_spaces(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4265,12 +4406,6 @@ class GOMCControl:
 
             key = "HistName"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_str_with_no_spaces(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4279,12 +4414,6 @@ class GOMCControl:
 
             key = "RunNumber"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4313,12 +4442,6 @@ class GOMCControl:
 
             key = "SampleFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4327,12 +4450,6 @@ class GOMCControl:
 
             key = "OutEnergy"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_bool(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4341,12 +4458,6 @@ class GOMCControl:
 
             key = "OutPressure"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_bool(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4355,11 +4466,6 @@ class GOMCControl:
 
             key = "OutMolNum"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_bool(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4368,12 +4474,6 @@ class GOMCControl:
 
             key = "OutDensity"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_bool(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4382,12 +4482,6 @@ class GOMCControl:
 
             key = "OutVolume"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_bool(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4396,12 +4490,6 @@ class GOMCControl:
 
             key = "OutSurfaceTension"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_bool(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4410,12 +4498,6 @@ class GOMCControl:
 
             key = "FreeEnergyCalc"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_bool_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4424,12 +4506,6 @@ class GOMCControl:
 
             key = "MoleculeType"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_residue_str_int_greater_zero(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4438,12 +4514,6 @@ class GOMCControl:
 
             key = "InitialState"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4452,12 +4522,6 @@ class GOMCControl:
 
             key = "LambdaVDW"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_of_floats_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4466,12 +4530,6 @@ class GOMCControl:
 
             key = "LambdaCoulomb"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_list_of_floats_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4480,12 +4538,6 @@ class GOMCControl:
 
             key = "ScaleCoulomb"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_true_or_false(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4494,12 +4546,6 @@ class GOMCControl:
 
             key = "ScalePower"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4508,12 +4554,6 @@ class GOMCControl:
 
             key = "ScaleAlpha"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4527,11 +4567,6 @@ class GOMCControl:
                         key, self.input_variables_dict[key]
                     )
                 )
-                self.ck_input_variable_int_or_float_zero_or_greater(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
 
                 if (
                     input_var_keys_list[var_iter] == key
@@ -4542,12 +4577,6 @@ class GOMCControl:
             # standard MC moves
             key = "DisFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4556,12 +4585,6 @@ class GOMCControl:
 
             key = "RotFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4570,12 +4593,6 @@ class GOMCControl:
 
             key = "IntraSwapFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4584,12 +4601,6 @@ class GOMCControl:
 
             key = "SwapFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4600,12 +4611,6 @@ class GOMCControl:
 
             key = "RegrowthFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4614,12 +4619,6 @@ class GOMCControl:
 
             key = "CrankShaftFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4628,12 +4627,6 @@ class GOMCControl:
 
             key = "VolFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4644,12 +4637,6 @@ class GOMCControl:
 
             key = "MultiParticleFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4658,12 +4645,6 @@ class GOMCControl:
 
             key = "MultiParticleBrownianFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4675,12 +4656,6 @@ class GOMCControl:
             # MEMC moves freqencies
             key = "IntraMEMC-1Freq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4691,12 +4666,6 @@ class GOMCControl:
 
             key = "MEMC-1Freq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4707,12 +4676,6 @@ class GOMCControl:
 
             key = "IntraMEMC-2Freq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4723,12 +4686,6 @@ class GOMCControl:
 
             key = "MEMC-2Freq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4738,12 +4695,6 @@ class GOMCControl:
                     self.MEMC_2Freq = 0.00
             key = "MEMC-2-LiqFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4753,12 +4704,6 @@ class GOMCControl:
                     self.MEMC_2LiqFreq = 0.00
             key = "IntraMEMC-3Freq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4769,12 +4714,6 @@ class GOMCControl:
 
             key = "MEMC-3Freq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -4784,12 +4723,6 @@ class GOMCControl:
                     self.MEMC_3Freq = 0.00
             key = "MEMC_3-LiqFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -5189,12 +5122,6 @@ class GOMCControl:
 
             key = "TargetedSwapFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -5205,12 +5132,6 @@ class GOMCControl:
 
             key = "IntraTargetedSwapFreq"
             if input_var_keys_list[var_iter] == key:
-                self.ck_input_variable_int_or_float_zero_to_1(
-                    self.input_variables_dict,
-                    key,
-                    bad_input_variables_values_list,
-                )
-
                 if (
                     input_var_keys_list[var_iter] == key
                     and key in possible_ensemble_variables_list
@@ -6144,39 +6065,8 @@ class GOMCControl:
             )
             raise ValueError(print_error_message)
 
-        # check if both the ChemPot and Fugacity are not set to None.  Only one can be used
-        if (
-            self.Fugacity is not None
-            and self.ChemPot is not None
-            and self.ensemble_type == "GCMC"
-        ):
-            self.input_error = True
-            print_error_message = (
-                "ERROR:  In the GCMC ensemble, both Fugacity and ChemPot are provided. "
-                "Add a dictionary for either the Fugacity or ChemPot and set the other "
-                "variable to None. Note: Both the Fugacity or ChemPot and set to None by default"
-            )
-            raise ValueError(print_error_message)
-
-        # check that both the ChemPot and Fugacity are set to None.  Only one can be used
-        if (
-            self.Fugacity is None
-            and self.ChemPot is None
-            and self.ensemble_type == "GCMC"
-        ):
-            warn(
-                "ERROR: In the GCMC ensemble, neither Fugacity and ChemPot are provided (i.e., both are None). "
-                "Add a dictionary for either the Fugacity or ChemPot and set the other variable to None. "
-                "Note: Both the Fugacity or ChemPot and set to None by default"
-            )
-            self.input_error = True
-            print_error_message = (
-                "ERROR: In the GCMC ensemble, neither Fugacity and ChemPot are provided "
-                "(i.e., both are None). Add a dictionary for either the Fugacity or "
-                "ChemPot and set the other variable to None. "
-                "Note: Both the Fugacity or ChemPot and set to None by default"
-            )
-            raise ValueError(print_error_message)
+        # check that only the ChemPot or the Fugacity is used
+        self._check_chempot_and_fugacity_variables()
 
         # check that TargetedSwap_DataInput values are provided if self.TargetedSwapFreq
         # and self.IntraTargetedSwapFreq is not zero
@@ -6190,43 +6080,13 @@ class GOMCControl:
             )
             raise ValueError(print_error_message)
 
-        # check that either the ChemPot or Fugacity are set for the Target swap moves
-        # only ChemPot or Fugacity can be set
+        # check that the ChemPot or Fugacity used for the Target swap moves
+        # can be used in the ensemble
         if isinstance(self.TargetedSwap_DataInput, dict):
-            chempot_used = False
-            fugacity_used = False
-            for tag_id_keys_j in list(self.TargetedSwap_DataInput.keys()):
-                target_swap_tag_id_dict_key_data = self.TargetedSwap_DataInput[
-                    tag_id_keys_j
-                ]
-
-                for target_swap_dict_key_j_lower in list(
-                    target_swap_tag_id_dict_key_data.keys()
-                ):
-                    if target_swap_dict_key_j_lower in ["subvolumechempot"]:
-                        chempot_used = True
-
-                    if target_swap_dict_key_j_lower in ["subvolumefugacity"]:
-                        fugacity_used = True
-
-            if chempot_used is True and fugacity_used is True:
-                print_error_message = (
-                    "Both ChemPot and Fugacity were used in the "
-                    "TargetedSwap_DataInput dictionaries. "
-                    "However, only ChemPot or Fugacity may be used, not both."
-                )
-                raise ValueError(print_error_message)
-
-            if (chempot_used is True and self.Fugacity is not None) or (
-                fugacity_used is True and self.ChemPot is not None
-            ):
-                print_error_message = (
-                    "Both ChemPot and Fugacity were used in the "
-                    "TargetedSwap_DataInput dictionaries "
-                    "and in the standard GOMC swap inputs. "
-                    "However, only ChemPot or Fugacity may be used, not both."
-                )
-                raise ValueError(print_error_message)
+            (
+                chempot_used,
+                fugacity_used,
+            ) = self._get_targeted_swap_chempot_fugacity_used()
 
             if (
                 chempot_used is True or fugacity_used is True
@@ -6321,7 +6181,7 @@ class GOMCControl:
                             ]:
                                 self.TargetedSwap_DataInput[ts_tag_i].update(
                                     {
-                                        subvolume_keys_j: _get_default_variables_dict()[
+                                        subvolume_keys_j: default_input_variables_dict[
                                             subvolume_keys_j
                                         ]
                                     }
@@ -6411,7 +6271,147 @@ class GOMCControl:
                     )
                     raise ValueError(print_error_message)
 
-        # check that all required free energy values are provided and RcutLow is zero (0)
+        # check that the free energy variables and the lambda schedule are valid
+        self._check_free_energy_variables()
+
+        # check that RcutLow is zero (0) if the free energy calculations are used
+        if self.FreeEnergyCalc is not None and self.RcutLow != 0:
+            print_warning_message = (
+                "WARNING: The free energy calculations are being used when RcutLow is not zero (0), "
+                "which can produce free energy results that are slightly off or wrong. "
+                "Please set RcutLow to zero (RcutLow=0) when using the free energy calculations."
+            )
+            warn(print_warning_message)
+
+        # send a warning if the geometric mixing rule is used
+        if self.VDWGeometricSigma == True:
+            print_warning_message = (
+                "WARNING: The geometric combining rules is being used in the GOMC "
+                "control file.  If this is OK or intentional, please ignore this warning. "
+                "NOTE: This could just be the force file XML files correct parameters, "
+                "but many GOMC simulations utilize 'lorentz' mixing rules, so a "
+                "warning is provided."
+            )
+            warn(print_warning_message)
+
+        # check/ensure if the RestartFreq and CheckpointFreq are the same number of steps
+        if self.Checkpoint[0] is True and self.Restart is False:
+            print_error_message = (
+                "ERROR: If Checkpoint is True, Restart must also be True."
+            )
+            raise ValueError(print_error_message)
+
+        if (
+            self.CheckpointFreq[0] is True
+            and self.CheckpointFreq[1] != self.RestartFreq[1]
+        ):
+            print_error_message = (
+                "ERROR: If CheckpointFreq is True, the CheckpointFreq and RestartFreq "
+                "output frequencies must be the same to start GOMC. This ensures the "
+                "simulation can always be properly restarted."
+            )
+            raise ValueError(print_error_message)
+
+    def _check_chempot_and_fugacity_variables(self):
+        """
+        Checks that only the ChemPot or the Fugacity is provided in the GCMC ensemble,
+        and that only the ChemPot or the Fugacity is used in the TargetedSwap_DataInput
+        dictionaries and the standard GOMC swap inputs.
+        """
+        # check if both the ChemPot and Fugacity are not set to None.  Only one can be used
+        if (
+            self.Fugacity is not None
+            and self.ChemPot is not None
+            and self.ensemble_type == "GCMC"
+        ):
+            self.input_error = True
+            print_error_message = (
+                "ERROR:  In the GCMC ensemble, both Fugacity and ChemPot are provided. "
+                "Add a dictionary for either the Fugacity or ChemPot and set the other "
+                "variable to None. Note: Both the Fugacity or ChemPot and set to None by default"
+            )
+            raise ValueError(print_error_message)
+
+        # check that both the ChemPot and Fugacity are set to None.  Only one can be used
+        if (
+            self.Fugacity is None
+            and self.ChemPot is None
+            and self.ensemble_type == "GCMC"
+        ):
+            warn(
+                "ERROR: In the GCMC ensemble, neither Fugacity and ChemPot are provided (i.e., both are None). "
+                "Add a dictionary for either the Fugacity or ChemPot and set the other variable to None. "
+                "Note: Both the Fugacity or ChemPot and set to None by default"
+            )
+            self.input_error = True
+            print_error_message = (
+                "ERROR: In the GCMC ensemble, neither Fugacity and ChemPot are provided "
+                "(i.e., both are None). Add a dictionary for either the Fugacity or "
+                "ChemPot and set the other variable to None. "
+                "Note: Both the Fugacity or ChemPot and set to None by default"
+            )
+            raise ValueError(print_error_message)
+
+        # check that either the ChemPot or Fugacity are set for the Target swap moves
+        # only ChemPot or Fugacity can be set
+        if isinstance(self.TargetedSwap_DataInput, dict):
+            (
+                chempot_used,
+                fugacity_used,
+            ) = self._get_targeted_swap_chempot_fugacity_used()
+
+            if chempot_used is True and fugacity_used is True:
+                print_error_message = (
+                    "Both ChemPot and Fugacity were used in the "
+                    "TargetedSwap_DataInput dictionaries. "
+                    "However, only ChemPot or Fugacity may be used, not both."
+                )
+                raise ValueError(print_error_message)
+
+            if (chempot_used is True and self.Fugacity is not None) or (
+                fugacity_used is True and self.ChemPot is not None
+            ):
+                print_error_message = (
+                    "Both ChemPot and Fugacity were used in the "
+                    "TargetedSwap_DataInput dictionaries "
+                    "and in the standard GOMC swap inputs. "
+                    "However, only ChemPot or Fugacity may be used, not both."
+                )
+                raise ValueError(print_error_message)
+
+    def _get_targeted_swap_chempot_fugacity_used(self):
+        """
+        Gets if the ChemPot or the Fugacity are used in the TargetedSwap_DataInput dictionaries.
+
+        Returns
+        ---------
+        [chempot_used, fugacity_used]: list of bool
+            If the subvolumechempot and subvolumefugacity are used, respectively.
+        """
+        chempot_used = False
+        fugacity_used = False
+        for tag_id_keys_j in list(self.TargetedSwap_DataInput.keys()):
+            target_swap_tag_id_dict_key_data = self.TargetedSwap_DataInput[
+                tag_id_keys_j
+            ]
+
+            for target_swap_dict_key_j_lower in list(
+                target_swap_tag_id_dict_key_data.keys()
+            ):
+                if target_swap_dict_key_j_lower in ["subvolumechempot"]:
+                    chempot_used = True
+
+                if target_swap_dict_key_j_lower in ["subvolumefugacity"]:
+                    fugacity_used = True
+
+        return [chempot_used, fugacity_used]
+
+    def _check_free_energy_variables(self):
+        """
+        Checks that the free energy variables are all provided, and that the
+        lambda schedule (LambdaVDW, LambdaCoulomb, and InitialState) is valid.
+        """
+        # check that all required free energy values are provided
         if (
             self.FreeEnergyCalc is not None
             or self.MoleculeType is not None
@@ -6432,14 +6432,6 @@ class GOMCControl:
                 )
                 raise ValueError(print_error_message)
 
-            if self.RcutLow != 0:
-                print_warning_message = (
-                    "WARNING: The free energy calculations are being used when RcutLow is not zero (0), "
-                    "which can produce free energy results that are slightly off or wrong. "
-                    "Please set RcutLow to zero (RcutLow=0) when using the free energy calculations."
-                )
-                warn(print_warning_message)
-
         if (
             self.LambdaVDW is not None
             and self.LambdaCoulomb is not None
@@ -6491,35 +6483,6 @@ class GOMCControl:
                         print_error_message = "ERROR: The first value in the LambdaCoulomb variable list must be a 0.0"
                         raise ValueError(print_error_message)
 
-        # send a warning if the geometric mixing rule is used
-        if self.VDWGeometricSigma == True:
-            print_warning_message = (
-                "WARNING: The geometric combining rules is being used in the GOMC "
-                "control file.  If this is OK or intentional, please ignore this warning. "
-                "NOTE: This could just be the force file XML files correct parameters, "
-                "but many GOMC simulations utilize 'lorentz' mixing rules, so a "
-                "warning is provided."
-            )
-            warn(print_warning_message)
-
-        # check/ensure if the RestartFreq and CheckpointFreq are the same number of steps
-        if self.Checkpoint[0] is True and self.Restart is False:
-            print_error_message = (
-                "ERROR: If Checkpoint is True, Restart must also be True."
-            )
-            raise ValueError(print_error_message)
-
-        if (
-            self.CheckpointFreq[0] is True
-            and self.CheckpointFreq[1] != self.RestartFreq[1]
-        ):
-            print_error_message = (
-                "ERROR: If CheckpointFreq is True, the CheckpointFreq and RestartFreq "
-                "output frequencies must be the same to start GOMC. This ensures the "
-                "simulation can always be properly restarted."
-            )
-            raise ValueError(print_error_message)
-
     # ***********************
     # write the control file
     # ***********************
@@ -6586,8 +6549,30 @@ class GOMCControl:
             )
             raise ValueError(print_error_message)
 
-        # get and open the control file file
-        data_control_file = open(self.conf_filename, "w")
+        # render the control file in memory, and write it with a single call
+        conf_file_text = self._render_conf_file(self.conf_filename, date_time)
+        with open(self.conf_filename, "w") as conf_file:
+            conf_file.write(conf_file_text)
+
+        return "GOMC_CONTROL_FILE_WRITTEN"
+
+    def _render_conf_file(self, conf_filename, date_time):
+        """
+        Renders the GOMC control file text from the GOMCControl object variables.
+
+        Parameters
+        ----------
+        conf_filename: str
+            The control file name, which is written in the control file header.
+        date_time: datetime.datetime
+            The date and time, which is written in the control file header.
+
+        Returns
+        ---------
+        conf_file_text: str
+            The GOMC control file text.
+        """
+        data_control_file = io.StringIO()
 
         data_control_file.write(
             "#######################################################"
@@ -6595,7 +6580,7 @@ class GOMCControl:
         )
         data_control_file.write(
             "##  This file ({}) - was created by MoSDeF-GOMC "
-            "using the on {}\n".format(self.conf_filename, date_time)
+            "using the on {}\n".format(conf_filename, date_time)
         )
         data_control_file.write(
             "#######################################################"
@@ -7542,25 +7527,170 @@ class GOMCControl:
         data_control_file.write("\n")
         data_control_file.write("\n")
 
-        return "GOMC_CONTROL_FILE_WRITTEN"
+        return data_control_file.getvalue()
 
-    def ck_input_variable_true_or_false(
-        self, input_variables_dict, key, bad_user_variable_list
+    def compile_renderer(self):
+        """
+        Compiles this GOMCControl object into a reusable control file renderer.
+
+        The renderer writes control files with some variables overridden
+        (e.g., Temperature, Pressure, ChemPot, Fugacity, RunSteps, and OutputName),
+        without rebuilding and checking all the other GOMCControl variables.
+
+        Returns
+        ---------
+        renderer: GOMCControlRenderer
+            The reusable control file renderer for this GOMCControl object.
+        """
+        return GOMCControlRenderer(self)
+
+    def write_free_energy_windows(
+        self,
+        out_dir,
+        conf_filename="in_GOMC_FE",
+        window_dirs=False,
+        n_processes=None,
     ):
         """
-        Checks if the input variable is either True for False.
-        If not either True or False, the provided list is appended with the bad with the dict_key
+        Writes the GOMC control files for all the free energy lambda windows.
+
+        The free energy variables and the lambda schedule (LambdaVDW and
+        LambdaCoulomb) were already checked when this GOMCControl object was built,
+        so the window control files, which only differ by the InitialState,
+        are written without checking them again.
 
         Parameters
         ----------
-        input_variables_dict: dict
-            The user input variable dictionary
-        key: str
-            Dictionary key for the user provided input variable list
-        bad_user_variable_list: list
-            A list to append with the bad dict_key user inputs
-            Note: This list is intented to be printed with all the bad input variables
-            so the user can fix them after upon a failed GOMC conf file writing attempt.
+        out_dir: str
+            The directory the control files (or window directories) are written to,
+            which is created if it does not exist.
+        conf_filename: str, default="in_GOMC_FE"
+            The control file name (without the directory), with the .conf extension,
+            or no extension.  If window_dirs=False, the "_window_{InitialState}"
+            suffix is added to it (e.g., in_GOMC_FE_window_0.conf).
+        window_dirs: bool, default=False
+            If True, each window is written to its own directory in the out_dir
+            ("window_{InitialState}"), which has links to the shared force field,
+            psf, pdb, and other input files, and the control file uses the
+            linked file names.  If the links can not be made, the files are copied.
+            If False, all the window control files are written to the out_dir,
+            and use the same input file paths as this GOMCControl object.
+            The "_window_{InitialState}" suffix is also added to each window's
+            OutputName, so the windows' GOMC output files do not overwrite each other.
+        n_processes: int (>= 1) or None, default=None
+            The number of processes used to render and write the control files.
+            If None or 1, the control files are rendered serially.
+
+        Returns
+        ---------
+        conf_filenames_written_list: list of str
+            The written control file paths, in the InitialState order.
+        """
+        if self.input_error is True:
+            print_error_message = (
+                "ERROR: The free energy windows were not written as at least 1 input to the "
+                "control file writer was bad."
+            )
+            raise ValueError(print_error_message)
+
+        if self.FreeEnergyCalc is None or self.LambdaVDW is None:
+            print_error_message = (
+                "ERROR: The free energy windows can only be written when the free energy "
+                "calculations are used (i.e., FreeEnergyCalc, MoleculeType, "
+                "InitialState, and LambdaVDW are set)."
+            )
+            raise ValueError(print_error_message)
+
+        _check_n_processes(n_processes)
+        conf_filename = GOMCControlRenderer._check_conf_filename(conf_filename)
+
+        os.makedirs(out_dir, exist_ok=True)
+        gomc_controls_list = []
+        conf_filenames_written_list = []
+        for initial_state_i in range(len(self.LambdaVDW)):
+            gomc_control_i = copy.copy(self)
+            gomc_control_i.InitialState = initial_state_i
+
+            if window_dirs is True:
+                window_dir_i = os.path.join(
+                    out_dir, f"window_{initial_state_i}"
+                )
+                os.makedirs(window_dir_i, exist_ok=True)
+                self._link_window_input_files(gomc_control_i, window_dir_i)
+                conf_file_path_i = os.path.join(window_dir_i, conf_filename)
+            else:
+                conf_file_path_i = os.path.join(
+                    out_dir,
+                    "{}_window_{}.conf".format(
+                        os.path.splitext(conf_filename)[0], initial_state_i
+                    ),
+                )
+                gomc_control_i.OutputName = (
+                    f"{self.OutputName}_window_{initial_state_i}"
+                )
+
+            gomc_controls_list.append(gomc_control_i)
+            conf_filenames_written_list.append(conf_file_path_i)
+
+        _write_rendered_conf_files_batch(
+            gomc_controls_list,
+            conf_filenames_written_list,
+            n_processes=n_processes,
+        )
+
+        return conf_filenames_written_list
+
+    def _link_window_input_files(self, gomc_control, window_dir):
+        """
+        Links the shared input files into a free energy window directory,
+        and sets the window GOMCControl object to use the linked file names.
+
+        Parameters
+        ----------
+        gomc_control: GOMCControl
+            The window's shallow copy of this GOMCControl object.
+        window_dir: str
+            The free energy window directory.
+        """
+        input_file_variables_list = [
+            "ff_filename",
+            "Coordinates_box_0",
+            "Structure_box_0",
+            "binCoordinates_box_0",
+            "extendedSystem_box_0",
+            "binVelocities_box_0",
+        ]
+        for variable_i in input_file_variables_list:
+            if getattr(self, variable_i) is not None:
+                setattr(
+                    gomc_control,
+                    variable_i,
+                    _link_input_file(getattr(self, variable_i), window_dir),
+                )
+
+        if self.Checkpoint[0] is True:
+            gomc_control.Checkpoint = [
+                True,
+                _link_input_file(self.Checkpoint[1], window_dir),
+            ]
+
+    def ck_input_variable_true_or_false(
+        self, input_variables_dict, key, bad_user_variable_list
+    ):
+        """
+        Checks if the input variable is either True for False.
+        If not either True or False, the provided list is appended with the bad with the dict_key
+
+        Parameters
+        ----------
+        input_variables_dict: dict
+            The user input variable dictionary
+        key: str
+            Dictionary key for the user provided input variable list
+        bad_user_variable_list: list
+            A list to append with the bad dict_key user inputs
+            Note: This list is intented to be printed with all the bad input variables
+            so the user can fix them after upon a failed GOMC conf file writing attempt.
 
         Returns
         ---------
@@ -7571,13 +7701,11 @@ class GOMCControl:
             so the user can fix them after upon a failed GOMC conf file writing attempt.
         """
 
-        if (
-            input_variables_dict[key] is not True
-            and input_variables_dict[key] is not False
-            or (
-                str(input_variables_dict[key]) == str(True)
-                and str(input_variables_dict[key]) == str(False)
-            )
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_true_or_false"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_user_variable_list.append(key)
 
@@ -7605,13 +7733,11 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], int) is not True
-            and isinstance(input_variables_dict[key], float) is not True
-            or input_variables_dict[key] < 0
-            or str(input_variables_dict[key]) == str(True)
-            or str(input_variables_dict[key]) == str(False)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_int_or_float_zero_or_greater"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
@@ -7639,12 +7765,11 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], int) is not True
-            or input_variables_dict[key] < 0
-            or str(input_variables_dict[key]) == str(True)
-            or str(input_variables_dict[key]) == str(False)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_int_zero_or_greater"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
@@ -7672,12 +7797,11 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], float) is not True
-            or input_variables_dict[key] < 0
-            or str(input_variables_dict[key]) == str(True)
-            or str(input_variables_dict[key]) == str(False)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_float_zero_or_greater"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
@@ -7705,13 +7829,11 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], int) is not True
-            and isinstance(input_variables_dict[key], float) is not True
-            or input_variables_dict[key] <= 0
-            or str(input_variables_dict[key]) == str(True)
-            or str(input_variables_dict[key]) == str(False)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_int_or_float_greater_zero"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
@@ -7739,12 +7861,11 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], int) is not True
-            or input_variables_dict[key] <= 0
-            or str(input_variables_dict[key]) == str(True)
-            or str(input_variables_dict[key]) == str(False)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_int_greater_zero"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
@@ -7772,12 +7893,11 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], float) is not True
-            or input_variables_dict[key] <= 0
-            or str(input_variables_dict[key]) == str(True)
-            or str(input_variables_dict[key]) == str(False)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_float_greater_zero"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
@@ -7806,13 +7926,11 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], float) is not True
-            or input_variables_dict[key] <= 0
-            or input_variables_dict[key] >= 1
-            or str(input_variables_dict[key]) == str(True)
-            or str(input_variables_dict[key]) == str(False)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_float_greater_zero_less_1"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
@@ -7841,14 +7959,11 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], int) is not True
-            and isinstance(input_variables_dict[key], float) is not True
-            or input_variables_dict[key] < 0
-            or input_variables_dict[key] > 1
-            or str(input_variables_dict[key]) == str(True)
-            or str(input_variables_dict[key]) == str(False)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_int_or_float_zero_to_1"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
@@ -7876,13 +7991,11 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], float) is not True
-            or input_variables_dict[key] < 0
-            or input_variables_dict[key] > 1
-            or str(input_variables_dict[key]) == str(True)
-            or str(input_variables_dict[key]) == str(False)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_float_zero_to_1"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
@@ -7910,13 +8023,11 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], int) is not True
-            or input_variables_dict[key] < 0
-            or input_variables_dict[key] > 1
-            or str(input_variables_dict[key]) == str(True)
-            or str(input_variables_dict[key]) == str(False)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_int_zero_to_1"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
@@ -7945,25 +8056,13 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if isinstance(input_variables_dict[key], list) is False:
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_list_bool_int_zero_or_greater"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
+        ):
             bad_input_variables_values_list.append(key)
-        elif isinstance(input_variables_dict[key], list) is True:
-            if (
-                len(input_variables_dict[key]) != 2
-                or (
-                    input_variables_dict[key][0] is not True
-                    and input_variables_dict[key][0] is not False
-                )
-                or isinstance(input_variables_dict[key][1], int) is not True
-                or input_variables_dict[key][1] < 0
-                or (
-                    str(input_variables_dict[key][0]) != str(True)
-                    and str(input_variables_dict[key][0]) != str(False)
-                )
-                or str(input_variables_dict[key][1]) == str(True)
-                or str(input_variables_dict[key][1]) == str(False)
-            ):
-                bad_input_variables_values_list.append(key)
 
     def ck_input_variable_list_bool_int_greater_zero(
         self, input_variables_dict, key, bad_input_variables_values_list
@@ -7990,25 +8089,13 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if isinstance(input_variables_dict[key], list) is False:
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_list_bool_int_greater_zero"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
+        ):
             bad_input_variables_values_list.append(key)
-        elif isinstance(input_variables_dict[key], list) is True:
-            if (
-                len(input_variables_dict[key]) != 2
-                or (
-                    input_variables_dict[key][0] is not True
-                    and input_variables_dict[key][0] is not False
-                )
-                or isinstance(input_variables_dict[key][1], int) is not True
-                or input_variables_dict[key][1] <= 0
-                or (
-                    str(input_variables_dict[key][0]) != str(True)
-                    and str(input_variables_dict[key][0]) != str(False)
-                )
-                or str(input_variables_dict[key][1]) == str(True)
-                or str(input_variables_dict[key][1]) == str(False)
-            ):
-                bad_input_variables_values_list.append(key)
 
     def ck_input_variable_list_residue_str_int_greater_zero(
         self, input_variables_dict, key, bad_input_variables_values_list
@@ -8035,29 +8122,13 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if isinstance(input_variables_dict[key], list) is False:
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_list_residue_str_int_greater_zero"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
+        ):
             bad_input_variables_values_list.append(key)
-        elif isinstance(input_variables_dict[key], list) is True:
-            if len(input_variables_dict[key]) == 2:
-                if isinstance(input_variables_dict[key], list) is True:
-                    if (
-                        isinstance(input_variables_dict[key][0], str) is False
-                        or isinstance(input_variables_dict[key][1], int)
-                        is False
-                    ):
-                        bad_input_variables_values_list.append(key)
-                    elif isinstance(input_variables_dict[key][0], str) is True:
-                        if (
-                            len(input_variables_dict[key][0]) > 4
-                            or input_variables_dict[key][0] not in self.residues
-                        ):
-                            bad_input_variables_values_list.append(key)
-
-                    if (
-                        isinstance(input_variables_dict[key][1], int) is True
-                        and input_variables_dict[key][1] <= 0
-                    ):
-                        bad_input_variables_values_list.append(key)
 
     def ck_input_variable_list_bool_bool(
         self, input_variables_dict, key, bad_input_variables_values_list
@@ -8083,29 +8154,13 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if isinstance(input_variables_dict[key], list) is False:
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_list_bool_bool"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
+        ):
             bad_input_variables_values_list.append(key)
-        elif isinstance(input_variables_dict[key], list) is True:
-            if (
-                len(input_variables_dict[key]) != 2
-                or (
-                    input_variables_dict[key][0] is not True
-                    and input_variables_dict[key][0] is not False
-                )
-                or (
-                    input_variables_dict[key][1] is not True
-                    and input_variables_dict[key][1] is not False
-                )
-                or (
-                    str(input_variables_dict[key][0]) != str(True)
-                    and str(input_variables_dict[key][0]) != str(False)
-                )
-                or (
-                    str(input_variables_dict[key][1]) != str(True)
-                    and str(input_variables_dict[key][1]) != str(False)
-                )
-            ):
-                bad_input_variables_values_list.append(key)
 
     def ck_input_variable_list_of_floats_zero_to_1(
         self, input_variables_dict, key, bad_input_variables_values_list
@@ -8132,32 +8187,13 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if input_variables_dict[key] is not None:
-            if isinstance(input_variables_dict[key], list) is False:
-                bad_input_variables_values_list.append(key)
-            elif isinstance(input_variables_dict[key], list) is True:
-                if len(input_variables_dict[key]) >= 1:
-                    for Lambda_i in range(0, len(input_variables_dict[key])):
-                        if (
-                            isinstance(
-                                input_variables_dict[key][Lambda_i], float
-                            )
-                            is False
-                        ):
-                            bad_input_variables_values_list.append(key)
-                        elif (
-                            isinstance(
-                                input_variables_dict[key][Lambda_i], float
-                            )
-                            is True
-                        ):
-                            if (
-                                input_variables_dict[key][Lambda_i] < 0.0
-                                or input_variables_dict[key][Lambda_i] > 1.0
-                            ):
-                                bad_input_variables_values_list.append(key)
-                else:
-                    bad_input_variables_values_list.append(key)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_list_of_floats_zero_to_1"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
+        ):
+            bad_input_variables_values_list.append(key)
 
     def ck_input_variable_GCMC_chempot_dict(
         self, input_variables_dict, key, bad_input_variables_values_list
@@ -8189,63 +8225,14 @@ class GOMCControl:
             returns a TypeError
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], dict) is not True
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_GCMC_chempot_dict"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
-        elif isinstance(input_variables_dict[key], dict) is True:
-            keys_list = dict_keys_to_list(input_variables_dict[key])
-            for keys_iter_No in range(0, len(keys_list)):
-                key_iter = keys_list[keys_iter_No]
-                value_iter = input_variables_dict[key][key_iter]
-
-                if key_iter not in self.residues:
-                    bad_input_variables_values_list.append(key)
-
-                if isinstance(key_iter, str) is False:
-                    bad_input_variables_values_list.append(key)
-                elif isinstance(key_iter, str) is True:
-                    if len(key_iter) > 4:
-                        bad_input_variables_values_list.append(key)
-
-                if isinstance(value_iter, type(u.unyt_quantity(1, "kcal/mol"))):
-                    if energy != value_iter.units.dimensions and "K" != str(
-                        value_iter.units
-                    ):
-                        print_error_message = (
-                            f"ERROR: The {key} input {u.array.unyt_quantity} needs to be a "
-                            f"{u.array.unyt_quantity} in energy units, "
-                            f"such as kcal/mol, kJ/mol, or K."
-                        )
-                        raise TypeError(print_error_message)
-
-                else:
-                    print_error_message = (
-                        f"ERROR: The {key} input is {type(value_iter)} "
-                        f"and needs to be a {u.array.unyt_quantity} in energy units, "
-                        f"such as kcal/mol, kJ/mol, or K."
-                    )
-                    raise TypeError(print_error_message)
-
-                if (
-                    (
-                        isinstance(
-                            value_iter.to_value("K", equivalence="thermal"), int
-                        )
-                        is False
-                        and isinstance(
-                            value_iter.to_value("K", equivalence="thermal"),
-                            float,
-                        )
-                        is False
-                    )
-                    or str(value_iter) == str(True)
-                    or str(value_iter) == str(False)
-                ):
-                    bad_input_variables_values_list.append(key)
-
     def ck_input_variable_GCMC_fugacity_dict(
         self, input_variables_dict, key, bad_input_variables_values_list
     ):
@@ -8276,54 +8263,14 @@ class GOMCControl:
             returns a TypeError
         """
 
-        if (
-            input_variables_dict[key] is not None
-            and isinstance(input_variables_dict[key], dict) is not True
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_GCMC_fugacity_dict"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
         ):
             bad_input_variables_values_list.append(key)
 
-        elif isinstance(input_variables_dict[key], dict) is True:
-            keys_list = dict_keys_to_list(input_variables_dict[key])
-            for keys_iter_No in range(0, len(keys_list)):
-                key_iter = keys_list[keys_iter_No]
-                value_iter = input_variables_dict[key][key_iter]
-
-                if key_iter not in self.residues:
-                    bad_input_variables_values_list.append(key)
-
-                if isinstance(key_iter, str) is False:
-                    bad_input_variables_values_list.append(key)
-                elif isinstance(key_iter, str) is True:
-                    if len(key_iter) > 4:
-                        bad_input_variables_values_list.append(key)
-
-                if isinstance(value_iter, type(u.unyt_quantity(1, "bar"))):
-                    if pressure != value_iter.units.dimensions:
-                        print_error_message = (
-                            f"ERROR: The {key} input {u.array.unyt_quantity} needs to be a "
-                            f"{u.array.unyt_quantity} in pressure units."
-                        )
-                        raise TypeError(print_error_message)
-
-                else:
-                    print_error_message = (
-                        f"ERROR: The {key} input is {type(value_iter)} "
-                        f"and needs to be a {u.array.unyt_quantity} in pressure units."
-                    )
-                    raise TypeError(print_error_message)
-
-                if (
-                    (
-                        isinstance(value_iter.to_value("bar"), int) is False
-                        and isinstance(value_iter.to_value("bar"), float)
-                        is False
-                    )
-                    or str(value_iter) == str(True)
-                    or str(value_iter) == str(False)
-                    or value_iter.to_value("bar") < 0
-                ):
-                    bad_input_variables_values_list.append(key)
-
     def ck_input_variable_str_with_no_spaces(
         self, input_variables_dict, key, bad_input_variables_values_list
     ):
@@ -8348,13 +8295,619 @@ class GOMCControl:
             so the user can see which variable input values are bad.
         """
 
-        if isinstance(input_variables_dict[key], str) is True:
-            no_spaces_in_OutputName_string = " " in input_variables_dict[key]
-        if (
-            isinstance(input_variables_dict[key], str) is not True
-            or no_spaces_in_OutputName_string is True
-        ):
-            bad_input_variables_values_list.append(key)
+        ck_validator = _control_value_validator_dict[
+            "ck_input_variable_str_with_no_spaces"
+        ]
+        if not ck_validator(
+            key, input_variables_dict[key], residues=self.residues
+        ):
+            bad_input_variables_values_list.append(key)
+
+
+class GOMCControlRenderer:
+    """
+    A reusable GOMC control file renderer, which is compiled from a GOMCControl object.
+
+    The GOMCControl object is fully built and checked once, and then the control
+    files are rendered with only the overridden variables changed and checked.
+    This is intended for parameter sweeps, where thousands of control files
+    only differ by a few variables.
+
+    Parameters
+    ----------
+    gomc_control: GOMCControl
+        The built GOMCControl object, which is used for all the variables
+        that are not overridden.  It is not modified by the renderer.
+
+    Attributes
+    ----------
+    override_variables: tuple of str
+        The variables which can be overridden (not case sensitive):
+
+        --- "Temperature": unyt.unyt_quantity in temperature units (> 1 K).
+
+        --- "Pressure": unyt.unyt_quantity in pressure units (>= 0),
+        only GEMC_NPT and NPT.
+
+        --- "ChemPot": dict {str, unyt.unyt_quantity in energy units}, only GCMC.
+        Note: This also removes the Fugacity.
+
+        --- "Fugacity": dict {str, unyt.unyt_quantity in pressure units (>= 0)},
+        only GCMC.  Note: This also removes the ChemPot.
+
+        --- "RunSteps": int (> 0). Note: The step and output frequency variables,
+        which were not provided in the GOMCControl input_variables_dict, are
+        automatically rescaled for the new RunSteps, like the GOMCControl object.
+
+        --- "OutputName": str (NO SPACES).
+
+        --- "PRNG": str ("RANDOM") or int (>= 0), the random number seed.
+
+        --- "InitialState": int (>= 0), only NVT and NPT.
+
+        --- "LambdaVDW": list of floats (0 to 1), only NVT and NPT.
+
+        --- "LambdaCoulomb": list of floats (0 to 1), only NVT and NPT.
+
+        Note: The free energy variables are checked with the GOMCControl
+        free energy checks, and the ChemPot and Fugacity are checked with the
+        GOMCControl ChemPot and Fugacity checks (i.e., against the
+        TargetedSwap_DataInput), after the overrides are applied.
+    """
+
+    override_variables = (
+        "Temperature",
+        "Pressure",
+        "ChemPot",
+        "Fugacity",
+        "RunSteps",
+        "OutputName",
+        "PRNG",
+        "InitialState",
+        "LambdaVDW",
+        "LambdaCoulomb",
+    )
+
+    # the overridden variables, which are checked with the free energy checks
+    _free_energy_variables = ("InitialState", "LambdaVDW", "LambdaCoulomb")
+
+    # the step and output frequency variables, which are scaled by the RunSteps
+    # if they are not provided by the user (see _scale_gen_freq_for_run_steps_*)
+    _run_steps_scaled_variables = (
+        "EqSteps",
+        "AdjSteps",
+        "RestartFreq",
+        "CheckpointFreq",
+        "CoordinatesFreq",
+        "DCDFreq",
+        "ConsoleFreq",
+        "PressureCalc",
+        "BlockAverageFreq",
+        "HistogramFreq",
+        "SampleFreq",
+    )
+
+    def __init__(self, gomc_control):
+        if not isinstance(gomc_control, GOMCControl):
+            print_error_message = (
+                "ERROR: The gomc_control variable is not a GOMCControl object."
+            )
+            raise TypeError(print_error_message)
+
+        if gomc_control.input_error is True:
+            print_error_message = (
+                "ERROR: The control file renderer was not compiled as at least 1 input to the "
+                "control file writer was bad."
+            )
+            raise ValueError(print_error_message)
+
+        self._base_control = copy.copy(gomc_control)
+        self._override_variables_lower_case_dict = {
+            variable_i.lower(): variable_i
+            for variable_i in self.override_variables
+        }
+        self._auto_scaled_variables_list = [
+            variable_i
+            for variable_i in self._run_steps_scaled_variables
+            if gomc_control.input_variables_dict.get(variable_i) is None
+        ]
+
+    def _get_overridden_control(self, overrides):
+        """
+        Provides a shallow copy of the compiled GOMCControl object,
+        with the checked overrides applied.
+
+        Parameters
+        ----------
+        overrides: dict or None
+            The {variable: value} overrides (see override_variables).
+
+        Returns
+        ---------
+        gomc_control: GOMCControl
+            The shallow copy of the compiled GOMCControl object, with the overrides.
+        """
+        gomc_control = copy.copy(self._base_control)
+        if overrides is None:
+            return gomc_control
+
+        if not isinstance(overrides, dict):
+            print_error_message = (
+                "ERROR: The overrides variable is not None or a dictionary."
+            )
+            raise TypeError(print_error_message)
+
+        overrides_dict = {}
+        for key_i, value_i in overrides.items():
+            variable_i = self._override_variables_lower_case_dict.get(
+                str(key_i).lower()
+            )
+            if variable_i is None:
+                print_error_message = (
+                    "ERROR: The {} variable can not be overridden in the control file renderer. "
+                    "The variables which can be overridden are {}.".format(
+                        key_i, list(self.override_variables)
+                    )
+                )
+                raise ValueError(print_error_message)
+            overrides_dict[variable_i] = value_i
+
+        if "ChemPot" in overrides_dict and "Fugacity" in overrides_dict:
+            print_error_message = "ERROR: Only the ChemPot or the Fugacity can be overridden, not both."
+            raise ValueError(print_error_message)
+
+        # check the GOMC control variables with their compiled validators,
+        # and if they are valid for the ensemble
+        control_variable_registry = _get_control_variable_registry()
+        registry_overrides_dict = {
+            variable_i: value_i
+            for variable_i, value_i in overrides_dict.items()
+            if variable_i in control_variable_registry
+        }
+        for variable_i, value_i in registry_overrides_dict.items():
+            if (
+                gomc_control.ensemble_type
+                not in control_variable_registry[variable_i]["valid_ensembles"]
+            ) or value_i is None:
+                print_error_message = (
+                    "ERROR: The {} variable can not be overridden for the {} "
+                    "ensemble, or it was set to None.".format(
+                        variable_i, gomc_control.ensemble_type
+                    )
+                )
+                raise ValueError(print_error_message)
+
+        bad_input_variables_values_list = [
+            error_i[0]
+            for error_i in _check_input_variables_values(
+                registry_overrides_dict,
+                residues=gomc_control.residues,
+                collect_all=False,
+            )
+        ]
+        # the PRNG has no compiled validator, so it is checked like GOMCControl
+        if "PRNG" in overrides_dict:
+            prng_value = overrides_dict["PRNG"]
+            if (
+                prng_value != "RANDOM"
+                and isinstance(prng_value, int) is not True
+            ) or (isinstance(prng_value, int) is True and prng_value < 0):
+                bad_input_variables_values_list.append("PRNG")
+        if len(bad_input_variables_values_list) > 0:
+            print_error_message = (
+                "ERROR: The following input variables have "
+                "bad values (check spelling and for empty spaces in the keys or that "
+                "the values are in the correct form with the acceptable values): "
+                "{}".format(bad_input_variables_values_list)
+            )
+            raise ValueError(print_error_message)
+
+        if "Temperature" in overrides_dict:
+            temperature_value = overrides_dict["Temperature"]
+            if (
+                not isinstance(temperature_value, u.array.unyt_quantity)
+                or temperature != temperature_value.units.dimensions
+            ):
+                print_error_message = (
+                    "ERROR: The Temperature is not a {} in temperature units."
+                    "".format(u.array.unyt_quantity)
+                )
+                raise TypeError(print_error_message)
+            gomc_control.Temperature = temperature_value.to_value("K")
+            if gomc_control.Temperature <= 1:
+                print_error_message = (
+                    "ERROR: The selected Temperature ({}) is equal to or less than 1 Kelvin. "
+                    "Please select a valid Temperature".format(
+                        gomc_control.Temperature
+                    )
+                )
+                raise TypeError(print_error_message)
+
+        if "Pressure" in overrides_dict:
+            gomc_control.Pressure = _check_if_unyt_pressure_convert_to_bar(
+                "Pressure", overrides_dict["Pressure"]
+            )
+
+        if "ChemPot" in overrides_dict:
+            gomc_control.ChemPot = overrides_dict["ChemPot"]
+            gomc_control.Fugacity = None
+
+        if "Fugacity" in overrides_dict:
+            gomc_control.Fugacity = overrides_dict["Fugacity"]
+            gomc_control.ChemPot = None
+
+        if "ChemPot" in overrides_dict or "Fugacity" in overrides_dict:
+            gomc_control._check_chempot_and_fugacity_variables()
+
+        if "OutputName" in overrides_dict:
+            gomc_control.OutputName = overrides_dict["OutputName"]
+
+        if "PRNG" in overrides_dict:
+            gomc_control.PRNG = overrides_dict["PRNG"]
+
+        free_energy_overrides_list = [
+            variable_i
+            for variable_i in self._free_energy_variables
+            if variable_i in overrides_dict
+        ]
+        for variable_i in free_energy_overrides_list:
+            setattr(gomc_control, variable_i, overrides_dict[variable_i])
+        if len(free_energy_overrides_list) > 0:
+            gomc_control._check_free_energy_variables()
+
+        if "RunSteps" in overrides_dict:
+            run_steps = overrides_dict["RunSteps"]
+            if (
+                not isinstance(run_steps, int)
+                or isinstance(run_steps, bool)
+                or run_steps <= 0
+            ):
+                print_error_message = (
+                    "ERROR: The selected run steps (RunSteps variable = {}) is not "
+                    "an integer or is less than or equal to 0.".format(
+                        run_steps
+                    )
+                )
+                raise ValueError(print_error_message)
+            gomc_control.RunSteps = run_steps
+
+            # rescale the step and output frequencies, which the user did not set
+            default_input_variables_dict = _get_default_variables_dict()
+            for variable_i in self._auto_scaled_variables_list:
+                if isinstance(default_input_variables_dict[variable_i], list):
+                    scaled_value_i = (
+                        _scale_gen_freq_for_run_steps_list_bool_int(
+                            variable_i,
+                            default_input_variables_dict[variable_i],
+                            run_steps,
+                        )
+                    )
+                else:
+                    scaled_value_i = _scale_gen_freq_for_run_steps_int(
+                        variable_i,
+                        default_input_variables_dict[variable_i],
+                        run_steps,
+                    )
+                setattr(gomc_control, variable_i, scaled_value_i)
+
+            # Check that RunSteps > EqSteps >= AdjSteps
+            if (
+                gomc_control.RunSteps <= gomc_control.EqSteps
+                or gomc_control.RunSteps < gomc_control.AdjSteps
+                or gomc_control.EqSteps < gomc_control.AdjSteps
+            ) and gomc_control.Restart is False:
+                print_error_message = (
+                    "ERROR: When starting a simulation, the values must be in this order RunSteps > EqSteps >= AdjSteps "
+                    "({} > {} >= {})".format(
+                        gomc_control.RunSteps,
+                        gomc_control.EqSteps,
+                        gomc_control.AdjSteps,
+                    )
+                )
+                raise ValueError(print_error_message)
+
+            elif (
+                gomc_control.RunSteps <= gomc_control.EqSteps
+            ) and gomc_control.Restart is True:
+                print_error_message = (
+                    "ERROR: When restarting a simulation, this must be true RunSteps > EqSteps "
+                    "({} > {})".format(
+                        gomc_control.RunSteps, gomc_control.EqSteps
+                    )
+                )
+                raise ValueError(print_error_message)
+
+        return gomc_control
+
+    @staticmethod
+    def _check_conf_filename(conf_filename):
+        """
+        Checks the control file name, and adds the .conf extension if it has no extension.
+
+        Parameters
+        ----------
+        conf_filename: str
+            The control file name, with the .conf extension, or no extension.
+
+        Returns
+        ---------
+        conf_filename: str
+            The control file name, with the .conf extension.
+        """
+        if not isinstance(conf_filename, str):
+            print_error_message = "ERROR: The control file name (conf_filename) is not provided as a string. "
+            raise ValueError(print_error_message)
+
+        if os.path.splitext(conf_filename)[1] == "":
+            conf_filename = conf_filename + ".conf"
+        elif os.path.splitext(conf_filename)[1] != ".conf":
+            print_error_message = (
+                "ERROR: No extension name or the wrong extension name was provided. "
+                "Please enter a proper extension name, .conf or no extension in the conf_filename "
+                "The control file as provided name = {}".format(conf_filename)
+            )
+            raise ValueError(print_error_message)
+
+        return conf_filename
+
+    def render(self, conf_filename, overrides=None):
+        """
+        Renders the GOMC control file text, with the overridden variables.
+
+        Parameters
+        ----------
+        conf_filename: str
+            The control file name, which is written in the control file header.
+        overrides: dict or None, default=None
+            The {variable: value} overrides (see override_variables).
+
+        Returns
+        ---------
+        conf_file_text: str
+            The GOMC control file text.
+        """
+        gomc_control = self._get_overridden_control(overrides)
+
+        return gomc_control._render_conf_file(
+            conf_filename, datetime.datetime.today()
+        )
+
+    def render_to_file(self, conf_filename, overrides=None):
+        """
+        Renders and writes the GOMC control file, with the overridden variables.
+
+        Parameters
+        ----------
+        conf_filename: str
+            The path and file name for the control file name, with
+            the .conf extension, or no extension.  If no extension is provided, the
+            code will add the .conf extension to the provided file name.
+        overrides: dict or None, default=None
+            The {variable: value} overrides (see override_variables).
+
+        Returns
+        ---------
+        conf_filename: str
+            The written control file name, with the .conf extension.
+        """
+        conf_filename = self._check_conf_filename(conf_filename)
+        conf_file_text = self.render(conf_filename, overrides=overrides)
+        with open(conf_filename, "w") as conf_file:
+            conf_file.write(conf_file_text)
+
+        return conf_filename
+
+    def render_many(
+        self,
+        overrides_list,
+        out_dir,
+        conf_filenames_list=None,
+        n_processes=None,
+    ):
+        """
+        Renders and writes a batch of GOMC control files, with the overridden variables.
+
+        All the overrides are checked before any of the control files are written.
+        Every control file needs a different OutputName, so the GOMC simulations
+        do not overwrite each other's output files.
+
+        Parameters
+        ----------
+        overrides_list: list of dicts
+            The {variable: value} overrides for each control file
+            (see override_variables).
+        out_dir: str
+            The directory the control files are written to,
+            which is created if it does not exist.
+        conf_filenames_list: list of str or None, default=None
+            The control file names (without the directory), with the .conf extension,
+            or no extension. If None, the control files are named
+            in_GOMC_0.conf, in_GOMC_1.conf, ..., in the overrides_list order.
+        n_processes: int (>= 1) or None, default=None
+            The number of processes used to render and write the control files.
+            If None or 1, the control files are rendered serially in this process.
+            The overrides are always checked in this process first.
+
+        Returns
+        ---------
+        conf_filenames_written_list: list of str
+            The written control file paths, in the overrides_list order.
+        """
+        _check_n_processes(n_processes)
+
+        if conf_filenames_list is None:
+            conf_filenames_list = [
+                f"in_GOMC_{overrides_i}.conf"
+                for overrides_i in range(len(overrides_list))
+            ]
+        elif len(conf_filenames_list) != len(overrides_list):
+            print_error_message = (
+                "ERROR: The conf_filenames_list length ({}) is not the same as "
+                "the overrides_list length ({}).".format(
+                    len(conf_filenames_list), len(overrides_list)
+                )
+            )
+            raise ValueError(print_error_message)
+
+        # check all the file names and overrides first,
+        # so no control files are written if any are bad
+        conf_filenames_list = [
+            self._check_conf_filename(conf_filename_i)
+            for conf_filename_i in conf_filenames_list
+        ]
+        gomc_controls_list = [
+            self._get_overridden_control(overrides_i)
+            for overrides_i in overrides_list
+        ]
+
+        output_names_list = [
+            gomc_control_i.OutputName for gomc_control_i in gomc_controls_list
+        ]
+        if len(set(output_names_list)) != len(output_names_list):
+            print_error_message = (
+                "ERROR: The OutputName is the same for more than one control file, "
+                "so the GOMC simulations would overwrite each other's output files. "
+                "Please override the OutputName with a different value for each "
+                "control file. The OutputNames are {}.".format(
+                    output_names_list
+                )
+            )
+            raise ValueError(print_error_message)
+
+        os.makedirs(out_dir, exist_ok=True)
+        conf_filenames_written_list = [
+            os.path.join(out_dir, conf_filename_i)
+            for conf_filename_i in conf_filenames_list
+        ]
+        _write_rendered_conf_files_batch(
+            gomc_controls_list,
+            conf_filenames_written_list,
+            n_processes=n_processes,
+        )
+
+        return conf_filenames_written_list
+
+
+def _check_n_processes(n_processes):
+    """
+    Checks that the number of processes is None or an integer >= 1.
+
+    Parameters
+    ----------
+    n_processes: int (>= 1) or None
+        The number of processes used to render and write the control files.
+    """
+    if n_processes is not None and (
+        not isinstance(n_processes, int)
+        or isinstance(n_processes, bool)
+        or n_processes < 1
+    ):
+        print_error_message = (
+            "ERROR: The n_processes variable ({}) is not None or "
+            "an integer >= 1.".format(n_processes)
+        )
+        raise ValueError(print_error_message)
+
+
+def _write_rendered_conf_files_batch(
+    gomc_controls_list, conf_file_paths_list, n_processes=None
+):
+    """
+    Renders and writes the control files for the checked GOMCControl objects,
+    serially or in a process pool.
+
+    Parameters
+    ----------
+    gomc_controls_list: list of GOMCControl
+        The checked GOMCControl objects.
+    conf_file_paths_list: list of str
+        The control file paths, with the .conf extension.
+    n_processes: int (>= 1) or None, default=None
+        The number of processes used to render and write the control files.
+        If None or 1, the control files are rendered serially in this process.
+    """
+    date_time = datetime.datetime.today()
+    if n_processes is None or n_processes == 1 or len(gomc_controls_list) <= 1:
+        _write_rendered_conf_files(
+            gomc_controls_list, conf_file_paths_list, date_time
+        )
+
+        return
+
+    # split the control files into contiguous chunks, one per process,
+    # so each process only receives its GOMCControl objects once
+    n_processes = min(n_processes, len(gomc_controls_list))
+    chunk_size = -(-len(gomc_controls_list) // n_processes)
+    with ProcessPoolExecutor(max_workers=n_processes) as render_executor:
+        render_futures_list = [
+            render_executor.submit(
+                _write_rendered_conf_files,
+                gomc_controls_list[chunk_start_i : chunk_start_i + chunk_size],
+                conf_file_paths_list[
+                    chunk_start_i : chunk_start_i + chunk_size
+                ],
+                date_time,
+            )
+            for chunk_start_i in range(0, len(gomc_controls_list), chunk_size)
+        ]
+
+        # raise the first error in the chunk order
+        for render_future_i in render_futures_list:
+            render_future_i.result()
+
+
+def _write_rendered_conf_files(
+    gomc_controls_list, conf_file_paths_list, date_time
+):
+    """
+    Renders and writes the control files for the checked GOMCControl objects.
+
+    This is a module level function, so it can be run in a process pool.
+
+    Parameters
+    ----------
+    gomc_controls_list: list of GOMCControl
+        The checked GOMCControl objects (see GOMCControlRenderer).
+    conf_file_paths_list: list of str
+        The control file paths, with the .conf extension.
+    date_time: datetime.datetime
+        The date and time written in the control file headers.
+    """
+    for gomc_control_i, conf_file_path_i in zip(
+        gomc_controls_list, conf_file_paths_list
+    ):
+        with open(conf_file_path_i, "w") as conf_file:
+            conf_file.write(
+                gomc_control_i._render_conf_file(conf_file_path_i, date_time)
+            )
+
+
+def _link_input_file(input_file, link_dir):
+    """
+    Links an input file into a directory, or copies it if the link can not be made.
+
+    Parameters
+    ----------
+    input_file: str
+        The input file path.
+    link_dir: str
+        The directory the input file is linked into.
+
+    Returns
+    ---------
+    linked_file: str
+        The linked file name, without the directory.
+    """
+    linked_file = os.path.basename(input_file)
+    linked_file_path = os.path.join(link_dir, linked_file)
+    if os.path.lexists(linked_file_path):
+        os.remove(linked_file_path)
+    try:
+        os.symlink(os.path.abspath(input_file), linked_file_path)
+    except OSError:
+        shutil.copy2(input_file, linked_file_path)
+
+    return linked_file
 
 
 def _scale_gen_freq_for_run_steps_list_bool_int(
@@ -8831,6 +9384,476 @@ def _check_if_unyt_pressure_convert_to_bar(variable_as_a_string, variable):
         raise TypeError(print_error_message)
 
 
+def _compile_number_validator(
+    number_types, lower_bound, upper_bound=None, strict_bounds=False
+):
+    """
+    Compiles a validator for the int and/or float input variables within the bounds.
+
+    Parameters
+    ----------
+    number_types: tuple of types
+        The valid number types, (int,), (float,), or (int, float).
+        The bool values are never valid numbers.
+    lower_bound: int or float
+        The lower bound of the valid values.
+    upper_bound: int, float, or None, default=None
+        The upper bound of the valid values, or None if there is no upper bound.
+    strict_bounds: bool, default=False
+        If True, the values equal to the bounds are not valid (i.e., > and <),
+        If False, the values equal to the bounds are valid (i.e., >= and <=).
+
+    Returns
+    ---------
+    number_validator: function(variable_name, value, residues=None)
+        The validator, which returns True if the value is valid, and False otherwise.
+    """
+
+    def number_validator(variable_name, value, residues=None):
+        if isinstance(value, bool) or not isinstance(value, number_types):
+            return False
+        if strict_bounds:
+            return value > lower_bound and (
+                upper_bound is None or value < upper_bound
+            )
+        else:
+            return value >= lower_bound and (
+                upper_bound is None or value <= upper_bound
+            )
+
+    return number_validator
+
+
+def _compile_list_bool_int_validator(lower_bound, strict_bounds=False):
+    """
+    Compiles a validator for the [bool, int] input variables,
+    where the int must be >= lower_bound (or > lower_bound if strict_bounds=True).
+    """
+    int_validator = _compile_number_validator(
+        (int,), lower_bound, strict_bounds=strict_bounds
+    )
+
+    def list_bool_int_validator(variable_name, value, residues=None):
+        return (
+            isinstance(value, list)
+            and len(value) == 2
+            and _is_true_or_false(variable_name, value[0])
+            and int_validator(variable_name, value[1])
+        )
+
+    return list_bool_int_validator
+
+
+def _is_true_or_false(variable_name, value, residues=None):
+    """Validates that the input variable is True or False."""
+    return value is True or value is False
+
+
+def _is_list_bool_bool(variable_name, value, residues=None):
+    """Validates that the input variable is a [bool, bool] list."""
+    return (
+        isinstance(value, list)
+        and len(value) == 2
+        and _is_true_or_false(variable_name, value[0])
+        and _is_true_or_false(variable_name, value[1])
+    )
+
+
+def _is_list_residue_str_int_greater_zero(variable_name, value, residues=None):
+    """
+    Validates that the input variable is a [residue_str, int > 0] list,
+    where the residue_str is 4 characters or less and in the residues
+    (the residues check is skipped if the residues are None).
+    """
+    return (
+        isinstance(value, list)
+        and len(value) == 2
+        and isinstance(value[0], str)
+        and len(value[0]) <= 4
+        and (residues is None or value[0] in residues)
+        and isinstance(value[1], int)
+        and value[1] > 0
+    )
+
+
+def _is_list_of_floats_zero_to_1(variable_name, value, residues=None):
+    """Validates that the input variable is a list of floats (0 <= floats <= 1)."""
+    return (
+        isinstance(value, list)
+        and len(value) >= 1
+        and all(
+            isinstance(value_i, float) and 0.0 <= value_i <= 1.0
+            for value_i in value
+        )
+    )
+
+
+def _is_str_with_no_spaces(variable_name, value, residues=None):
+    """Validates that the input variable is a string with no spaces."""
+    return isinstance(value, str) and " " not in value
+
+
+def _compile_residue_unyt_dict_validator(
+    variable_dimensions, variable_units_text, to_units, non_negative
+):
+    """
+    Compiles a validator for the {residue_str: unyt.unyt_quantity} input variables.
+
+    Parameters
+    ----------
+    variable_dimensions: unyt.dimensions
+        The valid dimensions of the unyt.unyt_quantity values.
+    variable_units_text: str
+        The valid units text, which is only used in the error messages.
+    to_units: str
+        The units the values are converted to before the value checks.
+        Temperature units (K) are converted with the thermal equivalence.
+    non_negative: bool
+        If True, the values must be zero or greater.
+
+    Returns
+    ---------
+    residue_unyt_dict_validator: function(variable_name, value, residues=None)
+        The validator, which returns True if the value is valid, and False otherwise.
+        Note: it raises a TypeError if the values are not a unyt.unyt_quantity
+        in the valid units.  The residues check is skipped if the residues are None.
+    """
+
+    def residue_unyt_dict_validator(variable_name, value, residues=None):
+        if not isinstance(value, dict):
+            return False
+
+        value_is_valid = True
+        for key_iter, value_iter in value.items():
+            if (
+                (residues is not None and key_iter not in residues)
+                or not isinstance(key_iter, str)
+                or len(key_iter) > 4
+            ):
+                value_is_valid = False
+
+            if not isinstance(value_iter, u.array.unyt_quantity):
+                print_error_message = (
+                    f"ERROR: The {variable_name} input is {type(value_iter)} "
+                    f"and needs to be a {u.array.unyt_quantity} in {variable_units_text}."
+                )
+                raise TypeError(print_error_message)
+            elif variable_dimensions != value_iter.units.dimensions and not (
+                to_units == "K" and str(value_iter.units) == "K"
+            ):
+                print_error_message = (
+                    f"ERROR: The {variable_name} input {u.array.unyt_quantity} needs to be a "
+                    f"{u.array.unyt_quantity} in {variable_units_text}."
+                )
+                raise TypeError(print_error_message)
+
+            if to_units == "K":
+                value_iter = value_iter.to_value(
+                    to_units, equivalence="thermal"
+                )
+            else:
+                value_iter = value_iter.to_value(to_units)
+            if non_negative and value_iter < 0:
+                value_is_valid = False
+
+        return value_is_valid
+
+    return residue_unyt_dict_validator
+
+
+# the compiled validators for the GOMCControl value checking methods, which all have the
+# validator(variable_name, value, residues=None) form, and return True if the value is valid
+_control_value_validator_dict = {
+    "ck_input_variable_true_or_false": _is_true_or_false,
+    "ck_input_variable_int_or_float_zero_or_greater": _compile_number_validator(
+        (int, float), 0
+    ),
+    "ck_input_variable_int_zero_or_greater": _compile_number_validator(
+        (int,), 0
+    ),
+    "ck_input_variable_float_zero_or_greater": _compile_number_validator(
+        (float,), 0
+    ),
+    "ck_input_variable_int_or_float_greater_zero": _compile_number_validator(
+        (int, float), 0, strict_bounds=True
+    ),
+    "ck_input_variable_int_greater_zero": _compile_number_validator(
+        (int,), 0, strict_bounds=True
+    ),
+    "ck_input_variable_float_greater_zero": _compile_number_validator(
+        (float,), 0, strict_bounds=True
+    ),
+    "ck_input_variable_float_greater_zero_less_1": _compile_number_validator(
+        (float,), 0, upper_bound=1, strict_bounds=True
+    ),
+    "ck_input_variable_int_or_float_zero_to_1": _compile_number_validator(
+        (int, float), 0, upper_bound=1
+    ),
+    "ck_input_variable_float_zero_to_1": _compile_number_validator(
+        (float,), 0, upper_bound=1
+    ),
+    "ck_input_variable_int_zero_to_1": _compile_number_validator(
+        (int,), 0, upper_bound=1
+    ),
+    "ck_input_variable_list_bool_int_zero_or_greater": _compile_list_bool_int_validator(
+        0
+    ),
+    "ck_input_variable_list_bool_int_greater_zero": _compile_list_bool_int_validator(
+        0, strict_bounds=True
+    ),
+    "ck_input_variable_list_residue_str_int_greater_zero": _is_list_residue_str_int_greater_zero,
+    "ck_input_variable_list_bool_bool": _is_list_bool_bool,
+    "ck_input_variable_list_of_floats_zero_to_1": _is_list_of_floats_zero_to_1,
+    "ck_input_variable_GCMC_chempot_dict": _compile_residue_unyt_dict_validator(
+        energy, "energy units, such as kcal/mol, kJ/mol, or K", "K", False
+    ),
+    "ck_input_variable_GCMC_fugacity_dict": _compile_residue_unyt_dict_validator(
+        pressure, "pressure units", "bar", True
+    ),
+    "ck_input_variable_str_with_no_spaces": _is_str_with_no_spaces,
+}
+
+# the compiled validators, which accept None values (i.e., the variable is not used)
+_control_none_value_validators = frozenset(
+    [
+        "ck_input_variable_list_of_floats_zero_to_1",
+        "ck_input_variable_GCMC_chempot_dict",
+        "ck_input_variable_GCMC_fugacity_dict",
+    ]
+)
+
+# the unit checks and conversions, which are done before the variable values are validated
+_control_value_converter_dict = {
+    "RcutCoulomb_box_0": _check_if_unyt_length_convert_to_angstrom,
+    "RcutCoulomb_box_1": _check_if_unyt_length_convert_to_angstrom,
+    "Pressure": _check_if_unyt_pressure_convert_to_bar,
+    "Rcut": _check_if_unyt_length_convert_to_angstrom,
+    "RcutLow": _check_if_unyt_length_convert_to_angstrom,
+    "Rswitch": _check_if_unyt_length_convert_to_angstrom,
+    "MinSigma": _check_if_unyt_length_convert_to_angstrom,
+}
+
+# the validation error messages, which are only formatted when they are requested
+# (see format_validation_errors)
+_control_validation_error_message_dict = {
+    "invalid_variable": "ERROR: The {} input variable is not a valid variable "
+    "for the {} ensemble.",
+    "bad_value": "ERROR: The {} input variable has a bad value ({}), "
+    "and it needs to be a {}.",
+    "type_error": "{}",
+}
+
+
+def _check_input_variables_values(
+    input_variables_dict, residues=None, collect_all=True
+):
+    """
+    Checks the input variables (user optional) values with their compiled validators, in a single pass.
+
+    The variables without a compiled validator (see _get_control_variable_registry)
+    are not checked here.  The None values are only valid for the variables which
+    are not used if they are None (i.e., the LambdaVDW, LambdaCoulomb, ChemPot,
+    and Fugacity), and they are bad values for all the other variables.
+
+    Parameters
+    ----------
+    input_variables_dict: dict
+        The input variables dictionary, with the case sensitive variable names.
+    residues: list, tuple, set, or None, default=None
+        The residue names in the simulation, or None to skip the residue name checks.
+    collect_all: bool, default=True
+        If True, the TypeErrors from the unit and value checks are collected as errors.
+        If False, they are raised.
+
+    Returns
+    ---------
+    errors_list: list of lists, [[variable, error_type, error_detail], ...]
+        The bad variables, with the "bad_value" or "type_error" error_type, and the
+        checked value or TypeError error_detail.
+    """
+    control_variable_registry = _get_control_variable_registry()
+
+    errors_list = []
+    for variable_i, value_i in input_variables_dict.items():
+        registry_entry_i = control_variable_registry.get(variable_i)
+        if registry_entry_i is None or registry_entry_i["validator"] is None:
+            continue
+
+        if value_i is None:
+            if (
+                registry_entry_i["validator"]
+                not in _control_none_value_validators
+            ):
+                errors_list.append([variable_i, "bad_value", value_i])
+            continue
+
+        try:
+            if variable_i in _control_value_converter_dict:
+                value_i = _control_value_converter_dict[variable_i](
+                    variable_i, value_i
+                )
+            value_is_valid = _control_value_validator_dict[
+                registry_entry_i["validator"]
+            ](variable_i, value_i, residues)
+        except TypeError as type_error_i:
+            if not collect_all:
+                raise
+            errors_list.append([variable_i, "type_error", type_error_i])
+            continue
+
+        if not value_is_valid:
+            errors_list.append([variable_i, "bad_value", value_i])
+
+    return errors_list
+
+
+def validate_input_variables_dict(
+    ensemble_type, input_variables_dict, residues=None
+):
+    """
+    Validates all the input variables (user optional) for the ensemble, collecting all the errors.
+
+    The variables are validated in a single pass with the same value checks as the
+    GOMCControl object, without building the GOMCControl object or raising on the
+    first error.  Like the GOMCControl object, the variable names are not case sensitive.
+    The variable specific GOMCControl checks, which depend on several variables or
+    the Charmm object (e.g., RcutLow < Rswitch < Rcut, MEMC_DataInput),
+    are only done when the GOMCControl object is built.
+
+    Parameters
+    ----------
+    ensemble_type: str, valid options are 'NVT', 'NPT', 'GEMC_NVT', 'GEMC_NPT', 'GCMC'
+        The ensemble type of the simulation.
+    input_variables_dict: dict
+        The input variables dictionary, which is checked.
+    residues: list, tuple, set, or None, default=None
+        The residue names in the simulation (i.e., Charmm.residues), or None
+        to skip the residue name checks.
+
+    Returns
+    ---------
+    errors_list: list of lists, [[variable, error_type, error_detail], ...]
+        The errors, which is empty if all the input variables are valid.
+        The error_type is "invalid_variable", "bad_value", or "type_error".
+        The error messages can be formatted with format_validation_errors.
+    """
+    _get_control_variable_registry()
+    ensemble_input_variables_sets_dict = _control_variable_registry_cache_dict[
+        "ensemble_input_variables_sets"
+    ]
+    lower_case_to_input_variables_dict = _control_variable_registry_cache_dict[
+        "lower_case_to_input_variables"
+    ]
+    if ensemble_type not in ensemble_input_variables_sets_dict:
+        print_error_message = (
+            "ERROR: The ensemble_type ({}) is not valid. The valid ensemble types are {}."
+            "".format(ensemble_type, list(_GOMC_ENSEMBLE_TYPES))
+        )
+        raise ValueError(print_error_message)
+
+    ensemble_input_variables_set = ensemble_input_variables_sets_dict[
+        ensemble_type
+    ]
+    errors_list = []
+    valid_input_variables_dict = {}
+    for variable_i, value_i in input_variables_dict.items():
+        case_spec_variable_i = lower_case_to_input_variables_dict.get(
+            str(variable_i).lower()
+        )
+        if case_spec_variable_i not in ensemble_input_variables_set:
+            errors_list.append([variable_i, "invalid_variable", ensemble_type])
+        else:
+            valid_input_variables_dict[case_spec_variable_i] = value_i
+
+    errors_list.extend(
+        _check_input_variables_values(
+            valid_input_variables_dict, residues=residues, collect_all=True
+        )
+    )
+
+    return errors_list
+
+
+def validate_input_variables_dicts(
+    ensemble_type, input_variables_dicts_list, residues=None
+):
+    """
+    Validates a batch of input variables dictionaries (user optional) for the ensemble.
+
+    This validates each dictionary with validate_input_variables_dict, which is useful
+    to check all the parameter sweep inputs before any GOMCControl files are built.
+
+    Parameters
+    ----------
+    ensemble_type: str, valid options are 'NVT', 'NPT', 'GEMC_NVT', 'GEMC_NPT', 'GCMC'
+        The ensemble type of the simulations.
+    input_variables_dicts_list: list of dicts
+        The input variables dictionaries, which are checked.
+    residues: list, tuple, set, or None, default=None
+        The residue names in the simulations (i.e., Charmm.residues), or None
+        to skip the residue name checks.
+
+    Returns
+    ---------
+    errors_lists: list of lists
+        The errors list for each input variables dictionary, in the same order
+        (see validate_input_variables_dict). An empty errors list means that
+        input variables dictionary is valid.
+    """
+    return [
+        validate_input_variables_dict(
+            ensemble_type, input_variables_dict_i, residues=residues
+        )
+        for input_variables_dict_i in input_variables_dicts_list
+    ]
+
+
+def format_validation_errors(errors_list):
+    """
+    Formats the validation errors into the error messages.
+
+    Parameters
+    ----------
+    errors_list: list of lists, [[variable, error_type, error_detail], ...]
+        The errors from the validate_input_variables_dict function.
+
+    Returns
+    ---------
+    error_messages_list: list of str
+        The error message for each error.
+    """
+    control_variable_registry = _get_control_variable_registry()
+
+    error_messages_list = []
+    for variable_i, error_type_i, error_detail_i in errors_list:
+        if error_type_i == "bad_value":
+            error_messages_list.append(
+                _control_validation_error_message_dict[error_type_i].format(
+                    variable_i,
+                    error_detail_i,
+                    control_variable_registry[variable_i]["type"],
+                )
+            )
+        elif error_type_i == "type_error":
+            error_message_i = error_detail_i.args[0]
+            # some of the unit checks have their error message in a tuple
+            if isinstance(error_message_i, tuple):
+                error_message_i = error_message_i[0]
+            error_messages_list.append(
+                _control_validation_error_message_dict[error_type_i].format(
+                    error_message_i
+                )
+            )
+        else:
+            error_messages_list.append(
+                _control_validation_error_message_dict[error_type_i].format(
+                    variable_i, error_detail_i
+                )
+            )
+
+    return error_messages_list
+
+
 # user callable function to write the GOMC control file
 def write_gomc_control_file(
     charmm_object,
@@ -9880,3 +10903,200 @@ def write_gomc_control_file(
         return "GOMC_CONTROL_FILE_WRITTEN"
     else:
         return None
+
+
+def build_sweep_overrides(sweep_variables_dict, sweep_type="grid"):
+    """
+    Builds the control file overrides for a parameter sweep.
+
+    Parameters
+    ----------
+    sweep_variables_dict: dict, {str: list, tuple, or range}
+        The overridden variables (see GOMCControlRenderer.override_variables)
+        and their sweep values, with one value per state point.
+        Note: The list variables (e.g., LambdaVDW) need a list of lists.
+    sweep_type: str, ['grid', 'zip'], default='grid'
+        'grid': every combination of the variable values, where the last
+        variable changes the fastest (i.e., itertools.product).
+        'zip': the i-th values of all the variables, which need to have
+        the same number of values.
+
+    Returns
+    ---------
+    overrides_list: list of dicts
+        The {variable: value} overrides for each state point.
+    """
+    if not isinstance(sweep_variables_dict, dict):
+        print_error_message = (
+            "ERROR: The sweep_variables_dict variable is not a dictionary."
+        )
+        raise TypeError(print_error_message)
+
+    for variable_i, values_i in sweep_variables_dict.items():
+        if not isinstance(values_i, (list, tuple, range)) or len(values_i) == 0:
+            print_error_message = (
+                "ERROR: The {} sweep values are not a non-empty list, tuple, "
+                "or range.".format(variable_i)
+            )
+            raise TypeError(print_error_message)
+
+    variables_list = list(sweep_variables_dict.keys())
+    values_lists = list(sweep_variables_dict.values())
+    if sweep_type == "grid":
+        state_points_list = list(itertools.product(*values_lists))
+    elif sweep_type == "zip":
+        if len({len(values_i) for values_i in values_lists}) > 1:
+            print_error_message = (
+                "ERROR: All the sweep variables need to have the same number "
+                "of values when the sweep_type = 'zip'."
+            )
+            raise ValueError(print_error_message)
+        state_points_list = list(zip(*values_lists))
+    else:
+        print_error_message = (
+            "ERROR: The sweep_type ({}) is not 'grid' or 'zip'.".format(
+                sweep_type
+            )
+        )
+        raise ValueError(print_error_message)
+
+    return [
+        dict(zip(variables_list, state_point_i))
+        for state_point_i in state_points_list
+    ]
+
+
+def write_gomc_control_file_sweep(
+    charmm_object,
+    ensemble_type,
+    RunSteps,
+    Temperature,
+    sweep_variables_dict,
+    out_dir,
+    sweep_type="grid",
+    conf_filenames_list=None,
+    n_processes=None,
+    unique_output_names=True,
+    ff_psf_pdb_file_directory=None,
+    check_input_files_exist=True,
+    Restart=False,
+    Checkpoint=False,
+    ExpertMode=False,
+    Parameters=None,
+    Coordinates_box_0=None,
+    Structure_box_0=None,
+    Coordinates_box_1=None,
+    Structure_box_1=None,
+    binCoordinates_box_0=None,
+    extendedSystem_box_0=None,
+    binVelocities_box_0=None,
+    binCoordinates_box_1=None,
+    extendedSystem_box_1=None,
+    binVelocities_box_1=None,
+    input_variables_dict=None,
+):
+    """
+    Writes a parameter sweep of GOMC control files from one Charmm object.
+
+    The ``GOMCControl`` object is built once, so the Charmm object is read,
+    the input files are checked, and the input_variables_dict is validated
+    only once.  It is then compiled into a ``GOMCControlRenderer``, which checks
+    every state point's overrides before any control files are written, and
+    renders the control files, optionally in a process pool.
+
+    Parameters
+    ----------
+    charmm_object: Charmm object
+        Charmm object is has been parameterized from the selected force field.
+    ensemble_typ: str, ['NVT', 'NPT', 'GEMC_NPT', 'GCMC-NVT', 'GCMC']
+        The ensemble type of the simulation.
+    RunSteps: int (>0), must be an integer greater than zero.
+        Sets the total number of simulation steps, for the state points
+        which do not override it.
+    Temperature: unyt.unyt_quantity in temperature units (> 1 K)
+        Temperature of system in unyt temperature units (written in Kelvin),
+        for the state points which do not override it.
+    sweep_variables_dict: dict, {str: list, tuple, or range}
+        The overridden variables (see GOMCControlRenderer.override_variables),
+        and their sweep values (e.g., {"Temperature": [300 * u.K, 350 * u.K],
+        "PRNG": [1, 2, 3]}).  See build_sweep_overrides.
+    out_dir: str
+        The directory the control files are written to,
+        which is created if it does not exist.
+    sweep_type: str, ['grid', 'zip'], default='grid'
+        'grid': every combination of the variable values.
+        'zip': the i-th values of all the variables (e.g., free energy windows).
+    conf_filenames_list: list of str or None, default=None
+        The control file names (without the directory), with the .conf extension,
+        or no extension. If None, the control files are named
+        in_GOMC_0.conf, in_GOMC_1.conf, ..., in the sweep order.
+    n_processes: int (>= 1) or None, default=None
+        The number of processes used to render and write the control files.
+        If None or 1, the control files are rendered serially.
+    unique_output_names: bool, default=True
+        If True and the sweep has more than one state point and does not sweep
+        the OutputName, each state point's OutputName is the OutputName plus the
+        state point number (i.e., Output_data_0, Output_data_1, ...), in the sweep
+        order, so the GOMC simulations do not overwrite each other's output files.
+        If False, the OutputName is not changed, and an error is raised if
+        more than one state point has the same OutputName.
+
+    The other parameters are the same as in the ``write_gomc_control_file`` function.
+
+    Returns
+    ---------
+    conf_filenames_written_list: list of str
+        The written control file paths, in the sweep order.
+    """
+    overrides_list = build_sweep_overrides(
+        sweep_variables_dict, sweep_type=sweep_type
+    )
+
+    if not isinstance(unique_output_names, bool):
+        print_error_message = (
+            "ERROR: The unique_output_names variable is not a bool."
+        )
+        raise TypeError(print_error_message)
+
+    gomc_control = GOMCControl(
+        charmm_object,
+        ensemble_type,
+        RunSteps,
+        Temperature,
+        ff_psf_pdb_file_directory=ff_psf_pdb_file_directory,
+        check_input_files_exist=check_input_files_exist,
+        Restart=Restart,
+        Checkpoint=Checkpoint,
+        ExpertMode=ExpertMode,
+        Parameters=Parameters,
+        Coordinates_box_0=Coordinates_box_0,
+        Structure_box_0=Structure_box_0,
+        Coordinates_box_1=Coordinates_box_1,
+        Structure_box_1=Structure_box_1,
+        binCoordinates_box_0=binCoordinates_box_0,
+        extendedSystem_box_0=extendedSystem_box_0,
+        binVelocities_box_0=binVelocities_box_0,
+        binCoordinates_box_1=binCoordinates_box_1,
+        extendedSystem_box_1=extendedSystem_box_1,
+        binVelocities_box_1=binVelocities_box_1,
+        input_variables_dict=input_variables_dict,
+    )
+
+    # add the state point number to each OutputName, like the free energy windows
+    if (
+        unique_output_names
+        and len(overrides_list) > 1
+        and "outputname"
+        not in [str(variable_i).lower() for variable_i in sweep_variables_dict]
+    ):
+        for state_point_i, overrides_i in enumerate(overrides_list):
+            overrides_i["OutputName"] = (
+                f"{gomc_control.OutputName}_{state_point_i}"
+            )
+
+    return gomc_control.compile_renderer().render_many(
+        overrides_list,
+        out_dir,
+        conf_filenames_list=conf_filenames_list,
+        n_processes=n_processes,
+    )
@@ -1,6 +1,11 @@
+import os
+import pickle
+from types import SimpleNamespace
+
 import mbuild as mb
 import numpy as np
 import pytest
+import unyt as u
 from foyer.forcefields import forcefields
 from gmso import Topology
 from gmso.exceptions import GMSOError
@@ -9,15 +14,31 @@ from mbuild import Box, Compound
 from mbuild.lattice import load_cif
 from mbuild.utils.io import get_fn, has_foyer
 
+from mosdef_gomc.formats import gmso_charmm_writer
 from mosdef_gomc.formats.gmso_charmm_writer import (
     Charmm,
+    _allocate_unique_class_name,
+    _ConcatenatedSequence,
+    _dihedral_to_periodic_max_abs_deviation,
+    _Exp6_bracketed_ratio_solver,
     _Exp6_Rmin_to_sigma,
     _Exp6_Rmin_to_sigma_solver,
+    _Exp6_Rmin_to_sigma_solver_array,
     _Exp6_sigma_to_Rmin,
     _Exp6_sigma_to_Rmin_solver,
+    _Exp6_sigma_to_Rmin_solver_array,
+    _psf_connection_section,
+    _register_parameter_entry,
+    _unyt_quantities_to_value,
+    unique_atom_naming,
 )
 from mosdef_gomc.tests.base_test import BaseTest
 from mosdef_gomc.utils.conversion import (
+    OPLS_to_periodic,
+    OPLS_to_periodic_array,
+    RB_to_periodic,
+    RB_to_periodic_array,
+    _to_base,
     base10_to_base16_alph_num,
     base10_to_base22_alph,
     base10_to_base26_alph,
@@ -25,6 +46,8 @@ from mosdef_gomc.utils.conversion import (
     base10_to_base52_alph,
     base10_to_base54_alph_num,
     base10_to_base62_alph_num,
+    base10_to_base_n,
+    base10_to_base_n_array,
 )
 from mosdef_gomc.utils.io import get_mosdef_gomc_fn
 
@@ -3377,6 +3400,62 @@ class TestCharmmWriterData(BaseTest):
         assert read_pdb_part_1
         assert read_pdb_part_2
 
+    def test_charmm_pdb_atom_records_written_in_bulk(
+        self, ethane_gomc, ethanol_gomc
+    ):
+        test_box_ethane_ethanol = mb.fill_box(
+            compound=[ethane_gomc, ethanol_gomc],
+            n_compounds=[2, 2],
+            box=[2.0, 2.0, 2.0],
+        )
+        charmm = Charmm(
+            test_box_ethane_ethanol,
+            "Test_pdb_atom_records_in_bulk",
+            ff_filename="Test_pdb_atom_records_in_bulk",
+            residues=[ethanol_gomc.name, ethane_gomc.name],
+            forcefield_selection="oplsaa",
+            fix_residue=[ethane_gomc.name],
+            set_residue_pdb_occupancy_to_1=[ethanol_gomc.name],
+            atom_type_naming_style="general",
+        )
+        charmm.write_pdb()
+
+        with open("Test_pdb_atom_records_in_bulk.pdb", "r") as fp:
+            out_gomc = fp.readlines()
+
+        atom_lines_list = [
+            line for line in out_gomc if line.startswith("ATOM  ")
+        ]
+        sites_list = list(charmm.topology_box_0_ff.sites)
+        assert len(atom_lines_list) == len(sites_list) == 2 * 8 + 2 * 9
+
+        # the beta and occupancy values are set per residue name, and the
+        # element names per site name, for every repeated residue and site
+        for j, line in enumerate(atom_lines_list):
+            assert len(line) == 81
+            assert line[6:11] == f"{j + 1:5d}"
+            residue_name_j = line[17:21].strip()
+            if residue_name_j == ethane_gomc.name:
+                assert line[54:66] == "  0.00  1.00"
+            else:
+                assert residue_name_j == ethanol_gomc.name
+                assert line[54:66] == "  1.00  0.00"
+            assert line[76:78].strip() == "".join(
+                site_name_char_i
+                for site_name_char_i in sites_list[j].name
+                if not site_name_char_i.isdigit()
+            )
+
+            # the coordinates are converted to Angstroms
+            assert np.allclose(
+                [float(line[30:38]), float(line[38:46]), float(line[46:54])],
+                sites_list[j].position.to_value("angstrom"),
+                atol=10 ** (-3),
+            )
+
+        assert out_gomc[-1] == "%-80s\n" % "END"
+        assert out_gomc[-2] == atom_lines_list[-1]
+
     def test_charmm_pdb_fix_bonds_only(self, ethane_gomc, ethanol_gomc):
         test_box_ethane_ethanol = mb.fill_box(
             compound=[ethane_gomc, ethanol_gomc],
@@ -3851,6 +3930,61 @@ class TestCharmmWriterData(BaseTest):
             add_same_values_list
         ) == len(unique_entries_base_16_list)
 
+    # test the lookup table and array base-n converters vs the original converter
+    def test_base_10_to_base_n_matches_to_base(self):
+        for base_iter in [22, 26, 44, 52, 54, 62]:
+            test_numbers_list = list(range(0, base_iter**2 + base_iter + 2)) + [
+                base_iter**3 - 1,
+                base_iter**3,
+                123456789,
+            ]
+            expected_list = [
+                _to_base(number_iter, base=base_iter)
+                for number_iter in test_numbers_list
+            ]
+            assert [
+                base10_to_base_n(number_iter, base=base_iter)
+                for number_iter in test_numbers_list
+            ] == expected_list
+            assert (
+                base10_to_base_n_array(
+                    test_numbers_list, base=base_iter
+                ).tolist()
+                == expected_list
+            )
+
+        test_numbers_16 = np.arange(99990, 100010)
+        assert base10_to_base_n_array(test_numbers_16, base=16).tolist() == [
+            base10_to_base16_alph_num(number_iter)
+            for number_iter in test_numbers_16
+        ]
+        assert base10_to_base_n_array(
+            np.array([[0, 61], [62, 3843]]), base=62
+        ).tolist() == [["0", "z"], ["10", "zz"]]
+        assert base10_to_base_n_array([], base=62).tolist() == []
+
+    def test_base_10_to_base_n_bad_inputs(self):
+        with pytest.raises(
+            ValueError,
+            match=r"Base-10 system is not supported. Supported bases are: "
+            r"\[16, 22, 26, 44, 52, 54, 62\]",
+        ):
+            base10_to_base_n(5, base=10)
+
+        with pytest.raises(
+            ValueError,
+            match=r"Base-10 system is not supported. Supported bases are: "
+            r"\[16, 22, 26, 44, 52, 54, 62\]",
+        ):
+            base10_to_base_n_array([5], base=10)
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The base10_array values must be non-negative integers, "
+            r"but the minimum value is -1.",
+        ):
+            base10_to_base_n_array([5, -1], base=62)
+
     # test utils base 10 to base 26 converter
     def test_base_10_to_base_26(self):
         list_base_10_and_26 = [
@@ -10399,6 +10533,194 @@ class TestCharmmWriterData(BaseTest):
                 3.6790000166, 0.1, sigma_fraction_for_Rmin_findroot=0.1
             )
 
+    def test_Exp6_Rmin_to_sigma_solver_array(self):
+        Rmin_list = [4.0941137, 3.5, 4.0941137, 2.0]
+        alpha_list = [16, 14, 16, 20]
+        exp6_sigma_array = _Exp6_Rmin_to_sigma_solver_array(
+            Rmin_list, alpha_list
+        )
+
+        assert exp6_sigma_array.shape == (4,)
+        assert np.isclose(exp6_sigma_array[0], 3.6790000166)
+        for i in range(0, len(Rmin_list)):
+            assert np.isclose(
+                exp6_sigma_array[i],
+                _Exp6_Rmin_to_sigma_solver(Rmin_list[i], alpha_list[i]),
+                rtol=10 ** (-10),
+            )
+
+        # repeated calls give the same values
+        assert np.array_equal(
+            exp6_sigma_array,
+            _Exp6_Rmin_to_sigma_solver_array(Rmin_list, alpha_list),
+        )
+
+        # the scalar solver is only run once per (Rmin, alpha) pair
+        _Exp6_Rmin_to_sigma_solver.cache_clear()
+        exp6_sigma_value_1 = _Exp6_Rmin_to_sigma_solver(4.0941137, 16)
+        exp6_sigma_value_2 = _Exp6_Rmin_to_sigma_solver(4.0941137, 16)
+        assert exp6_sigma_value_1 == exp6_sigma_value_2
+        assert _Exp6_Rmin_to_sigma_solver.cache_info().misses == 1
+        assert _Exp6_Rmin_to_sigma_solver.cache_info().hits == 1
+        assert _Exp6_Rmin_to_sigma_solver.cache_info().maxsize == 1024
+
+    def test_Exp6_Rmin_to_sigma_solver_array_failing(self):
+        with pytest.raises(
+            ValueError,
+            match=f"ERROR: The Exp6 potential Rmin --> sigma converter failed. "
+            f"The Exp6 potential values can not be Rmin = 0 or alpha = 6, "
+            f"as it divides by zero. "
+            f"The entered values are Rmin = 4.0941137 and alpha = 6.0.",
+        ):
+            _Exp6_Rmin_to_sigma_solver_array([3.5, 4.0941137], [16, 6])
+
+        with pytest.raises(
+            ValueError,
+            match="ERROR: The Exp6 potential Rmin --> sigma converter failed. "
+            "It did not converge, sigma_calculated >= Rmin_actual, or "
+            "another issue.",
+        ):
+            _Exp6_Rmin_to_sigma_solver_array([4.0941137], [1000000.0])
+
+        with pytest.raises(
+            ValueError,
+            match="ERROR: The Exp6 potential Rmin --> sigma converter failed. "
+            "It did not converge, sigma_calculated >= Rmin_actual, or "
+            "another issue.",
+        ):
+            _Exp6_Rmin_to_sigma_solver_array(
+                [4.0941137], [16], Rmin_fraction_for_sigma_findroot=1.1
+            )
+
+    def test_Exp6_sigma_to_Rmin_solver_array(self):
+        sigma_list = [3.6790000166, 3.0, 3.6790000166]
+        alpha_list = [16, 14, 16]
+        exp6_Rmin_array = _Exp6_sigma_to_Rmin_solver_array(
+            sigma_list, alpha_list
+        )
+
+        assert np.isclose(exp6_Rmin_array[0], 4.0941137)
+        for i in range(0, len(sigma_list)):
+            assert np.isclose(
+                exp6_Rmin_array[i],
+                _Exp6_sigma_to_Rmin_solver(sigma_list[i], alpha_list[i]),
+                rtol=10 ** (-10),
+            )
+
+        with pytest.raises(
+            ValueError,
+            match=f"ERROR: The Exp6 potential sigma --> Rmin converter failed. "
+            f"The Exp6 potential values can not be sigma = 0 or alpha = 6, "
+            f"as it divides by zero. "
+            f"The entered values are sigma = 0.0 and alpha = 16.0.",
+        ):
+            _Exp6_sigma_to_Rmin_solver_array([0], [16])
+
+    def test_Exp6_solver_array_cache(self, monkeypatch):
+        gmso_charmm_writer._Exp6_solver_array_cache.clear()
+        _Exp6_Rmin_to_sigma_solver.cache_clear()
+        _Exp6_sigma_to_Rmin_solver.cache_clear()
+        exp6_sigma_array = _Exp6_Rmin_to_sigma_solver_array(
+            [4.0941137, 3.5, 4.0941137], [16, 14, 16]
+        )
+        exp6_Rmin_array = _Exp6_sigma_to_Rmin_solver_array(
+            [3.6790000166, 3.0], [16, 14]
+        )
+        assert len(gmso_charmm_writer._Exp6_solver_array_cache) == 4
+        assert (
+            "Rmin_to_sigma",
+            4.0941137,
+            16.0,
+            0.95,
+        ) in gmso_charmm_writer._Exp6_solver_array_cache
+        assert (
+            "sigma_to_Rmin",
+            3.0,
+            14.0,
+            1.05,
+        ) in gmso_charmm_writer._Exp6_solver_array_cache
+
+        # the repeated batch calls do not run any solvers
+        solver_calls_list = []
+
+        def counting_solver(*args, **kwargs):
+            solver_calls_list.append(args)
+            return _Exp6_bracketed_ratio_solver(*args, **kwargs)
+
+        monkeypatch.setattr(
+            gmso_charmm_writer,
+            "_Exp6_bracketed_ratio_solver",
+            counting_solver,
+        )
+        assert np.array_equal(
+            exp6_sigma_array,
+            _Exp6_Rmin_to_sigma_solver_array(
+                [4.0941137, 3.5, 4.0941137], [16, 14, 16]
+            ),
+        )
+        assert np.array_equal(
+            exp6_Rmin_array,
+            _Exp6_sigma_to_Rmin_solver_array([3.6790000166, 3.0], [16, 14]),
+        )
+        assert solver_calls_list == []
+        assert _Exp6_Rmin_to_sigma_solver.cache_info().currsize == 0
+        assert _Exp6_sigma_to_Rmin_solver.cache_info().currsize == 0
+
+        # a different starting fraction is a different cache key
+        _Exp6_Rmin_to_sigma_solver_array(
+            [4.0941137], [16], Rmin_fraction_for_sigma_findroot=0.9
+        )
+        assert len(solver_calls_list) == 1
+
+        # the cache is bounded, removing the least recently used values
+        monkeypatch.setattr(
+            gmso_charmm_writer, "MAX_EXP6_SOLVER_CACHE_ENTRIES", 2
+        )
+        _Exp6_Rmin_to_sigma_solver_array([3.5, 2.0], [14, 20])
+        assert list(gmso_charmm_writer._Exp6_solver_array_cache.keys()) == [
+            ("Rmin_to_sigma", 3.5, 14.0, 0.95),
+            ("Rmin_to_sigma", 2.0, 20.0, 0.95),
+        ]
+
+    def test_Exp6_bracketed_ratio_solver(self):
+        # For alpha = 16, the non-logical root is at a sigma / Rmin ratio
+        # of about 0.12, and the sigma root is at about 0.899.
+        # The starting ratios between the roots, or above the sigma root,
+        # all converge to the sigma root.
+        for start_ratio in [0.15, 0.5, 0.8986, 0.95, 0.99]:
+            ratio_array, converged_array = _Exp6_bracketed_ratio_solver(
+                np.array([16.0, 14.0]), start_ratio
+            )
+            assert np.all(converged_array)
+            assert np.isclose(
+                ratio_array[0] * 4.0941137, 3.6790000166, rtol=10 ** (-8)
+            )
+            assert np.isclose(
+                ratio_array[1] * 3.5,
+                _Exp6_Rmin_to_sigma_solver(3.5, 14),
+                rtol=10 ** (-10),
+            )
+
+        # The starting ratio below the non-logical root does not bracket
+        # the sigma root, so it is not converged to the non-logical root.
+        ratio_array, converged_array = _Exp6_bracketed_ratio_solver(
+            np.array([16.0]), 0.1
+        )
+        assert not np.any(converged_array)
+
+        # the starting ratios outside of (0, 1), alpha < 6,
+        # or f(x) overflow are not converged
+        for alpha_value, start_ratio in [
+            (16.0, 1.1),
+            (16.0, 0),
+            (5.0, 0.95),
+            (1000000.0, 0.95),
+        ]:
+            ratio_array, converged_array = _Exp6_bracketed_ratio_solver(
+                np.array([alpha_value]), start_ratio
+            )
+            assert not np.any(converged_array)
+
     def test_save_Exp6_gomc_ff(self, hexane_ua):
         box_0 = mb.fill_box(
             compound=[hexane_ua], n_compounds=[2], box=[4, 4, 4]
@@ -11109,3 +11431,697 @@ class TestCharmmWriterData(BaseTest):
         assert dihedrals_read
         assert impropers_read
         assert nonbondeds_read
+
+    def test_psf_connection_section_formatting(self):
+        # 5 bonds at 4 per line: 1 full line, 1 partial line, then a blank line
+        bond_index_array = np.array(
+            [[0, 1], [1, 2], [2, 3], [3, 4], [99998, 99999]]
+        )
+        assert _psf_connection_section(bond_index_array, 4) == (
+            "       1       2       2       3       3       4       4       5\n"
+            "   99999  100000\n\n"
+        )
+
+        # 2 dihedrals at 2 per line: 1 full line, then a blank line
+        dihedral_index_array = np.array([[0, 1, 2, 3], [1, 2, 3, 4]])
+        assert _psf_connection_section(dihedral_index_array, 2) == (
+            "       1       2       3       4       2       3       4       5\n"
+            "\n"
+        )
+
+        # no angles: 2 blank lines
+        angle_index_array = np.zeros((0, 3), dtype=np.int32)
+        assert _psf_connection_section(angle_index_array, 3) == "\n\n"
+
+    def test_site_table_two_boxes(self, ethane_gomc, ethanol_gomc):
+        box_0 = mb.fill_box(
+            compound=[ethane_gomc, ethanol_gomc],
+            n_compounds=[2, 1],
+            box=[4, 4, 4],
+        )
+        box_1 = mb.fill_box(
+            compound=[ethanol_gomc], n_compounds=[2], box=[4, 4, 4]
+        )
+
+        charmm = Charmm(
+            box_0,
+            "site_table_box_0",
+            structure_box_1=box_1,
+            filename_box_1="site_table_box_1",
+            ff_filename="site_table_ff",
+            residues=[ethane_gomc.name, ethanol_gomc.name],
+            forcefield_selection="oplsaa",
+        )
+
+        # ethane has 8 atoms and ethanol has 9 atoms
+        assert charmm.site_table["box_site_slices"] == [
+            slice(0, 25),
+            slice(25, 43),
+        ]
+        assert charmm.site_table["residue_names"] == ["ETH", "ETO"]
+        assert charmm.site_table["residue_name_to_code"] == {"ETH": 0, "ETO": 1}
+        assert list(charmm.site_table["residue_name_codes"]) == (
+            [0] * 16 + [1] * 27
+        )
+        assert list(charmm.site_table["residue_ids"]) == (
+            [1] * 8 + [2] * 8 + [3] * 9 + [1] * 9 + [2] * 9
+        )
+        assert charmm.site_table["type_keys"][0:2] == [
+            ("ETH", "CT", "opls_135"),
+            ("ETH", "HC", "opls_140"),
+        ]
+        assert len(charmm.site_table["first_site_of_type_code"]) == len(
+            charmm.site_table["type_keys"]
+        )
+        assert np.allclose(charmm.site_table["masses"], charmm.masses)
+        assert np.allclose(charmm.site_table["charges"], charmm.charges)
+
+        # the per atom type masses and charges are broadcast to all the sites
+        all_sites_list = list(charmm.topology_box_0_ff.sites) + list(
+            charmm.topology_box_1_ff.sites
+        )
+        assert np.allclose(
+            charmm.masses,
+            [site.atom_type.mass.to_value("amu") for site in all_sites_list],
+        )
+        assert np.allclose(
+            charmm.charges,
+            [
+                (site.atom_type.charge.to("C") / u.elementary_charge).to_value(
+                    "(dimensionless)"
+                )
+                for site in all_sites_list
+            ],
+        )
+        assert charmm.mass_atom_type_dict["ETH_opls_135"] == pytest.approx(
+            12.011
+        )
+        assert charmm.charges_atom_type_dict["ETH_opls_140"] == pytest.approx(
+            0.06
+        )
+        assert list(charmm.types[0:3]) == [
+            "ETH_opls_135",
+            "ETH_opls_135",
+            "ETH_opls_140",
+        ]
+        assert charmm.residue_names_list_box_1 == ["ETO"] * 18
+        assert charmm.residue_id_list_box_1 == [1] * 9 + [2] * 9
+
+    def test_two_box_topology_view(self, ethane_gomc, ethanol_gomc):
+        box_0 = mb.fill_box(
+            compound=[ethane_gomc, ethanol_gomc],
+            n_compounds=[2, 1],
+            box=[4, 4, 4],
+        )
+        box_1 = mb.fill_box(
+            compound=[ethanol_gomc], n_compounds=[2], box=[4, 4, 4]
+        )
+
+        charmm = Charmm(
+            box_0,
+            "topology_view_box_0",
+            structure_box_1=box_1,
+            filename_box_1="topology_view_box_1",
+            ff_filename="topology_view_ff",
+            residues=[ethane_gomc.name, ethanol_gomc.name],
+            forcefield_selection="oplsaa",
+        )
+
+        topology_view = charmm._topology_box_0_and_1_view
+        topology_box_0 = charmm.topology_box_0_ff
+        topology_box_1 = charmm.topology_box_1_ff
+        assert topology_view.site_offsets == (0, 25)
+        assert topology_view.n_sites == 43
+        assert len(topology_view.sites) == 43
+        assert list(topology_view.sites) == list(topology_box_0.sites) + list(
+            topology_box_1.sites
+        )
+        assert topology_view.sites[25] is topology_box_1.sites[0]
+        assert topology_view.sites[-1] is topology_box_1.sites[-1]
+        assert topology_view.get_index(topology_box_1.sites[3]) == 28
+        for connection_type_i in ["bonds", "angles", "dihedrals", "impropers"]:
+            assert getattr(topology_view, f"n_{connection_type_i}") == (
+                getattr(topology_box_0, f"n_{connection_type_i}")
+                + getattr(topology_box_1, f"n_{connection_type_i}")
+            )
+        assert topology_view.n_connections == len(topology_view.connections)
+
+        # the public combined topology is still a gmso.Topology,
+        # with the same sites and connections as the merged view
+        topology_box_0_and_1 = charmm.topology_box_0_and_1_ff
+        assert isinstance(topology_box_0_and_1, Topology)
+        assert charmm.topology_box_0_and_1_ff is topology_box_0_and_1
+        assert charmm.topology_selection is topology_box_0_and_1
+        assert list(topology_box_0_and_1.sites) == list(topology_view.sites)
+        assert topology_box_0_and_1.n_connections == topology_view.n_connections
+        assert len(topology_box_0_and_1.atom_types) > 0
+
+    def test_concatenated_sequence(self):
+        concatenated_sequence = _ConcatenatedSequence([[0, 1, 2], [], [3, 4]])
+        assert len(concatenated_sequence) == 5
+        assert list(concatenated_sequence) == [0, 1, 2, 3, 4]
+        assert concatenated_sequence[3] == 3
+        assert concatenated_sequence[-1] == 4
+        assert concatenated_sequence[1:4] == [1, 2, 3]
+        with pytest.raises(IndexError):
+            concatenated_sequence[5]
+
+    def test_unique_atom_naming_large_residue(self):
+        # 70 oxygens in 1 residue (i.e., a zeolite), 2 oxygens in another residue,
+        # and a bead that is not in the bead_to_atom_name_dict
+        site_names_list = ["O"] * 70 + ["O2", "O"] + ["_CH4"]
+        test_topology = SimpleNamespace(
+            sites=[SimpleNamespace(name_=name_i) for name_i in site_names_list]
+        )
+        residue_id_list = [1] * 70 + [2, 2] + [3]
+        residue_names_list = ["ZEO"] * 70 + ["WAT", "WAT"] + ["MET"]
+
+        [
+            unique_names_dict,
+            individual_atom_names_list,
+            missing_bead_to_atom_name,
+        ] = unique_atom_naming(
+            test_topology, residue_id_list, residue_names_list
+        )
+
+        assert individual_atom_names_list[0:3] == ["O1", "O2", "O3"]
+        assert individual_atom_names_list[9] == "OA"
+        assert individual_atom_names_list[35] == "Oa"
+        assert individual_atom_names_list[60] == "Oz"
+        assert individual_atom_names_list[61:63] == ["O10", "O11"]
+        assert individual_atom_names_list[69] == "O18"
+        assert individual_atom_names_list[70:] == ["O1", "O2", "BD1"]
+        assert len(unique_names_dict) == 73
+        assert unique_names_dict["1_ZEO_O18"] == 70
+        assert missing_bead_to_atom_name == [1]
+
+    def test_unique_atom_naming_names_shared_by_atom_names(self):
+        # "C" + "l1" (j = 2915) is the same name as "Cl" + "1", so it is skipped
+        site_names_list = ["Cl"] + ["C"] * 2915
+        test_topology = SimpleNamespace(
+            sites=[SimpleNamespace(name_=name_i) for name_i in site_names_list]
+        )
+
+        [
+            unique_names_dict,
+            individual_atom_names_list,
+            missing_bead_to_atom_name,
+        ] = unique_atom_naming(test_topology, [1] * 2916, ["RES"] * 2916)
+
+        assert individual_atom_names_list[0] == "Cl1"
+        assert individual_atom_names_list[2914] == "Cl0"
+        assert individual_atom_names_list[2915] == "Cl2"
+        assert unique_names_dict["1_RES_Cl1"] == 1
+        assert unique_names_dict["1_RES_Cl2"] == 2916
+        assert len(unique_names_dict) == 2916
+
+    def test_write_all_parallel_matches_serial(self, ethane_gomc, ethanol_gomc):
+        box_0 = mb.fill_box(
+            compound=[ethane_gomc, ethanol_gomc],
+            n_compounds=[2, 1],
+            box=[4, 4, 4],
+        )
+        box_1 = mb.fill_box(
+            compound=[ethanol_gomc], n_compounds=[2], box=[4, 4, 4]
+        )
+
+        charmm = Charmm(
+            box_0,
+            "write_all_box_0",
+            structure_box_1=box_1,
+            filename_box_1="write_all_box_1",
+            ff_filename="write_all_ff",
+            residues=[ethane_gomc.name, ethanol_gomc.name],
+            forcefield_selection="oplsaa",
+        )
+
+        file_names_list = [
+            "write_all_ff.inp",
+            "write_all_box_0.psf",
+            "write_all_box_1.psf",
+            "write_all_box_0.pdb",
+            "write_all_box_1.pdb",
+        ]
+
+        def read_files_without_dates():
+            files_text_list = []
+            for file_name_i in file_names_list:
+                with open(file_name_i, "r") as fp:
+                    files_text_list.append(
+                        [
+                            line_i
+                            for line_i in fp.readlines()
+                            if "created on" not in line_i
+                        ]
+                    )
+            return files_text_list
+
+        charmm.write_inp()
+        charmm.write_psf()
+        charmm.write_pdb()
+        serial_files_text_list = read_files_without_dates()
+
+        for file_name_i in file_names_list:
+            os.remove(file_name_i)
+
+        charmm.write_all(parallel=True)
+        assert read_files_without_dates() == serial_files_text_list
+
+        # the files are written serially by default
+        for file_name_i in file_names_list:
+            os.remove(file_name_i)
+
+        charmm.write_all()
+        assert read_files_without_dates() == serial_files_text_list
+
+        charmm.write_psf(parallel=True, max_workers=2)
+        charmm.write_pdb(parallel=True)
+        assert read_files_without_dates() == serial_files_text_list
+
+        # the PSF and PDB box data is picklable, for the process pool,
+        # and is rendered to the same file text
+        writer_tasks_list = (
+            charmm._psf_writer_tasks() + charmm._pdb_writer_tasks()
+        )
+        assert len(writer_tasks_list) == 4
+        for (
+            prepare_function_i,
+            prepare_args_i,
+            render_function_i,
+            output_file_name_i,
+        ) in writer_tasks_list:
+            file_data_i = pickle.loads(
+                pickle.dumps(prepare_function_i(*prepare_args_i))
+            )
+            with open(output_file_name_i, "r") as fp:
+                assert [
+                    line_i
+                    for line_i in fp.readlines()
+                    if "created on" not in line_i
+                ] == [
+                    line_i
+                    for line_i in render_function_i(file_data_i).splitlines(
+                        keepends=True
+                    )
+                    if "created on" not in line_i
+                ]
+
+    def test_parallel_typing_matches_serial(self, ethane_gomc, ethanol_gomc):
+        box_0 = mb.fill_box(
+            compound=[ethane_gomc, ethanol_gomc],
+            n_compounds=[2, 1],
+            box=[4, 4, 4],
+        )
+        box_1 = mb.fill_box(
+            compound=[ethanol_gomc], n_compounds=[2], box=[4, 4, 4]
+        )
+
+        file_names_list = [
+            "typing_ff.inp",
+            "typing_box_0.psf",
+            "typing_box_1.psf",
+            "typing_box_0.pdb",
+            "typing_box_1.pdb",
+        ]
+
+        def write_files_without_dates(
+            parallel_typing, parallel_residue_typing=False
+        ):
+            charmm = Charmm(
+                box_0,
+                "typing_box_0",
+                structure_box_1=box_1,
+                filename_box_1="typing_box_1",
+                ff_filename="typing_ff",
+                residues=[ethane_gomc.name, ethanol_gomc.name],
+                forcefield_selection="oplsaa",
+                parallel_typing=parallel_typing,
+                parallel_residue_typing=parallel_residue_typing,
+                residue_typing_max_workers=2,
+            )
+            charmm.write_all(parallel=False)
+
+            files_text_list = []
+            for file_name_i in file_names_list:
+                with open(file_name_i, "r") as fp:
+                    files_text_list.append(
+                        [
+                            line_i
+                            for line_i in fp.readlines()
+                            if "created on" not in line_i
+                        ]
+                    )
+                os.remove(file_name_i)
+            return files_text_list
+
+        serial_files_text_list = write_files_without_dates(False)
+        assert write_files_without_dates(True) == serial_files_text_list
+
+        # the residues are typed in worker processes, with or without the box processes
+        assert (
+            write_files_without_dates(False, parallel_residue_typing=True)
+            == serial_files_text_list
+        )
+        assert (
+            write_files_without_dates(True, parallel_residue_typing=True)
+            == serial_files_text_list
+        )
+
+        # a single box is also typed per residue
+        charmm_box_0_serial = Charmm(
+            box_0,
+            "typing_box_0",
+            ff_filename="typing_ff",
+            residues=[ethane_gomc.name, ethanol_gomc.name],
+            forcefield_selection="oplsaa",
+        )
+        charmm_box_0_parallel = Charmm(
+            box_0,
+            "typing_box_0",
+            ff_filename="typing_ff",
+            residues=[ethane_gomc.name, ethanol_gomc.name],
+            forcefield_selection="oplsaa",
+            parallel_residue_typing=True,
+        )
+        assert [
+            site_i.atom_type.name
+            for site_i in charmm_box_0_parallel.topology_box_0_ff.sites
+        ] == [
+            site_i.atom_type.name
+            for site_i in charmm_box_0_serial.topology_box_0_ff.sites
+        ]
+
+        with pytest.raises(
+            TypeError,
+            match=r"ERROR: Please enter the parallel_residue_typing as a bool "
+            r"\(True or False\).",
+        ):
+            Charmm(
+                box_0,
+                "typing_box_0",
+                ff_filename="typing_ff",
+                residues=[ethane_gomc.name, ethanol_gomc.name],
+                forcefield_selection="oplsaa",
+                parallel_residue_typing="yes",
+            )
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: Please enter the residue_typing_max_workers as None or "
+            r"an integer greater than or equal to 1.",
+        ):
+            Charmm(
+                box_0,
+                "typing_box_0",
+                ff_filename="typing_ff",
+                residues=[ethane_gomc.name, ethanol_gomc.name],
+                forcefield_selection="oplsaa",
+                parallel_residue_typing=True,
+                residue_typing_max_workers=0,
+            )
+
+        with pytest.raises(
+            TypeError,
+            match=r"ERROR: Please enter the parallel_typing as a bool "
+            r"\(True or False\).",
+        ):
+            Charmm(
+                box_0,
+                "typing_box_0",
+                structure_box_1=box_1,
+                filename_box_1="typing_box_1",
+                ff_filename="typing_ff",
+                residues=[ethane_gomc.name, ethanol_gomc.name],
+                forcefield_selection="oplsaa",
+                parallel_typing="yes",
+            )
+
+        # the force field errors are raised before the box processes start
+        with pytest.raises(
+            ValueError,
+            match=r"Please make sure you are entering the correct foyer FF path, "
+            r"including the FF file name.xml.",
+        ):
+            Charmm(
+                box_0,
+                "typing_box_0",
+                structure_box_1=box_1,
+                filename_box_1="typing_box_1",
+                ff_filename="typing_ff",
+                residues=[ethane_gomc.name, ethanol_gomc.name],
+                forcefield_selection="bad_path/oplsaa.xml",
+                parallel_typing=True,
+            )
+
+    def test_allocate_unique_class_name(self):
+        used_class_names_set = set()
+        next_suffix_number_dict = {}
+        assert [
+            _allocate_unique_class_name(
+                class_stem_i, used_class_names_set, next_suffix_number_dict
+            )
+            for class_stem_i in ["CH3", "CH2", "CH3", "CH3"]
+        ] == ["CH30", "CH20", "CH31", "CH32"]
+
+        # the names used by other class stems are skipped (i.e., "C" + "T" == "CT")
+        used_class_names_set = {"CH31", "CT"}
+        next_suffix_number_dict = {"C": 29}
+        assert [
+            _allocate_unique_class_name(
+                class_stem_i, used_class_names_set, next_suffix_number_dict
+            )
+            for class_stem_i in ["CH3", "CH3", "CH3", "C"]
+        ] == ["CH30", "CH32", "CH33", "CU"]
+        assert next_suffix_number_dict == {"C": 31, "CH3": 4}
+
+    def test_register_parameter_entry(self):
+        bond_registry_dict = {}
+        bond_entries_list = [
+            ["CT", "HC", "340.0", "1.09", "ETH_CT", "ETH_HC"],
+            ["HC", "CT", "340.0", "1.09", "ETO_HC", "ETO_CT"],
+            ["CT", "OH", "320.0", "1.41", "ETO_CT", "ETO_OH"],
+        ]
+        new_bond_entries_list = [
+            _register_parameter_entry(
+                bond_registry_dict,
+                tuple(sorted(bond_entry_i[0:2])),
+                bond_entry_i,
+                [2, 3],
+                "bond",
+            )
+            for bond_entry_i in bond_entries_list
+        ]
+
+        # the reverse bond order is a duplicate, so it is not written
+        assert new_bond_entries_list == [True, False, True]
+        assert bond_registry_dict == {
+            ("CT", "HC"): bond_entries_list[0],
+            ("CT", "OH"): bond_entries_list[2],
+        }
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The same atomclass or atomtype in the "
+            r"force field are have different bond values.\n"
+            r"\['HC', 'CT', '340.0', '1.1', 'ETO_HC', 'ETO_CT'\] != "
+            r"\['CT', 'HC', '340.0', '1.09', 'ETH_CT', 'ETH_HC'\] ",
+        ):
+            _register_parameter_entry(
+                bond_registry_dict,
+                ("CT", "HC"),
+                ["HC", "CT", "340.0", "1.1", "ETO_HC", "ETO_CT"],
+                [2, 3],
+                "bond",
+            )
+
+        # the multi-term (dihedral) entries are compared row by row
+        dihedral_registry_dict = {}
+        dihedral_entry_1 = [
+            ["HC", "CT", "CT", "HC", "0.0", "0", "90.0", "a", "b", "c", "d"],
+            ["HC", "CT", "CT", "HC", "0.3", "3", "0.0", "a", "b", "c", "d"],
+        ]
+        dihedral_entry_2 = [
+            ["HC", "CT", "CT", "HC", "0.0", "0", "90.0", "e", "f", "g", "h"],
+            ["HC", "CT", "CT", "HC", "0.3", "3", "0.0", "e", "f", "g", "h"],
+        ]
+        dihedral_entry_3 = [
+            ["HC", "CT", "CT", "HC", "0.0", "0", "90.0", "e", "f", "g", "h"],
+            ["HC", "CT", "CT", "HC", "0.4", "3", "0.0", "e", "f", "g", "h"],
+        ]
+        dihedral_key = ("HC", "CT", "CT", "HC")
+        assert [
+            _register_parameter_entry(
+                dihedral_registry_dict,
+                dihedral_key,
+                dihedral_entry_i,
+                [4, 5, 6],
+                "dihedral",
+                multi_row_entry=True,
+            )
+            for dihedral_entry_i in [dihedral_entry_1, dihedral_entry_2]
+        ] == [True, False]
+        assert dihedral_registry_dict == {dihedral_key: dihedral_entry_1}
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The same atomclass or atomtype in the "
+            r"force field are have different dihedral values.\n"
+            r"\['HC', 'CT', 'CT', 'HC', '0.4', '3', '0.0', 'e', 'f', 'g', 'h'\] != "
+            r"\['HC', 'CT', 'CT', 'HC', '0.3', '3', '0.0', 'a', 'b', 'c', 'd'\]\.",
+        ):
+            _register_parameter_entry(
+                dihedral_registry_dict,
+                dihedral_key,
+                dihedral_entry_3,
+                [4, 5, 6],
+                "dihedral",
+                multi_row_entry=True,
+            )
+
+    def test_write_inp_dihedral_conversion_tolerance(self, ethane_gomc):
+        box_0 = mb.fill_box(
+            compound=[ethane_gomc], n_compounds=[2], box=[4, 4, 4]
+        )
+
+        charmm = Charmm(
+            box_0,
+            "charmm_data",
+            ff_filename="charmm_data",
+            residues=[ethane_gomc.name],
+            forcefield_selection="oplsaa",
+        )
+
+        # the default tolerance keeps the 10^(-10) wording
+        charmm.write_inp()
+        with open("charmm_data.inp", "r") as fp:
+            out_gomc = fp.read()
+        assert (
+            "! The input dihedral to periodic dihedral conversion error is OK "
+            "[error <= 10^(-10)]\n"
+        ) in out_gomc
+
+        # any other tolerance is written as a formatted float
+        charmm.write_inp(dihedral_conversion_tolerance=10 ** (-5))
+        with open("charmm_data.inp", "r") as fp:
+            out_gomc = fp.read()
+        assert (
+            "! The input dihedral to periodic dihedral conversion error is OK "
+            "[error <= 1e-05]\n"
+        ) in out_gomc
+        assert "10^(-10)" not in out_gomc
+
+    def test_dihedral_to_periodic_max_abs_deviation(self):
+        RB_coefficients = [1.5, -0.2, 3.1, -0.9, 0.4, 0.25]
+        OPLS_coefficients = [0.0, 1.3, -0.05, 0.2, 0.1]
+        periodic_K_n_d = [
+            [0, 0, 90],
+            [0.7, 1, 180],
+            [0, 2, 0],
+            [0.3, 3, 0],
+            [0, 4, 0],
+            [0, 5, 0],
+        ]
+        RB_K_n_d_bad = RB_to_periodic(*RB_coefficients)
+        RB_K_n_d_bad[3][0] += 0.01
+
+        max_abs_deviation_array = _dihedral_to_periodic_max_abs_deviation(
+            [
+                "RyckaertBellemansTorsionPotential",
+                "OPLSTorsionPotential",
+                "PeriodicTorsionPotential",
+                "RyckaertBellemansTorsionPotential",
+            ],
+            [RB_coefficients, OPLS_coefficients, None, RB_coefficients],
+            [
+                RB_to_periodic(*RB_coefficients),
+                OPLS_to_periodic(*OPLS_coefficients),
+                periodic_K_n_d,
+                RB_K_n_d_bad,
+            ],
+        )
+
+        assert max_abs_deviation_array.shape == (4,)
+        assert np.all(max_abs_deviation_array[0:3] <= 10 ** (-10))
+        # the K3 * (1 + cos(3 * phi - pi)) max error is 0.02 at phi = pi / 3
+        assert np.isclose(max_abs_deviation_array[3], 0.02, atol=10 ** (-5))
+
+        # a lower resolution samples the max error less accurately
+        assert np.isclose(
+            _dihedral_to_periodic_max_abs_deviation(
+                ["RyckaertBellemansTorsionPotential"],
+                [RB_coefficients],
+                [RB_K_n_d_bad],
+                dihedral_steps=0.1,
+            )[0],
+            0.02,
+            atol=10 ** (-3),
+        )
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The HarmonicTorsionPotential dihedral type can not be "
+            r"compared to the periodic dihedral.",
+        ):
+            _dihedral_to_periodic_max_abs_deviation(
+                ["HarmonicTorsionPotential"], [None], [periodic_K_n_d]
+            )
+
+    def test_RB_and_OPLS_to_periodic_array(self):
+        RB_coefficients_array = np.array(
+            [
+                [1.5, -0.2, 3.1, -0.9, 0.4, 0.25],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                [-2.0, 1.0, 0.5, 4.0, -1.0, 0.0],
+            ]
+        )
+        OPLS_coefficients_array = np.array(
+            [[0.0, 1.3, -0.05, 0.2, 0.1], [2.0, -1.0, 0.0, 0.3, 0.0]]
+        )
+
+        RB_periodic_array = RB_to_periodic_array(RB_coefficients_array)
+        assert RB_periodic_array.shape == (3, 6, 3)
+        for RB_coefficients_i, RB_periodic_i in zip(
+            RB_coefficients_array, RB_periodic_array
+        ):
+            assert np.array_equal(
+                RB_periodic_i, RB_to_periodic(*RB_coefficients_i)
+            )
+
+        OPLS_periodic_array = OPLS_to_periodic_array(OPLS_coefficients_array)
+        assert OPLS_periodic_array.shape == (2, 6, 3)
+        for OPLS_coefficients_i, OPLS_periodic_i in zip(
+            OPLS_coefficients_array, OPLS_periodic_array
+        ):
+            assert np.array_equal(
+                OPLS_periodic_i, OPLS_to_periodic(*OPLS_coefficients_i)
+            )
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The c_array must have the shape \(n_dihedrals, 6\), "
+            r"but it has the shape \(2, 5\).",
+        ):
+            RB_to_periodic_array(OPLS_coefficients_array)
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The f_array must have the shape \(n_dihedrals, 5\), "
+            r"but it has the shape \(6,\).",
+        ):
+            OPLS_to_periodic_array(RB_coefficients_array[0])
+
+    def test_unyt_quantities_to_value(self):
+        energies_list = [
+            u.unyt_quantity(1, "kcal/mol"),
+            u.unyt_quantity(4.184, "kJ/mol"),
+            u.unyt_quantity(2, "kcal/mol"),
+            u.unyt_quantity(503.2195, "K"),
+        ]
+        assert np.allclose(
+            _unyt_quantities_to_value(
+                energies_list, "kcal/mol", equivalence="thermal"
+            ),
+            [1, 1, 2, 1],
+            atol=10 ** (-5),
+        )
+        assert _unyt_quantities_to_value([], "kcal/mol").shape == (0,)
@@ -3,7 +3,10 @@ import pytest
 from gmso.tests.base_test import BaseTest
 from mbuild.utils.io import has_foyer
 
+from mosdef_gomc.utils import gmso_equation_compare
 from mosdef_gomc.utils.gmso_equation_compare import (
+    _numeric_form_ratio,
+    clear_form_classification_cache,
     evaluate_harmonic_angle_format_with_scaler,
     evaluate_harmonic_bond_format_with_scaler,
     evaluate_harmonic_improper_format_with_scaler,
@@ -29,6 +32,23 @@ input_base_exp6_form = (
     "epsilon*alpha/(alpha-6) * (6/alpha*exp(alpha*(1-r/Rmin)) - (Rmin/r)**6)"
 )
 
+# bonded base forms
+input_base_opls_torsion_form = (
+    "1/2 * k0 + "
+    "1/2 * k1 * (1 + cos(phi)) + "
+    "1/2 * k2 * (1 - cos(2*phi)) + "
+    "1/2 * k3 * (1 + cos(3*phi)) + "
+    "1/2 * k4 * (1 - cos(4*phi))"
+)
+input_base_RB_torsion_form = (
+    "c0 * cos(phi)**0 + "
+    "c1 * cos(phi)**1 + "
+    "c2 * cos(phi)**2 + "
+    "c3 * cos(phi)**3 + "
+    "c4 * cos(phi)**4 + "
+    "c5 * cos(phi)**5"
+)
+
 # main_output_types
 lj_output = "LJ"
 mie_output = "Mie"
@@ -480,3 +500,234 @@ class TestEqnCompare(BaseTest):
 
         assert form_output == "PeriodicImproperPotential"
         assert form_scalar == 2
+
+    def test_form_classification_cache(self):
+        clear_form_classification_cache()
+        input_new_lj_form = "8*epsilon * ((sigma/r)**12 - (sigma/r)**6)"
+
+        for i in range(0, 2):
+            [
+                form_output,
+                form_scalar,
+            ] = evaluate_nonbonded_lj_format_with_scaler(
+                input_new_lj_form, input_base_lj_form
+            )
+            assert form_output == lj_output
+            assert form_scalar == 2.0
+
+            [
+                form_output,
+                form_scalar,
+            ] = evaluate_nonbonded_mie_format_with_scaler(
+                input_new_lj_form, input_base_mie_form
+            )
+            assert form_output == None
+            assert form_scalar == None
+
+        assert len(gmso_equation_compare._form_classification_cache) == 2
+
+        # the same form with different spacing uses the same cache entry
+        evaluate_nonbonded_lj_format_with_scaler(
+            "8*epsilon*((sigma/r)**12-(sigma/r)**6)", input_base_lj_form
+        )
+        assert len(gmso_equation_compare._form_classification_cache) == 2
+
+    def test_form_classification_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(
+            gmso_equation_compare, "MAX_FORM_CLASSIFICATION_CACHE_ENTRIES", 2
+        )
+        clear_form_classification_cache()
+        lj_forms_list = [
+            f"{scalar_i}*epsilon * ((sigma/r)**12 - (sigma/r)**6)"
+            for scalar_i in [8, 12, 16]
+        ]
+        for lj_form_i in lj_forms_list[0:2]:
+            evaluate_nonbonded_lj_format_with_scaler(
+                lj_form_i, input_base_lj_form
+            )
+
+        # the first form is used again, so the second form is the LRU entry
+        evaluate_nonbonded_lj_format_with_scaler(
+            lj_forms_list[0], input_base_lj_form
+        )
+        assert evaluate_nonbonded_lj_format_with_scaler(
+            lj_forms_list[2], input_base_lj_form
+        ) == [lj_output, 4.0]
+
+        cached_new_forms_list = [
+            cache_key_i[2]
+            for cache_key_i in gmso_equation_compare._form_classification_cache
+        ]
+        assert len(cached_new_forms_list) == 2
+        assert cached_new_forms_list == [
+            gmso_equation_compare._canonical_form_string(lj_forms_list[0]),
+            gmso_equation_compare._canonical_form_string(lj_forms_list[2]),
+        ]
+
+    def test_numeric_form_ratio(self):
+        assert _numeric_form_ratio(
+            "8*epsilon * ((sigma/r)**12 - (sigma/r)**6)", input_base_lj_form
+        ) == ["constant", 2.0]
+        assert _numeric_form_ratio("x", input_base_lj_form) == [
+            "not_constant",
+            None,
+        ]
+        assert _numeric_form_ratio("epsilon * (", input_base_lj_form) == [
+            "inconclusive",
+            None,
+        ]
+
+    def test_numeric_engine_matches_symbolic_engine(self):
+        # [evaluate function, new form, base form]
+        forms_to_compare_list = [
+            [
+                evaluate_nonbonded_lj_format_with_scaler,
+                "8*epsilon * ((sigma/r)**12 - (sigma/r)**6)",
+                input_base_lj_form,
+            ],
+            [
+                evaluate_nonbonded_lj_format_with_scaler,
+                input_base_mie_form,
+                input_base_lj_form,
+            ],
+            [
+                evaluate_nonbonded_mie_format_with_scaler,
+                "2*(n/(n-m)) * (n/m)**(m/(n-m)) * epsilon * ((sigma/r)**n - (sigma/r)**m)",
+                input_base_mie_form,
+            ],
+            [
+                evaluate_nonbonded_mie_format_with_scaler,
+                input_base_lj_form,
+                input_base_mie_form,
+            ],
+            [
+                evaluate_nonbonded_exp6_format_with_scaler,
+                "2*epsilon*alpha/(alpha-6) * (6/alpha*exp(alpha*(1-r/Rmin)) - (Rmin/r)**6)",
+                input_base_exp6_form,
+            ],
+            [
+                evaluate_nonbonded_exp6_format_with_scaler,
+                "x",
+                input_base_exp6_form,
+            ],
+            [
+                evaluate_harmonic_bond_format_with_scaler,
+                "1/2 * k * (r - r_eq)**2",
+                "k * (r - r_eq)**2",
+            ],
+            [
+                evaluate_harmonic_angle_format_with_scaler,
+                "1/2 * k * (theta - theta_eq)**2",
+                "k * (theta - theta_eq)**2",
+            ],
+            [
+                evaluate_harmonic_torsion_format_with_scaler,
+                "1/2 * k * (phi - phi_eq)**2",
+                "k * (phi - phi_eq)**2",
+            ],
+            [
+                evaluate_OPLS_torsion_format_with_scaler,
+                "2 * k0 + "
+                "2 * k1 * (1 + cos(phi)) + "
+                "2 * k2 * (1 - cos(2*phi)) + "
+                "2 * k3 * (1 + cos(3*phi)) + "
+                "2 * k4 * (1 - cos(4*phi))",
+                input_base_opls_torsion_form,
+            ],
+            [
+                evaluate_OPLS_torsion_format_with_scaler,
+                input_base_RB_torsion_form,
+                input_base_opls_torsion_form,
+            ],
+            [
+                evaluate_periodic_torsion_format_with_scaler,
+                "2 * k * (1 + cos(n * phi - phi_eq))",
+                "k * (1 + cos(n * phi - phi_eq))",
+            ],
+            [
+                evaluate_RB_torsion_format_with_scaler,
+                "2 * c0 * cos(phi)**0 + "
+                "2 * c1 * cos(phi)**1 + "
+                "2 * c2 * cos(phi)**2 + "
+                "2 * c3 * cos(phi)**3 + "
+                "2 * c4 * cos(phi)**4 + "
+                "2 * c5 * cos(phi)**5",
+                input_base_RB_torsion_form,
+            ],
+            [
+                evaluate_RB_torsion_format_with_scaler,
+                "k * (1 + cos(n * phi - phi_eq))",
+                input_base_RB_torsion_form,
+            ],
+            [
+                evaluate_harmonic_improper_format_with_scaler,
+                "1/2 * k * (phi - phi_eq)**2",
+                "k * (phi - phi_eq)**2",
+            ],
+            [
+                evaluate_periodic_improper_format_with_scaler,
+                "2* k * (1 + cos(n * phi - phi_eq))",
+                "k * (1 + cos(n * phi - phi_eq))",
+            ],
+        ]
+
+        clear_form_classification_cache()
+        for evaluate_function, new_form, base_form in forms_to_compare_list:
+            [
+                numeric_form_output,
+                numeric_form_scalar,
+            ] = evaluate_function(new_form, base_form, engine="numeric")
+            [
+                symbolic_form_output,
+                symbolic_form_scalar,
+            ] = evaluate_function(new_form, base_form, engine="symbolic")
+
+            assert numeric_form_output == symbolic_form_output
+            if symbolic_form_scalar is None:
+                assert numeric_form_scalar is None
+            else:
+                assert numeric_form_scalar == pytest.approx(
+                    symbolic_form_scalar, rel=1e-12
+                )
+
+    def test_symbolic_engine_is_default(self, monkeypatch):
+        numeric_form_ratio_calls_list = []
+
+        def numeric_form_ratio_counter(*args, **kwargs):
+            numeric_form_ratio_calls_list.append(args)
+            return _numeric_form_ratio(*args, **kwargs)
+
+        monkeypatch.setattr(
+            gmso_equation_compare,
+            "_numeric_form_ratio",
+            numeric_form_ratio_counter,
+        )
+
+        # the default symbolic engine never uses the numeric classification,
+        # including for the forms which are not a constant multiple
+        clear_form_classification_cache()
+        assert evaluate_nonbonded_lj_format_with_scaler(
+            "8*epsilon * ((sigma/r)**12 - (sigma/r)**6)", input_base_lj_form
+        ) == [lj_output, 2.0]
+        assert evaluate_nonbonded_lj_format_with_scaler(
+            input_base_mie_form, input_base_lj_form
+        ) == [None, None]
+        assert numeric_form_ratio_calls_list == []
+
+        # the numeric engine is only used when selected
+        assert evaluate_nonbonded_lj_format_with_scaler(
+            "8*epsilon * ((sigma/r)**12 - (sigma/r)**6)",
+            input_base_lj_form,
+            engine="numeric",
+        ) == [lj_output, 2.0]
+        assert len(numeric_form_ratio_calls_list) == 1
+
+    def test_bad_engine(self):
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The engine = bad_engine, but it must be "
+            r"'numeric' or 'symbolic'.",
+        ):
+            evaluate_nonbonded_lj_format_with_scaler(
+                input_base_lj_form, input_base_lj_form, engine="bad_engine"
+            )
@@ -0,0 +1,182 @@
+import os
+import pickle
+
+import pytest
+from foyer.forcefields import forcefields
+from mbuild.utils.io import has_foyer
+
+from mosdef_gomc.tests.base_test import BaseTest
+from mosdef_gomc.utils.gmso_forcefield_cache import (
+    _evict_lru_cache_files,
+    clear_forcefield_cache,
+    forcefield_xml_hash,
+    load_cached_forcefield,
+    load_cached_residue_template,
+    residue_template_key,
+)
+
+
+@pytest.mark.skipif(not has_foyer, reason="Foyer package not installed")
+class TestForceFieldCache(BaseTest):
+    @pytest.fixture
+    def trappe_ua_path(self):
+        return forcefields.get_ff_path()[0] + "/xml/trappe-ua.xml"
+
+    def test_forcefield_xml_hash_tracks_file_contents(self, trappe_ua_path):
+        with open(trappe_ua_path) as ff_file:
+            ff_text = ff_file.read()
+        with open("trappe-ua_copy.xml", "w") as ff_file:
+            ff_file.write(ff_text)
+
+        assert forcefield_xml_hash(trappe_ua_path) == forcefield_xml_hash(
+            "trappe-ua_copy.xml"
+        )
+
+        with open("trappe-ua_copy.xml", "a") as ff_file:
+            ff_file.write("\n")
+
+        assert forcefield_xml_hash(trappe_ua_path) != forcefield_xml_hash(
+            "trappe-ua_copy.xml"
+        )
+
+    def test_load_cached_forcefield_memory_and_disk(self, trappe_ua_path):
+        clear_forcefield_cache()
+        ff_1 = load_cached_forcefield(trappe_ua_path, cache_dir="ff_cache")
+        ff_2 = load_cached_forcefield(trappe_ua_path, cache_dir="ff_cache")
+        assert ff_1 is not ff_2
+        assert sorted(ff_2.atom_types.keys()) == sorted(ff_1.atom_types.keys())
+
+        # changing a returned force field does not change the cached copy
+        ff_1.atom_types.clear()
+        ff_4 = load_cached_forcefield(trappe_ua_path, cache_dir="ff_cache")
+        assert sorted(ff_4.atom_types.keys()) == sorted(ff_2.atom_types.keys())
+        assert len(ff_4.atom_types) > 0
+
+        ff_hash = forcefield_xml_hash(trappe_ua_path)
+        assert os.listdir("ff_cache") == [f"{ff_hash}.pkl"]
+
+        # only the memory cache is cleared, so this is loaded from the disk cache
+        clear_forcefield_cache()
+        ff_3 = load_cached_forcefield(trappe_ua_path, cache_dir="ff_cache")
+        assert ff_3 is not ff_2
+        assert sorted(ff_3.atom_types.keys()) == sorted(ff_2.atom_types.keys())
+
+        clear_forcefield_cache(cache_dir="ff_cache")
+        assert os.listdir("ff_cache") == []
+
+    def test_evict_lru_cache_files(self):
+        os.makedirs("ff_cache")
+        for i, file_name_iter in enumerate(["a.pkl", "b.pkl", "c.pkl"]):
+            file_path_iter = os.path.join("ff_cache", file_name_iter)
+            with open(file_path_iter, "wb") as cache_file:
+                cache_file.write(b"0" * 100)
+            os.utime(file_path_iter, (1000 + i, 1000 + i))
+
+        # "a.pkl" was used most recently, so "b.pkl" is the LRU file
+        os.utime(os.path.join("ff_cache", "a.pkl"), (2000, 2000))
+        _evict_lru_cache_files("ff_cache", 200)
+
+        assert sorted(os.listdir("ff_cache")) == ["a.pkl", "c.pkl"]
+
+    def test_residue_template_key(self):
+        template_key = residue_template_key(
+            "ff_hash",
+            "ETO",
+            "molecule",
+            ["C", "C", "O"],
+            ["C", "C", "O"],
+            [[0, 1], [1, 2]],
+        )
+
+        # the bonded site pairs are canonicalized
+        assert template_key == residue_template_key(
+            "ff_hash",
+            "ETO",
+            "molecule",
+            ["C", "C", "O"],
+            ["C", "C", "O"],
+            [[2, 1], [1, 0]],
+        )
+
+        # any change in the force field, residue, or molecule graph is a new key
+        for changed_key_args in [
+            [
+                "new_ff_hash",
+                "ETO",
+                "molecule",
+                ["C", "C", "O"],
+                ["C", "C", "O"],
+                [[0, 1], [1, 2]],
+            ],
+            [
+                "ff_hash",
+                "ETH",
+                "molecule",
+                ["C", "C", "O"],
+                ["C", "C", "O"],
+                [[0, 1], [1, 2]],
+            ],
+            [
+                "ff_hash",
+                "ETO",
+                "group",
+                ["C", "C", "O"],
+                ["C", "C", "O"],
+                [[0, 1], [1, 2]],
+            ],
+            [
+                "ff_hash",
+                "ETO",
+                "molecule",
+                ["C", "O", "C"],
+                ["C", "O", "C"],
+                [[0, 1], [1, 2]],
+            ],
+            [
+                "ff_hash",
+                "ETO",
+                "molecule",
+                ["C", "C", "O"],
+                ["C", "C", "O"],
+                [[0, 1], [0, 2]],
+            ],
+        ]:
+            assert residue_template_key(*changed_key_args) != template_key
+
+    def test_load_cached_residue_template_memory_and_disk(self):
+        clear_forcefield_cache()
+        build_calls_list = []
+
+        def build_template():
+            build_calls_list.append(1)
+            return {"atom_types": ["opls_135", "opls_140"]}
+
+        template_bytes_1 = load_cached_residue_template(
+            "abc", build_template, cache_dir="ff_cache"
+        )
+        template_bytes_2 = load_cached_residue_template(
+            "abc", build_template, cache_dir="ff_cache"
+        )
+        assert template_bytes_1 == template_bytes_2
+        assert pickle.loads(template_bytes_1) == {
+            "atom_types": ["opls_135", "opls_140"]
+        }
+        assert len(build_calls_list) == 1
+        assert os.listdir("ff_cache") == ["template_abc.pkl"]
+
+        # only the memory cache is cleared, so it is loaded from the disk cache
+        clear_forcefield_cache()
+        template_bytes_3 = load_cached_residue_template(
+            "abc", build_template, cache_dir="ff_cache"
+        )
+        assert template_bytes_3 == template_bytes_1
+        assert len(build_calls_list) == 1
+
+        # the template files share the force field cache's LRU eviction
+        clear_forcefield_cache()
+        load_cached_residue_template(
+            "def", build_template, cache_dir="ff_cache", max_cache_size_bytes=1
+        )
+        assert os.listdir("ff_cache") == []
+
+        clear_forcefield_cache(cache_dir="ff_cache")
@@ -331,6 +331,178 @@ class TestGOMCControlFileWriter(BaseTest):
             ].sort()
         )
 
+    def test_control_variable_registry(self):
+        registry = gomc_control._get_control_variable_registry()
+
+        # the registry is only compiled once, and it is read-only
+        assert gomc_control._get_control_variable_registry() is registry
+        with pytest.raises(TypeError):
+            registry["PRNG"] = None
+        with pytest.raises(TypeError):
+            registry["Rcut"]["default"] = 12 * u.angstrom
+
+        # the mutable default values are frozen, including the nested values
+        assert registry["PressureCalc"]["default"] == (True, 10000)
+        with pytest.raises(TypeError):
+            registry["PressureCalc"]["default"][1] = 10
+        with pytest.raises(TypeError):
+            registry["DisFreq"]["default"]["NVT"] = 0.5
+        with pytest.raises(ValueError):
+            registry["Rcut"]["default"][...] = 12
+        assert registry["PressureCalc"]["default"] == (True, 10000)
+        assert registry["Rcut"]["default"] == 10 * u.angstrom
+
+        assert list(registry.keys()) == (
+            gomc_control._get_all_possible_input_variables(description=False)
+        )
+        assert registry["Rcut"]["default"] == 10 * u.angstrom
+        assert registry["Rcut"]["type"] == "int or float (>= 0)"
+        assert (
+            registry["Rcut"]["validator"]
+            == "ck_input_variable_int_or_float_zero_or_greater"
+        )
+        assert registry["Rcut"]["valid_ensembles"] == (
+            "NVT",
+            "NPT",
+            "GEMC_NVT",
+            "GEMC_NPT",
+            "GCMC",
+        )
+        assert registry["ChemPot"]["valid_ensembles"] == ("GCMC",)
+        assert registry["LambdaVDW"]["valid_ensembles"] == ("NVT", "NPT")
+        assert registry["PRNG"]["validator"] is None
+        assert registry["PRNG"]["description"].startswith(
+            "Simulation info (all ensembles)"
+        )
+        for variable_i, entry_i in registry.items():
+            for ensemble_j in entry_i["valid_ensembles"]:
+                assert (
+                    variable_i
+                    in gomc_control._get_possible_ensemble_input_variables(
+                        ensemble_j
+                    )
+                )
+
+        # the default variables are a new modifiable copy for every call
+        default_variables_dict = gomc_control._get_default_variables_dict()
+        default_variables_dict["PressureCalc"][1] = 10
+        assert gomc_control._get_default_variables_dict()["PressureCalc"] == [
+            True,
+            10000,
+        ]
+
+        assert gomc_control.check_valid_ensemble_input_variables(
+            "NVT", ["Rcut", "ChemPot", "XXX"]
+        ) == [False, ["ChemPot", "XXX"]]
+
+    def test_validate_input_variables_dict(self):
+        assert (
+            gomc_control.validate_input_variables_dict(
+                "NVT",
+                {
+                    "rcut": 12 * u.angstrom,
+                    "OutputName": "test_out",
+                    "MoleculeType": ["ETH", 1],
+                    "LambdaVDW": [0.0, 0.5, 1.0],
+                    "LambdaCoulomb": None,
+                    "ConsoleFreq": [True, 100],
+                },
+                residues=["ETH"],
+            )
+            == []
+        )
+
+        # None is only valid for the variables which are not used if they are None
+        assert (
+            gomc_control.validate_input_variables_dict(
+                "GCMC", {"ChemPot": None, "Fugacity": None}
+            )
+            == []
+        )
+        assert gomc_control.validate_input_variables_dict(
+            "NVT", {"LRC": None, "OutputName": None, "CoordinatesFreq": None}
+        ) == [
+            ["LRC", "bad_value", None],
+            ["OutputName", "bad_value", None],
+            ["CoordinatesFreq", "bad_value", None],
+        ]
+
+        # all the errors are collected, instead of raising the first one
+        errors_list = gomc_control.validate_input_variables_dict(
+            "NVT",
+            {
+                "ChemPot": {"ETH": -4000 * u.K},
+                "Rcut": -1 * u.angstrom,
+                "RcutLow": 1,
+                "LRC": 1,
+                "OutputName": "test out",
+                "MoleculeType": ["XXX", 1],
+                "ConsoleFreq": [True, 0],
+                "EqSteps": True,
+            },
+            residues=["ETH"],
+        )
+        assert [error_i[0:2] for error_i in errors_list] == [
+            ["ChemPot", "invalid_variable"],
+            ["Rcut", "bad_value"],
+            ["RcutLow", "type_error"],
+            ["LRC", "bad_value"],
+            ["OutputName", "bad_value"],
+            ["MoleculeType", "bad_value"],
+            ["ConsoleFreq", "bad_value"],
+            ["EqSteps", "bad_value"],
+        ]
+
+        error_messages_list = gomc_control.format_validation_errors(errors_list)
+        assert error_messages_list[0] == (
+            "ERROR: The ChemPot input variable is not a valid variable "
+            "for the NVT ensemble."
+        )
+        assert error_messages_list[1] == (
+            "ERROR: The Rcut input variable has a bad value (-1.0), "
+            "and it needs to be a int or float (>= 0)."
+        )
+        assert error_messages_list[2] == (
+            f"ERROR: The RcutLow input is {type(1)} "
+            f"and needs to be a {u.array.unyt_quantity} in length units."
+        )
+
+        # the residue names are only checked if the residues are provided
+        assert (
+            gomc_control.validate_input_variables_dict(
+                "GCMC", {"Fugacity": {"XXX": 1 * u.bar}}
+            )
+            == []
+        )
+        assert gomc_control.validate_input_variables_dict(
+            "GCMC", {"Fugacity": {"XXX": 1 * u.bar}}, residues=["ETH"]
+        ) == [["Fugacity", "bad_value", {"XXX": 1 * u.bar}]]
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The ensemble_type \(XXX\) is not valid.",
+        ):
+            gomc_control.validate_input_variables_dict("XXX", {})
+
+    def test_validate_input_variables_dicts(self):
+        input_variables_dicts_list = [
+            {"Pressure": pressure_i * u.bar, "RunNumber": 1}
+            for pressure_i in [1, 10, -10, 100]
+        ]
+        input_variables_dicts_list.append({"Fugacity": {"ETH": 1 * u.bar}})
+
+        errors_lists = gomc_control.validate_input_variables_dicts(
+            "NPT", input_variables_dicts_list
+        )
+        assert len(errors_lists) == 5
+        assert errors_lists[0] == errors_lists[1] == errors_lists[3] == []
+        assert [error_i[0:2] for error_i in errors_lists[2]] == [
+            ["Pressure", "bad_value"]
+        ]
+        assert [error_i[0:2] for error_i in errors_lists[4]] == [
+            ["Fugacity", "invalid_variable"]
+        ]
+
     def test_print_ensemble_info(self):
         try:
             gomc_control.print_required_input(description=True)
@@ -1217,6 +1389,468 @@ class TestGOMCControlFileWriter(BaseTest):
             "useConstantArea": True,
         }
 
+    def test_gomc_control_renderer(self, ethane_gomc):
+        test_box_ethane_gomc = mb.fill_box(
+            compound=[ethane_gomc], n_compounds=[1], box=[2, 2, 2]
+        )
+        charmm = Charmm(
+            test_box_ethane_gomc,
+            "ethane",
+            ff_filename="ethane",
+            residues=[ethane_gomc.name],
+            forcefield_selection="oplsaa",
+        )
+
+        def read_conf_lines(conf_filename):
+            # remove the header line with the file name and date
+            with open(conf_filename, "r") as fp:
+                return [
+                    line
+                    for line in fp.readlines()
+                    if "was created by MoSDeF-GOMC" not in line
+                ]
+
+        renderer = gomc_control.GOMCControl(
+            charmm,
+            "NPT",
+            100000,
+            500 * u.K,
+            check_input_files_exist=False,
+            input_variables_dict={"ConsoleFreq": [True, 50]},
+        ).compile_renderer()
+
+        written_conf_filenames_list = renderer.render_many(
+            [
+                {"Temperature": 400 * u.K, "pressure": 10 * u.bar},
+                {"RunSteps": 1000, "OutputName": "short_run"},
+            ],
+            "renderer_out",
+        )
+        assert written_conf_filenames_list == [
+            os.path.join("renderer_out", "in_GOMC_0.conf"),
+            os.path.join("renderer_out", "in_GOMC_1.conf"),
+        ]
+
+        # the rendered files match the fully built GOMCControl files
+        for conf_filename_i, control_kwargs_i in zip(
+            written_conf_filenames_list,
+            [
+                {
+                    "RunSteps": 100000,
+                    "Temperature": 400 * u.K,
+                    "input_variables_dict": {
+                        "ConsoleFreq": [True, 50],
+                        "Pressure": 10 * u.bar,
+                    },
+                },
+                {
+                    "RunSteps": 1000,
+                    "Temperature": 500 * u.K,
+                    "input_variables_dict": {
+                        "ConsoleFreq": [True, 50],
+                        "OutputName": "short_run",
+                    },
+                },
+            ],
+        ):
+            gomc_control.GOMCControl(
+                charmm,
+                "NPT",
+                check_input_files_exist=False,
+                **control_kwargs_i,
+            ).write_conf_file("full_build.conf")
+            assert read_conf_lines(conf_filename_i) == read_conf_lines(
+                "full_build.conf"
+            )
+
+        assert renderer.render_to_file("render_to_file") == (
+            "render_to_file.conf"
+        )
+        assert "Temperature               500.0\n" in renderer.render(
+            "render.conf"
+        )
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The Rcut variable can not be overridden in the "
+            r"control file renderer.",
+        ):
+            renderer.render("render.conf", overrides={"Rcut": 12})
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The ChemPot variable can not be overridden for "
+            r"the NPT ensemble",
+        ):
+            renderer.render(
+                "render.conf", overrides={"ChemPot": {"ETH": -4000 * u.K}}
+            )
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The following input variables have bad values",
+        ):
+            renderer.render_many(
+                [{"OutputName": "good"}, {"OutputName": "bad name"}],
+                "renderer_bad_out",
+            )
+        assert not os.path.isdir("renderer_bad_out")
+
+    def test_gomc_control_renderer_chempot_fugacity_checks(self, ethane_gomc):
+        test_box_ethane_gomc = mb.fill_box(
+            compound=[ethane_gomc], n_compounds=[1], box=[2, 2, 2]
+        )
+        charmm = Charmm(
+            test_box_ethane_gomc,
+            "ethane_box_0",
+            structure_box_1=test_box_ethane_gomc,
+            filename_box_1="ethane_box_1",
+            ff_filename="ethane_FF",
+            residues=[ethane_gomc.name],
+            forcefield_selection="oplsaa",
+        )
+
+        renderer = gomc_control.GOMCControl(
+            charmm,
+            "GCMC",
+            100000,
+            500 * u.K,
+            check_input_files_exist=False,
+            input_variables_dict={
+                "DisFreq": 0.40,
+                "RotFreq": 0.20,
+                "SwapFreq": 0.20,
+                "TargetedSwapFreq": 0.20,
+                "ChemPot": {"ETH": -4000 * u.K},
+                "TargetedSwap_DataInput": {
+                    0: {
+                        "SubVolumeType": "static",
+                        "SubVolumeBox": 0,
+                        "SubVolumeCenter": [1, 1, 1] * u.angstrom,
+                        "SubVolumeDim": [2, 2, 2] * u.angstrom,
+                        "SubVolumeResidueKind": "ALL",
+                        "SubVolumeRigidSwap": True,
+                        "SubVolumePBC": "XYZ",
+                        "SubVolumeChemPot": {"ETH": -3000 * u.K},
+                    },
+                },
+            },
+        ).compile_renderer()
+
+        rendered_text = renderer.render(
+            "render.conf", overrides={"ChemPot": {"ETH": -3500 * u.K}}
+        )
+        assert "ChemPot                   ETH        -3500.0\n" in rendered_text
+
+        # the Fugacity override is checked against the TargetedSwap_DataInput,
+        # which uses the ChemPot, like the GOMCControl object
+        with pytest.raises(
+            ValueError,
+            match=r"Both ChemPot and Fugacity were used in the "
+            r"TargetedSwap_DataInput dictionaries and in the standard GOMC "
+            r"swap inputs.",
+        ):
+            renderer.render(
+                "render.conf", overrides={"Fugacity": {"ETH": 1 * u.bar}}
+            )
+
+    def test_build_sweep_overrides(self):
+        assert gomc_control.build_sweep_overrides(
+            {"Temperature": [300 * u.K, 400 * u.K], "PRNG": [1, 2]}
+        ) == [
+            {"Temperature": 300 * u.K, "PRNG": 1},
+            {"Temperature": 300 * u.K, "PRNG": 2},
+            {"Temperature": 400 * u.K, "PRNG": 1},
+            {"Temperature": 400 * u.K, "PRNG": 2},
+        ]
+        assert gomc_control.build_sweep_overrides(
+            {"InitialState": range(2), "PRNG": [5, 6]}, sweep_type="zip"
+        ) == [{"InitialState": 0, "PRNG": 5}, {"InitialState": 1, "PRNG": 6}]
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: All the sweep variables need to have the same number "
+            r"of values when the sweep_type = 'zip'.",
+        ):
+            gomc_control.build_sweep_overrides(
+                {"InitialState": [0, 1], "PRNG": [5]}, sweep_type="zip"
+            )
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The sweep_type \(bad\) is not 'grid' or 'zip'.",
+        ):
+            gomc_control.build_sweep_overrides({"PRNG": [5]}, sweep_type="bad")
+        with pytest.raises(
+            TypeError,
+            match=r"ERROR: The PRNG sweep values are not a non-empty list, "
+            r"tuple, or range.",
+        ):
+            gomc_control.build_sweep_overrides({"PRNG": 5})
+
+    def test_write_gomc_control_file_sweep(self, ethane_gomc):
+        test_box_ethane_gomc = mb.fill_box(
+            compound=[ethane_gomc], n_compounds=[1], box=[2, 2, 2]
+        )
+        charmm = Charmm(
+            test_box_ethane_gomc,
+            "ethane",
+            ff_filename="ethane",
+            residues=[ethane_gomc.name],
+            forcefield_selection="oplsaa",
+        )
+
+        def read_conf_lines(conf_filename):
+            # remove the header line with the file name and date
+            with open(conf_filename, "r") as fp:
+                return [
+                    line
+                    for line in fp.readlines()
+                    if "was created by MoSDeF-GOMC" not in line
+                ]
+
+        sweep_variables_dict = {
+            "Temperature": [300 * u.K, 400 * u.K],
+            "Pressure": [1 * u.bar, 10 * u.bar],
+            "PRNG": [12, "RANDOM"],
+        }
+        serial_conf_filenames_list = gomc_control.write_gomc_control_file_sweep(
+            charmm,
+            "NPT",
+            1000,
+            500 * u.K,
+            sweep_variables_dict,
+            "sweep_serial",
+            check_input_files_exist=False,
+        )
+        parallel_conf_filenames_list = (
+            gomc_control.write_gomc_control_file_sweep(
+                charmm,
+                "NPT",
+                1000,
+                500 * u.K,
+                sweep_variables_dict,
+                "sweep_parallel",
+                n_processes=2,
+                check_input_files_exist=False,
+            )
+        )
+        assert len(serial_conf_filenames_list) == 8
+        for serial_conf_filename_i, parallel_conf_filename_i in zip(
+            serial_conf_filenames_list, parallel_conf_filenames_list
+        ):
+            assert read_conf_lines(serial_conf_filename_i) == read_conf_lines(
+                parallel_conf_filename_i
+            )
+
+        last_conf_lines = read_conf_lines(serial_conf_filenames_list[-1])
+        assert "Temperature               400.0\n" in last_conf_lines
+        assert "Pressure                  10.0\n" in last_conf_lines
+        assert "PRNG                      RANDOM\n" in last_conf_lines
+        first_conf_lines = read_conf_lines(serial_conf_filenames_list[0])
+        assert "PRNG \t\t INTSEED \n" in first_conf_lines
+        assert "Random_Seed               12\n" in first_conf_lines
+
+        # each state point has its own OutputName, so the runs do not
+        # overwrite each other's output files
+        for state_point_i, serial_conf_filename_i in enumerate(
+            serial_conf_filenames_list
+        ):
+            assert "OutputName                Output_data_{}\n".format(
+                state_point_i
+            ) in read_conf_lines(serial_conf_filename_i)
+
+        # the swept OutputName is not changed
+        output_name_conf_filenames_list = (
+            gomc_control.write_gomc_control_file_sweep(
+                charmm,
+                "NPT",
+                1000,
+                500 * u.K,
+                {"outputname": ["run_a", "run_b"]},
+                "sweep_output_names",
+                check_input_files_exist=False,
+            )
+        )
+        for output_name_i, output_name_conf_filename_i in zip(
+            ["run_a", "run_b"], output_name_conf_filenames_list
+        ):
+            assert "OutputName                {}\n".format(
+                output_name_i
+            ) in read_conf_lines(output_name_conf_filename_i)
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The OutputName is the same for more than one "
+            r"control file",
+        ):
+            gomc_control.write_gomc_control_file_sweep(
+                charmm,
+                "NPT",
+                1000,
+                500 * u.K,
+                {"PRNG": [1, 2]},
+                "sweep_same_output_names",
+                unique_output_names=False,
+                check_input_files_exist=False,
+            )
+        assert not os.path.isdir("sweep_same_output_names")
+
+        # the free energy windows only differ by the InitialState
+        free_energy_input_variables_dict = {
+            "FreeEnergyCalc": [True, 50],
+            "MoleculeType": ["ETH", 1],
+            "InitialState": 0,
+            "LambdaVDW": [0.0, 0.5, 1.0],
+            "LambdaCoulomb": [0.0, 0.5, 1.0],
+            "RcutLow": 0 * u.angstrom,
+        }
+        window_conf_filenames_list = gomc_control.write_gomc_control_file_sweep(
+            charmm,
+            "NVT",
+            1000,
+            500 * u.K,
+            {"InitialState": range(3)},
+            "sweep_windows",
+            conf_filenames_list=["window_0", "window_1", "window_2"],
+            check_input_files_exist=False,
+            input_variables_dict=free_energy_input_variables_dict,
+        )
+        assert window_conf_filenames_list == [
+            os.path.join("sweep_windows", "window_0.conf"),
+            os.path.join("sweep_windows", "window_1.conf"),
+            os.path.join("sweep_windows", "window_2.conf"),
+        ]
+        for window_i, window_conf_filename_i in enumerate(
+            window_conf_filenames_list
+        ):
+            assert "InitialState              {}\n".format(
+                window_i
+            ) in read_conf_lines(window_conf_filename_i)
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The InitialState integer is greater than the "
+            r"LambdaVDW and LambdaCoulomb list length.",
+        ):
+            gomc_control.write_gomc_control_file_sweep(
+                charmm,
+                "NVT",
+                1000,
+                500 * u.K,
+                {"InitialState": [2, 3]},
+                "sweep_bad_windows",
+                check_input_files_exist=False,
+                input_variables_dict=free_energy_input_variables_dict,
+            )
+        assert not os.path.isdir("sweep_bad_windows")
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The n_processes variable \(0\) is not None or "
+            r"an integer >= 1.",
+        ):
+            gomc_control.write_gomc_control_file_sweep(
+                charmm,
+                "NPT",
+                1000,
+                500 * u.K,
+                sweep_variables_dict,
+                "sweep_bad_processes",
+                n_processes=0,
+                check_input_files_exist=False,
+            )
+
+    def test_write_free_energy_windows(self, ethane_gomc):
+        test_box_ethane_gomc = mb.fill_box(
+            compound=[ethane_gomc], n_compounds=[1], box=[2, 2, 2]
+        )
+        charmm = Charmm(
+            test_box_ethane_gomc,
+            "ethane_FE",
+            ff_filename="ethane_FE",
+            residues=[ethane_gomc.name],
+            forcefield_selection="oplsaa",
+        )
+        charmm.write_inp()
+        charmm.write_psf()
+        charmm.write_pdb()
+
+        control = gomc_control.GOMCControl(
+            charmm,
+            "NVT",
+            1000,
+            500 * u.K,
+            input_variables_dict={
+                "FreeEnergyCalc": [True, 50],
+                "MoleculeType": ["ETH", 1],
+                "InitialState": 0,
+                "LambdaVDW": [0.0, 0.25, 0.5, 1.0],
+                "LambdaCoulomb": [0.0, 0.0, 0.5, 1.0],
+                "RcutLow": 0 * u.angstrom,
+            },
+        )
+
+        window_conf_filenames_list = control.write_free_energy_windows(
+            "fe_windows"
+        )
+        assert window_conf_filenames_list == [
+            os.path.join("fe_windows", f"in_GOMC_FE_window_{window_i}.conf")
+            for window_i in range(4)
+        ]
+        for window_i, window_conf_filename_i in enumerate(
+            window_conf_filenames_list
+        ):
+            with open(window_conf_filename_i, "r") as fp:
+                conf_lines = fp.readlines()
+            assert (
+                "InitialState              {}\n".format(window_i) in conf_lines
+            )
+            assert "Parameters                ethane_FE.inp\n" in conf_lines
+            # the windows in the same directory have different OutputNames,
+            # so their GOMC output files are not overwritten
+            assert (
+                "OutputName                Output_data_window_{}\n".format(
+                    window_i
+                )
+                in conf_lines
+            )
+
+        # the GOMCControl object is not changed by the window writer
+        assert control.InitialState == 0
+        assert control.OutputName == "Output_data"
+
+        window_conf_filenames_list = control.write_free_energy_windows(
+            "fe_window_dirs", conf_filename="in_FE", window_dirs=True
+        )
+        assert window_conf_filenames_list == [
+            os.path.join("fe_window_dirs", f"window_{window_i}", "in_FE.conf")
+            for window_i in range(4)
+        ]
+        for window_i, window_conf_filename_i in enumerate(
+            window_conf_filenames_list
+        ):
+            window_dir_i = os.path.dirname(window_conf_filename_i)
+            for input_file_i in [
+                "ethane_FE.inp",
+                "ethane_FE.psf",
+                "ethane_FE.pdb",
+            ]:
+                assert os.path.isfile(os.path.join(window_dir_i, input_file_i))
+            with open(window_conf_filename_i, "r") as fp:
+                conf_lines = fp.readlines()
+            assert (
+                "InitialState              {}\n".format(window_i) in conf_lines
+            )
+            assert "Coordinates 0             ethane_FE.pdb\n" in conf_lines
+
+        control_no_free_energy = gomc_control.GOMCControl(
+            charmm, "NVT", 1000, 500 * u.K
+        )
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: The free energy windows can only be written when "
+            r"the free energy calculations are used",
+        ):
+            control_no_free_energy.write_free_energy_windows("fe_bad_windows")
+
     def test_save_basic_GCMC(self, ethane_gomc):
         test_box_ethane_gomc = mb.fill_box(
             compound=[ethane_gomc], n_compounds=[1], box=[2, 2, 2]
@@ -1,3 +1,5 @@
+import os
+
 import mbuild as mb
 import pytest
 from foyer.forcefields import forcefields
@@ -6,7 +8,12 @@ from mbuild import Box, Compound
 from mbuild.utils.io import has_foyer
 
 from mosdef_gomc.tests.base_test import BaseTest
-from mosdef_gomc.utils.gmso_specific_ff_to_residue import specific_ff_to_residue
+from mosdef_gomc.utils import gmso_specific_ff_to_residue
+from mosdef_gomc.utils.gmso_forcefield_cache import clear_forcefield_cache
+from mosdef_gomc.utils.gmso_specific_ff_to_residue import (
+    _get_molecule_ids,
+    specific_ff_to_residue,
+)
 from mosdef_gomc.utils.io import get_mosdef_gomc_fn
 
 
@@ -612,3 +619,324 @@ class TestSpecificFFToResidue(BaseTest):
             len(list(test_atom_types_dict["MET"]["atom_types"].yield_view()))
             == 1
         )
+
+    def test_get_molecule_ids_bond_order_independent(self):
+        # molecule 0 = sites 0, 3, 5; molecule 1 = site 1; molecule 2 = sites 2, 4
+        bonded_atom_pairs = [(5, 3), (4, 2), (0, 5)]
+        molecule_ids = _get_molecule_ids(7, bonded_atom_pairs)
+
+        assert list(molecule_ids) == [0, 1, 2, 0, 2, 0, 3]
+
+    def test_get_molecule_ids_no_bonds_or_sites(self):
+        assert list(_get_molecule_ids(3, [])) == [0, 1, 2]
+        assert list(_get_molecule_ids(0, [])) == []
+
+    def test_specific_ff_residue_numbers_ethane_ethanol(
+        self, ethane_gomc, ethanol_gomc
+    ):
+        test_box = mb.fill_box(
+            compound=[ethane_gomc, ethanol_gomc],
+            n_compounds=[2, 3],
+            box=[4, 4, 4],
+        )
+
+        test_topology = specific_ff_to_residue(
+            test_box,
+            forcefield_selection={
+                ethane_gomc.name: "oplsaa",
+                ethanol_gomc.name: "oplsaa",
+            },
+            residues=[ethane_gomc.name, ethanol_gomc.name],
+            boxes_for_simulation=1,
+        )[0]
+
+        residue_numbers = [
+            site.__dict__["residue_number_"] for site in test_topology.sites
+        ]
+        residue_names = [
+            site.__dict__["residue_name_"] for site in test_topology.sites
+        ]
+        # ethane has 8 atoms and ethanol has 9 atoms
+        assert residue_numbers == (
+            [1] * 8 + [2] * 8 + [3] * 9 + [4] * 9 + [5] * 9
+        )
+        assert residue_names == ["ETH"] * 16 + ["ETO"] * 27
+
+    def test_specific_ff_template_typing_copies_match(
+        self, ethane_gomc, ethanol_gomc
+    ):
+        test_box = mb.fill_box(
+            compound=[ethane_gomc, ethanol_gomc],
+            n_compounds=[3, 4],
+            box=[4, 4, 4],
+        )
+
+        test_topology = specific_ff_to_residue(
+            test_box,
+            forcefield_selection={
+                ethane_gomc.name: "oplsaa",
+                ethanol_gomc.name: "oplsaa",
+            },
+            residues=[ethane_gomc.name, ethanol_gomc.name],
+            boxes_for_simulation=1,
+        )[0]
+
+        # every copy of a residue must have the same atom types, in the same
+        # atom order, as the first (template) molecule of that residue
+        atom_types_per_molecule = {}
+        for site in test_topology.sites:
+            atom_types_per_molecule.setdefault(
+                (
+                    site.__dict__["residue_name_"],
+                    site.__dict__["residue_number_"],
+                ),
+                [],
+            ).append(site.atom_type.name)
+
+        template_atom_types = {}
+        for (res_name, res_no), atom_types in atom_types_per_molecule.items():
+            template_atom_types.setdefault(res_name, atom_types)
+            assert atom_types == template_atom_types[res_name]
+
+        assert len(atom_types_per_molecule) == 7
+        assert template_atom_types["ETH"] == ["opls_135"] * 2 + ["opls_140"] * 6
+
+    def test_specific_ff_parallel_residue_typing_matches_serial(
+        self, ethane_gomc, ethanol_gomc
+    ):
+        test_box = mb.fill_box(
+            compound=[ethane_gomc, ethanol_gomc],
+            n_compounds=[3, 4],
+            box=[4, 4, 4],
+        )
+
+        serial_output = specific_ff_to_residue(
+            test_box,
+            forcefield_selection={
+                ethane_gomc.name: "oplsaa",
+                ethanol_gomc.name: "oplsaa",
+            },
+            residues=[ethane_gomc.name, ethanol_gomc.name],
+            boxes_for_simulation=1,
+        )
+        parallel_output = specific_ff_to_residue(
+            test_box,
+            forcefield_selection={
+                ethane_gomc.name: "oplsaa",
+                ethanol_gomc.name: "oplsaa",
+            },
+            residues=[ethane_gomc.name, ethanol_gomc.name],
+            boxes_for_simulation=1,
+            parallel_residue_typing=True,
+            max_workers=2,
+        )
+        serial_topology = serial_output[0]
+        parallel_topology = parallel_output[0]
+
+        assert parallel_topology.n_sites == serial_topology.n_sites
+        for serial_site, parallel_site in zip(
+            serial_topology.sites, parallel_topology.sites
+        ):
+            assert parallel_site.name == serial_site.name
+            assert parallel_site.atom_type.name == serial_site.atom_type.name
+            assert (
+                parallel_site.__dict__["residue_name_"]
+                == serial_site.__dict__["residue_name_"]
+            )
+            assert (
+                parallel_site.__dict__["residue_number_"]
+                == serial_site.__dict__["residue_number_"]
+            )
+
+        assert parallel_topology.n_bonds == serial_topology.n_bonds
+        assert parallel_topology.n_angles == serial_topology.n_angles
+        assert parallel_topology.n_dihedrals == serial_topology.n_dihedrals
+        assert sorted(
+            (
+                parallel_topology.get_index(bond.connection_members[0]),
+                parallel_topology.get_index(bond.connection_members[1]),
+            )
+            for bond in parallel_topology.bonds
+        ) == sorted(
+            (
+                serial_topology.get_index(bond.connection_members[0]),
+                serial_topology.get_index(bond.connection_members[1]),
+            )
+            for bond in serial_topology.bonds
+        )
+
+        # the residues, 1-4 scaling factors, and combining rule are the same
+        assert parallel_output[1:4] == serial_output[1:4]
+        assert parallel_output[-1] == serial_output[-1]
+
+    def test_specific_ff_parallel_residue_typing_bad_inputs(self, ethane_gomc):
+        with pytest.raises(
+            TypeError,
+            match=r"ERROR: Please enter the parallel_residue_typing as a bool.",
+        ):
+            specific_ff_to_residue(
+                ethane_gomc,
+                forcefield_selection={ethane_gomc.name: "oplsaa"},
+                residues=[ethane_gomc.name],
+                boxes_for_simulation=1,
+                parallel_residue_typing="True",
+            )
+
+        with pytest.raises(
+            ValueError,
+            match=r"ERROR: Please enter the max_workers as None or "
+            r"an integer greater than or equal to 1.",
+        ):
+            specific_ff_to_residue(
+                ethane_gomc,
+                forcefield_selection={ethane_gomc.name: "oplsaa"},
+                residues=[ethane_gomc.name],
+                boxes_for_simulation=1,
+                max_workers=0,
+            )
+
+    def test_specific_ff_residue_template_cache(
+        self, ethane_gomc, ethanol_gomc, monkeypatch
+    ):
+        specific_ff_to_residue_kwargs = {
+            "forcefield_selection": {
+                ethane_gomc.name: "oplsaa",
+                ethanol_gomc.name: "oplsaa",
+            },
+            "residues": [ethane_gomc.name, ethanol_gomc.name],
+            "boxes_for_simulation": 1,
+        }
+        test_box = mb.fill_box(
+            compound=[ethane_gomc, ethanol_gomc],
+            n_compounds=[3, 4],
+            box=[4, 4, 4],
+        )
+        serial_output = specific_ff_to_residue(
+            test_box, **specific_ff_to_residue_kwargs
+        )
+
+        gmso_apply_calls_list = []
+        load_forcefield_calls_list = []
+        gmso_apply = gmso_specific_ff_to_residue.gmso_apply
+        load_cached_forcefield = (
+            gmso_specific_ff_to_residue.load_cached_forcefield
+        )
+
+        def counting_gmso_apply(*args, **kwargs):
+            gmso_apply_calls_list.append(args)
+            return gmso_apply(*args, **kwargs)
+
+        def counting_load_cached_forcefield(*args, **kwargs):
+            load_forcefield_calls_list.append(args)
+            return load_cached_forcefield(*args, **kwargs)
+
+        monkeypatch.setattr(
+            gmso_specific_ff_to_residue, "gmso_apply", counting_gmso_apply
+        )
+        monkeypatch.setattr(
+            gmso_specific_ff_to_residue,
+            "load_cached_forcefield",
+            counting_load_cached_forcefield,
+        )
+
+        # the first build types one ethane and one ethanol molecule
+        clear_forcefield_cache()
+        template_output = specific_ff_to_residue(
+            test_box,
+            forcefield_cache_dir="ff_cache",
+            residue_template_cache=True,
+            **specific_ff_to_residue_kwargs,
+        )
+        assert len(gmso_apply_calls_list) == 2
+        assert len(load_forcefield_calls_list) == 2
+        assert (
+            len(
+                [
+                    file_name_i
+                    for file_name_i in os.listdir("ff_cache")
+                    if file_name_i.startswith("template_")
+                ]
+            )
+            == 2
+        )
+
+        serial_topology = serial_output[0]
+        template_topology = template_output[0]
+        assert template_topology.n_sites == serial_topology.n_sites
+        for serial_site, template_site in zip(
+            serial_topology.sites, template_topology.sites
+        ):
+            assert template_site.name == serial_site.name
+            assert template_site.atom_type.name == serial_site.atom_type.name
+            assert (
+                template_site.__dict__["residue_name_"]
+                == serial_site.__dict__["residue_name_"]
+            )
+            assert (
+                template_site.__dict__["residue_number_"]
+                == serial_site.__dict__["residue_number_"]
+            )
+            assert (template_site.position == serial_site.position).all()
+
+        assert template_topology.n_bonds == serial_topology.n_bonds
+        assert template_topology.n_angles == serial_topology.n_angles
+        assert template_topology.n_dihedrals == serial_topology.n_dihedrals
+        assert template_topology.n_impropers == serial_topology.n_impropers
+        assert sorted(
+            (
+                template_topology.get_index(bond.connection_members[0]),
+                template_topology.get_index(bond.connection_members[1]),
+            )
+            for bond in template_topology.bonds
+        ) == sorted(
+            (
+                serial_topology.get_index(bond.connection_members[0]),
+                serial_topology.get_index(bond.connection_members[1]),
+            )
+            for bond in serial_topology.bonds
+        )
+
+        # the residues, 1-4 scaling factors, and combining rule are the same
+        assert template_output[1:4] == serial_output[1:4]
+        assert template_output[-1] == serial_output[-1]
+
+        # a repeat build, with different numbers of the same molecules,
+        # does not parse the force fields or run the GMSO typing
+        repeat_box = mb.fill_box(
+            compound=[ethane_gomc, ethanol_gomc],
+            n_compounds=[5, 2],
+            box=[4, 4, 4],
+        )
+        repeat_output = specific_ff_to_residue(
+            repeat_box,
+            forcefield_cache_dir="ff_cache",
+            residue_template_cache=True,
+            **specific_ff_to_residue_kwargs,
+        )
+        assert len(gmso_apply_calls_list) == 2
+        assert len(load_forcefield_calls_list) == 2
+        assert repeat_output[0].n_sites == 5 * 8 + 2 * 9
+        assert repeat_output[1:4] == serial_output[1:4]
+
+        # the templates are also loaded from the on-disk cache
+        clear_forcefield_cache()
+        specific_ff_to_residue(
+            test_box,
+            forcefield_cache_dir="ff_cache",
+            residue_template_cache=True,
+            **specific_ff_to_residue_kwargs,
+        )
+        assert len(gmso_apply_calls_list) == 2
+        assert len(load_forcefield_calls_list) == 2
+
+        with pytest.raises(
+            TypeError,
+            match=r"ERROR: Please enter the residue_template_cache as a bool.",
+        ):
+            specific_ff_to_residue(
+                test_box,
+                residue_template_cache="True",
+                **specific_ff_to_residue_kwargs,
+            )
+
+        clear_forcefield_cache(cache_dir="ff_cache")
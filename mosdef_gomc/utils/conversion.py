@@ -1,9 +1,24 @@
 """MoSDeF-GOMC conversion utilities."""
 
+import string
 from warnings import warn
 
 import numpy as np
 
+# The base-n alphabets (digit values 0 to n-1), which are the same digits as
+# the _digit_to_alpha_num function.
+_BASE_N_ALPHABETS = {
+    16: string.digits + "abcdef",
+    22: string.ascii_uppercase[:22],
+    26: string.ascii_uppercase,
+    44: string.ascii_uppercase[:22] + string.ascii_lowercase[:22],
+    52: string.ascii_uppercase + string.ascii_lowercase,
+    54: string.digits
+    + string.ascii_uppercase[:22]
+    + string.ascii_lowercase[:22],
+    62: string.digits + string.ascii_uppercase + string.ascii_lowercase,
+}
+
 
 def base10_to_base62_alph_num(base10_no):
     """Convert base-10 integer to base-62 alphanumeric system.
@@ -23,9 +38,9 @@ def base10_to_base62_alph_num(base10_no):
 
     See Also
     --------
-    mbuild.conversion._to_base: Helper function to perform a base-n conversion
+    base10_to_base_n: Function to perform a base-n conversion
     """
-    return _to_base(base10_no, base=62)
+    return base10_to_base_n(base10_no, base=62)
 
 
 def base10_to_base54_alph_num(base10_no):
@@ -47,9 +62,9 @@ def base10_to_base54_alph_num(base10_no):
 
     See Also
     --------
-    mbuild.conversion._to_base: Helper function to perform a base-n conversion
+    base10_to_base_n: Function to perform a base-n conversion
     """
-    return _to_base(base10_no, base=54)
+    return base10_to_base_n(base10_no, base=54)
 
 
 def base10_to_base44_alph(base10_no):
@@ -71,9 +86,9 @@ def base10_to_base44_alph(base10_no):
 
     See Also
     --------
-    mbuild.conversion._to_base: Helper function to perform a base-n conversion
+    base10_to_base_n: Function to perform a base-n conversion
     """
-    return _to_base(base10_no, base=44)
+    return base10_to_base_n(base10_no, base=44)
 
 
 def base10_to_base22_alph(base10_no):
@@ -95,9 +110,9 @@ def base10_to_base22_alph(base10_no):
 
     See Also
     --------
-    mbuild.conversion._to_base: Helper function to perform a base-n conversion
+    base10_to_base_n: Function to perform a base-n conversion
     """
-    return _to_base(base10_no, base=22)
+    return base10_to_base_n(base10_no, base=22)
 
 
 def base10_to_base52_alph(base10_no):
@@ -118,9 +133,9 @@ def base10_to_base52_alph(base10_no):
 
     See Also
     --------
-    mbuild.conversion._to_base: Helper function to perform a base-n conversion
+    base10_to_base_n: Function to perform a base-n conversion
     """
-    return _to_base(number=base10_no, base=52)
+    return base10_to_base_n(base10_no, base=52)
 
 
 def base10_to_base26_alph(base10_no):
@@ -141,9 +156,9 @@ def base10_to_base26_alph(base10_no):
 
     See Also
     --------
-    mbuild.conversion._to_base: Helper function to perform a base-n conversion
+    base10_to_base_n: Function to perform a base-n conversion
     """
-    return _to_base(base10_no, base=26)
+    return base10_to_base_n(base10_no, base=26)
 
 
 def base10_to_base16_alph_num(base10_no):
@@ -164,11 +179,112 @@ def base10_to_base16_alph_num(base10_no):
 
     See Also
     --------
-    mbuild.conversion._to_base: Helper function to perform a base-n conversion
+    base10_to_base_n: Function to perform a base-n conversion
     """
     return hex(int(base10_no))[2:]
 
 
+def base10_to_base_n(base10_no, base=62):
+    """Convert a base-10 integer to a base-n alphanumeric system string.
+
+    The digits are looked up in the precomputed base-n alphabets, and the
+    strings are the same as the original _to_base conversion.
+
+    Parameters
+    ----------
+    base10_no: int
+        The integer to convert to the base-n system.
+    base: int, default=62
+        The base-n system, which is 16, 22, 26, 44, 52, 54, or 62.
+
+    Returns
+    -------
+    str
+        The converted base-n system string
+
+    See Also
+    --------
+    base10_to_base_n_array: Function to convert an array of integers in one call
+    """
+    if base not in _BASE_N_ALPHABETS:
+        raise ValueError(
+            f"Base-{base} system is not supported. Supported bases are: "
+            f"{list(_BASE_N_ALPHABETS.keys())}"
+        )
+
+    number = int(base10_no)
+    if number < 0:
+        # negative numbers are not used in the files, but keep their original output
+        return hex(number)[2:] if base == 16 else _to_base(number, base=base)
+
+    alphabet = _BASE_N_ALPHABETS[base]
+    if number < base:
+        return alphabet[number]
+
+    base_n_digits = []
+    while number != 0:
+        number, digit = divmod(number, base)
+        base_n_digits.append(alphabet[digit])
+
+    return "".join(reversed(base_n_digits))
+
+
+def base10_to_base_n_array(base10_array, base=62):
+    """Convert an array of base-10 integers to base-n alphanumeric system strings.
+
+    This is the array version of base10_to_base_n, which converts all the atom or
+    residue numbers in one call. The same digit (power) of all the numbers is
+    converted at once, so the loop is only over the number of digits.
+
+    Parameters
+    ----------
+    base10_array: array-like of int
+        The non-negative integers to convert to the base-n system.
+    base: int, default=62
+        The base-n system, which is 16, 22, 26, 44, 52, 54, or 62.
+
+    Returns
+    -------
+    base_n_array: numpy.ndarray of str
+        The converted base-n system strings, with the same shape as base10_array.
+
+    See Also
+    --------
+    base10_to_base_n: Function to convert a single integer
+    """
+    if base not in _BASE_N_ALPHABETS:
+        raise ValueError(
+            f"Base-{base} system is not supported. Supported bases are: "
+            f"{list(_BASE_N_ALPHABETS.keys())}"
+        )
+
+    base10_array = np.asarray(base10_array).astype(np.int64)
+    if base10_array.size > 0 and base10_array.min() < 0:
+        raise ValueError(
+            f"ERROR: The base10_array values must be non-negative integers, "
+            f"but the minimum value is {base10_array.min()}."
+        )
+
+    alphabet_array = np.array(list(_BASE_N_ALPHABETS[base]))
+    remaining_numbers = base10_array.ravel()
+
+    # the lowest digit is always written, and the higher digits only if non-zero
+    base_n_array = alphabet_array[remaining_numbers % base]
+    remaining_numbers = remaining_numbers // base
+    while np.any(remaining_numbers != 0):
+        base_n_array = np.char.add(
+            np.where(
+                remaining_numbers != 0,
+                alphabet_array[remaining_numbers % base],
+                "",
+            ),
+            base_n_array,
+        )
+        remaining_numbers = remaining_numbers // base
+
+    return base_n_array.reshape(base10_array.shape)
+
+
 # Helpers to convert base
 def _to_base(number, base=62):
     """Convert a base-10 number into base-n alpha-num."""
@@ -398,3 +514,109 @@ def OPLS_to_periodic(f0, f1, f2, f3, f4):
             [K5, n5, d5],
         ]
     )
+
+
+def RB_to_periodic_array(c_array):
+    r"""Convert an array of Ryckaert-Bellemans (RB) type dihedrals to periodic type.
+
+    This is the array version of RB_to_periodic, which converts all the
+    dihedral types in one call.
+
+    Parameters
+    ----------
+    c_array : array-like, shape=(n_dihedrals, 6)
+        The Ryckaert-Belleman coefficients (in kcal/mol) for each dihedral,
+        [[c0, c1, c2, c3, c4, c5], ...]
+
+    Returns
+    -------
+    periodic_dihedral_coeffs : np.ndarray, shape=(n_dihedrals, 6, 3)
+        Array containing the periodic dihedral coeffs (in kcal/mol) for each
+        dihedral, which are the same as the RB_to_periodic output:
+
+        [[[K0, n0, d0],
+          [K1, n1, d1],
+          [K2, n2, d2],
+          [K3, n3, d3],
+          [K4, n4, d4],
+          [K5, n5, d5]], ...]
+    """
+    c_array = np.asarray(c_array, dtype=float)
+    if c_array.ndim != 2 or c_array.shape[1] != 6:
+        raise ValueError(
+            f"ERROR: The c_array must have the shape (n_dihedrals, 6), "
+            f"but it has the shape {c_array.shape}."
+        )
+
+    c0, c1, c2, c3, c4, c5 = c_array.T
+    K_array = np.stack(
+        [
+            c0 - c1 - c3 - (c4 / 4) - c5,
+            c1 + (3 / 4) * c3 + (5 / 8) * c5,
+            (1 / 2) * c2 + (1 / 2) * c4,
+            (1 / 4) * c3 + (5 / 16) * c5,
+            (1 / 8) * c4,
+            (1 / 16) * c5,
+        ],
+        axis=1,
+    )
+
+    return _periodic_K_to_K_n_d_array(K_array)
+
+
+def OPLS_to_periodic_array(f_array):
+    r"""Convert an array of OPLS type dihedrals to periodic type.
+
+    This is the array version of OPLS_to_periodic, which converts all the
+    dihedral types in one call.
+
+    Parameters
+    ----------
+    f_array : array-like, shape=(n_dihedrals, 5)
+        The OPLS dihedrals coeffs (in kcal/mol) for each dihedral,
+        [[f0, f1, f2, f3, f4], ...]
+
+    Returns
+    -------
+    periodic_dihedral_coeffs : np.ndarray, shape=(n_dihedrals, 6, 3)
+        Array containing the periodic dihedral coeffs (in kcal/mol) for each
+        dihedral, which are the same as the OPLS_to_periodic output:
+
+        [[[K0, n0, d0],
+          [K1, n1, d1],
+          [K2, n2, d2],
+          [K3, n3, d3],
+          [K4, n4, d4],
+          [K5, n5, d5]], ...]
+    """
+    f_array = np.asarray(f_array, dtype=float)
+    if f_array.ndim != 2 or f_array.shape[1] != 5:
+        raise ValueError(
+            f"ERROR: The f_array must have the shape (n_dihedrals, 5), "
+            f"but it has the shape {f_array.shape}."
+        )
+
+    f0, f1, f2, f3, f4 = f_array.T
+    K_array = np.stack(
+        [
+            f0 / 2 + (f1 + f2 + f3 + f4),
+            -f1 / 2,
+            -f2 / 2,
+            -f3 / 2,
+            -f4 / 2,
+            np.zeros_like(f0),
+        ],
+        axis=1,
+    )
+
+    return _periodic_K_to_K_n_d_array(K_array)
+
+
+def _periodic_K_to_K_n_d_array(K_array):
+    """Add the n (0 to 5) and d values of the RB and OPLS to periodic conversions to the K values."""
+    K_n_d_array = np.empty((len(K_array), 6, 3))
+    K_n_d_array[:, :, 0] = K_array
+    K_n_d_array[:, :, 1] = [0, 1, 2, 3, 4, 5]
+    K_n_d_array[:, :, 2] = [90, 180, 0, 180, 0, 180]
+
+    return K_n_d_array
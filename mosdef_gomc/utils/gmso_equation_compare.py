@@ -1,9 +1,13 @@
 # GMSO equation or expression comparisons
+import fractions
+import functools
 import os
 
 # import signac
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 
+import numpy as np
 import symengine
 import sympy
 import unyt as u
@@ -12,8 +16,237 @@ import unyt as u
 # less simple equations with the 0.5 decimals in it (example OPLS dihedral).  This was the only was to improve
 # or actually solve for the scalers in the equations when using non-integers in the forms like the OPLS dihedral.
 
+# the maximum number of form classifications held in memory for this process
+MAX_FORM_CLASSIFICATION_CACHE_ENTRIES = 1024
+
+# The process-wide form classification cache (LRU), which stores the [form_output, form_scalar]
+# results of the evaluate_*_format_with_scaler functions.
+# {(function_name, engine, canonical_new_form, canonical_base_form): [form_output, form_scalar]}
+_form_classification_cache = OrderedDict()
+
+
+def _canonical_form_string(form):
+    """Get the canonical string of an expression, which is used as the cache key.
+
+    Parameters
+    ----------
+    form : str or sympy/symengine expression
+        The expression.
+
+    Returns
+    ----------
+    canonical_form : str
+        The symengine string of the expression, or the plain string if it can not be parsed.
+    """
+    try:
+        return str(symengine.sympify(str(form)))
+    except:
+        return str(form)
+
+
+def _numeric_form_ratio(
+    new_form,
+    base_form,
+    substitutions=None,
+    no_samples=16,
+    relative_tolerance=1e-9,
+):
+    """Numerically classify the ratio of two expressions (new form / base form).
+
+    Both expressions are lambdified with symengine, and their ratio is evaluated on a
+    batch of random values for all its variables in a single NumPy call.  If all the
+    finite ratio values are the same, within the relative tolerance, the ratio is a
+    constant and it is the form's scalar.
+
+    Parameters
+    ----------
+    new_form : str or sympy/symengine expression
+        The new form that will be divided by the base form.
+    base_form : str or sympy/symengine expression
+        The base form, which is the standard form.
+    substitutions : dict or None, default=None
+        The variables substituted into the ratio before it is evaluated.
+        Example for LJ: {"Rmin": "sigma*2**(1/6)"}
+    no_samples : int, default=16
+        The number of random samples.
+    relative_tolerance : float, default=1e-9
+        The relative tolerance for the ratio values to be considered the same.
+
+    Returns
+    ----------
+    list, [ratio_status, form_scalar]
+        ratio_status : str
+            'constant', if the ratio is a constant.
+            'not_constant', if the ratio is definitely not a constant.
+            'inconclusive', if the expressions can not be parsed, or evaluated to
+            at least 2 real finite values.
+        form_scalar : float or None
+            The constant ratio, if the ratio_status is 'constant', otherwise None.
+    """
+    try:
+        form_ratio = symengine.sympify(str(new_form)) / symengine.sympify(
+            str(base_form)
+        )
+        if substitutions is not None:
+            form_ratio = form_ratio.subs(
+                {
+                    symengine.Symbol(variable_i): symengine.sympify(value_i)
+                    for variable_i, value_i in substitutions.items()
+                }
+            )
+        ratio_variables = sorted(form_ratio.free_symbols, key=str)
+
+        if len(ratio_variables) == 0:
+            ratio_values = np.array([float(form_ratio)])
+        else:
+            # a fixed seed, so the results are reproducible
+            random_values = np.random.default_rng(12345).uniform(
+                0.6, 1.9, size=(no_samples, len(ratio_variables))
+            )
+            ratio_values = np.asarray(
+                symengine.Lambdify(ratio_variables, form_ratio)(random_values),
+                dtype=float,
+            ).reshape(-1)
+
+    except:
+        return ["inconclusive", None]
+
+    ratio_values = ratio_values[np.isfinite(ratio_values)]
+    if len(ratio_variables) != 0 and len(ratio_values) < 2:
+        return ["inconclusive", None]
+    elif len(ratio_values) == 0:
+        return ["inconclusive", None]
+
+    if not np.allclose(
+        ratio_values, ratio_values[0], rtol=relative_tolerance, atol=0
+    ):
+        return ["not_constant", None]
+
+    return ["constant", _snap_form_scalar(float(np.mean(ratio_values)))]
+
+
+def _snap_form_scalar(
+    form_scalar, max_denominator=1000, relative_tolerance=1e-9
+):
+    """Snap a numerically calculated scalar to a nearby simple fraction (e.g., 2.0000000001 --> 2.0).
+
+    Parameters
+    ----------
+    form_scalar : float
+        The numerically calculated scalar.
+    max_denominator : int, default=1000
+        The largest denominator of the simple fraction.
+    relative_tolerance : float, default=1e-9
+        The maximum relative difference between the scalar and the simple fraction.
+
+    Returns
+    ----------
+    snapped_form_scalar : float
+        The simple fraction as a float, if it is within the relative tolerance,
+        otherwise the unchanged scalar.
+    """
+    simple_fraction = float(
+        fractions.Fraction(form_scalar).limit_denominator(max_denominator)
+    )
+    if abs(simple_fraction - form_scalar) <= relative_tolerance * abs(
+        form_scalar
+    ):
+        return simple_fraction
+
+    return form_scalar
+
+
+def _cache_form_classification(form_output, substitutions=None):
+    """Memoize an evaluate_*_format_with_scaler function, and add the numeric engine to it.
+
+    The results are stored in the process-wide _form_classification_cache, keyed by
+    the function name, engine, and the canonical new and base form strings, so each unique
+    form is only classified once.  The cache holds the most recently used
+    MAX_FORM_CLASSIFICATION_CACHE_ENTRIES classifications.
+
+    The wrapped function has an added 'engine' keyword argument.
+
+    * 'symbolic' (default) always uses the symbolic solver (the wrapped function,
+    sympy.nonlinsolve), which gives the exact scalars.
+
+    * 'numeric' classifies the form with _numeric_form_ratio, which evaluates the
+    ratio at seeded random points, and snaps the constant ratio to a simple fraction
+    (see _snap_form_scalar).  The symbolic solver is only used when the numeric
+    result is inconclusive.  This is faster, but the scalars are numerical estimates.
+
+    Parameters
+    ----------
+    form_output : str
+        The form name that the wrapped function returns for a matching form (e.g., 'LJ').
+    substitutions : dict or None, default=None
+        The variables substituted into the ratio for the numeric classification.
+
+    Returns
+    ----------
+    decorator : function
+        The decorator for the evaluate_*_format_with_scaler function.
+    """
+
+    def decorator(evaluate_form_function):
+        @functools.wraps(evaluate_form_function)
+        def cached_evaluate_form_function(
+            new_form, base_form, engine="symbolic"
+        ):
+            if engine not in ["numeric", "symbolic"]:
+                print_error_message = (
+                    f"ERROR: The engine = {engine}, but it must be "
+                    f"'numeric' or 'symbolic'."
+                )
+                raise ValueError(print_error_message)
+
+            cache_key = (
+                evaluate_form_function.__name__,
+                engine,
+                _canonical_form_string(new_form),
+                _canonical_form_string(base_form),
+            )
+            if cache_key in _form_classification_cache:
+                _form_classification_cache.move_to_end(cache_key)
+            else:
+                if engine == "numeric":
+                    [ratio_status, form_scalar] = _numeric_form_ratio(
+                        new_form, base_form, substitutions=substitutions
+                    )
+                else:
+                    ratio_status = "inconclusive"
+
+                if ratio_status == "not_constant":
+                    form_output_and_scalar = [None, None]
+                elif ratio_status == "constant":
+                    form_output_and_scalar = [form_output, form_scalar]
+                else:
+                    form_output_and_scalar = evaluate_form_function(
+                        new_form, base_form
+                    )
+
+                _form_classification_cache[cache_key] = form_output_and_scalar
+                while (
+                    len(_form_classification_cache)
+                    > MAX_FORM_CLASSIFICATION_CACHE_ENTRIES
+                ):
+                    _form_classification_cache.popitem(last=False)
+
+            return list(_form_classification_cache[cache_key])
+
+        return cached_evaluate_form_function
+
+    return decorator
+
+
+def clear_form_classification_cache():
+    """Clear the process-wide form classification cache."""
+    _form_classification_cache.clear()
+
 
 # compare Lennard-Jones (LJ) non-bonded equations
+@_cache_form_classification(
+    "LJ", substitutions={"Rmin": "sigma*2**(1/6)", "two": "2"}
+)
 def evaluate_nonbonded_lj_format_with_scaler(new_lj_form, base_lj_form):
     """Compare a new Lennard-Jones (LJ) form to a base LJ form (new LJ form / base LJ form).
     If the new form is the same as the base form, other than a scaling factor,
@@ -67,6 +300,7 @@ def evaluate_nonbonded_lj_format_with_scaler(new_lj_form, base_lj_form):
 
 
 # compare Mie non-bonded equations
+@_cache_form_classification("Mie")
 def evaluate_nonbonded_mie_format_with_scaler(new_mie_form, base_mie_form):
     """Compare a new Mie form to a base Mie form (new Mie form / base Mie form).
     If the new form is the same as the base form, other than a scaling factor,
@@ -117,6 +351,7 @@ def evaluate_nonbonded_mie_format_with_scaler(new_mie_form, base_mie_form):
 
 
 # compare Exp6 non-bonded equations
+@_cache_form_classification("Exp6")
 def evaluate_nonbonded_exp6_format_with_scaler(new_exp6_form, base_exp6_form):
     """Compare a new Exp6 form to a base Exp6 form (new Mie form / base Mie form).
     If the new form is the same as the base form, other than a scaling factor,
@@ -342,6 +577,7 @@ def get_atom_type_expressions_and_scalars(atom_types_dict):
 
 
 # compare harmonic bond equations or expressions
+@_cache_form_classification("HarmonicBondPotential")
 def evaluate_harmonic_bond_format_with_scaler(new_bond_form, base_bond_form):
     """Compare a new harmonic bond form to a base harmonic bond form
     (new bond form / base bond form).
@@ -387,6 +623,7 @@ def evaluate_harmonic_bond_format_with_scaler(new_bond_form, base_bond_form):
 
 
 # compare harmonic angle equations or expressions
+@_cache_form_classification("HarmonicAnglePotential")
 def evaluate_harmonic_angle_format_with_scaler(new_angle_form, base_angle_form):
     """Compare a new harmonic angle form to a base harmonic angle form
     (new angle form / base angle form).
@@ -434,6 +671,7 @@ def evaluate_harmonic_angle_format_with_scaler(new_angle_form, base_angle_form):
 
 
 # check for the harmonic torsion potential equations or expressions
+@_cache_form_classification("HarmonicTorsionPotential")
 def evaluate_harmonic_torsion_format_with_scaler(
     new_torsion_form, base_torsion_form
 ):
@@ -481,6 +719,7 @@ def evaluate_harmonic_torsion_format_with_scaler(
 
 
 # check for the OPLS torsion potential equations or expressions
+@_cache_form_classification("OPLSTorsionPotential")
 def evaluate_OPLS_torsion_format_with_scaler(
     new_torsion_form, base_torsion_form
 ):
@@ -530,6 +769,7 @@ def evaluate_OPLS_torsion_format_with_scaler(
 
 
 # check for the periodic torsion potential equations or expressions
+@_cache_form_classification("PeriodicTorsionPotential")
 def evaluate_periodic_torsion_format_with_scaler(
     new_torsion_form, base_torsion_form
 ):
@@ -577,6 +817,7 @@ def evaluate_periodic_torsion_format_with_scaler(
 
 
 # check for the RyckaertBellemans (RB) torsion potential equations or expressions
+@_cache_form_classification("RyckaertBellemansTorsionPotential")
 def evaluate_RB_torsion_format_with_scaler(new_torsion_form, base_torsion_form):
     """Compare a new Ryckaert-Bellemans (RB) torsion form to a base torsion form
     (new torsion form / base torsion form).
@@ -624,6 +865,7 @@ def evaluate_RB_torsion_format_with_scaler(new_torsion_form, base_torsion_form):
 
 
 # check for the harmonic improper potential equations or expressions
+@_cache_form_classification("HarmonicImproperPotential")
 def evaluate_harmonic_improper_format_with_scaler(
     new_improper_form, base_improper_form
 ):
@@ -671,6 +913,7 @@ def evaluate_harmonic_improper_format_with_scaler(
 
 
 # check for the periodic improper potential equations or expressions
+@_cache_form_classification("PeriodicImproperPotential")
 def evaluate_periodic_improper_format_with_scaler(
     new_improper_form, base_improper_form
 ):
@@ -0,0 +1,375 @@
+"""Content-addressed caches of the GMSO force fields and typed residue templates."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from warnings import warn
+
+import gmso
+from gmso import ForceField
+
+# the environment variable that sets the on-disk cache directory, if not given
+FORCEFIELD_CACHE_DIR_ENV = "MOSDEF_GOMC_FF_CACHE_DIR"
+
+# the default maximum on-disk cache size (bytes), before the LRU files are removed
+DEFAULT_MAX_CACHE_SIZE_BYTES = 512 * 1024**2
+
+# the maximum number of force fields held in memory for this process
+MAX_MEMORY_CACHE_ENTRIES = 32
+
+# the maximum number of typed residue templates held in memory for this process
+MAX_TEMPLATE_MEMORY_CACHE_ENTRIES = 256
+
+# the pickled force fields, so every caller gets its own ForceField copy
+_forcefield_memory_cache = OrderedDict()
+
+# the pickled typed residue templates, so every caller gets its own copy
+_residue_template_memory_cache = OrderedDict()
+
+
+def forcefield_xml_hash(ff_path):
+    """Get the content hash of a force field xml file.
+
+    The GMSO version is included in the hash, so a GMSO upgrade does not load
+    force fields which were pickled with an older GMSO version.
+
+    Parameters
+    ----------
+    ff_path: str
+        The force field xml file path.
+
+    Returns
+    -------
+    ff_hash: str
+        The sha256 hex digest of the xml file contents and the GMSO version.
+    """
+    ff_hasher = hashlib.sha256()
+    ff_hasher.update(f"gmso-{gmso.__version__}".encode())
+    with open(ff_path, "rb") as ff_file:
+        for file_chunk in iter(lambda: ff_file.read(1024**2), b""):
+            ff_hasher.update(file_chunk)
+
+    return ff_hasher.hexdigest()
+
+
+def _evict_lru_cache_files(cache_dir, max_cache_size_bytes):
+    """Remove the least recently used cache files until they fit in the size limit."""
+    cache_files_list = []
+    for file_name_iter in os.listdir(cache_dir):
+        if file_name_iter.endswith(".pkl"):
+            file_path_iter = os.path.join(cache_dir, file_name_iter)
+            try:
+                file_stat_iter = os.stat(file_path_iter)
+            except FileNotFoundError:
+                continue
+            cache_files_list.append(
+                [
+                    file_stat_iter.st_mtime,
+                    file_stat_iter.st_size,
+                    file_path_iter,
+                ]
+            )
+
+    total_cache_size = sum(file_iter[1] for file_iter in cache_files_list)
+    for mtime_iter, size_iter, file_path_iter in sorted(cache_files_list):
+        if total_cache_size <= max_cache_size_bytes:
+            break
+        try:
+            os.remove(file_path_iter)
+        except FileNotFoundError:
+            pass
+        total_cache_size -= size_iter
+
+
+def _read_cache_file(cache_file_path):
+    """Read and unpickle a cache file, updating its modification time.
+
+    The modification times are used for the LRU eviction.
+
+    Parameters
+    ----------
+    cache_file_path: str
+        The cache file path.
+
+    Returns
+    -------
+    cache_bytes, cached_object: bytes or None, object or None
+        The pickled bytes and the unpickled object, which are both None if
+        the cache file does not exist, or it is corrupt or incompatible.
+    """
+    if not os.path.isfile(cache_file_path):
+        return None, None
+
+    try:
+        with open(cache_file_path, "rb") as cache_file:
+            cache_bytes = cache_file.read()
+        cached_object = pickle.loads(cache_bytes)
+        os.utime(cache_file_path)
+    except Exception:
+        return None, None
+
+    return cache_bytes, cached_object
+
+
+def _write_cache_file(
+    cache_dir,
+    cache_file_path,
+    cache_bytes,
+    max_cache_size_bytes,
+    cache_description,
+):
+    """Write a cache file, and then remove the LRU files over the size limit.
+
+    Parameters
+    ----------
+    cache_dir: str
+        The on-disk cache directory.
+    cache_file_path: str
+        The cache file path, in the cache_dir.
+    cache_bytes: bytes
+        The pickled object.
+    max_cache_size_bytes: int
+        The maximum total size of the on-disk cache files.
+    cache_description: str
+        The cached object's description, which is used in the warning if the
+        cache file can not be written (i.e., 'The trappe-ua.xml force field').
+    """
+    temp_file_path = None
+    try:
+        # write to a temporary file first, so other processes never
+        # read a partially written cache file
+        cache_file_descriptor, temp_file_path = tempfile.mkstemp(
+            dir=cache_dir, suffix=".tmp"
+        )
+        with os.fdopen(cache_file_descriptor, "wb") as cache_file:
+            cache_file.write(cache_bytes)
+        os.replace(temp_file_path, cache_file_path)
+    except Exception as cache_error:
+        warn(
+            f"WARNING: {cache_description} could not be written "
+            f"to the force field cache, {cache_dir}. {cache_error}"
+        )
+        if temp_file_path is not None and os.path.isfile(temp_file_path):
+            os.remove(temp_file_path)
+
+    _evict_lru_cache_files(cache_dir, max_cache_size_bytes)
+
+
+def load_cached_forcefield(
+    ff_path,
+    cache_dir=None,
+    max_cache_size_bytes=DEFAULT_MAX_CACHE_SIZE_BYTES,
+):
+    """Load a GMSO ForceField, using the memory and on-disk caches when possible.
+
+    The force fields are keyed by the content hash of the xml file (see
+    forcefield_xml_hash), so an edited xml file is always parsed again.
+    The ForceField is first looked up in this process's memory cache, then in the
+    on-disk cache directory, and if it is not found it is parsed and added to both.
+    The memory cache holds the pickled force fields, so every call returns a new
+    ForceField, which the caller can modify without changing the cached copy.
+    The on-disk cache uses size-based LRU eviction, using the file modification
+    times, which are updated on every cache hit.
+
+    Parameters
+    ----------
+    ff_path: str
+        The foyer or GMSO force field xml file path.
+    cache_dir: str or None, default=None
+        The on-disk cache directory. If None, the MOSDEF_GOMC_FF_CACHE_DIR
+        environment variable is used, and if it is not set, only the memory
+        cache is used.
+    max_cache_size_bytes: int, default=DEFAULT_MAX_CACHE_SIZE_BYTES (512 MiB)
+        The maximum total size of the on-disk cache files.
+
+    Returns
+    -------
+    forcefield: gmso.ForceField
+        The parsed force field, which is not shared with any other caller.
+    """
+    ff_hash = forcefield_xml_hash(ff_path)
+    if ff_hash in _forcefield_memory_cache:
+        _forcefield_memory_cache.move_to_end(ff_hash)
+        return pickle.loads(_forcefield_memory_cache[ff_hash])
+
+    if cache_dir is None:
+        cache_dir = os.environ.get(FORCEFIELD_CACHE_DIR_ENV)
+
+    forcefield = None
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_file_path = os.path.join(cache_dir, f"{ff_hash}.pkl")
+        # a corrupt or incompatible cache file is parsed again below
+        forcefield_bytes, forcefield = _read_cache_file(cache_file_path)
+
+    if forcefield is None:
+        forcefield = ForceField(ff_path)
+        forcefield_bytes = pickle.dumps(
+            forcefield, protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        if cache_dir is not None:
+            _write_cache_file(
+                cache_dir,
+                cache_file_path,
+                forcefield_bytes,
+                max_cache_size_bytes,
+                f"The {ff_path} force field",
+            )
+
+    _forcefield_memory_cache[ff_hash] = forcefield_bytes
+    while len(_forcefield_memory_cache) > MAX_MEMORY_CACHE_ENTRIES:
+        _forcefield_memory_cache.popitem(last=False)
+
+    return forcefield
+
+
+def residue_template_key(
+    ff_hash,
+    residue_name,
+    gmso_match_ff_by,
+    site_names_list,
+    site_elements_list,
+    bonded_site_pairs,
+):
+    """Get the content key of a typed residue template.
+
+    The key is the hash of the residue's force field xml (see
+    forcefield_xml_hash), the residue name, how the force field is applied,
+    and the canonical molecule graph.  The molecule graph is canonicalized as
+    the site (name, element) pairs in the molecule's site order and the sorted
+    bonded site index pairs, so every copy of a molecule built from the same
+    mbuild.Compound has the same key, and the template's atom types can be
+    mapped onto the copies by site index.
+
+    Parameters
+    ----------
+    ff_hash: str
+        The content hash of the residue's force field xml file.
+    residue_name: str
+        The residue name, which the force field is applied by.
+    gmso_match_ff_by: str ("group" or "molecule")
+        How the GMSO force field is applied (see specific_ff_to_residue).
+    site_names_list: list of str
+        The site names, in the molecule's site order.
+    site_elements_list: list of str or None
+        The site element symbols, in the molecule's site order.
+    bonded_site_pairs: list of [int, int]
+        The bonded site index pairs, using the site indices in the molecule.
+
+    Returns
+    -------
+    template_key: str
+        The sha256 hex digest of the template's content.
+    """
+    molecule_graph = (
+        tuple(zip(site_names_list, site_elements_list)),
+        tuple(
+            sorted(
+                (min(site_i, site_j), max(site_i, site_j))
+                for site_i, site_j in bonded_site_pairs
+            )
+        ),
+    )
+    template_hasher = hashlib.sha256()
+    template_hasher.update(
+        repr((ff_hash, residue_name, gmso_match_ff_by, molecule_graph)).encode()
+    )
+
+    return template_hasher.hexdigest()
+
+
+def load_cached_residue_template(
+    template_key,
+    build_template,
+    cache_dir=None,
+    max_cache_size_bytes=DEFAULT_MAX_CACHE_SIZE_BYTES,
+):
+    """Load a pickled typed residue template, using the memory and on-disk caches.
+
+    The typed residue templates are keyed by their content (see
+    residue_template_key), and are first looked up in this process's memory
+    cache, then in the on-disk cache directory, and if they are not found they
+    are built (typed) and added to both.  The template files share the force
+    field cache directory and its size-based LRU eviction (see
+    load_cached_forcefield).
+
+    Parameters
+    ----------
+    template_key: str
+        The template's content key (see residue_template_key).
+    build_template: function
+        The function, without any arguments, which builds the template
+        if it is not cached.
+    cache_dir: str or None, default=None
+        The on-disk cache directory. If None, the MOSDEF_GOMC_FF_CACHE_DIR
+        environment variable is used, and if it is not set, only the memory
+        cache is used.
+    max_cache_size_bytes: int, default=DEFAULT_MAX_CACHE_SIZE_BYTES (512 MiB)
+        The maximum total size of the on-disk cache files.
+
+    Returns
+    -------
+    template_bytes: bytes
+        The pickled template, which is unpickled for every copy of the residue,
+        so the copies do not share any objects.
+    """
+    if template_key in _residue_template_memory_cache:
+        _residue_template_memory_cache.move_to_end(template_key)
+        return _residue_template_memory_cache[template_key]
+
+    if cache_dir is None:
+        cache_dir = os.environ.get(FORCEFIELD_CACHE_DIR_ENV)
+
+    template_bytes = None
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_file_path = os.path.join(
+            cache_dir, f"template_{template_key}.pkl"
+        )
+        # a corrupt or incompatible cache file is built again below
+        template_bytes = _read_cache_file(cache_file_path)[0]
+
+    if template_bytes is None:
+        template_bytes = pickle.dumps(
+            build_template(), protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        if cache_dir is not None:
+            _write_cache_file(
+                cache_dir,
+                cache_file_path,
+                template_bytes,
+                max_cache_size_bytes,
+                f"The {template_key} residue template",
+            )
+
+    _residue_template_memory_cache[template_key] = template_bytes
+    while (
+        len(_residue_template_memory_cache) > MAX_TEMPLATE_MEMORY_CACHE_ENTRIES
+    ):
+        _residue_template_memory_cache.popitem(last=False)
+
+    return template_bytes
+
+
+def clear_forcefield_cache(cache_dir=None):
+    """Clear the memory caches, and the on-disk cache files if cache_dir is given.
+
+    Both the force field and the typed residue template caches are cleared.
+
+    Parameters
+    ----------
+    cache_dir: str or None, default=None
+        The on-disk cache directory to empty. If None, only the memory caches
+        are cleared.
+    """
+    _forcefield_memory_cache.clear()
+    _residue_template_memory_cache.clear()
+
+    if cache_dir is not None and os.path.isdir(cache_dir):
+        for file_name_iter in os.listdir(cache_dir):
+            if file_name_iter.endswith(".pkl"):
+                os.remove(os.path.join(cache_dir, file_name_iter))
@@ -1,16 +1,597 @@
 # GMSO and foyer use specific residues to apply force fields and mapping molecule number to atom numbers
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from warnings import warn
 from xml.dom import minidom
 
 import gmso
 import mbuild as mb
-from gmso import ForceField
+import numpy as np
 from gmso.core.views import PotentialFilters
 from gmso.external.convert_mbuild import from_mbuild as mb_convert
 from gmso.parameterization import apply as gmso_apply
 from mbuild.compound import Compound
 from mbuild.utils.io import has_foyer
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from mosdef_gomc.utils.gmso_forcefield_cache import (
+    forcefield_xml_hash,
+    load_cached_forcefield,
+    load_cached_residue_template,
+    residue_template_key,
+)
+
+
+def _get_molecule_ids(n_sites, bonded_atom_pairs):
+    """Label every site with its molecule number using the bonded atom pairs.
+
+    The molecules are the connected components of the bond graph, which are found
+    in O(N + B) time (N = number of sites, B = number of bonds).  The molecule
+    numbers are ordered by the lowest site index in each molecule, so the first site
+    is always in molecule 0, and any non-bonded site is its own molecule.
+
+    Parameters
+    ----------
+    n_sites: int
+        The number of sites (atoms or beads) in the topology.
+    bonded_atom_pairs: list, tuple, or numpy.ndarray of shape (n_bonds, 2)
+        The zero-based site indices of the two atoms in each bond.
+
+    Returns
+    -------
+    molecule_ids: numpy.ndarray of int, shape (n_sites,)
+        The zero-based molecule number for each site.
+    """
+    if n_sites == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    bonded_atom_pairs = np.asarray(bonded_atom_pairs, dtype=np.int64).reshape(
+        -1, 2
+    )
+    bond_graph = coo_matrix(
+        (
+            np.ones(len(bonded_atom_pairs), dtype=np.int8),
+            (bonded_atom_pairs[:, 0], bonded_atom_pairs[:, 1]),
+        ),
+        shape=(n_sites, n_sites),
+    )
+    no_components, component_labels = connected_components(
+        bond_graph, directed=False
+    )
+
+    # renumber the components in order of their first (lowest index) site
+    first_site_in_component = np.full(no_components, n_sites, dtype=np.int64)
+    np.minimum.at(first_site_in_component, component_labels, np.arange(n_sites))
+    sorted_components = np.argsort(first_site_in_component)
+    component_order = np.empty(no_components, dtype=np.int64)
+    component_order[sorted_components] = np.arange(no_components)
+
+    return component_order[component_labels]
+
+
+def _get_forcefield_selection_with_paths(forcefield_selection, residues):
+    """
+    Checks the force field selection and gets the force field xml file path for each residue.
+
+    Parameters
+    ----------
+    forcefield_selection: dict
+        The force field xml file with its path or the standard foyer force field name
+        for each residue (see specific_ff_to_residue).
+    residues: list
+        The residue names.
+
+    Returns
+    -------
+    forcefield_selection_with_paths: dict
+        The force field xml file path for each residue, {'residue_name': 'ff_path'}.
+    """
+    from foyer.forcefields import forcefields
+
+    forcefield_keys_list = []
+    if forcefield_selection is not None:
+        for res in forcefield_selection.keys():
+            forcefield_keys_list.append(res)
+        ff_data = forcefield_selection
+
+    if forcefield_keys_list == [] and len(residues) != 0:
+        print_error_message = "The forcefield_selection variable are not provided, but there are residues provided."
+        raise ValueError(print_error_message)
+
+    elif forcefield_keys_list != [] and len(residues) == 0:
+        print_error_message = (
+            "The residues variable is an empty list but there are "
+            "forcefield_selection variables provided."
+        )
+        raise ValueError(print_error_message)
+
+    user_entered_ff_with_path_dict = (
+        {}
+    )  # True means user entered the path, False is a standard foyer FF with no path
+    for z in range(0, len(forcefield_keys_list)):
+        for res_i in range(0, len(residues)):
+            if residues[res_i] == forcefield_keys_list[z]:
+                if (
+                    os.path.splitext(ff_data[forcefield_keys_list[z]])[1]
+                    == ".xml"
+                    and len(residues) != 0
+                ):
+                    user_entered_ff_with_path_dict.update(
+                        {residues[res_i]: True}
+                    )
+                elif (
+                    os.path.splitext(ff_data[forcefield_keys_list[z]])[1] == ""
+                    and len(residues) != 0
+                ):
+                    user_entered_ff_with_path_dict.update(
+                        {residues[res_i]: False}
+                    )
+                else:
+                    print_error_message = (
+                        r"Please make sure you are entering the correct "
+                        "foyer FF name and not a path to a FF file. "
+                        "If you are entering a path to a FF file, "
+                        "please use the forcefield_files variable with the "
+                        "proper XML extension (.xml)."
+                    )
+                    raise ValueError(print_error_message)
+
+    forcefield_selection_with_paths = {}
+    for j in range(0, len(forcefield_keys_list)):
+        residue_iteration = forcefield_keys_list[j]
+        ff_for_residue_iteration = ff_data[residue_iteration]
+        if user_entered_ff_with_path_dict[residue_iteration]:
+            ff_names_path_iteration = ff_data[residue_iteration]
+
+            try:
+                read_xlm_iteration = minidom.parse(ff_names_path_iteration)
+                forcefield_selection_with_paths.update(
+                    {residue_iteration: ff_names_path_iteration}
+                )
+
+            except:
+                print_error_message = (
+                    "Please make sure you are entering the correct foyer FF path, "
+                    "including the FF file name.xml. "
+                    "If you are using the pre-build FF files in foyer, "
+                    "only use the string name without any extension. "
+                    "The selected FF file could also could not formated properly, or "
+                    "there may be errors in the FF file itself."
+                )
+                raise ValueError(print_error_message)
+        elif not user_entered_ff_with_path_dict[residue_iteration]:
+            ff_for_residue_iteration = ff_data[residue_iteration]
+            ff_names_path_iteration = (
+                forcefields.get_ff_path()[0]
+                + "/xml/"
+                + ff_for_residue_iteration
+                + ".xml"
+            )
+            try:
+                read_xlm_iteration = minidom.parse(ff_names_path_iteration)
+                forcefield_selection_with_paths.update(
+                    {residue_iteration: ff_names_path_iteration}
+                )
+            except:
+                print_error_message = (
+                    "Please make sure you are entering the correct foyer FF name, or the "
+                    "correct file extension (i.e., .xml, if required)."
+                )
+                raise ValueError(print_error_message)
+
+    return forcefield_selection_with_paths
+
+
+def _load_forcefield_selection(
+    forcefield_selection_with_paths, forcefield_cache_dir=None
+):
+    """
+    Loads the GMSO force field for each residue, using the force field cache.
+
+    Parameters
+    ----------
+    forcefield_selection_with_paths: dict
+        The force field xml file path for each residue, {'residue_name': 'ff_path'}
+        (see _get_forcefield_selection_with_paths).
+    forcefield_cache_dir: str or None, default=None
+        The on-disk cache directory for the parsed force fields (see load_cached_forcefield).
+
+    Returns
+    -------
+    gmso_compatable_forcefield_selection: dict
+        The GMSO force field for each residue, {'residue_name': gmso.ForceField}.
+    """
+    gmso_compatable_forcefield_selection = {}
+    for ff_key_iter, ff_value_iter in forcefield_selection_with_paths.items():
+        # try to load the Foyer and GMSO FFs, if Foyer convert to GMSO; otherwise, it is an error.
+        try:
+            ff_new_gmso_value_iter = load_cached_forcefield(
+                ff_value_iter, cache_dir=forcefield_cache_dir
+            )
+
+        except:
+            print_error = (
+                f"ERROR: The supplied force field xml for the "
+                f"{ff_key_iter} residue is not a foyer or gmso xml, "
+                f"or the xml has errors and it not able to load properly."
+            )
+            raise TypeError(print_error)
+
+        gmso_compatable_forcefield_selection.update(
+            {ff_key_iter: ff_new_gmso_value_iter}
+        )
+
+    return gmso_compatable_forcefield_selection
+
+
+def _apply_forcefields(topology, forcefields, gmso_match_ff_by):
+    """Apply the force fields to the topology with GMSO, and return the typed topology."""
+    # can use  match_ff_by="group" or "molecule", group was only chosen so everything is using the
+    # user selected mb.Compound.name...
+    gmso_apply(
+        topology,
+        forcefields,
+        speedup_by_molgraph=True,
+        speedup_by_moltag=True,
+        identify_connections=True,
+        match_ff_by=gmso_match_ff_by,
+        remove_untyped=True,
+    )
+
+    return topology
+
+
+def _apply_forcefields_by_residue(
+    topology, forcefields, gmso_match_ff_by, max_workers=None
+):
+    """Apply the force fields to each residue partition of the topology in a process pool.
+
+    The topology is partitioned by its gmso_match_ff_by labels (residue names),
+    each partition is typed with its residue's force field in a worker process,
+    and the typed partitions are stitched back together.  The sites keep their
+    original topology order, and the connections are added per partition,
+    in the order of each residue's first site.  If any site does not have a
+    residue label, or there is only one residue, the whole topology is typed
+    in this process.
+
+    Parameters
+    ----------
+    topology: gmso.Topology
+        The untyped topology.
+    forcefields: dict
+        The GMSO force field for each residue name.
+    gmso_match_ff_by: str ("group" or "molecule")
+        The site labels that the force fields are applied by.
+    max_workers: int or None, default=None
+        The maximum number of worker processes.  If None, the number of
+        processes is the smaller of the number of residues and the CPU count.
+
+    Returns
+    -------
+    typed_topology: gmso.Topology
+        The typed topology.
+    """
+    # get the original site indices of each residue partition
+    residue_site_indices_dict = {}
+    for site_index, site in enumerate(topology.sites):
+        residue_name = _get_site_residue_label(site, gmso_match_ff_by)
+        if residue_name is None:
+            return _apply_forcefields(topology, forcefields, gmso_match_ff_by)
+        residue_site_indices_dict.setdefault(residue_name, []).append(
+            site_index
+        )
+
+    if len(residue_site_indices_dict) <= 1:
+        return _apply_forcefields(topology, forcefields, gmso_match_ff_by)
+
+    if max_workers is None:
+        max_workers = min(len(residue_site_indices_dict), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as typing_executor:
+        typing_futures_list = []
+        for residue_name in residue_site_indices_dict.keys():
+            # only send the residue's force field to the worker process,
+            # unless it is missing, so GMSO handles it as in the serial typing
+            if residue_name in forcefields:
+                residue_forcefields = {residue_name: forcefields[residue_name]}
+            else:
+                residue_forcefields = forcefields
+
+            typing_futures_list.append(
+                typing_executor.submit(
+                    _apply_forcefields,
+                    topology.create_subtop(
+                        label_type=gmso_match_ff_by, label=residue_name
+                    ),
+                    residue_forcefields,
+                    gmso_match_ff_by,
+                )
+            )
+
+        # raise the first error in the residue order, after all the residues finish
+        typed_partitions_list = [
+            typing_future_iter.result()
+            for typing_future_iter in typing_futures_list
+        ]
+
+    combining_rule = _get_combining_rule(typed_partitions_list)
+
+    # stitch the typed partitions together, with the sites at their original indices
+    typed_sites_list = [None] * topology.n_sites
+    for site_indices_iter, typed_partition_iter in zip(
+        residue_site_indices_dict.values(), typed_partitions_list
+    ):
+        for site_index, typed_site in zip(
+            site_indices_iter, typed_partition_iter.sites
+        ):
+            typed_sites_list[site_index] = typed_site
+
+    typed_topology = gmso.Topology(name=topology.name, box=topology.box)
+    for typed_site in typed_sites_list:
+        typed_topology.add_site(typed_site, update_types=False)
+
+    for residue_name, typed_partition_iter in zip(
+        residue_site_indices_dict.keys(), typed_partitions_list
+    ):
+        for connection_iter in typed_partition_iter.connections:
+            typed_topology.add_connection(connection_iter, update_types=False)
+
+        typed_topology.set_lj_scale(
+            typed_partition_iter.get_lj_scale(molecule_id=residue_name),
+            molecule_id=residue_name,
+        )
+        typed_topology.set_electrostatics_scale(
+            typed_partition_iter.get_electrostatics_scale(
+                molecule_id=residue_name
+            ),
+            molecule_id=residue_name,
+        )
+
+    typed_topology.combining_rule = combining_rule
+
+    return typed_topology
+
+
+def _get_site_residue_label(site, gmso_match_ff_by):
+    """Get the site's residue label (group or molecule name) for the force field."""
+    if gmso_match_ff_by == "group":
+        return site.group
+    elif site.molecule is not None:
+        return site.molecule.name
+
+    return None
+
+
+def _get_combining_rule(typed_topologies_list):
+    """Get the combining rule of the typed topologies, which must be the same."""
+    combining_rules_set = set(
+        typed_topology_iter.combining_rule
+        for typed_topology_iter in typed_topologies_list
+    )
+    if len(combining_rules_set) > 1:
+        print_error_message = (
+            f"ERROR: The residue force fields do not have the same combining "
+            f"rule, {sorted(combining_rules_set)}. All the force fields "
+            f"must use the same combining rule."
+        )
+        raise ValueError(print_error_message)
+
+    return combining_rules_set.pop()
+
+
+def _apply_forcefields_from_templates(
+    topology,
+    forcefield_selection_with_paths,
+    gmso_match_ff_by,
+    forcefield_cache_dir=None,
+):
+    """Apply the force fields to the topology from the typed residue templates.
+
+    The topology is split into its molecules (the bonded site groups), and each
+    unique molecule (its residue name and canonical molecule graph, see
+    residue_template_key) is typed once with GMSO as a single molecule topology,
+    which is the typed residue template.  The templates hold the atom types,
+    their parameters and expressions, the typed connections, the 1-4 scales,
+    and the combining rule.  They are cached in memory and on-disk (see
+    load_cached_residue_template), keyed by the force field xml hash and the
+    molecule graph, so repeat builds do not parse the force fields or run the
+    GMSO (SMARTS) typing.  Every molecule copy gets its own unpickled template,
+    with the copy's site data (positions, labels, etc.).  If any site does not
+    have a residue label, a molecule has more than one residue label, or a
+    residue does not have a force field, the whole topology is typed with GMSO
+    in this process.
+
+    Parameters
+    ----------
+    topology: gmso.Topology
+        The untyped topology.
+    forcefield_selection_with_paths: dict
+        The force field xml file path for each residue,
+        {'residue_name': 'ff_path'} (see _get_forcefield_selection_with_paths).
+    gmso_match_ff_by: str ("group" or "molecule")
+        The site labels that the force fields are applied by.
+    forcefield_cache_dir: str or None, default=None
+        The on-disk cache directory for the parsed force fields and the typed
+        residue templates (see load_cached_residue_template).
+
+    Returns
+    -------
+    typed_topology: gmso.Topology
+        The typed topology.
+    """
+    gmso_compatable_forcefield_selection = None
+
+    def get_forcefields():
+        # the force fields are only loaded if a template is not cached
+        nonlocal gmso_compatable_forcefield_selection
+        if gmso_compatable_forcefield_selection is None:
+            gmso_compatable_forcefield_selection = _load_forcefield_selection(
+                forcefield_selection_with_paths,
+                forcefield_cache_dir=forcefield_cache_dir,
+            )
+
+        return gmso_compatable_forcefield_selection
+
+    sites_list = list(topology.sites)
+    bonds_list = list(topology.bonds)
+    if len(sites_list) == 0:
+        return _apply_forcefields(topology, get_forcefields(), gmso_match_ff_by)
+
+    # split the topology into its molecules, in the order of their first site
+    site_index_dict = {
+        site: site_index for site_index, site in enumerate(sites_list)
+    }
+    bonded_atom_pairs = [
+        (
+            site_index_dict[bond.connection_members[0]],
+            site_index_dict[bond.connection_members[1]],
+        )
+        for bond in bonds_list
+    ]
+    molecule_ids = _get_molecule_ids(
+        len(sites_list), bonded_atom_pairs
+    ).tolist()
+
+    molecule_site_indices_list = [[] for _ in range(max(molecule_ids) + 1)]
+    local_site_index_list = []
+    for site_index, molecule_id in enumerate(molecule_ids):
+        local_site_index_list.append(
+            len(molecule_site_indices_list[molecule_id])
+        )
+        molecule_site_indices_list[molecule_id].append(site_index)
+
+    molecule_bonds_list = [[] for _ in molecule_site_indices_list]
+    for bond, (site_i, site_j) in zip(bonds_list, bonded_atom_pairs):
+        molecule_bonds_list[molecule_ids[site_i]].append(
+            [bond, local_site_index_list[site_i], local_site_index_list[site_j]]
+        )
+
+    # get each molecule's residue name and template key
+    ff_hash_dict = {}
+    molecule_residue_names_list = []
+    molecule_template_keys_list = []
+    for site_indices_iter, bonds_iter in zip(
+        molecule_site_indices_list, molecule_bonds_list
+    ):
+        residue_names_set = set(
+            _get_site_residue_label(sites_list[site_index], gmso_match_ff_by)
+            for site_index in site_indices_iter
+        )
+        residue_name = residue_names_set.pop()
+        if (
+            len(residue_names_set) > 0
+            or residue_name not in forcefield_selection_with_paths
+        ):
+            return _apply_forcefields(
+                topology, get_forcefields(), gmso_match_ff_by
+            )
+
+        if residue_name not in ff_hash_dict:
+            ff_hash_dict[residue_name] = forcefield_xml_hash(
+                forcefield_selection_with_paths[residue_name]
+            )
+
+        molecule_residue_names_list.append(residue_name)
+        molecule_template_keys_list.append(
+            residue_template_key(
+                ff_hash_dict[residue_name],
+                residue_name,
+                gmso_match_ff_by,
+                [
+                    str(sites_list[site_index].name)
+                    for site_index in site_indices_iter
+                ],
+                [
+                    getattr(sites_list[site_index].element, "symbol", None)
+                    for site_index in site_indices_iter
+                ],
+                [[site_i, site_j] for bond, site_i, site_j in bonds_iter],
+            )
+        )
+
+    # load (or type) each unique template, from its first molecule
+    template_bytes_dict = {}
+    for molecule_id, template_key in enumerate(molecule_template_keys_list):
+        if template_key in template_bytes_dict:
+            continue
+
+        def build_template():
+            residue_name = molecule_residue_names_list[molecule_id]
+            molecule_topology = gmso.Topology(name=residue_name)
+            for site_index in molecule_site_indices_list[molecule_id]:
+                molecule_topology.add_site(sites_list[site_index])
+            for bond, site_i, site_j in molecule_bonds_list[molecule_id]:
+                molecule_topology.add_connection(bond)
+
+            return _apply_forcefields(
+                molecule_topology,
+                {residue_name: get_forcefields()[residue_name]},
+                gmso_match_ff_by,
+            )
+
+        template_bytes_dict[template_key] = load_cached_residue_template(
+            template_key, build_template, cache_dir=forcefield_cache_dir
+        )
+
+    # stitch an unpickled template copy for every molecule together,
+    # with the sites at their original indices
+    typed_sites_list = [None] * len(sites_list)
+    typed_molecules_list = []
+    residue_templates_dict = {}
+    for site_indices_iter, residue_name, template_key in zip(
+        molecule_site_indices_list,
+        molecule_residue_names_list,
+        molecule_template_keys_list,
+    ):
+        typed_molecule = pickle.loads(template_bytes_dict[template_key])
+        if typed_molecule.n_sites != len(site_indices_iter):
+            print_error_message = (
+                f"ERROR: The typed {residue_name} residue template does not "
+                f"have the same number of atoms/beads as the residue. "
+                f"Please clear the force field cache "
+                f"(see clear_forcefield_cache)."
+            )
+            raise ValueError(print_error_message)
+
+        for site_index, typed_site in zip(
+            site_indices_iter, typed_molecule.sites
+        ):
+            # only the atom type comes from the template
+            for field_name, field_value in sites_list[
+                site_index
+            ].__dict__.items():
+                if field_name != "atom_type_":
+                    typed_site.__dict__[field_name] = field_value
+            typed_sites_list[site_index] = typed_site
+
+        typed_molecules_list.append(typed_molecule)
+        residue_templates_dict.setdefault(residue_name, typed_molecule)
+
+    typed_topology = gmso.Topology(name=topology.name, box=topology.box)
+    for typed_site in typed_sites_list:
+        typed_topology.add_site(typed_site, update_types=False)
+
+    for typed_molecule in typed_molecules_list:
+        for connection_iter in typed_molecule.connections:
+            typed_topology.add_connection(connection_iter, update_types=False)
+
+    for residue_name, typed_molecule in residue_templates_dict.items():
+        typed_topology.set_lj_scale(
+            typed_molecule.get_lj_scale(molecule_id=residue_name),
+            molecule_id=residue_name,
+        )
+        typed_topology.set_electrostatics_scale(
+            typed_molecule.get_electrostatics_scale(molecule_id=residue_name),
+            molecule_id=residue_name,
+        )
+
+    typed_topology.combining_rule = _get_combining_rule(
+        list(residue_templates_dict.values())
+    )
+
+    return typed_topology
 
 
 def specific_ff_to_residue(
@@ -19,6 +600,10 @@ def specific_ff_to_residue(
     gmso_match_ff_by="molecule",
     residues=None,
     boxes_for_simulation=1,
+    forcefield_cache_dir=None,
+    parallel_residue_typing=False,
+    max_workers=None,
+    residue_template_cache=False,
 ):
     """
     Takes the mbuild Compound or mbuild Box and applies the selected
@@ -186,6 +771,31 @@ def specific_ff_to_residue(
         Gibbs (GEMC) or grand canonical (GCMC) ensembles are examples of where the boxes_for_simulation would be 2.
         Canonical (NVT) or isothermal–isobaric (NPT) ensembles are example with the boxes_for_simulation equal to 1.
         Note: the only valid options are 1 or 2.
+    forcefield_cache_dir: str or None, default=None
+        The on-disk cache directory for the parsed force fields, which are keyed by
+        the force field xml file's content hash (see gmso_forcefield_cache).
+        If None, the MOSDEF_GOMC_FF_CACHE_DIR environment variable is used,
+        and if it is not set, the parsed force fields are only cached in memory.
+    parallel_residue_typing: bool, default=False
+        If True, the topology is partitioned by residue (the gmso_match_ff_by labels),
+        and each residue is typed with its force field in a separate worker process.
+        The typed residues are then stitched back together, with the atoms/beads
+        in the same order as the serial typing.  This is useful for mixtures with
+        many different residues.  If False, all the residues are typed in this process.
+    max_workers: int or None, default=None
+        The maximum number of worker processes used if parallel_residue_typing is True.
+        If None, the smaller of the number of residues and the CPU count is used.
+    residue_template_cache: bool, default=False
+        If True, the force fields are applied from the typed residue templates,
+        which are cached in memory and in the forcefield_cache_dir (or the
+        MOSDEF_GOMC_FF_CACHE_DIR environment variable directory), keyed by the
+        force field xml file's content hash and the canonical molecule graph
+        (see gmso_forcefield_cache.residue_template_key).  Each unique molecule
+        is only typed with GMSO the first time it is seen, so repeat builds
+        do not parse the force fields or run the GMSO (SMARTS) typing.
+        The bonds, angles, dihedrals, and impropers are ordered by molecule.
+        If True, the parallel_residue_typing is not used.
+        If False, the whole topology is typed with GMSO.
 
     Returns
     -------
@@ -256,11 +866,17 @@ def specific_ff_to_residue(
     has the same residue name, and the residue name is specific to that molecule type.
     For example: a protein molecule with many residue names is not currently supported,
     but is planned to be supported in the future.
+
+    The force field is applied by template typing.  GMSO types only one representative
+    molecule per unique residue (speedup_by_moltag=True), confirms that every other
+    copy of that residue has the same molecular graph (speedup_by_molgraph=True),
+    and maps the representative's atom types onto the copies by atom index.
+    Therefore, the typing cost scales with the number of unique residues,
+    not the number of atoms (e.g., mbuild.fill_box built systems).
     """
 
     if has_foyer:
         from foyer import Forcefield
-        from foyer.forcefields import forcefields
     else:
         print_error_message = (
             "Package foyer is not installed. "
@@ -334,98 +950,33 @@ def specific_ff_to_residue(
     ]:
         raise ValueError(print_error_message_for_boxes_for_simulatiion)
 
-    forcefield_keys_list = []
-    if forcefield_selection is not None:
-        for res in forcefield_selection.keys():
-            forcefield_keys_list.append(res)
-        ff_data = forcefield_selection
-
-    if forcefield_keys_list == [] and len(residues) != 0:
-        print_error_message = "The forcefield_selection variable are not provided, but there are residues provided."
-        raise ValueError(print_error_message)
+    if not isinstance(parallel_residue_typing, bool):
+        print_error_message = (
+            "ERROR: Please enter the parallel_residue_typing as a bool."
+        )
+        raise TypeError(print_error_message)
 
-    elif forcefield_keys_list != [] and len(residues) == 0:
+    if max_workers is not None and (
+        not isinstance(max_workers, int)
+        or isinstance(max_workers, bool)
+        or max_workers < 1
+    ):
         print_error_message = (
-            "The residues variable is an empty list but there are "
-            "forcefield_selection variables provided."
+            "ERROR: Please enter the max_workers as None or "
+            "an integer greater than or equal to 1."
         )
         raise ValueError(print_error_message)
 
-    user_entered_ff_with_path_dict = (
-        {}
-    )  # True means user entered the path, False is a standard foyer FF with no path
-    for z in range(0, len(forcefield_keys_list)):
-        for res_i in range(0, len(residues)):
-            if residues[res_i] == forcefield_keys_list[z]:
-                if (
-                    os.path.splitext(ff_data[forcefield_keys_list[z]])[1]
-                    == ".xml"
-                    and len(residues) != 0
-                ):
-                    user_entered_ff_with_path_dict.update(
-                        {residues[res_i]: True}
-                    )
-                elif (
-                    os.path.splitext(ff_data[forcefield_keys_list[z]])[1] == ""
-                    and len(residues) != 0
-                ):
-                    user_entered_ff_with_path_dict.update(
-                        {residues[res_i]: False}
-                    )
-                else:
-                    print_error_message = (
-                        r"Please make sure you are entering the correct "
-                        "foyer FF name and not a path to a FF file. "
-                        "If you are entering a path to a FF file, "
-                        "please use the forcefield_files variable with the "
-                        "proper XML extension (.xml)."
-                    )
-                    raise ValueError(print_error_message)
+    if not isinstance(residue_template_cache, bool):
+        print_error_message = (
+            "ERROR: Please enter the residue_template_cache as a bool."
+        )
+        raise TypeError(print_error_message)
 
     # check if FF files exist and create a forcefield selection with directory paths
-    # forcefield_selection_with_paths
-    forcefield_selection_with_paths = {}
-    for j in range(0, len(forcefield_keys_list)):
-        residue_iteration = forcefield_keys_list[j]
-        ff_for_residue_iteration = ff_data[residue_iteration]
-        if user_entered_ff_with_path_dict[residue_iteration]:
-            ff_names_path_iteration = ff_data[residue_iteration]
-
-            try:
-                read_xlm_iteration = minidom.parse(ff_names_path_iteration)
-                forcefield_selection_with_paths.update(
-                    {residue_iteration: ff_names_path_iteration}
-                )
-
-            except:
-                print_error_message = (
-                    "Please make sure you are entering the correct foyer FF path, "
-                    "including the FF file name.xml. "
-                    "If you are using the pre-build FF files in foyer, "
-                    "only use the string name without any extension. "
-                    "The selected FF file could also could not formated properly, or "
-                    "there may be errors in the FF file itself."
-                )
-                raise ValueError(print_error_message)
-        elif not user_entered_ff_with_path_dict[residue_iteration]:
-            ff_for_residue_iteration = ff_data[residue_iteration]
-            ff_names_path_iteration = (
-                forcefields.get_ff_path()[0]
-                + "/xml/"
-                + ff_for_residue_iteration
-                + ".xml"
-            )
-            try:
-                read_xlm_iteration = minidom.parse(ff_names_path_iteration)
-                forcefield_selection_with_paths.update(
-                    {residue_iteration: ff_names_path_iteration}
-                )
-            except:
-                print_error_message = (
-                    "Please make sure you are entering the correct foyer FF name, or the "
-                    "correct file extension (i.e., .xml, if required)."
-                )
-                raise ValueError(print_error_message)
+    forcefield_selection_with_paths = _get_forcefield_selection_with_paths(
+        forcefield_selection, residues
+    )
 
     # Check to see if it is an empty mbuild.Compound and set intial atoms to 0
     # note empty mbuild.Compound will read 1 atoms but there is really noting there
@@ -458,36 +1009,34 @@ def specific_ff_to_residue(
         new_gmso_topology = gmso.Topology()
         new_gmso_topology.box = gmso.Box(lengths=lengths, angles=angles)
 
-    # push the FF paths and/or name to the GMSO format and create the new GMSO topology format
-    gmso_compatable_forcefield_selection = {}
-    for ff_key_iter, ff_value_iter in forcefield_selection_with_paths.items():
-        # try to load the Foyer and GMSO FFs, if Foyer convert to GMSO; otherwise, it is an error.
-        try:
-            ff_new_gmso_value_iter = ForceField(ff_value_iter)
-
-        except:
-            print_error = (
-                f"ERROR: The supplied force field xml for the "
-                f"{ff_key_iter} residue is not a foyer or gmso xml, "
-                f"or the xml has errors and it not able to load properly."
-            )
-            raise TypeError(print_error)
-
-        gmso_compatable_forcefield_selection.update(
-            {ff_key_iter: ff_new_gmso_value_iter}
+    if residue_template_cache and new_gmso_topology.n_sites > 0:
+        # the force fields are only loaded if a residue template is not cached
+        new_gmso_topology = _apply_forcefields_from_templates(
+            new_gmso_topology,
+            forcefield_selection_with_paths,
+            gmso_match_ff_by,
+            forcefield_cache_dir=forcefield_cache_dir,
+        )
+    else:
+        # push the FF paths and/or name to the GMSO format and create the new GMSO topology format
+        gmso_compatable_forcefield_selection = _load_forcefield_selection(
+            forcefield_selection_with_paths,
+            forcefield_cache_dir=forcefield_cache_dir,
         )
 
-    # can use  match_ff_by="group" or "molecule", group was only chosen so everything is using the
-    # user selected mb.Compound.name...
-    gmso_apply(
-        new_gmso_topology,
-        gmso_compatable_forcefield_selection,
-        speedup_by_molgraph=True,
-        speedup_by_moltag=True,
-        identify_connections=True,
-        match_ff_by=gmso_match_ff_by,
-        remove_untyped=True,
-    )
+        if parallel_residue_typing and new_gmso_topology.n_sites > 0:
+            new_gmso_topology = _apply_forcefields_by_residue(
+                new_gmso_topology,
+                gmso_compatable_forcefield_selection,
+                gmso_match_ff_by,
+                max_workers=max_workers,
+            )
+        else:
+            new_gmso_topology = _apply_forcefields(
+                new_gmso_topology,
+                gmso_compatable_forcefield_selection,
+                gmso_match_ff_by,
+            )
     new_gmso_topology.update_topology()
 
     # find mixing rule.  If an empty.box mixing rule is set to None
@@ -498,8 +1047,6 @@ def specific_ff_to_residue(
 
     # identify the bonded atoms and hence the molecule, label the GMSO objects
     # and create the function outputs.
-    molecule_number = 0  # 0 sets the 1st molecule_number at 1
-    molecules_atom_number_dict = {}
     unique_topology_groups_list = []
     unique_topologies_groups_dict = {}
     atom_types_dict = {}
@@ -581,95 +1128,26 @@ def specific_ff_to_residue(
                 )
 
     # get all the bonded atoms, which is used for the bonded map to identify molecules
-    bonded_atom_number_set = set()
-    all_bonded_atoms_list = set()
-    for bond in new_gmso_topology.bonds:
-        bonded_atom_0_iter = new_gmso_topology.get_index(
-            bond.connection_members[0]
-        )
-        bonded_atom_1_iter = new_gmso_topology.get_index(
-            bond.connection_members[1]
+    bonded_atom_pairs = [
+        (
+            new_gmso_topology.get_index(bond.connection_members[0]),
+            new_gmso_topology.get_index(bond.connection_members[1]),
         )
-        if bonded_atom_0_iter < bonded_atom_1_iter:
-            bonded_atom_tuple_iter = (bonded_atom_0_iter, bonded_atom_1_iter)
-        else:
-            bonded_atom_tuple_iter = (bonded_atom_1_iter, bonded_atom_0_iter)
-
-        bonded_atom_number_set.add(bonded_atom_tuple_iter)
-        all_bonded_atoms_list.add(bonded_atom_0_iter)
-        all_bonded_atoms_list.add(bonded_atom_1_iter)
+        for bond in new_gmso_topology.bonds
+    ]
 
-    """
-    build_molecule_list_time_start = time.time()
-    """
+    # map all bonded atoms as molecules, with the molecule numbers in site order
+    molecule_ids = _get_molecule_ids(
+        new_gmso_topology.n_sites, bonded_atom_pairs
+    )
 
-    # map all bonded atoms as molecules
-    molecules_atom_number_list = []
     for site_j, site in enumerate(new_gmso_topology.sites):
-        atom_iter_k = new_gmso_topology.get_index(site)
-
-        if atom_iter_k in all_bonded_atoms_list:
-            for bonded_atoms_n in bonded_atom_number_set:
-                if atom_iter_k in bonded_atoms_n:
-                    bonded_atoms_n_list_iter = list(bonded_atoms_n)
-                    atom_found_iter = False
-                    if len(molecules_atom_number_list) != 0:
-                        for molecule_j in range(
-                            0, len(molecules_atom_number_list)
-                        ):
-                            if (
-                                atom_iter_k
-                                in molecules_atom_number_list[molecule_j]
-                            ):
-                                molecules_atom_number_list[molecule_j].add(
-                                    bonded_atoms_n_list_iter[0]
-                                )
-                                molecules_atom_number_list[molecule_j].add(
-                                    bonded_atoms_n_list_iter[1]
-                                )
-                                atom_found_iter = True
-
-                            if (
-                                molecule_j
-                                == len(molecules_atom_number_list) - 1
-                            ) and atom_found_iter is False:
-                                molecules_atom_number_list.append(
-                                    {
-                                        bonded_atoms_n_list_iter[0],
-                                        bonded_atoms_n_list_iter[1],
-                                    }
-                                )
-                    else:
-                        molecules_atom_number_list.append(
-                            {
-                                bonded_atoms_n_list_iter[0],
-                                bonded_atoms_n_list_iter[1],
-                            }
-                        )
-        else:
-            molecules_atom_number_list.append({atom_iter_k})
-
-    # create a molecule number to atom number dict
-    # Example:  {molecule_number_x: {atom_number_1, ..., atom_number_y}, ...}
-    for molecule_iter in range(0, len(molecules_atom_number_list)):
-        molecules_atom_number_dict.update(
-            {molecule_number: molecules_atom_number_list[molecule_iter]}
-        )
-        molecule_number += 1
-
-    for site in new_gmso_topology.sites:
-        site_atom_number_iter = new_gmso_topology.get_index(site)
-        # get molecule number
-        for mol_n, atom_set_n in molecules_atom_number_dict.items():
-            if site_atom_number_iter in atom_set_n:
-                molecule_p_number = mol_n
-
         if gmso_match_ff_by == "group":
             site.__dict__["residue_name_"] = site.__dict__["group_"]
         elif gmso_match_ff_by == "molecule":
             site.__dict__["residue_name_"] = site.__dict__["molecule_"].name
 
-        site.__dict__["residue_number_"] = molecule_p_number + 1
+        site.__dict__["residue_number_"] = int(molecule_ids[site_j]) + 1
 
     # create a topolgy only with the bonded parameters, including their residue/molecule type
     # which permit force fielding in GOMC easier in the charmm_writer